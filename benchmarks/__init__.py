@@ -0,0 +1,6 @@
+"""
+Benchmarks of chaosk8s activities against a fake Kubernetes API server.
+
+Run them with `python -m benchmarks`, see `python -m benchmarks --help` for
+the available options.
+"""
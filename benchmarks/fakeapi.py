@@ -0,0 +1,633 @@
+"""
+An in-process fake of the Kubernetes API server.
+
+The fake serves a synthetic cluster over plain HTTP so that activities are
+exercised through the real Kubernetes client, serialization included. Pods,
+nodes, deployments and events are generated on the fly from their index
+rather than stored, which keeps the footprint of the server flat whatever
+the size of the cluster. Only the changes made by the activities (deleted
+pods, cordoned nodes) are recorded, and replayed to watchers.
+
+Only the subset of the API used by chaosk8s is implemented: lists with
+equality-based label selectors, the field selectors chaosk8s relies on,
+`limit`/`continue` pagination, metadata-only lists, watches, pod deletion,
+eviction and logs, and node patches.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+__all__ = ["FakeCluster", "FakeApiServer"]
+
+PODS_PER_NODE = 100
+SHARDS = 100
+DEPLOYMENTS = 10
+LOG_LINES = 200
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeCluster:
+    """
+    A synthetic cluster of `pods` pods, spread over `nodes` nodes and
+    labelled `app=bench`, `shard=<index % 100>` and
+    `deployment=bench-<index % 10>`.
+    """
+
+    def __init__(
+        self,
+        pods: int = 1000,
+        nodes: int = None,
+        events: int = None,
+        ns: str = "default",
+    ) -> None:
+        self.size = pods
+        self.nodes = nodes or max(3, pods // PODS_PER_NODE)
+        self.events = pods if events is None else events
+        self.ns = ns
+        self.deleted = set()
+        self.cordoned = set()
+        self.resource_version = 1000
+        self.changes = []
+        self.cond = threading.Condition()
+
+    def pod(self, i: int) -> Dict[str, Any]:
+        created = EPOCH + timedelta(seconds=i)
+        return {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {
+                "name": f"bench-{i}",
+                "namespace": self.ns,
+                "uid": f"pod-{i}",
+                "resourceVersion": str(self.resource_version),
+                "creationTimestamp": created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "labels": self.pod_labels(i),
+                "ownerReferences": [
+                    {
+                        "apiVersion": "apps/v1",
+                        "kind": "ReplicaSet",
+                        "name": f"bench-{i % DEPLOYMENTS}-rs",
+                        "uid": f"rs-{i % DEPLOYMENTS}",
+                        "controller": True,
+                    }
+                ],
+            },
+            "spec": {
+                "nodeName": f"node-{i % self.nodes}",
+                "containers": [
+                    {
+                        "name": "app",
+                        "image": "nginx:1.25",
+                        "ports": [{"containerPort": 80, "protocol": "TCP"}],
+                        "resources": {
+                            "requests": {"cpu": "100m", "memory": "64Mi"}
+                        },
+                    }
+                ],
+                "volumes": [],
+            },
+            "status": {
+                "phase": "Running",
+                "podIP": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+                "hostIP": f"192.168.0.{i % self.nodes % 256}",
+                "conditions": [
+                    {"type": t, "status": "True"}
+                    for t in (
+                        "Initialized",
+                        "Ready",
+                        "ContainersReady",
+                        "PodScheduled",
+                    )
+                ],
+                "containerStatuses": [
+                    {
+                        "name": "app",
+                        "ready": True,
+                        "restartCount": 0,
+                        "image": "nginx:1.25",
+                        "imageID": "docker.io/library/nginx@sha256:0",
+                        "state": {
+                            "running": {"startedAt": "2024-01-01T00:00:00Z"}
+                        },
+                    }
+                ],
+            },
+        }
+
+    def pod_labels(self, i: int) -> Dict[str, str]:
+        return {
+            "app": "bench",
+            "shard": str(i % SHARDS),
+            "deployment": f"bench-{i % DEPLOYMENTS}",
+        }
+
+    def node(self, k: int) -> Dict[str, Any]:
+        conditions = [
+            ("MemoryPressure", "False"),
+            ("DiskPressure", "False"),
+            ("PIDPressure", "False"),
+            ("Ready", "True"),
+        ]
+        return {
+            "apiVersion": "v1",
+            "kind": "Node",
+            "metadata": {
+                "name": f"node-{k}",
+                "uid": f"node-{k}",
+                "resourceVersion": str(self.resource_version),
+                "labels": {"kubernetes.io/hostname": f"node-{k}"},
+            },
+            "spec": {"unschedulable": f"node-{k}" in self.cordoned},
+            "status": {
+                "conditions": [{"type": t, "status": s} for t, s in conditions]
+            },
+        }
+
+    def deployment(self, k: int) -> Dict[str, Any]:
+        replicas = len(range(k, self.size, DEPLOYMENTS))
+        return {
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "metadata": {
+                "name": f"bench-{k}",
+                "namespace": self.ns,
+                "uid": f"deployment-{k}",
+                "resourceVersion": str(self.resource_version),
+                "labels": {"app": "bench"},
+            },
+            "spec": {
+                "replicas": replicas,
+                "selector": {"matchLabels": {"deployment": f"bench-{k}"}},
+                "template": {"metadata": {"labels": {"app": "bench"}}},
+            },
+            "status": {
+                "replicas": replicas,
+                "readyReplicas": replicas,
+                "availableReplicas": replicas,
+            },
+        }
+
+    def event(self, i: int) -> Dict[str, Any]:
+        return {
+            "apiVersion": "events.k8s.io/v1",
+            "kind": "Event",
+            "metadata": {
+                "name": f"bench-{i % self.size}.{i:x}",
+                "namespace": self.ns,
+                "resourceVersion": str(self.resource_version),
+            },
+            "reason": "Started",
+            "note": "Started container app",
+            "type": "Normal",
+            "regarding": {"kind": "Pod", "name": f"bench-{i % self.size}"},
+        }
+
+    def pod_indexes(
+        self, labels: List[tuple], fields: Dict[str, str]
+    ) -> Iterator[int]:
+        """
+        Yield the index of each remaining pod matching the given selectors.
+        """
+        if "metadata.name" in fields:
+            i = _index_of(fields["metadata.name"], "bench-")
+            candidates = [i] if i is not None and i < self.size else []
+        elif "spec.nodeName" in fields:
+            k = _index_of(fields["spec.nodeName"], "node-")
+            candidates = (
+                range(k, self.size, self.nodes) if k is not None else []
+            )
+        else:
+            candidates = range(self.size)
+
+        phase = fields.get("status.phase")
+        for i in candidates:
+            if i in self.deleted:
+                continue
+            if phase and phase != "Running":
+                continue
+            if labels and not _match_labels(self.pod_labels(i), labels):
+                continue
+            yield i
+
+    def delete_pod(self, i: int) -> Optional[Dict[str, Any]]:
+        with self.cond:
+            if i in self.deleted or i >= self.size:
+                return None
+            self.deleted.add(i)
+            self.resource_version += 1
+            pod = self.pod(i)
+            self.changes.append((self.resource_version, "DELETED", pod))
+            self.cond.notify_all()
+            return pod
+
+
+class FakeApiServer:
+    """
+    Serve a `FakeCluster` on a local port, adding `latency` seconds to every
+    request, and count the requests and bytes sent per kind of call.
+    """
+
+    def __init__(self, cluster: FakeCluster, latency: float = 0.0) -> None:
+        self.cluster = cluster
+        self.latency = latency
+        self.calls = Counter()
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeApiServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeApiServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def record(self, call: str, sent: int = 0) -> None:
+        with self._lock:
+            self.calls[call] += 1
+            self.bytes_sent += sent
+
+    def add_bytes(self, sent: int) -> None:
+        with self._lock:
+            self.bytes_sent += sent
+
+
+###############################################################################
+# Internals
+###############################################################################
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    routes = [
+        ("GET", r"/api/v1/namespaces/(?P<ns>[^/]+)/pods", "list_pods"),
+        ("GET", r"/api/v1/pods", "list_pods"),
+        (
+            "GET",
+            r"/api/v1/namespaces/(?P<ns>[^/]+)/pods/(?P<name>[^/]+)",
+            "get_pod",
+        ),
+        (
+            "DELETE",
+            r"/api/v1/namespaces/(?P<ns>[^/]+)/pods/(?P<name>[^/]+)",
+            "delete_pod",
+        ),
+        (
+            "POST",
+            r"/api/v1/namespaces/(?P<ns>[^/]+)/pods/(?P<name>[^/]+)/eviction",
+            "evict_pod",
+        ),
+        (
+            "GET",
+            r"/api/v1/namespaces/(?P<ns>[^/]+)/pods/(?P<name>[^/]+)/log",
+            "read_log",
+        ),
+        ("GET", r"/api/v1/nodes", "list_nodes"),
+        ("PATCH", r"/api/v1/nodes/(?P<name>[^/]+)", "patch_node"),
+        (
+            "GET",
+            r"/apis/apps/v1/namespaces/(?P<ns>[^/]+)/deployments",
+            "list_deployments",
+        ),
+        ("GET", r"/apis/apps/v1/deployments", "list_deployments"),
+        ("GET", r"/apis/events.k8s.io/v1/events", "list_events"),
+    ]
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    @property
+    def fake(self) -> FakeApiServer:
+        return self.server.fake
+
+    @property
+    def cluster(self) -> FakeCluster:
+        return self.server.fake.cluster
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+
+        if self.fake.latency:
+            time.sleep(self.fake.latency)
+
+        for verb, pattern, handler in self.routes:
+            m = re.fullmatch(pattern, url.path)
+            if verb == method and m:
+                getattr(self, handler)(**m.groupdict())
+                return
+
+        self._send_json(
+            {"kind": "Status", "status": "Failure", "code": 404},
+            404,
+            f"{method} unknown",
+        )
+
+    # --- handlers ------------------------------------------------------------
+    def list_pods(self, ns: str = None) -> None:
+        cluster = self.cluster
+        labels = _parse_selector(self.query.get("labelSelector"))
+        fields = dict(_parse_selector(self.query.get("fieldSelector"), True))
+        if ns and ns != cluster.ns:
+            indexes = iter(())
+        else:
+            indexes = cluster.pod_indexes(labels, fields)
+
+        if self.query.get("watch") in ("true", "1", "True"):
+
+            def match(pod: Dict[str, Any]) -> bool:
+                i = _index_of(pod["metadata"]["name"], "bench-")
+                return _match_labels(cluster.pod_labels(i), labels) and all(
+                    _field(pod, k) == v for k, v in fields.items()
+                )
+
+            self._watch(
+                "pods", lambda: (cluster.pod(i) for i in indexes), match
+            )
+            return
+
+        self._send_list("pods", "PodList", indexes, cluster.pod)
+
+    def get_pod(self, ns: str, name: str) -> None:
+        i = _index_of(name, "bench-")
+        if i is None or i >= self.cluster.size or i in self.cluster.deleted:
+            self._send_status(404, "GET pods")
+            return
+        self._send_json(self.cluster.pod(i), 200, "GET pods")
+
+    def delete_pod(self, ns: str, name: str) -> None:
+        i = _index_of(name, "bench-")
+        pod = self.cluster.delete_pod(i) if i is not None else None
+        if pod is None:
+            self._send_status(404, "DELETE pods")
+            return
+        self._send_json(pod, 200, "DELETE pods")
+
+    def evict_pod(self, ns: str, name: str) -> None:
+        i = _index_of(name, "bench-")
+        pod = self.cluster.delete_pod(i) if i is not None else None
+        if pod is None:
+            self._send_status(404, "POST pods/eviction")
+            return
+        self._send_status(201, "POST pods/eviction")
+
+    def read_log(self, ns: str, name: str) -> None:
+        lines = int(self.query.get("tailLines") or LOG_LINES)
+        text = "".join(
+            f"2024-01-01T00:00:{n % 60:02d}Z {name} handled request {n}\n"
+            for n in range(min(lines, LOG_LINES))
+        )
+        self._send(text.encode("utf-8"), 200, "text/plain", "GET pods/log")
+
+    def list_nodes(self) -> None:
+        cluster = self.cluster
+        fields = dict(_parse_selector(self.query.get("fieldSelector"), True))
+        labels = _parse_selector(self.query.get("labelSelector"))
+        indexes = (
+            k
+            for k in range(cluster.nodes)
+            if fields.get("metadata.name", f"node-{k}") == f"node-{k}"
+            and _match_labels(cluster.node(k)["metadata"]["labels"], labels)
+        )
+        self._send_list("nodes", "NodeList", indexes, cluster.node)
+
+    def patch_node(self, name: str) -> None:
+        k = _index_of(name, "node-")
+        if k is None or k >= self.cluster.nodes:
+            self._send_status(404, "PATCH nodes")
+            return
+        patch = json.loads(self.body or b"{}")
+        if patch.get("spec", {}).get("unschedulable"):
+            self.cluster.cordoned.add(name)
+        else:
+            self.cluster.cordoned.discard(name)
+        self._send_json(self.cluster.node(k), 200, "PATCH nodes")
+
+    def list_deployments(self, ns: str = None) -> None:
+        cluster = self.cluster
+        fields = dict(_parse_selector(self.query.get("fieldSelector"), True))
+        indexes = [
+            k
+            for k in range(DEPLOYMENTS)
+            if fields.get("metadata.name", f"bench-{k}") == f"bench-{k}"
+        ]
+
+        if self.query.get("watch") in ("true", "1", "True"):
+            self._watch(
+                "deployments",
+                lambda: (cluster.deployment(k) for k in indexes),
+                lambda obj: False,
+            )
+            return
+
+        self._send_list(
+            "deployments", "DeploymentList", iter(indexes), cluster.deployment
+        )
+
+    def list_events(self) -> None:
+        self._send_list(
+            "events",
+            "EventList",
+            iter(range(self.cluster.events)),
+            self.cluster.event,
+        )
+
+    # --- responses -----------------------------------------------------------
+    def _send_list(
+        self,
+        resource: str,
+        kind: str,
+        indexes: Iterable[int],
+        render: Callable[[int], Dict[str, Any]],
+    ) -> None:
+        limit = int(self.query.get("limit") or 0)
+        start = int(self.query.get("continue") or 0)
+
+        items = []
+        token = None
+        for i in indexes:
+            if i < start:
+                continue
+            if limit and len(items) == limit:
+                token = str(i)
+                break
+            items.append(render(i))
+
+        if "as=PartialObjectMetadataList" in self.headers.get("Accept", ""):
+            kind = "PartialObjectMetadataList"
+            items = [{"metadata": o["metadata"]} for o in items]
+
+        metadata = {"resourceVersion": str(self.cluster.resource_version)}
+        if token:
+            metadata["continue"] = token
+        self._send_json(
+            {
+                "kind": kind,
+                "apiVersion": "v1",
+                "metadata": metadata,
+                "items": items,
+            },
+            200,
+            f"GET {resource}",
+        )
+
+    def _send_status(self, code: int, call: str) -> None:
+        status = "Success" if code < 400 else "Failure"
+        self._send_json(
+            {
+                "kind": "Status",
+                "apiVersion": "v1",
+                "status": status,
+                "code": code,
+            },
+            code,
+            call,
+        )
+
+    def _send_json(self, obj: Any, code: int, call: str) -> None:
+        self._send(
+            json.dumps(obj).encode("utf-8"), code, "application/json", call
+        )
+
+    def _send(
+        self, data: bytes, code: int, content_type: str, call: str
+    ) -> None:
+        self.fake.record(call, len(data))
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _watch(
+        self,
+        resource: str,
+        initial: Callable[[], Iterable[Dict[str, Any]]],
+        match: Callable[[Dict[str, Any]], bool],
+    ) -> None:
+        """
+        Stream the changes made after the requested resource version, or the
+        current objects as `ADDED` events followed by the changes when none
+        is given, until `timeoutSeconds`.
+        """
+        cluster = self.cluster
+        self.fake.record(f"WATCH {resource}")
+        timeout = float(self.query.get("timeoutSeconds") or 300)
+        deadline = time.monotonic() + timeout
+        since = self.query.get("resourceVersion")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        try:
+            if not since:
+                since = cluster.resource_version
+                for obj in initial():
+                    self._send_event("ADDED", obj)
+            since = int(since)
+
+            seen = 0
+            while time.monotonic() < deadline:
+                with cluster.cond:
+                    if len(cluster.changes) == seen:
+                        cluster.cond.wait(
+                            min(0.5, max(0, deadline - time.monotonic()))
+                        )
+                    changes = cluster.changes[:]
+                for rv, event_type, obj in changes:
+                    if rv > since and match(obj):
+                        self._send_event(event_type, obj)
+                        since = rv
+                seen = len(changes)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send_event(self, event_type: str, obj: Dict[str, Any]) -> None:
+        line = json.dumps({"type": event_type, "object": obj}) + "\n"
+        data = line.encode("utf-8")
+        self.fake.add_bytes(len(data))
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+def _index_of(name: str, prefix: str) -> Optional[int]:
+    if not name.startswith(prefix):
+        return None
+    suffix = name[len(prefix) :]
+    return int(suffix) if suffix.isdigit() else None
+
+
+def _parse_selector(selector: str = None, fields: bool = False) -> List[tuple]:
+    """
+    Parse the equality-based selector syntax into `(key, value, equals)`
+    requirements, or `(key, value)` pairs for field selectors.
+    """
+    requirements = []
+    for clause in (selector or "").split(","):
+        clause = clause.strip()
+        if not clause:
+            continue
+        if "!=" in clause:
+            key, value = clause.split("!=", 1)
+            equals = False
+        else:
+            key, value = re.split(r"==?", clause, maxsplit=1)
+            equals = True
+        if fields:
+            requirements.append((key.strip(), value.strip()))
+        else:
+            requirements.append((key.strip(), value.strip(), equals))
+    return requirements
+
+
+def _match_labels(labels: Dict[str, str], requirements: List[tuple]) -> bool:
+    return all(
+        (labels.get(key) == value) == equals
+        for key, value, equals in requirements
+    )
+
+
+def _field(obj: Dict[str, Any], path: str) -> Any:
+    for part in path.split("."):
+        obj = (obj or {}).get(part)
+    return obj
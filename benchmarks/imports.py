@@ -0,0 +1,68 @@
+"""
+Time how long loading the extension takes, in a fresh interpreter each time
+since modules already imported would otherwise make it look free.
+
+The Kubernetes client is only imported once an activity runs, so neither
+importing `chaosk8s` nor discovering its activities should load it. The
+results say whether it was.
+"""
+
+import json
+import subprocess
+import sys
+from typing import Any, Dict
+
+__all__ = ["IMPORTS", "time_import"]
+
+IMPORTS = {
+    "import": "import chaosk8s",
+    "discover": "import chaosk8s; chaosk8s.discover()",
+}
+
+_TIMER = """
+import json, resource, sys, time
+started = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - started
+# ru_maxrss survives exec and would report the parent's peak on Linux
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "linux":
+    with open("/proc/self/status") as f:
+        hwm = [line for line in f if line.startswith("VmHWM:")]
+    peak = int(hwm[0].split()[1])
+print(json.dumps({{
+    "wall_time": elapsed,
+    "modules": len(sys.modules),
+    "kubernetes_loaded": "kubernetes" in sys.modules,
+    "peak_rss_kb": peak,
+}}))
+"""
+
+
+def time_import(name: str) -> Dict[str, Any]:
+    """
+    Run the statement `IMPORTS[name]` in a new interpreter and return its
+    measurements, shaped like those of the other scenarios.
+    """
+    code = _TIMER.format(statement=IMPORTS[name])
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True
+    ).stdout
+    measures = json.loads(out)
+
+    peak = measures["peak_rss_kb"]
+    if sys.platform == "darwin":
+        peak //= 1024
+
+    return {
+        "scenario": name,
+        "size": 0,
+        "latency": 0.0,
+        "wall_time": round(measures["wall_time"], 4),
+        "api_calls": 0,
+        "calls": {},
+        "bytes_sent": 0,
+        "peak_rss_kb": peak,
+        "modules": measures["modules"],
+        "kubernetes_loaded": measures["kubernetes_loaded"],
+    }
@@ -0,0 +1,192 @@
+"""
+Time chaosk8s activities against clusters of growing sizes.
+
+Each scenario runs in its own process, against its own fake API server, so
+that the recorded peak RSS belongs to that scenario only. The fake server
+lives in the same process but generates objects on the fly, so its own
+footprint does not grow with the cluster size.
+
+The `import` and `discover` scenarios rather time loading the extension in
+a fresh interpreter, once whatever the sizes.
+
+Results can be saved with `--output` and later given back with `--baseline`
+to flag the scenarios which got slower than `--threshold`.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+DEFAULT_SIZES = "1000,10000"
+DEFAULT_LATENCY = 0.002
+DEFAULT_THRESHOLD = 0.2
+
+
+def run_one(name: str, size: int, latency: float) -> Dict[str, Any]:
+    """
+    Run the scenario `name` against a fresh cluster of `size` pods and
+    return its measurements. Meant to be called in a child process.
+    """
+    from benchmarks.fakeapi import FakeApiServer, FakeCluster
+    from benchmarks.scenarios import SCENARIOS
+    from chaosk8s import clear_k8s_api_client_cache
+
+    cluster = FakeCluster(pods=size)
+    with FakeApiServer(cluster, latency=latency) as server:
+        os.environ["KUBERNETES_HOST"] = server.url
+        os.environ["KUBECONFIG"] = os.path.join(
+            tempfile.gettempdir(), "chaosk8s-benchmarks-no-kubeconfig"
+        )
+        os.environ.pop("CHAOSTOOLKIT_IN_POD", None)
+        clear_k8s_api_client_cache()
+
+        started = time.perf_counter()
+        SCENARIOS[name](cluster)
+        elapsed = time.perf_counter() - started
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak //= 1024
+
+        return {
+            "scenario": name,
+            "size": size,
+            "latency": latency,
+            "wall_time": round(elapsed, 4),
+            "api_calls": sum(server.calls.values()),
+            "calls": dict(sorted(server.calls.items())),
+            "bytes_sent": server.bytes_sent,
+            "peak_rss_kb": peak,
+        }
+
+
+def run(names: List[str], sizes: List[int], latency: float) -> List[Dict]:
+    from benchmarks.imports import IMPORTS, time_import
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for name in names:
+        if name in IMPORTS:
+            result = time_import(name)
+            results.append(result)
+            print(_format(result), flush=True)
+
+    for size in sizes:
+        for name in names:
+            if name in IMPORTS:
+                continue
+            with ctx.Pool(1, maxtasksperchild=1) as pool:
+                result = pool.apply(run_one, (name, size, latency))
+            results.append(result)
+            print(_format(result), flush=True)
+    return results
+
+
+def compare(
+    results: List[Dict], baseline: List[Dict], threshold: float
+) -> List[str]:
+    """
+    Return a line for each result slower than its baseline by more than
+    `threshold`, as a ratio of the baseline wall time, or which now loads the
+    Kubernetes client when its baseline did not.
+    """
+    previous = {(b["scenario"], b["size"]): b for b in baseline}
+    regressions = []
+    for r in results:
+        b = previous.get((r["scenario"], r["size"]))
+        if not b or not b["wall_time"]:
+            continue
+        if r.get("kubernetes_loaded") and not b.get("kubernetes_loaded"):
+            regressions.append(
+                f"{r['scenario']} now imports the Kubernetes client"
+            )
+        ratio = r["wall_time"] / b["wall_time"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{r['scenario']} ({r['size']} pods) took "
+                f"{r['wall_time']:.3f}s, {ratio:.2f}x the baseline "
+                f"{b['wall_time']:.3f}s, with {r['api_calls']} API calls "
+                f"against {b['api_calls']}"
+            )
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    from benchmarks.imports import IMPORTS
+    from benchmarks.scenarios import SCENARIOS
+
+    known = list(IMPORTS) + list(SCENARIOS)
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__
+    )
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help="comma-separated cluster sizes, in pods (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(known),
+        help="comma-separated scenarios to run (default: all)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=DEFAULT_LATENCY,
+        help="seconds added to each API call (default: %(default)s)",
+    )
+    parser.add_argument("--output", help="save the results to this file")
+    parser.add_argument(
+        "--baseline", help="compare against results saved with --output"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown, as a ratio, reported as a regression "
+        "(default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.scenarios.split(",") if n.strip()]
+    unknown = set(names) - set(known)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    results = run(names, sizes, args.latency)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION: {line}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+def _format(result: Dict[str, Any]) -> str:
+    line = (
+        f"{result['scenario']:<28} {result['size']:>7} pods "
+        f"{result['wall_time']:>9.3f}s {result['api_calls']:>6} calls "
+        f"{result['bytes_sent'] / 1024 / 1024:>8.1f} MiB "
+        f"{result['peak_rss_kb'] / 1024:>8.1f} MiB RSS"
+    )
+    if "modules" in result:
+        line += f" {result['modules']:>6} modules"
+        if result["kubernetes_loaded"]:
+            line += " (kubernetes loaded)"
+    return line
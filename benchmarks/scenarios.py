@@ -0,0 +1,75 @@
+"""
+The activities timed by the benchmarks, each run against a fresh
+`FakeCluster`.
+"""
+
+from typing import Callable, Dict
+
+from kubernetes import client
+
+from benchmarks.fakeapi import FakeCluster
+from chaosk8s import create_k8s_api_client
+from chaosk8s.deployment import probes as deployment_probes
+from chaosk8s.event import probes as event_probes
+from chaosk8s.node import actions as node_actions
+from chaosk8s.pod import actions as pod_actions
+from chaosk8s.pod import probes as pod_probes
+
+__all__ = ["SCENARIOS", "scenario"]
+
+SCENARIOS: Dict[str, Callable[[FakeCluster], None]] = {}
+
+
+def scenario(name: str) -> Callable:
+    def register(func: Callable[[FakeCluster], None]) -> Callable:
+        SCENARIOS[name] = func
+        return func
+
+    return register
+
+
+@scenario("select_pods")
+def select_pods(cluster: FakeCluster) -> None:
+    v1 = client.CoreV1Api(create_k8s_api_client())
+    pod_actions._select_pods(
+        v1, label_selector="app=bench", name_pattern="7$", rand=True, qty=10
+    )
+
+
+@scenario("terminate_pods")
+def terminate_pods(cluster: FakeCluster) -> None:
+    pod_actions.terminate_pods(
+        label_selector="shard=0", all=True, max_concurrency=10
+    )
+
+
+@scenario("drain_nodes")
+def drain_nodes(cluster: FakeCluster) -> None:
+    node_actions.drain_nodes(name="node-0", timeout=120, max_concurrency=10)
+
+
+@scenario("read_pod_logs")
+def read_pod_logs(cluster: FakeCluster) -> None:
+    pod_probes.read_pod_logs(
+        label_selector="shard=0", tail_lines=100, max_concurrency=10
+    )
+
+
+@scenario("all_pods_healthy")
+def all_pods_healthy(cluster: FakeCluster) -> None:
+    pod_probes.all_pods_healthy()
+
+
+@scenario("count_pods")
+def count_pods(cluster: FakeCluster) -> None:
+    pod_probes.count_pods("app=bench", phase="Running")
+
+
+@scenario("deployment_fully_available")
+def deployment_fully_available(cluster: FakeCluster) -> None:
+    deployment_probes.deployment_fully_available("bench-0", timeout=30)
+
+
+@scenario("get_events")
+def get_events(cluster: FakeCluster) -> None:
+    event_probes.get_events(limit=cluster.events)
@@ -1,8 +1,11 @@
 import logging
 import os
 import os.path
+import threading
+import time
+from collections import OrderedDict
 from importlib.metadata import version, PackageNotFoundError
-from typing import List
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
 from chaoslib.discovery.discover import (
     discover_actions,
@@ -10,9 +13,22 @@ from chaoslib.discovery.discover import (
     initialize_discovery_result,
 )
 from chaoslib.types import DiscoveredActivities, Discovery, Secrets
-from kubernetes import client, config
 
-__all__ = ["create_k8s_api_client", "discover", "__version__"]
+from chaosk8s.instrumentation import instrument_requests
+from chaosk8s.lazy import lazy_import
+from chaosk8s.manifest import load_manifest
+from chaosk8s.ratelimit import limit_requests
+
+client = lazy_import("kubernetes.client")
+config = lazy_import("kubernetes.config")
+
+__all__ = [
+    "create_k8s_api_client",
+    "invalidate_k8s_api_client",
+    "clear_k8s_api_client_cache",
+    "discover",
+    "__version__",
+]
 try:
     __version__ = version("chaostoolkit-kubernetes")
 except PackageNotFoundError:
@@ -20,6 +36,56 @@ except PackageNotFoundError:
 
 logger = logging.getLogger("chaostoolkit")
 
+# modules whose exported functions are discovered, and how
+_ACTIVITY_MODULES = [
+    ("chaosk8s.actions", discover_actions),
+    ("chaosk8s.probes", discover_probes),
+    ("chaosk8s.daemonset.actions", discover_actions),
+    ("chaosk8s.daemonset.probes", discover_actions),
+    ("chaosk8s.deployment.actions", discover_actions),
+    ("chaosk8s.deployment.probes", discover_actions),
+    ("chaosk8s.namespace.actions", discover_actions),
+    ("chaosk8s.namespace.probes", discover_actions),
+    ("chaosk8s.networking.actions", discover_actions),
+    ("chaosk8s.networking.probes", discover_actions),
+    ("chaosk8s.node.actions", discover_actions),
+    ("chaosk8s.node.probes", discover_actions),
+    ("chaosk8s.pod.actions", discover_actions),
+    ("chaosk8s.pod.probes", discover_probes),
+    ("chaosk8s.replicaset.actions", discover_actions),
+    ("chaosk8s.service.actions", discover_actions),
+    ("chaosk8s.service.probes", discover_actions),
+    ("chaosk8s.secret.actions", discover_actions),
+    ("chaosk8s.secret.probes", discover_actions),
+    ("chaosk8s.statefulset.actions", discover_actions),
+    ("chaosk8s.statefulset.probes", discover_probes),
+    ("chaosk8s.crd.actions", discover_actions),
+    ("chaosk8s.crd.probes", discover_probes),
+    ("chaosk8s.chaosmesh.network.actions", discover_actions),
+    ("chaosk8s.chaosmesh.stress.actions", discover_actions),
+    ("chaosk8s.chaosmesh.network.probes", discover_probes),
+    ("chaosk8s.chaosmesh.stress.probes", discover_probes),
+    ("chaosk8s.event.probes", discover_probes),
+    ("chaosk8s.multicluster.actions", discover_actions),
+    ("chaosk8s.multicluster.probes", discover_probes),
+    ("chaosk8s.health.probes", discover_probes),
+]
+
+DEFAULT_CLIENT_CACHE_SIZE = 16
+DEFAULT_CLIENT_CACHE_TTL = 300
+
+# clients are keyed by the resolved credentials they were created with and
+# kept in LRU order so that the least recently used one is evicted first
+_client_cache: "OrderedDict[Tuple, Tuple[float, client.ApiClient]]" = (
+    OrderedDict()
+)
+_client_cache_lock = threading.RLock()
+# called with the key of each client invalidated, explicitly or because its
+# kubeconfig file was rewritten, so that what was started with the same
+# credentials can be stopped as well. Clients expiring or evicted from the
+# cache are not reported: their credentials still hold.
+_client_release_listeners: List[Callable[[Tuple], None]] = []
+
 
 def get_config_path() -> str:
     return os.path.expanduser(os.environ.get("KUBECONFIG", "~/.kube/config"))
@@ -30,7 +96,7 @@ def has_local_config_file(config_file: str = None):
     return os.path.exists(config_path)
 
 
-def create_k8s_api_client(secrets: Secrets = None) -> client.ApiClient:
+def create_k8s_api_client(secrets: Secrets = None) -> "client.ApiClient":
     """
     Create a Kubernetes client from:
 
@@ -63,7 +129,109 @@ def create_k8s_api_client(secrets: Secrets = None) -> client.ApiClient:
 
         You may pass a secrets dictionary, in which case, values will be looked
         there before the environ.
+
+    Clients are cached process-wide, keyed by the credentials they were
+    resolved from (config file path and modification time, context, host and
+    authentication material), so that repeated activities reuse the same
+    connection pool rather than parsing the configuration and negotiating a
+    new TLS session every time. Use `KUBERNETES_CLIENT_CACHE_TTL` to set how
+    long, in seconds, a client may be reused (defaults to 300, `0` disables
+    the cache) and `KUBERNETES_CLIENT_CACHE_SIZE` to bound how many clients
+    are kept around (defaults to 16).
+
+    Requests sent by a client are rate limited with a token bucket, as with
+    client-go: `KUBERNETES_BURST` requests may be sent at once (defaults to
+    300) and then `KUBERNETES_QPS` per second (defaults to 50, `0` disables
+    the limit).
+
+    Requests are also reported to the recorders of
+    `chaosk8s.instrumentation`, when any is registered.
+    """
+    ttl, size = _client_cache_settings(secrets)
+    if ttl <= 0 or size <= 0:
+        # loading a kubeconfig mutates the default client configuration
+        with _client_cache_lock:
+            return _build_instrumented_client(secrets)
+
+    key = _client_cache_key(secrets)
+    now = time.monotonic()
+    released = []
+
+    # loading a kubeconfig mutates the default client configuration, so
+    # building happens under the lock as well
+    with _client_cache_lock:
+        cached = _client_cache.get(key)
+        if cached is not None:
+            created, api = cached
+            if now - created < ttl:
+                _client_cache.move_to_end(key)
+                return api
+            logger.debug("Kubernetes client expired, creating a new one")
+            del _client_cache[key]
+
+        api = _build_instrumented_client(secrets)
+        # clients of a kubeconfig file that has since been rewritten would
+        # never be looked up again
+        for k in [k for k in _client_cache if _is_superseded(k, key)]:
+            del _client_cache[k]
+            released.append(k)
+        _client_cache[key] = (now, api)
+        while len(_client_cache) > size:
+            _client_cache.popitem(last=False)
+
+    _notify_client_released(released)
+    return api
+
+
+def invalidate_k8s_api_client(secrets: Secrets = None) -> bool:
+    """
+    Remove the cached client matching the given `secrets`, so the next call
+    to `create_k8s_api_client` resolves the credentials again. Returns `True`
+    when a client was indeed dropped from the cache.
+    """
+    key = _client_cache_key(secrets)
+    with _client_cache_lock:
+        dropped = _client_cache.pop(key, None) is not None
+
+    if dropped:
+        _notify_client_released([key])
+    return dropped
+
+
+def clear_k8s_api_client_cache() -> None:
+    """
+    Drop all the cached Kubernetes clients.
+    """
+    with _client_cache_lock:
+        released = list(_client_cache)
+        _client_cache.clear()
+
+    _notify_client_released(released)
+
+
+def discover(discover_system: bool = True) -> Discovery:
+    """
+    Discover Kubernetes capabilities offered by this extension.
     """
+    logger.info("Discovering capabilities from chaostoolkit-kubernetes")
+
+    discovery = initialize_discovery_result(
+        "chaostoolkit-kubernetes", __version__, "kubernetes"
+    )
+    discovery["activities"].extend(load_exported_activities())
+    return discovery
+
+
+###############################################################################
+# Private functions
+###############################################################################
+def _build_instrumented_client(secrets: Secrets = None) -> "client.ApiClient":
+    # instrumented first so that latencies leave client-side throttling out
+    api = instrument_requests(_build_k8s_api_client(secrets))
+    return limit_requests(api, secrets)
+
+
+def _build_k8s_api_client(secrets: Secrets = None) -> "client.ApiClient":
     env = os.environ
     secrets = secrets or {}
 
@@ -141,55 +309,118 @@ def create_k8s_api_client(secrets: Secrets = None) -> client.ApiClient:
     return client.ApiClient(configuration)
 
 
-def discover(discover_system: bool = True) -> Discovery:
+def _client_cache_settings(secrets: Secrets = None) -> Tuple[float, int]:
+    secrets = secrets or {}
+
+    def lookup(k: str, d: Any) -> Any:
+        return secrets.get(k, os.environ.get(k, d))
+
+    try:
+        ttl = float(
+            lookup("KUBERNETES_CLIENT_CACHE_TTL", DEFAULT_CLIENT_CACHE_TTL)
+        )
+        size = int(
+            lookup("KUBERNETES_CLIENT_CACHE_SIZE", DEFAULT_CLIENT_CACHE_SIZE)
+        )
+    except (TypeError, ValueError):
+        logger.debug("Invalid client cache settings, disabling the cache")
+        return 0, 0
+
+    return ttl, size
+
+
+def _client_cache_key(secrets: Secrets = None) -> Tuple:
     """
-    Discover Kubernetes capabilities offered by this extension.
+    Compute the cache key of a client from the same inputs
+    `_build_k8s_api_client` resolves its configuration from.
     """
-    logger.info("Discovering capabilities from chaostoolkit-kubernetes")
+    env = os.environ
+    secrets = secrets or {}
 
-    discovery = initialize_discovery_result(
-        "chaostoolkit-kubernetes", __version__, "kubernetes"
+    def lookup(k: str, d: str = None) -> str:
+        return secrets.get(k, env.get(k, d))
+
+    common = (
+        lookup("KUBERNETES_VERIFY_SSL", False) is not False,
+        lookup("KUBERNETES_DEBUG", False) is not False,
+        lookup("KUBERNETES_QPS"),
+        lookup("KUBERNETES_BURST"),
+        os.getenv("HTTP_PROXY", None),
+        os.getenv("NO_PROXY", None),
     )
-    discovery["activities"].extend(load_exported_activities())
-    return discovery
 
+    config_file = get_config_path()
+    if has_local_config_file(config_file):
+        return (
+            "kubeconfig",
+            config_file,
+            _file_mtime(config_file),
+            lookup("KUBERNETES_CONTEXT"),
+        ) + common
+    elif env.get("CHAOSTOOLKIT_IN_POD") == "true":
+        return ("incluster",) + common
+
+    return (
+        "environ",
+        lookup("KUBERNETES_HOST", "http://localhost"),
+        lookup("KUBERNETES_CA_CERT_FILE"),
+        lookup("KUBERNETES_API_KEY"),
+        lookup("KUBERNETES_API_KEY_PREFIX", "Bearer"),
+        lookup("KUBERNETES_CERT_FILE"),
+        lookup("KUBERNETES_KEY_FILE"),
+        lookup("KUBERNETES_USERNAME"),
+        lookup("KUBERNETES_PASSWORD", ""),
+    ) + common
+
+
+def _is_superseded(key: Tuple, by: Tuple) -> bool:
+    """
+    Tell whether the client cache `key` was computed from an earlier version
+    of the same kubeconfig file and context as `by`.
+    """
+    return (
+        key[0] == by[0] == "kubeconfig"
+        and key[1] == by[1]
+        and key[3:] == by[3:]
+        and key[2] != by[2]
+    )
 
-###############################################################################
-# Private functions
-###############################################################################
-def load_exported_activities() -> List[DiscoveredActivities]:
+
+def _notify_client_released(keys: Iterable[Tuple]) -> None:
+    # listeners may take locks of their own, so they are never called while
+    # the client cache lock is held
+    for key in keys:
+        for listener in list(_client_release_listeners):
+            try:
+                listener(key)
+            except Exception:
+                logger.debug("Failed releasing a client", exc_info=True)
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def load_exported_activities(
+    use_manifest: bool = True,
+) -> List[DiscoveredActivities]:
     """
     Extract metadata from actions and probes exposed by this extension.
+
+    Unless `use_manifest` is disabled, they are read from the manifest built
+    with the package, if it matches its version, rather than introspected.
     """
+    if use_manifest:
+        activities = load_manifest(__version__)
+        if activities is not None:
+            return activities
+
     activities = []
-    activities.extend(discover_actions("chaosk8s.actions"))
-    activities.extend(discover_probes("chaosk8s.probes"))
-    activities.extend(discover_actions("chaosk8s.daemonset.actions"))
-    activities.extend(discover_actions("chaosk8s.daemonset.probes"))
-    activities.extend(discover_actions("chaosk8s.deployment.actions"))
-    activities.extend(discover_actions("chaosk8s.deployment.probes"))
-    activities.extend(discover_actions("chaosk8s.namespace.actions"))
-    activities.extend(discover_actions("chaosk8s.namespace.probes"))
-    activities.extend(discover_actions("chaosk8s.networking.actions"))
-    activities.extend(discover_actions("chaosk8s.networking.probes"))
-    activities.extend(discover_actions("chaosk8s.node.actions"))
-    activities.extend(discover_actions("chaosk8s.node.probes"))
-    activities.extend(discover_actions("chaosk8s.pod.actions"))
-    activities.extend(discover_probes("chaosk8s.pod.probes"))
-    activities.extend(discover_actions("chaosk8s.replicaset.actions"))
-    activities.extend(discover_actions("chaosk8s.service.actions"))
-    activities.extend(discover_actions("chaosk8s.service.probes"))
-    activities.extend(discover_actions("chaosk8s.secret.actions"))
-    activities.extend(discover_actions("chaosk8s.secret.probes"))
-    activities.extend(discover_actions("chaosk8s.statefulset.actions"))
-    activities.extend(discover_probes("chaosk8s.statefulset.probes"))
-    activities.extend(discover_actions("chaosk8s.crd.actions"))
-    activities.extend(discover_probes("chaosk8s.crd.probes"))
-    activities.extend(discover_actions("chaosk8s.chaosmesh.network.actions"))
-    activities.extend(discover_actions("chaosk8s.chaosmesh.stress.actions"))
-    activities.extend(discover_probes("chaosk8s.chaosmesh.network.probes"))
-    activities.extend(discover_probes("chaosk8s.chaosmesh.stress.probes"))
-    activities.extend(discover_probes("chaosk8s.event.probes"))
+    for module, discover_activities in _ACTIVITY_MODULES:
+        activities.extend(discover_activities(module))
     return activities
 
 
@@ -60,6 +60,6 @@ def kill_microservice(
     _log_deprecated(
         "kill_microservice", "delete_deployment/delete_replica_set/delete_pods"
     )
-    delete_deployment(name, ns, label_selector, secrets)
-    delete_replica_set(name, ns, label_selector, secrets)
+    delete_deployment(name, ns, label_selector, secrets=secrets)
+    delete_replica_set(name, ns, label_selector, secrets=secrets)
     delete_pods(name, ns, label_selector, secrets)
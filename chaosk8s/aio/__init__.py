@@ -0,0 +1,299 @@
+"""
+Asynchronous equivalents of the activities of the extension.
+
+`chaosk8s.aio.<kind>.actions` and `chaosk8s.aio.<kind>.probes` expose, under
+the same names and with the same arguments, coroutine functions for the
+activities of `chaosk8s.<kind>.actions` and `chaosk8s.<kind>.probes`, for the
+pod, node, deployment, statefulset, daemonset and crd kinds:
+
+```python
+from chaosk8s.aio import close_k8s_api_clients
+from chaosk8s.aio.pod.probes import count_pods
+
+counts = await asyncio.gather(
+    *[count_pods(label_selector=s, ns="default") for s in selectors]
+)
+await close_k8s_api_clients()
+```
+
+They are built on the asynchronous Kubernetes client, `kubernetes_asyncio`,
+installed with the `aio` extra of this package. Requests are sent from the
+event loop awaiting them, over one HTTP session per event loop and set of
+credentials, so concurrent activities hold no thread of their own and are
+only bounded by the `KUBERNETES_AIO_MAX_CONNECTIONS` connections of that
+session (defaults to `1000`).
+
+Clients are configured from the same settings as
+`chaosk8s.create_k8s_api_client`, their requests are rate limited by the
+same `KUBERNETES_QPS` and `KUBERNETES_BURST` and reported to the recorders
+of `chaosk8s.instrumentation`. The informer cache is not read from.
+
+Sessions are bound to their event loop and must be closed before it is,
+with `close_k8s_api_clients`.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import time
+import weakref
+from typing import Any, Dict, Tuple
+
+from chaoslib.types import Secrets
+
+from chaosk8s import _client_cache_key, get_config_path
+from chaosk8s import instrumentation
+from chaosk8s.lazy import lazy_import
+from chaosk8s.ratelimit import (
+    THROTTLING_LOG_THRESHOLD,
+    TokenBucket,
+    _rate_limit_settings,
+)
+
+client = lazy_import("kubernetes_asyncio.client")
+config = lazy_import("kubernetes_asyncio.config")
+rest = lazy_import("kubernetes_asyncio.client.rest")
+
+__all__ = [
+    "create_k8s_api_client",
+    "close_k8s_api_clients",
+    "throttle",
+    "DEFAULT_MAX_CONNECTIONS",
+]
+logger = logging.getLogger("chaostoolkit")
+
+DEFAULT_MAX_CONNECTIONS = 1000
+
+
+async def create_k8s_api_client(secrets: Secrets = None) -> "client.ApiClient":
+    """
+    Return the asynchronous Kubernetes client of the running event loop for
+    the credentials resolved from `secrets` and the environment, as
+    `chaosk8s.create_k8s_api_client` does, creating it on first use.
+
+    Clients are kept until `close_k8s_api_clients` is awaited, so all the
+    activities of the loop share the connections of their session.
+    """
+    if importlib.util.find_spec("kubernetes_asyncio") is None:
+        raise ImportError(
+            "chaosk8s.aio requires kubernetes_asyncio, install it with the "
+            "'aio' extra of chaostoolkit-kubernetes"
+        )
+
+    key = _client_cache_key(secrets)
+    clients = _loop_clients()
+    api = clients.apis.get(key)
+    if api is not None:
+        return api
+
+    async with clients.lock:
+        api = clients.apis.get(key)
+        if api is None:
+            api = await _build_k8s_api_client(key, secrets)
+            _instrument_requests(api)
+            _limit_requests(api, secrets)
+            clients.apis[key] = api
+
+    return api
+
+
+async def close_k8s_api_clients() -> None:
+    """
+    Close the sessions of the clients of the running event loop. The next
+    activity creates new ones.
+    """
+    clients = _loop_clients()
+    async with clients.lock:
+        apis = list(clients.apis.values())
+        clients.apis.clear()
+
+    for api in apis:
+        try:
+            await api.close()
+        except Exception:
+            logger.debug("Failed closing a Kubernetes client", exc_info=True)
+
+
+async def throttle(api: "client.ApiClient") -> float:
+    """
+    Wait for a token of the bucket limiting the requests of the client `api`
+    and return how long, in seconds, that took. This is meant for requests
+    which bypass its REST client, such as websocket upgrades.
+    """
+    bucket = getattr(api.rest_client.request, "bucket", None)
+    if not isinstance(bucket, TokenBucket):
+        return 0.0
+
+    delay = bucket.reserve()
+    if delay > 0:
+        await asyncio.sleep(delay)
+    return delay
+
+
+###############################################################################
+# Private functions
+###############################################################################
+class _LoopClients:
+    """
+    Clients of an event loop, keyed by their credentials.
+    """
+
+    def __init__(self) -> None:
+        self.apis: Dict[Tuple, "client.ApiClient"] = {}
+        self.lock = asyncio.Lock()
+
+
+# dropped along with their event loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = weakref.WeakKeyDictionary()  # noqa: E501
+
+
+def _loop_clients() -> _LoopClients:
+    loop = asyncio.get_running_loop()
+    clients = _clients.get(loop)
+    if clients is None:
+        clients = _clients[loop] = _LoopClients()
+    return clients
+
+
+async def _build_k8s_api_client(
+    key: Tuple, secrets: Secrets = None
+) -> "client.ApiClient":
+    env = os.environ
+    secrets = secrets or {}
+
+    def lookup(k: str, d: str = None) -> str:
+        return secrets.get(k, env.get(k, d))
+
+    configuration = client.Configuration()
+
+    # the key tells which of the sources the credentials were resolved from
+    if key[0] == "kubeconfig":
+        config_file = get_config_path()
+        context = lookup("KUBERNETES_CONTEXT")
+        logger.debug(
+            f"Using Kubernetes context '{context or 'default'}' "
+            f"from config '{config_file}'"
+        )
+        await config.load_kube_config(
+            config_file=config_file,
+            context=context,
+            client_configuration=configuration,
+            persist_config=False,
+        )
+    elif key[0] == "incluster":
+        config.load_incluster_config(client_configuration=configuration)
+    else:
+        configuration.host = lookup("KUBERNETES_HOST", "http://localhost")
+        configuration.verify_ssl = (
+            lookup("KUBERNETES_VERIFY_SSL", False) is not False
+        )
+        configuration.ssl_ca_cert = lookup("KUBERNETES_CA_CERT_FILE")
+
+        if "KUBERNETES_API_KEY" in env or "KUBERNETES_API_KEY" in secrets:
+            configuration.api_key["authorization"] = lookup(
+                "KUBERNETES_API_KEY"
+            )
+            configuration.api_key_prefix["authorization"] = lookup(
+                "KUBERNETES_API_KEY_PREFIX", "Bearer"
+            )
+        elif "KUBERNETES_CERT_FILE" in env or "KUBERNETES_CERT_FILE" in secrets:
+            configuration.cert_file = lookup("KUBERNETES_CERT_FILE")
+            configuration.key_file = lookup("KUBERNETES_KEY_FILE")
+        elif "KUBERNETES_USERNAME" in env or "KUBERNETES_USERNAME" in secrets:
+            configuration.username = lookup("KUBERNETES_USERNAME")
+            configuration.password = lookup("KUBERNETES_PASSWORD", "")
+
+    configuration.debug = lookup("KUBERNETES_DEBUG", False) is not False
+    # proxies are read from the environment by the session itself
+    configuration.connection_pool_maxsize = _max_connections(secrets)
+
+    return client.ApiClient(configuration)
+
+
+def _max_connections(secrets: Secrets = None) -> int:
+    value = (secrets or {}).get(
+        "KUBERNETES_AIO_MAX_CONNECTIONS",
+        os.environ.get(
+            "KUBERNETES_AIO_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS
+        ),
+    )
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        logger.debug("Invalid KUBERNETES_AIO_MAX_CONNECTIONS, using default")
+        return DEFAULT_MAX_CONNECTIONS
+
+
+def _instrument_requests(api: "client.ApiClient") -> "client.ApiClient":
+    """
+    Report every request sent by the client `api` to the recorders of
+    `chaosk8s.instrumentation`, as `instrument_requests` does for the
+    blocking client.
+    """
+    request = api.rest_client.request
+
+    async def instrumented_request(
+        method: str, url: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        if not instrumentation._recorders:
+            return await request(method, url, *args, **kwargs)
+
+        query = kwargs.get("query_params", args[0] if args else None)
+        verb, resource = instrumentation._describe_request(method, url, query)
+        started = time.perf_counter()
+        try:
+            response = await request(method, url, *args, **kwargs)
+        except rest.ApiException as x:
+            instrumentation._record(
+                verb, resource, x.status or 0, started, x.body, None
+            )
+            raise
+        except Exception:
+            instrumentation._record(verb, resource, 0, started, None, None)
+            raise
+
+        # streamed responses have not been read yet, their size is unknown
+        instrumentation._record(
+            verb,
+            resource,
+            response.status,
+            started,
+            getattr(response, "data", None),
+            None,
+        )
+        return response
+
+    api.rest_client.request = instrumented_request
+    return api
+
+
+def _limit_requests(
+    api: "client.ApiClient", secrets: Secrets = None
+) -> "client.ApiClient":
+    """
+    Make every request sent by the client `api` wait, without blocking the
+    event loop, for a token of a bucket configured as `limit_requests` does
+    for the blocking client.
+    """
+    qps, burst = _rate_limit_settings(secrets)
+    if qps <= 0:
+        return api
+
+    bucket = TokenBucket(qps, burst)
+    request = api.rest_client.request
+
+    async def limited_request(*args: Any, **kwargs: Any) -> Any:
+        delay = bucket.reserve()
+        if delay > 0:
+            if delay > THROTTLING_LOG_THRESHOLD:
+                logger.debug(
+                    f"Waiting {delay:.2f}s due to client-side throttling, "
+                    f"not priority and fairness"
+                )
+            await asyncio.sleep(delay)
+        return await request(*args, **kwargs)
+
+    limited_request.bucket = bucket
+    api.rest_client.request = limited_request
+    return api
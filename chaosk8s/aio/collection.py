@@ -0,0 +1,42 @@
+"""
+Server-side deletion of collections of namespaced resources with the
+asynchronous client.
+
+Counterpart of `chaosk8s.collection`.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, List
+
+from chaosk8s.aio.views import read_json
+from chaosk8s.collection import _deleted_names, _deletion_selectors
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes_asyncio.client")
+
+__all__ = ["delete_namespaced_collection"]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def delete_namespaced_collection(
+    delete_func: Callable[..., Awaitable[Any]],
+    ns: str = "default",
+    name: str = None,
+    label_selector: str = None,
+) -> List[str]:
+    """
+    Await a `delete_collection_namespaced_*` client method, such as
+    `AppsV1Api.delete_collection_namespaced_deployment`, to delete the
+    object named `name` or, when no name is given, those matching
+    `label_selector` in the namespace `ns`. With neither, all the objects of
+    that kind in the namespace are deleted.
+
+    Returns the names of the deleted objects.
+    """
+    resp = await delete_func(
+        ns,
+        body=client.V1DeleteOptions(),
+        _preload_content=False,
+        **_deletion_selectors(name, label_selector),
+    )
+    return _deleted_names(await read_json(resp), ns)
@@ -0,0 +1,86 @@
+"""
+Helpers to fan Kubernetes API calls out over concurrent tasks.
+
+Counterpart of `chaosk8s.concurrency` for coroutine functions: rather than
+a pool of threads, calls are tasks of the running event loop, at most
+`max_concurrency` of them awaiting the API server at once.
+
+The few blocking calls shared with the synchronous activities, such as
+reading a spec file, are run off the loop with `run_blocking`.
+"""
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+__all__ = ["fan_out", "run_blocking"]
+logger = logging.getLogger("chaostoolkit")
+
+T = TypeVar("T")
+
+
+async def fan_out(
+    func: Callable[[T], Awaitable[Any]],
+    items: Iterable[T],
+    max_concurrency: int = 1,
+) -> AsyncIterator[Tuple[T, Any, Optional[BaseException]]]:
+    """
+    Await `func` on each of the `items` with at most `max_concurrency` calls
+    in flight, and yield an `(item, result, error)` tuple as soon as each
+    call completes. `error` is the exception the call raised, if any, in
+    which case `result` is `None`.
+
+    With a `max_concurrency` of one or less, calls are awaited one after the
+    other and results are yielded in order. Calls still running once the
+    generator is closed are cancelled.
+    """
+    items = list(items)
+    if not items:
+        return
+
+    if max_concurrency is None or max_concurrency <= 1 or len(items) == 1:
+        for item in items:
+            try:
+                yield item, await func(item), None
+            except Exception as x:
+                yield item, None, x
+        return
+
+    logger.debug(
+        f"Running {len(items)} calls, {min(max_concurrency, len(items))} "
+        "at a time"
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(item: T) -> Tuple[T, Any, Optional[BaseException]]:
+        async with semaphore:
+            try:
+                return item, await func(item), None
+            except Exception as x:
+                return item, None, x
+
+    tasks = [asyncio.ensure_future(call(item)) for item in items]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            yield await completed
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """
+    Call the blocking `func` with `args` in the default executor of the
+    running loop, so that other coroutines are not held up meanwhile.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
@@ -0,0 +1,338 @@
+import json
+import logging
+from typing import Any, Dict
+
+import yaml
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.concurrency import run_blocking
+from chaosk8s.aio.views import read_json
+from chaosk8s.crd.actions import _custom_object_target, load_body
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes_asyncio.client")
+rest = lazy_import("kubernetes_asyncio.client.rest")
+
+__all__ = [
+    "create_custom_object",
+    "delete_custom_object",
+    "create_cluster_custom_object",
+    "delete_cluster_custom_object",
+    "patch_custom_object",
+    "replace_custom_object",
+    "patch_cluster_custom_object",
+    "replace_cluster_custom_object",
+    "apply_from_json",
+    "apply_from_yaml",
+]
+logger = logging.getLogger("chaostoolkit")
+
+# unlike the blocking client, the asynchronous one is told the content type
+# of each patch, so the shared client is used for JSON Patch documents too
+JSON_PATCH_CONTENT_TYPE = "application/json-patch+json"
+
+
+async def apply_from_json(
+    resource: str = None, secrets: Secrets = None
+) -> Dict[str, Any]:
+    """
+    Apply the given custom resource, given as a JSON string, to the cluster.
+    """
+    group, version, plural, ns = _custom_object_target(json.loads(resource))
+
+    return await create_custom_object(
+        group, version, plural, ns, resource, secrets=secrets
+    )
+
+
+async def apply_from_yaml(
+    resource: str = None, secrets: Secrets = None
+) -> Dict[str, Any]:
+    """
+    Apply the given custom resource, given as a YAML string, to the cluster.
+    """
+    group, version, plural, ns = _custom_object_target(yaml.safe_load(resource))
+
+    return await create_custom_object(
+        group, version, plural, ns, resource, secrets=secrets
+    )
+
+
+async def create_custom_object(
+    group: str,
+    version: str,
+    plural: str,
+    ns: str = "default",
+    resource: Dict[str, Any] = None,
+    resource_as_yaml_file: str = None,
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Create a custom object in the given namespace. Its custom resource
+    definition must already exists or this will fail with a 404.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+    body = await run_blocking(load_body, resource, resource_as_yaml_file)
+
+    try:
+        r = await api.create_namespaced_custom_object(
+            group, version, ns, plural, body, _preload_content=False
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        if x.status == 409:
+            logger.debug(
+                f"Custom resource object {group}/{version} already exists"
+            )
+            return json.loads(x.body)
+        else:
+            raise ActivityFailed(
+                f"Failed to create custom resource object: '{x.reason}' {x.body}"
+            )
+
+
+async def delete_custom_object(
+    group: str,
+    version: str,
+    plural: str,
+    name: str,
+    ns: str = "default",
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Create a custom object cluster wide. Its custom resource
+    definition must already exists or this will fail with a 404.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+
+    try:
+        r = await api.delete_namespaced_custom_object(
+            group, version, ns, plural, name, _preload_content=False
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to delete custom resource object: '{x.reason}' {x.body}"
+        )
+
+
+async def create_cluster_custom_object(
+    group: str,
+    version: str,
+    plural: str,
+    resource: Dict[str, Any] = None,
+    resource_as_yaml_file: str = None,
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Delete a custom object in the given namespace.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+    body = await run_blocking(load_body, resource, resource_as_yaml_file)
+
+    try:
+        r = await api.create_cluster_custom_object(
+            group, version, plural, body, _preload_content=False
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        if x.status == 409:
+            logger.debug(
+                f"Custom resource object {group}/{version} already exists"
+            )
+            return json.loads(x.body)
+        else:
+            raise ActivityFailed(
+                f"Failed to create custom resource object: '{x.reason}' {x.body}"
+            )
+
+
+async def delete_cluster_custom_object(
+    group: str, version: str, plural: str, name: str, secrets: Secrets = None
+) -> Dict[str, Any]:
+    """
+    Delete a custom object cluster wide.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+
+    try:
+        r = await api.delete_cluster_custom_object(
+            group, version, plural, name, _preload_content=False
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to delete custom resource object: '{x.reason}' {x.body}"
+        )
+
+
+async def patch_custom_object(
+    group: str,
+    version: str,
+    plural: str,
+    name: str,
+    ns: str = "default",
+    force: bool = False,
+    resource: Dict[str, Any] = None,
+    resource_as_yaml_file: str = None,
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Patch a custom object in the given namespace. The resource must be the
+    updated version to apply. Force will re-acquire conflicting fields
+    owned by others.
+
+    The resource, or resource_as_yaml_file, must be a JSON Patch document.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+    body = await run_blocking(load_body, resource, resource_as_yaml_file)
+
+    try:
+        r = await api.patch_namespaced_custom_object(
+            group,
+            version,
+            ns,
+            plural,
+            name,
+            body,
+            _content_type=JSON_PATCH_CONTENT_TYPE,
+            _preload_content=False,
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to patch custom resource object: '{x.reason}' {x.body}"
+        )
+
+
+async def replace_custom_object(
+    group: str,
+    version: str,
+    plural: str,
+    name: str,
+    ns: str = "default",
+    force: bool = False,
+    resource: Dict[str, Any] = None,
+    resource_as_yaml_file: str = None,
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Replace a custom object in the given namespace. The resource must be the
+    new version to apply.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+    body = await run_blocking(load_body, resource, resource_as_yaml_file)
+
+    try:
+        r = await api.replace_namespaced_custom_object(
+            group,
+            version,
+            ns,
+            plural,
+            name,
+            body,
+            force=force,
+            _preload_content=False,
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to replace custom resource object: '{x.reason}' {x.body}"
+        )
+
+
+async def patch_cluster_custom_object(
+    group: str,
+    version: str,
+    plural: str,
+    name: str,
+    force: bool = False,
+    resource: Dict[str, Any] = None,
+    resource_as_yaml_file: str = None,
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Patch a custom object cluster-wide. The resource must be the
+    updated version to apply. Force will re-acquire conflicting fields
+    owned by others.
+
+    The resource, or resource_as_yaml_file, must be a JSON Patch document.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+    body = await run_blocking(load_body, resource, resource_as_yaml_file)
+
+    try:
+        r = await api.patch_cluster_custom_object(
+            group,
+            version,
+            plural,
+            name,
+            body,
+            _content_type=JSON_PATCH_CONTENT_TYPE,
+            _preload_content=False,
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to patch custom resource object: '{x.reason}' {x.body}"
+        )
+
+
+async def replace_cluster_custom_object(
+    group: str,
+    version: str,
+    plural: str,
+    name: str,
+    force: bool = False,
+    resource: Dict[str, Any] = None,
+    resource_as_yaml_file: str = None,
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Replace a custom object in the given namespace. The resource must be the
+    new version to apply.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+    body = await run_blocking(load_body, resource, resource_as_yaml_file)
+
+    try:
+        r = await api.replace_cluster_custom_object(
+            group,
+            version,
+            plural,
+            name,
+            body,
+            force=force,
+            _preload_content=False,
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to replace custom resource object: '{x.reason}' {x.body}"
+        )
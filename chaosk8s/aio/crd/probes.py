@@ -0,0 +1,115 @@
+from typing import Any, Dict, List
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.views import read_json
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes_asyncio.client")
+rest = lazy_import("kubernetes_asyncio.client.rest")
+
+__all__ = [
+    "get_custom_object",
+    "get_cluster_custom_object",
+    "list_custom_objects",
+    "list_cluster_custom_objects",
+]
+
+
+async def get_custom_object(
+    group: str,
+    version: str,
+    plural: str,
+    name: str,
+    ns: str = "default",
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Get a custom object in the given namespace.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+
+    try:
+        r = await api.get_namespaced_custom_object(
+            group, version, ns, plural, name, _preload_content=False
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to create custom resource object: '{x.reason}' {x.body}"
+        )
+
+
+async def list_custom_objects(
+    group: str,
+    version: str,
+    plural: str,
+    ns: str = "default",
+    secrets: Secrets = None,
+) -> List[Dict[str, Any]]:
+    """
+    List custom objects in the given namespace.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+
+    try:
+        r = await api.list_namespaced_custom_object(
+            group, version, ns, plural, _preload_content=False
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to create custom resource object: '{x.reason}' {x.body}"
+        )
+
+
+async def get_cluster_custom_object(
+    group: str, version: str, plural: str, name: str, secrets: Secrets = None
+) -> Dict[str, Any]:
+    """
+    Get a custom object cluster-wide.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+
+    try:
+        r = await api.get_cluster_custom_object(
+            group, version, plural, name, _preload_content=False
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to create custom resource object: '{x.reason}' {x.body}"
+        )
+
+
+async def list_cluster_custom_objects(
+    group: str, version: str, plural: str, secrets: Secrets = None
+) -> List[Dict[str, Any]]:
+    """
+    List custom objects cluster-wide.
+
+    Read more about custom resources here:
+    https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
+    """  # noqa: E501
+    api = client.CustomObjectsApi(await create_k8s_api_client(secrets))
+
+    try:
+        r = await api.list_cluster_custom_object(
+            group, version, plural, _preload_content=False
+        )
+        return await read_json(r)
+    except rest.ApiException as x:
+        raise ActivityFailed(
+            f"Failed to create custom resource object: '{x.reason}' {x.body}"
+        )
@@ -0,0 +1,95 @@
+import logging
+from typing import List
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.collection import delete_namespaced_collection
+from chaosk8s.aio.concurrency import run_blocking
+from chaosk8s.collection import _deletion_selectors
+from chaosk8s.lazy import lazy_import
+from chaosk8s.spec import load_spec
+
+client = lazy_import("kubernetes_asyncio.client")
+rest = lazy_import("kubernetes_asyncio.client.rest")
+
+__all__ = [
+    "create_daemon_set",
+    "delete_daemon_set",
+    "update_daemon_set",
+]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def create_daemon_set(
+    spec_path: str, ns: str = "default", secrets: Secrets = None
+):
+    """
+    Create a daemon set described by the daemon set spec, which must be the
+    path to the JSON or YAML representation of the daemon_set.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    daemon_set = await run_blocking(load_spec, spec_path)
+
+    v1 = client.AppsV1Api(api)
+    _ = await v1.create_namespaced_daemon_set(ns, body=daemon_set)
+
+
+async def delete_daemon_set(
+    name: str = None,
+    ns: str = "default",
+    label_selector: str = None,
+    delete_collection: bool = False,
+    secrets: Secrets = None,
+) -> List[str]:
+    """
+    Delete a daemon set by `name` or `label_selector` in the namespace `ns`.
+
+    The daemon set is deleted without a graceful period to trigger an abrupt
+    termination.
+
+    If neither `name` nor `label_selector` is specified, all the daemon sets
+    will be deleted in the namespace.
+
+    Set `delete_collection` to `True` to delete all the matching daemon sets
+    through a single request to the API server rather than one per daemon set.
+
+    Returns the names of the deleted daemon sets.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.AppsV1Api(api)
+
+    if delete_collection:
+        return await delete_namespaced_collection(
+            v1.delete_collection_namespaced_daemon_set, ns, name, label_selector
+        )
+
+    ret = await v1.list_namespaced_daemon_set(
+        ns, **_deletion_selectors(name, label_selector)
+    )
+
+    logger.debug(f"Found {len(ret.items)} daemon sets named '{name}'")
+
+    body = client.V1DeleteOptions()
+    for d in ret.items:
+        await v1.delete_namespaced_daemon_set(d.metadata.name, ns, body=body)
+
+    return [d.metadata.name for d in ret.items]
+
+
+async def update_daemon_set(
+    name: str, spec: dict, ns: str = "default", secrets: Secrets = None
+):
+    """
+    Update the specification of the targeted daemon set according to spec.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.AppsV1Api(api)
+    try:
+        await v1.patch_namespaced_daemon_set(name=name, namespace=ns, body=spec)
+    except rest.ApiException as e:
+        raise ActivityFailed(f"failed to update daemon set '{name}': {str(e)}")
@@ -0,0 +1,156 @@
+import logging
+from typing import Any, List
+
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.waiter import wait_for
+from chaosk8s.daemonset.probes import (
+    _daemon_set_available,
+    _daemon_set_partially_available,
+    _daemon_set_readiness_target,
+)
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes_asyncio.client")
+
+__all__ = [
+    "daemon_set_available_and_healthy",
+    "daemon_set_not_fully_available",
+    "daemon_set_fully_available",
+    "daemon_set_partially_available",
+]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def daemon_set_available_and_healthy(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Lookup a daemon set by `name` in the namespace `ns`.
+
+    The selected resources are matched by the given `label_selector`.
+
+    Return `True` if daemon set is available, otherwise `False`.
+
+    """
+    daemon_sets = await _list_daemon_sets(name, ns, label_selector, secrets)
+
+    return _daemon_set_available(name, daemon_sets)
+
+
+async def daemon_set_partially_available(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Check whether if the given daemon set state is ready or at-least partially
+    ready. Return `True` if dameon set is partially available, otherwise `False`
+    """
+    daemon_sets = await _list_daemon_sets(name, ns, label_selector, secrets)
+
+    return _daemon_set_partially_available(name, daemon_sets)
+
+
+async def daemon_set_not_fully_available(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Wait until the daemon set gets into an intermediate state where not all
+    expected replicas are available. Once this state is reached, return `True`.
+    If the state is not reached after `timeout` seconds, return `False`.
+    """
+    if await _daemon_set_readiness_has_state(
+        name,
+        False,
+        ns,
+        label_selector,
+        timeout,
+        secrets,
+    ):
+        return True
+    else:
+        logger.debug(
+            f"daemon set '{name}' failed to stop running within {timeout}s"
+        )
+        return False
+
+
+async def daemon_set_fully_available(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Wait until all the daemon set expected replicas are available.
+    Once this state is reached, return `True`.
+    If the state is not reached after `timeout` seconds, return `False`
+    """
+    if await _daemon_set_readiness_has_state(
+        name,
+        True,
+        ns,
+        label_selector,
+        timeout,
+        secrets,
+    ):
+        return True
+    else:
+        logger.debug(f"daemon set '{name}' failed to recover within {timeout}s")
+        return False
+
+
+###############################################################################
+# Internals
+###############################################################################
+async def _list_daemon_sets(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    secrets: Secrets = None,
+) -> List[Any]:
+    field_selector = f"metadata.name={name}"
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.AppsV1Api(api)
+    if label_selector:
+        ret = await v1.list_namespaced_daemon_set(
+            ns, field_selector=field_selector, label_selector=label_selector
+        )
+    else:
+        ret = await v1.list_namespaced_daemon_set(
+            ns, field_selector=field_selector
+        )
+
+    logger.debug(
+        f"Found {len(ret.items)} daemon_set(s) named '{name}' in ns '{ns}'"
+    )
+    return ret.items
+
+
+async def _daemon_set_readiness_has_state(
+    name: str,
+    ready: bool,
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Check wether if the given daemon_set state is ready or not
+    according to the ready paramter.
+    Return `False` if the state is not reached after `timeout` seconds.
+    """
+    target = _daemon_set_readiness_target(name, ready, ns, label_selector)
+    return await wait_for([target], timeout=timeout, secrets=secrets)
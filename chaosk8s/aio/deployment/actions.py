@@ -0,0 +1,132 @@
+import datetime
+import logging
+from typing import List
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.collection import delete_namespaced_collection
+from chaosk8s.aio.concurrency import run_blocking
+from chaosk8s.collection import _deletion_selectors
+from chaosk8s.lazy import lazy_import
+from chaosk8s.spec import load_spec
+
+client = lazy_import("kubernetes_asyncio.client")
+rest = lazy_import("kubernetes_asyncio.client.rest")
+
+__all__ = [
+    "create_deployment",
+    "delete_deployment",
+    "scale_deployment",
+    "rollout_deployment",
+]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def create_deployment(
+    spec_path: str, ns: str = "default", secrets: Secrets = None
+):
+    """
+    Create a deployment described by the deployment config, which must be the
+    path to the JSON or YAML representation of the deployment.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    deployment = await run_blocking(load_spec, spec_path)
+
+    v1 = client.AppsV1Api(api)
+    _ = await v1.create_namespaced_deployment(ns, body=deployment)
+
+
+async def delete_deployment(
+    name: str = None,
+    ns: str = "default",
+    label_selector: str = None,
+    delete_collection: bool = False,
+    secrets: Secrets = None,
+) -> List[str]:
+    """
+    Delete a deployment by `name` or `label_selector` in the namespace `ns`.
+
+    The deployment is deleted without a graceful period to trigger an abrupt
+    termination.
+
+    If neither `name` nor `label_selector` is specified, all the deployments
+    will be deleted in the namespace.
+
+    Set `delete_collection` to `True` to delete all the matching deployments
+    through a single request to the API server rather than one per deployment.
+
+    Returns the names of the deleted deployments.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.AppsV1Api(api)
+
+    if delete_collection:
+        return await delete_namespaced_collection(
+            v1.delete_collection_namespaced_deployment, ns, name, label_selector
+        )
+
+    ret = await v1.list_namespaced_deployment(
+        ns, **_deletion_selectors(name, label_selector)
+    )
+
+    logger.debug(f"Found {len(ret.items)} deployments named '{name}'")
+
+    body = client.V1DeleteOptions()
+    for d in ret.items:
+        await v1.delete_namespaced_deployment(d.metadata.name, ns, body=body)
+
+    return [d.metadata.name for d in ret.items]
+
+
+async def scale_deployment(
+    name: str, replicas: int, ns: str = "default", secrets: Secrets = None
+):
+    """
+    Scale a deployment up or down. The `name` is the name of the deployment.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.AppsV1Api(api)
+    body = {"spec": {"replicas": replicas}}
+    try:
+        await v1.patch_namespaced_deployment(name=name, namespace=ns, body=body)
+    except rest.ApiException as e:
+        raise ActivityFailed(
+            f"failed to scale '{name}' to {replicas} replicas: {str(e)}"
+        )
+
+
+async def rollout_deployment(
+    name: str = None,
+    ns: str = "default",
+    secrets: Secrets = None,
+):
+    """
+    Rolling the deployment. The `name` is the name of the deployment.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.AppsV1Api(api)
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    now = str(now.isoformat("T") + "Z")
+    body = {
+        "spec": {
+            "template": {
+                "metadata": {
+                    "annotations": {"kubectl.kubernetes.io/restartedAt": now}
+                }
+            }
+        }
+    }
+
+    try:
+        await v1.patch_namespaced_deployment(name=name, namespace=ns, body=body)
+    except rest.ApiException as e:
+        raise ActivityFailed(
+            f"failed to rollout the deployment '{name}'! Error: {str(e)}"
+        )
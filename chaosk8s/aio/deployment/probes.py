@@ -0,0 +1,222 @@
+import logging
+from typing import List, Union
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.views import ObjectView, raw_list
+from chaosk8s.aio.waiter import wait_for
+from chaosk8s.deployment.probes import (
+    _deployment_readiness_target,
+    _deployments_targets,
+    _not_available,
+    _not_partially_available,
+)
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes_asyncio.client")
+
+__all__ = [
+    "deployment_available_and_healthy",
+    "deployment_not_fully_available",
+    "deployment_fully_available",
+    "deployment_partially_available",
+    "deployments_fully_available",
+]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def deployment_available_and_healthy(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    raise_on_unavailable: bool = True,
+    secrets: Secrets = None,
+) -> Union[bool, None]:
+    """
+    Lookup a deployment by `name` in the namespace `ns`.
+
+    The selected resources are matched by the given `label_selector`.
+
+    Raises :exc:`chaoslib.exceptions.ActivityFailed` when the state is not
+    as expected. Unless `raise_on_unavailable` is set to `False` which means
+    the probe will return `False` rather than raise the exception.
+    """
+    deployments = await _list_deployments(name, ns, label_selector, secrets)
+
+    m = _not_available(name, deployments)
+    if m is None:
+        return True
+    if not raise_on_unavailable:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
+
+
+async def deployment_partially_available(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    raise_on_not_partially_available: bool = True,
+    secrets: Secrets = None,
+) -> Union[bool, None]:
+    """
+    Check whether if the given deployment state is ready or at-least partially
+    ready.
+    Raises :exc:`chaoslib.exceptions.ActivityFailed` when the state is not
+    as expected. Unless `raise_on_not_partially_available` is set to `False`
+    which means the probe will return `False` rather than raise the exception.
+    """
+    deployments = await _list_deployments(name, ns, label_selector, secrets)
+
+    m = _not_partially_available(name, deployments)
+    if m is None:
+        return True
+    if not raise_on_not_partially_available:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
+
+
+async def deployment_not_fully_available(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    raise_on_fully_available: bool = True,
+    secrets: Secrets = None,
+) -> Union[bool, None]:
+    """
+    Wait until the deployment gets into an intermediate state where not all
+    expected replicas are available. Once this state is reached, return `True`.
+    If the state is not reached after `timeout` seconds, a
+    :exc:`chaoslib.exceptions.ActivityFailed` exception is raised.
+
+    If `raise_on_fully_available` is set to `False`, return `False` instead
+    of raising the exception.
+    """
+    if await _deployment_readiness_has_state(
+        name,
+        False,
+        ns,
+        label_selector,
+        timeout,
+        secrets,
+    ):
+        return True
+    else:
+        m = f"deployment '{name}' failed to stop running within {timeout}s"
+        if not raise_on_fully_available:
+            logger.debug(m)
+            return False
+        else:
+            raise ActivityFailed(m)
+
+
+async def deployment_fully_available(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    raise_on_not_fully_available: bool = True,
+    secrets: Secrets = None,
+) -> Union[bool, None]:
+    """
+    Wait until all the deployment expected replicas are available.
+    Once this state is reached, return `True`.
+    If the state is not reached after `timeout` seconds, a
+    :exc:`chaoslib.exceptions.ActivityFailed` exception is raised.
+
+    If `raise_on_not_fully_available` is set to `False`, return `False` instead
+    of raising the exception.
+    """
+    if await _deployment_readiness_has_state(
+        name,
+        True,
+        ns,
+        label_selector,
+        timeout,
+        secrets,
+    ):
+        return True
+    else:
+        m = f"deployment '{name}' failed to recover within {timeout}s"
+        if not raise_on_not_fully_available:
+            logger.debug(m)
+            return False
+        else:
+            raise ActivityFailed(m)
+
+
+async def deployments_fully_available(
+    names: List[str],
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    raise_on_not_fully_available: bool = True,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Wait until all the expected replicas of each of the deployments `names`
+    are available. The deployments are watched at once, so this waits as long
+    as the slowest of them. Once this state is reached, return `True`.
+    If the state is not reached after `timeout` seconds, a
+    :exc:`chaoslib.exceptions.ActivityFailed` exception is raised.
+
+    If `raise_on_not_fully_available` is set to `False`, return `False` instead
+    of raising the exception.
+    """
+    targets = _deployments_targets(names, ns, label_selector)
+    if await wait_for(targets, timeout=timeout, secrets=secrets):
+        return True
+
+    m = f"deployments {names} failed to recover within {timeout}s"
+    if not raise_on_not_fully_available:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
+
+
+###############################################################################
+# Internals
+###############################################################################
+async def _list_deployments(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    secrets: Secrets = None,
+) -> List[ObjectView]:
+    field_selector = f"metadata.name={name}"
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.AppsV1Api(api)
+    list_deployments = raw_list(v1.list_namespaced_deployment)
+    if label_selector:
+        ret = await list_deployments(
+            ns, field_selector=field_selector, label_selector=label_selector
+        )
+    else:
+        ret = await list_deployments(ns, field_selector=field_selector)
+
+    logger.debug(
+        f"Found {len(ret.items)} deployment(s) named '{name}' in ns '{ns}'"
+    )
+    return ret.items
+
+
+async def _deployment_readiness_has_state(
+    name: str,
+    ready: bool,
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    secrets: Secrets = None,
+) -> Union[bool, None]:
+    """
+    Check wether if the given deployment state is ready or not
+    according to the ready paramter.
+    Return `False` if the state is not reached after `timeout` seconds.
+    """
+    target = _deployment_readiness_target(name, ready, ns, label_selector)
+    return await wait_for([target], timeout=timeout, secrets=secrets)
@@ -0,0 +1,56 @@
+"""
+Metadata-only listing of Kubernetes resources with the asynchronous client.
+
+Counterpart of `chaosk8s.metadata`.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from chaosk8s.aio.views import read_json
+from chaosk8s.lazy import lazy_import
+from chaosk8s.metadata import METADATA_LIST_ACCEPT
+
+client = lazy_import("kubernetes_asyncio.client")
+
+__all__ = ["list_metadata"]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def list_metadata(
+    api: "client.ApiClient",
+    path: str,
+    path_params: Dict[str, str] = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    limit: int = None,
+) -> List[Dict[str, Any]]:
+    """
+    List the metadata of the resources found at the collection `path`, such
+    as `/api/v1/namespaces/{namespace}/pods`, whose placeholders are filled
+    from `path_params`.
+
+    Returns the `metadata` of each object as a dictionary, in the camel case
+    form sent by the API server.
+    """
+    query_params = []
+    if label_selector:
+        query_params.append(("labelSelector", label_selector))
+    if field_selector:
+        query_params.append(("fieldSelector", field_selector))
+    if limit:
+        query_params.append(("limit", limit))
+
+    resp = await api.call_api(
+        path,
+        "GET",
+        path_params=path_params or {},
+        query_params=query_params,
+        header_params={"Accept": METADATA_LIST_ACCEPT},
+        auth_settings=["BearerToken"],
+        _return_http_data_only=True,
+        _preload_content=False,
+    )
+
+    items = (await read_json(resp)).get("items") or []
+    return [item.get("metadata") or {} for item in items]
@@ -0,0 +1,451 @@
+# WARNING: This module exposes actions that have rather strong impacts on your
+# cluster. While Chaos Engineering is all about disrupting and weaknesses,
+# it is important to take the time to fully appreciate what those actions
+# do and how they do it.
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.concurrency import fan_out
+from chaosk8s.aio.pagination import iter_items, iter_pages
+from chaosk8s.aio.waiter import iter_events
+from chaosk8s.lazy import lazy_import
+from chaosk8s.node.actions import (
+    _deletion_selection,
+    _drain_error,
+    _drain_timeout_error,
+    _drain_workers,
+    _eviction_delay,
+    _is_eviction_candidate,
+    _node_deleted,
+    _node_selectors,
+    _pick_nodes,
+)
+
+client = lazy_import("kubernetes_asyncio.client")
+rest = lazy_import("kubernetes_asyncio.client.rest")
+
+__all__ = [
+    "create_node",
+    "delete_nodes",
+    "cordon_node",
+    "drain_nodes",
+    "uncordon_node",
+]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def delete_nodes(
+    label_selector: str = None,
+    all: bool = False,
+    rand: bool = False,
+    count: int = None,
+    grace_period_seconds: int = None,
+    secrets: Secrets = None,
+    pod_label_selector: str = None,
+    pod_namespace: str = None,
+) -> List[str]:
+    """
+    Delete nodes gracefully, selected as `chaosk8s.node.actions.delete_nodes`
+    does.
+
+    Please be careful when using this action.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.CoreV1Api(api)
+
+    nodes = await _select_nodes(
+        secrets=secrets,
+        **_deletion_selection(
+            label_selector,
+            all,
+            rand,
+            count,
+            pod_label_selector,
+            pod_namespace,
+        ),
+    )
+
+    deleted = []
+    body = client.V1DeleteOptions()
+    for n in nodes:
+        res = await v1.delete_node(
+            n.metadata.name,
+            body=body,
+            grace_period_seconds=grace_period_seconds,
+        )
+        if _node_deleted(n.metadata.name, res):
+            deleted.append(n.metadata.name)
+
+    return deleted
+
+
+async def create_node(
+    meta: Dict[str, Any] = None,
+    spec: Dict[str, Any] = None,
+    secrets: Secrets = None,
+) -> "client.V1Node":
+    """
+    Create one new node in the cluster, as
+    `chaosk8s.node.actions.create_node` does.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.CoreV1Api(api)
+    body = client.V1Node()
+
+    body.metadata = client.V1ObjectMeta(**meta) if meta else None
+    body.spec = client.V1NodeSpec(**spec) if spec else None
+
+    try:
+        res = await v1.create_node(body)
+    except rest.ApiException as x:
+        raise ActivityFailed(f"Creating new node failed: {x.body}")
+
+    logger.debug(f"Node '{res.metadata.name}' created")
+
+    return res
+
+
+async def cordon_node(
+    name: str = None, label_selector: str = None, secrets: Secrets = None
+) -> List[str]:
+    """
+    Cordon nodes matching the given label or name, so that no pods
+    are scheduled on them any longer.
+    """
+    return await _set_unschedulable(name, label_selector, True, secrets)
+
+
+async def uncordon_node(
+    name: str = None, label_selector: str = None, secrets: Secrets = None
+) -> List[str]:
+    """
+    Uncordon nodes matching the given label name, so that pods can be
+    scheduled on them again.
+    """
+    return await _set_unschedulable(name, label_selector, False, secrets)
+
+
+async def drain_nodes(
+    name: str = None,
+    label_selector: str = None,
+    delete_pods_with_local_storage: bool = False,
+    timeout: int = 120,
+    secrets: Secrets = None,
+    count: int = None,
+    pod_label_selector: str = None,
+    pod_namespace: str = None,
+    max_concurrency: int = 1,
+) -> List[str]:
+    """
+    Drain nodes matching the given label or name, as
+    `chaosk8s.node.actions.drain_nodes` does.
+
+    Set `max_concurrency` to a value greater than `1` to drain several nodes,
+    and evict their pods, concurrently, with up to that many evictions in
+    flight at once.
+
+    You probably want to call `uncordon` from in your experiment's rollbacks.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.CoreV1Api(api)
+
+    # select nodes to drain
+    nodes = await _select_nodes(
+        name=name,
+        label_selector=label_selector,
+        count=count,
+        pod_label_selector=pod_label_selector,
+        pod_namespace=pod_namespace,
+        secrets=secrets,
+    )
+
+    # first let's make the nodes unschedulable
+    for node in nodes:
+        await cordon_node(name=node.metadata.name, secrets=secrets)
+
+    async def list_candidates(
+        node: "client.V1Node",
+    ) -> Tuple[List["client.V1Pod"], str]:
+        return await _list_eviction_candidates(
+            v1, node.metadata.name, delete_pods_with_local_storage
+        )
+
+    candidates = {}
+    async for node, listed, error in fan_out(
+        list_candidates, nodes, max_concurrency
+    ):
+        if error is not None:
+            raise error
+        if listed[0]:
+            candidates[node.metadata.name] = listed
+
+    if not candidates:
+        logger.debug("No pods to evict")
+        return [n.metadata.name for n in nodes]
+
+    pods = [p for listed, _ in candidates.values() for p in listed]
+    logger.debug(f"Found {len(pods)} pods to evict")
+
+    # nodes drained at once share the evictions in flight
+    workers, per_node = _drain_workers(max_concurrency, len(candidates))
+
+    async def drain(node_name: str) -> Dict[str, Any]:
+        listed, resource_version = candidates[node_name]
+        # each node is given its own timeout, from when its draining starts
+        deadline = time.time() + timeout
+
+        async def evict(pod: "client.V1Pod") -> str:
+            return await _evict_pod(v1, pod, deadline)
+
+        failed = {}
+        async for pod, outcome, error in fan_out(evict, listed, per_node):
+            pod_name = f"{pod.metadata.namespace}/{pod.metadata.name}"
+            if error is not None:
+                reason = (
+                    error.body
+                    if isinstance(error, rest.ApiException)
+                    else error
+                )
+                logger.debug(f"Failed to evict pod '{pod_name}': {reason}")
+                failed[pod_name] = reason
+            else:
+                logger.debug(f"Pod '{pod_name}' {outcome}")
+
+        if not failed:
+            # watching from the listing's version means we also see the pods
+            # which went away before the watch started
+            await _wait_for_pods_to_go(
+                v1, node_name, listed, resource_version, timeout, deadline
+            )
+        return failed
+
+    failed = {}
+    errors = {}
+    async for node_name, failures, error in fan_out(
+        drain, list(candidates), workers
+    ):
+        if error is not None:
+            logger.debug(f"Failed to drain node '{node_name}': {error}")
+            errors[node_name] = error
+        else:
+            failed.update(failures)
+
+    error = _drain_error(failed, len(pods), errors, len(candidates))
+    if error is not None:
+        raise error
+
+    return [n.metadata.name for n in nodes]
+
+
+###############################################################################
+# Internals
+###############################################################################
+async def _select_nodes(
+    name: str = None,
+    label_selector: str = None,
+    count: int = None,
+    secrets: Secrets = None,
+    pod_label_selector: str = None,
+    pod_namespace: str = None,
+    first: bool = False,
+) -> List["client.V1Node"]:
+    """
+    Select nodes as `chaosk8s.node.actions._select_nodes` does.
+    """
+    api = await create_k8s_api_client(secrets)
+    v1 = client.CoreV1Api(api)
+
+    selectors = _node_selectors(name, label_selector)
+    nodes = [n async for n in iter_items(v1.list_node, **selectors)]
+    logger.debug(f"Found {len(nodes)} nodes")
+
+    if pod_label_selector and pod_namespace:
+        logger.debug(f"Filtering nodes by pod label {pod_label_selector}")
+        hosting = {
+            pod.spec.node_name
+            async for pod in iter_items(
+                v1.list_namespaced_pod,
+                pod_namespace,
+                label_selector=pod_label_selector,
+            )
+        }
+        nodes = [n for n in nodes if n.metadata.name in hosting]
+        logger.debug(f"Found {len(nodes)} nodes")
+
+    return _pick_nodes(nodes, count, first)
+
+
+async def _set_unschedulable(
+    name: str = None,
+    label_selector: str = None,
+    unschedulable: bool = True,
+    secrets: Secrets = None,
+) -> List[str]:
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.CoreV1Api(api)
+
+    nodes = await _select_nodes(
+        name=name, label_selector=label_selector, secrets=secrets
+    )
+
+    body = {"spec": {"unschedulable": unschedulable}}
+    verb = "Unscheduling" if unschedulable else "Scheduling"
+
+    patched = []
+    for n in nodes:
+        try:
+            await v1.patch_node(n.metadata.name, body)
+            patched.append(n.metadata.name)
+        except rest.ApiException as x:
+            logger.debug(f"{verb} node '{n.metadata.name}' failed: {x.body}")
+            raise ActivityFailed(
+                f"Failed to {'un' if unschedulable else ''}schedule node "
+                f"'{n.metadata.name}': {x.body}"
+            )
+
+    return patched
+
+
+async def _list_eviction_candidates(
+    v1: "client.CoreV1Api",
+    node_name: str,
+    delete_pods_with_local_storage: bool = False,
+) -> Tuple[List["client.V1Pod"], str]:
+    """
+    List the pods to evict from the given node, along with the resource
+    version of that listing.
+    """
+    eviction_candidates = []
+    resource_version = None
+    count = 0
+    async for page in iter_pages(
+        v1.list_pod_for_all_namespaces,
+        field_selector=f"spec.nodeName={node_name}",
+    ):
+        # every page is served from the snapshot of the first one
+        resource_version = resource_version or page.metadata.resource_version
+        count += len(page.items)
+        eviction_candidates.extend(
+            pod
+            for pod in page.items
+            if _is_eviction_candidate(
+                pod, node_name, delete_pods_with_local_storage
+            )
+        )
+
+    logger.debug(f"Found {count} pods on node '{node_name}'")
+
+    return eviction_candidates, resource_version
+
+
+async def _evict_pod(
+    v1: "client.CoreV1Api", pod: "client.V1Pod", deadline: float
+) -> str:
+    """
+    Evict the given pod, retrying with an exponential backoff and jitter for
+    as long as a disruption budget refuses the eviction, until `deadline`.
+    """
+    eviction = client.V1Eviction()
+    eviction.metadata = client.V1ObjectMeta()
+    eviction.metadata.name = pod.metadata.name
+    eviction.metadata.namespace = pod.metadata.namespace
+    eviction.delete_options = client.V1DeleteOptions()
+
+    attempt = 0
+    while True:
+        try:
+            await v1.create_namespaced_pod_eviction(
+                pod.metadata.name, pod.metadata.namespace, body=eviction
+            )
+            return "evicted"
+        except rest.ApiException as x:
+            if x.status == 404:
+                return "already gone"
+            if x.status != 429:
+                raise
+
+            delay = _eviction_delay(attempt)
+            if time.time() + delay > deadline:
+                raise
+
+            logger.debug(
+                f"Eviction of pod '{pod.metadata.name}' refused by a "
+                f"disruption budget, retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+async def _wait_for_pods_to_go(
+    v1: "client.CoreV1Api",
+    node_name: str,
+    pods: List["client.V1Pod"],
+    resource_version: str = None,
+    timeout: int = 120,
+    deadline: float = None,
+) -> None:
+    """
+    Wait until all the given `pods` have been deleted from the node, over a
+    single watch of the pods scheduled on the node, as
+    `chaosk8s.node.actions._wait_for_pods_to_go` does.
+    """
+    pending = {p.metadata.uid: p for p in pods}
+    field_selector = f"spec.nodeName={node_name}"
+    if deadline is None:
+        deadline = time.time() + timeout
+
+    while pending:
+        logger.debug(f"Waiting for {len(pending)} pods to go")
+
+        remaining = int(deadline - time.time())
+        if remaining <= 0:
+            raise _drain_timeout_error(pending.values(), timeout)
+
+        try:
+            async for event_type, pod in iter_events(
+                v1.list_pod_for_all_namespaces,
+                field_selector=field_selector,
+                resource_version=resource_version,
+                timeout_seconds=remaining,
+                _request_timeout=remaining + 1,
+            ):
+                resource_version = (
+                    pod.metadata.resource_version or resource_version
+                )
+                if event_type != "DELETED":
+                    continue
+
+                if pending.pop(pod.metadata.uid, None) is not None:
+                    logger.debug(f"Pod '{pod.metadata.name}' is gone")
+
+                if not pending:
+                    break
+        except asyncio.TimeoutError:
+            logger.debug("Watch of the pods on the node stalled")
+        except rest.ApiException as x:
+            if x.status != 410:
+                raise
+
+            logger.debug("Watch expired, listing pods still on the node")
+            present = set()
+            resource_version = None
+            async for page in iter_pages(
+                v1.list_pod_for_all_namespaces, field_selector=field_selector
+            ):
+                resource_version = (
+                    resource_version or page.metadata.resource_version
+                )
+                present.update(p.metadata.uid for p in page.items)
+            pending = {u: p for u, p in pending.items() if u in present}
+
+    logger.debug("Evicted all pods we could")
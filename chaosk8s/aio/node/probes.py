@@ -0,0 +1,115 @@
+import logging
+from typing import Dict, List
+
+from chaoslib.types import Configuration, Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.views import raw_list, read_json
+from chaosk8s.lazy import lazy_import
+from chaosk8s.node.probes import (
+    _node_statuses,
+    _nodes_healthy,
+    _nodes_in_condition,
+)
+
+client = lazy_import("kubernetes_asyncio.client")
+
+__all__ = [
+    "get_nodes",
+    "all_nodes_must_be_ready_to_schedule",
+    "get_all_node_status_conditions",
+    "verify_nodes_condition",
+    "nodes_must_be_healthy",
+]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def get_nodes(
+    label_selector: str = None,
+    configuration: Configuration = None,
+    secrets: Secrets = None,
+):
+    """
+    List all Kubernetes worker nodes in your cluster. You may filter nodes
+    by specifying a label selector.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.CoreV1Api(api)
+    if label_selector:
+        ret = await v1.list_node(
+            label_selector=label_selector, _preload_content=False
+        )
+    else:
+        ret = await v1.list_node(_preload_content=False)
+
+    return await read_json(ret)
+
+
+async def get_all_node_status_conditions(
+    label_selector: str = None,
+    configuration: Configuration = None,
+    secrets: Secrets = None,
+) -> List[Dict[str, str]]:
+    """
+    Get all nodes conditions. You can select a subset of nodes by specifying a
+    `label_selector`.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.CoreV1Api(api)
+    ret = await raw_list(v1.list_node)(label_selector=label_selector or None)
+
+    return _node_statuses(ret.items)
+
+
+async def all_nodes_must_be_ready_to_schedule(
+    label_selector: str = None,
+    configuration: Configuration = None,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Verifies that all nodes in the cluster are in `Ready` condition and can
+    be scheduled. You can select a subset of nodes by specifying a
+    `label_selector`.
+    """
+    result = await get_all_node_status_conditions(
+        label_selector, configuration, secrets
+    )
+
+    return _nodes_in_condition(result, "Ready", "True")
+
+
+async def verify_nodes_condition(
+    condition_type: str = "PIDPressure",
+    condition_value: str = "False",
+    label_selector: str = None,
+    configuration: Configuration = None,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    For each select node, verifies that the gievn condition is met.
+    """
+    result = await get_all_node_status_conditions(
+        label_selector, configuration, secrets
+    )
+
+    return _nodes_in_condition(result, condition_type, condition_value)
+
+
+async def nodes_must_be_healthy(
+    label_selector: str = None,
+    configuration: Configuration = None,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Verifies the state of the node conditions listed by
+    `chaosk8s.node.probes.nodes_must_be_healthy`.
+
+    For all matching nodes, if any is not in the expected state, returns False.
+    """
+    result = await get_all_node_status_conditions(
+        label_selector, configuration, secrets
+    )
+
+    return _nodes_healthy(result)
@@ -0,0 +1,54 @@
+"""
+Paginated listing of Kubernetes resources with the asynchronous client.
+
+Counterpart of `chaosk8s.pagination` for the list methods of
+`kubernetes_asyncio`, which are coroutine functions.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from chaosk8s.pagination import DEFAULT_PAGE_SIZE
+
+__all__ = ["DEFAULT_PAGE_SIZE", "iter_pages", "iter_items"]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def iter_pages(
+    list_func: Callable[..., Awaitable[Any]],
+    *args: Any,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """
+    Await `list_func`, such as `CoreV1Api.list_namespaced_pod`, with the
+    given arguments and yield each page of results, as returned by the
+    client, until the API server has no more to send.
+    """
+    token = None
+    while True:
+        if token:
+            kwargs["_continue"] = token
+        ret = await list_func(*args, limit=page_size, **kwargs)
+        yield ret
+
+        token = ret.metadata._continue if ret.metadata else None
+        if not token:
+            return
+        logger.debug(f"Listed {len(ret.items)} objects, fetching more")
+
+
+async def iter_items(
+    list_func: Callable[..., Awaitable[Any]],
+    *args: Any,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """
+    Same as `iter_pages` but yield the listed objects one by one.
+    """
+    async for page in iter_pages(
+        list_func, *args, page_size=page_size, **kwargs
+    ):
+        for item in page.items:
+            yield item
@@ -0,0 +1,268 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, List, Union
+from urllib.parse import quote, urlencode
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s import instrumentation
+from chaosk8s.aio import create_k8s_api_client, throttle
+from chaosk8s.aio.concurrency import fan_out
+from chaosk8s.aio.pagination import iter_items
+from chaosk8s.lazy import lazy_import
+from chaosk8s.pod.actions import (
+    _check_selection,
+    _deletion_error,
+    _exec_result,
+    _exec_targets,
+    _log_selection,
+    _name_matches,
+    _pick_pods,
+)
+
+client = lazy_import("kubernetes_asyncio.client")
+rest = lazy_import("kubernetes_asyncio.client.rest")
+ws_client = lazy_import("kubernetes_asyncio.stream.ws_client")
+
+__all__ = ["terminate_pods", "exec_in_pods"]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def terminate_pods(
+    label_selector: str = None,
+    name_pattern: str = None,
+    all: bool = False,
+    rand: bool = False,
+    mode: str = "fixed",
+    qty: int = 1,
+    grace_period: int = -1,
+    ns: str = "default",
+    order: str = "alphabetic",
+    max_concurrency: int = 1,
+    secrets: Secrets = None,
+):
+    """
+    Terminate pods, selected as `chaosk8s.pod.actions.terminate_pods` does.
+
+    Pods are deleted one after the other, stopping at the first failure,
+    unless `max_concurrency` is greater than `1`, in which case up to that
+    many deletions are awaited at once. Pods that could not be deleted are
+    then reported in the raised :exc:`chaoslib.exceptions.ActivityFailed`,
+    once all deletions have been attempted.
+    """
+    api = await create_k8s_api_client(secrets)
+    v1 = client.CoreV1Api(api)
+
+    pods = await _select_pods(
+        v1, label_selector, name_pattern, all, rand, mode, qty, ns, order
+    )
+
+    body = client.V1DeleteOptions()
+    if grace_period >= 0:
+        body = client.V1DeleteOptions(grace_period_seconds=grace_period)
+
+    if max_concurrency is None or max_concurrency <= 1:
+        deleted_pods = []
+        for p in pods:
+            await v1.delete_namespaced_pod(p.metadata.name, ns, body=body)
+            deleted_pods.append(p.metadata.name)
+
+        return deleted_pods
+
+    async def delete(p: "client.V1Pod") -> str:
+        await v1.delete_namespaced_pod(p.metadata.name, ns, body=body)
+        return p.metadata.name
+
+    deleted = set()
+    failed = {}
+    async for p, name, error in fan_out(delete, pods, max_concurrency):
+        if error is None:
+            logger.debug(f"Pod '{name}' deleted")
+            deleted.add(name)
+        else:
+            reason = (
+                error.reason if isinstance(error, rest.ApiException) else error
+            )
+            logger.debug(f"Failed to delete pod '{p.metadata.name}': {reason}")
+            failed[p.metadata.name] = reason
+
+    if failed:
+        raise _deletion_error(failed, len(pods))
+
+    # keep the order in which pods were selected
+    return [p.metadata.name for p in pods if p.metadata.name in deleted]
+
+
+async def exec_in_pods(
+    cmd: Union[str, List[str]],
+    label_selector: str = None,
+    name_pattern: str = None,
+    all: bool = False,
+    rand: bool = False,
+    mode: str = "fixed",
+    qty: int = 1,
+    ns: str = "default",
+    order: str = "alphabetic",
+    container_name: str = None,
+    request_timeout: int = 60,
+    max_concurrency: int = 1,
+    secrets: Secrets = None,
+) -> List[Dict[str, Any]]:
+    """
+    Execute the command `cmd` in the container of the pods selected as
+    `chaosk8s.pod.actions.exec_in_pods` does.
+
+    Commands run over websockets of the shared HTTP session. When
+    `max_concurrency` is greater than `1`, the command runs in up to that
+    many pods at once, each bounded by its own `request_timeout`. Results are
+    then listed in the order pods completed.
+    """
+    if not cmd:
+        raise ActivityFailed("A command must be set to run a container")
+
+    api = await create_k8s_api_client(secrets)
+    v1 = client.CoreV1Api(api)
+
+    pods = await _select_pods(
+        v1, label_selector, name_pattern, all, rand, mode, qty, ns, order
+    )
+
+    exec_command, targets = _exec_targets(pods, cmd, container_name)
+
+    async def run(po: "client.V1Pod") -> Dict[str, Any]:
+        return await _exec_in_pod(
+            api, po, ns, container_name, exec_command, cmd, request_timeout
+        )
+
+    results = []
+    async for po, result, error in fan_out(run, targets, max_concurrency):
+        if error is not None:
+            raise error
+        logger.debug(
+            f"Command exited with '{result['exit_code']}' in pod "
+            f"'{po.metadata.name}'"
+        )
+        results.append(result)
+
+    return results
+
+
+###############################################################################
+# Internals
+###############################################################################
+async def _exec_in_pod(
+    api: "client.ApiClient",
+    po: "client.V1Pod",
+    ns: str,
+    container_name: str,
+    exec_command: List[str],
+    cmd: Union[str, List[str]],
+    request_timeout: int = 60,
+) -> Dict[str, Any]:
+    """
+    Run the command in the pod over a websocket opened by the session of the
+    shared client `api`, rather than by the client's `WsApiClient` which
+    opens a session of its own.
+
+    Only what the command wrote within `request_timeout` seconds is kept.
+    """
+    path = (
+        f"/api/v1/namespaces/{quote(ns, safe='')}/pods/"
+        f"{quote(po.metadata.name, safe='')}/exec"
+    )
+    query = [("command", c) for c in exec_command]
+    if container_name:
+        query.append(("container", container_name))
+    query.extend([("stderr", "true"), ("stdin", "false"), ("stdout", "true")])
+    query.append(("tty", "false"))
+    headers = {"sec-websocket-protocol": "v4.channel.k8s.io"}
+    await api.update_params_for_auth(headers, query, ["BearerToken"])
+    url = ws_client.get_websocket_url(
+        f"{api.configuration.host}{path}?{urlencode(query)}"
+    )
+
+    out = []
+    err = []
+
+    async def read(ws: Any) -> None:
+        async for msg in ws:
+            data = msg.data
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            if not isinstance(data, bytes) or len(data) < 2:
+                continue
+
+            # frames may cut characters in half, they are decoded once joined
+            if data[0] == ws_client.STDOUT_CHANNEL:
+                out.append(data[1:])
+            elif data[0] == ws_client.ERROR_CHANNEL:
+                err.append(data[1:])
+
+    # websocket upgrades bypass the REST client, they are throttled and
+    # recorded here
+    await throttle(api)
+    started = time.perf_counter()
+    try:
+        rest_client = api.rest_client
+        async with rest_client.pool_manager.ws_connect(
+            url,
+            headers=headers,
+            proxy=rest_client.proxy,
+            proxy_headers=rest_client.proxy_headers,
+        ) as ws:
+            try:
+                await asyncio.wait_for(read(ws), request_timeout)
+            except asyncio.TimeoutError:
+                logger.debug(
+                    f"Command still running in pod '{po.metadata.name}' "
+                    f"after {request_timeout}s"
+                )
+    except Exception:
+        if instrumentation._recorders:
+            instrumentation._record(
+                "create", "pods/exec", 0, started, None, None
+            )
+        raise
+
+    if instrumentation._recorders:
+        instrumentation._record("create", "pods/exec", 101, started, None, None)
+
+    return _exec_result(
+        po,
+        cmd,
+        b"".join(out).decode("utf-8", errors="replace"),
+        b"".join(err).decode("utf-8", errors="replace").strip(),
+    )
+
+
+async def _select_pods(
+    v1: "client.CoreV1Api" = None,
+    label_selector: str = None,
+    name_pattern: str = None,
+    all: bool = False,
+    rand: bool = False,
+    mode: str = "fixed",
+    qty: int = 1,
+    ns: str = "default",
+    order: str = "alphabetic",
+) -> List["client.V1Pod"]:
+    if v1 is None:
+        raise ActivityFailed("Cannot select pods. Client API is None")
+
+    _check_selection(mode, qty, order)
+
+    pattern = re.compile(name_pattern) if name_pattern else None
+    pods = []
+    count = 0
+    selectors = {"label_selector": label_selector} if label_selector else {}
+    async for p in iter_items(v1.list_namespaced_pod, ns, **selectors):
+        count += 1
+        if _name_matches(p, pattern):
+            pods.append(p)
+
+    _log_selection(count, label_selector, ns)
+
+    return _pick_pods(pods, all, rand, mode, qty, order)
@@ -0,0 +1,415 @@
+import asyncio
+import logging
+import re
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.concurrency import fan_out
+from chaosk8s.aio.metadata import list_metadata
+from chaosk8s.aio.views import ObjectView, raise_for_status, raw_list
+from chaosk8s.aio.waiter import wait_for_selection
+from chaosk8s.lazy import lazy_import
+from chaosk8s.pod import probes
+from chaosk8s.pod.probes import (
+    LOG_CHUNK_SIZE,
+    _in_phase,
+    _log_params,
+    _LogSearch,
+    _not_in_conditions,
+    _not_in_phase,
+    _running,
+    _split_log_lines,
+)
+
+client = lazy_import("kubernetes_asyncio.client")
+
+__all__ = [
+    "pods_in_phase",
+    "pods_in_conditions",
+    "pods_not_in_phase",
+    "read_pod_logs",
+    "count_pods",
+    "pod_is_not_available",
+    "count_min_pods",
+    "should_be_found_in_logs",
+    "should_be_found_in_pod_logs",
+]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def read_pod_logs(
+    name: str = None,
+    last: Union[str, None] = None,
+    ns: str = "default",
+    from_previous: bool = False,
+    label_selector: str = "name in ({name})",
+    container_name: str = None,
+    tail_lines: int = None,
+    limit_bytes: int = None,
+    since_time: str = None,
+    max_concurrency: int = 1,
+    secrets: Secrets = None,
+) -> Dict[str, str]:
+    """
+    Fetch the logs of the pods, as `chaosk8s.pod.probes.read_pod_logs` does.
+
+    Logs are fetched from one pod at a time unless `max_concurrency` is
+    greater than `1`.
+    """
+    label_selector = label_selector.format(name=name)
+    api = await create_k8s_api_client(secrets)
+    v1 = client.CoreV1Api(api)
+
+    if label_selector:
+        ret = await v1.list_namespaced_pod(ns, label_selector=label_selector)
+    else:
+        ret = await v1.list_namespaced_pod(ns)
+
+    logger.debug(
+        f"Found {len(ret.items)} "
+        f"pods: [{', '.join([p.metadata.name for p in ret.items])}] in ns '{ns}'"
+    )
+
+    params = _log_params(
+        ns,
+        last,
+        from_previous,
+        container_name,
+        tail_lines,
+        limit_bytes,
+        since_time,
+    )
+
+    async def fetch(p: "client.V1Pod") -> str:
+        logger.debug(f"Fetching logs for pod '{p.metadata.name}'")
+        r = await v1.read_namespaced_pod_log(p.metadata.name, **params)
+        try:
+            await raise_for_status(r)
+            # limit_bytes may cut the last character in half
+            return (await r.read()).decode("utf-8", errors="replace")
+        finally:
+            r.release()
+
+    logs = {}
+    async for p, text, error in fan_out(fetch, ret.items, max_concurrency):
+        if error is not None:
+            raise error
+        logs[p.metadata.name] = text
+
+    # keep the order in which pods were listed
+    return {
+        p.metadata.name: logs[p.metadata.name]
+        for p in ret.items
+        if p.metadata.name in logs
+    }
+
+
+async def pods_in_phase(
+    label_selector: str,
+    phase: str = "Running",
+    ns: str = "default",
+    raise_on_invalid_phase: bool = True,
+    timeout: float = None,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Lookup a pod by `label_selector` in the namespace `ns`, as
+    `chaosk8s.pod.probes.pods_in_phase` does.
+    """
+    mismatch = _not_in_phase(label_selector, phase)
+    m = await _check_pods(ns, label_selector, mismatch, timeout, secrets)
+    if m is None:
+        return True
+    if not raise_on_invalid_phase:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
+
+
+async def pods_in_conditions(
+    label_selector: str,
+    conditions: List[Dict[str, str]],
+    ns: str = "default",
+    raise_on_invalid_conditions: bool = True,
+    timeout: float = None,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Lookup a pod by `label_selector` in the namespace `ns`, as
+    `chaosk8s.pod.probes.pods_in_conditions` does.
+    """
+    mismatch = _not_in_conditions(label_selector, conditions)
+    m = await _check_pods(ns, label_selector, mismatch, timeout, secrets)
+    if m is None:
+        return True
+    if not raise_on_invalid_conditions:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
+
+
+async def pods_not_in_phase(
+    label_selector: str,
+    phase: str = "Running",
+    ns: str = "default",
+    raise_on_in_phase: bool = True,
+    timeout: float = None,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Lookup a pod by `label_selector` in the namespace `ns`, as
+    `chaosk8s.pod.probes.pods_not_in_phase` does.
+    """
+    mismatch = _in_phase(label_selector, phase)
+    m = await _check_pods(ns, label_selector, mismatch, timeout, secrets)
+    if m is None:
+        return True
+    if not raise_on_in_phase:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
+
+
+async def count_pods(
+    label_selector: str,
+    phase: str = None,
+    ns: str = "default",
+    secrets: Secrets = None,
+) -> int:
+    """
+    Count the number of pods matching the given selector in a given `phase`, if
+    one is given.
+    """
+    api = await create_k8s_api_client(secrets)
+    pods = await list_metadata(
+        api,
+        "/api/v1/namespaces/{namespace}/pods",
+        path_params={"namespace": ns},
+        label_selector=label_selector,
+        field_selector=f"status.phase={phase}" if phase else None,
+    )
+    logger.debug(
+        f"Found {len(pods)} pods matching label '{label_selector}' in ns '{ns}'"
+    )
+
+    return len(pods)
+
+
+async def pod_is_not_available(
+    name: str,
+    ns: str = "default",
+    label_selector: str = "name in ({name})",
+    raise_on_is_available: bool = True,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Lookup pods with a `name` label set to the given `name` in the specified
+    `ns`.
+
+    Raises :exc:`chaoslib.exceptions.ActivityFailed` when one of the pods
+    with the specified `name` is in the `"Running"` phase.
+    """
+    label_selector = label_selector.format(name=name)
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.CoreV1Api(api)
+    list_pods = raw_list(v1.list_namespaced_pod)
+    if label_selector:
+        ret = await list_pods(ns, label_selector=label_selector)
+    else:
+        ret = await list_pods(ns)
+
+    logger.debug(f"Found {len(ret.items)} pod(s) named '{name}' in ns '{ns}")
+
+    m = _running(name, ret.items)
+    if m is None:
+        return True
+    if not raise_on_is_available:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
+
+
+async def count_min_pods(
+    label_selector: str,
+    phase: str = "Running",
+    min_count: int = 2,
+    ns: str = "default",
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Check if minimum number of pods are running.
+    """
+    count = await count_pods(
+        label_selector=label_selector, phase=phase, ns=ns, secrets=secrets
+    )
+    return count >= min_count
+
+
+async def should_be_found_in_logs(
+    pattern: str,
+    all_containers: bool = True,
+    value: Dict[str, str] = None,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Lookup for the first occurence of `pattern` in the logs of each container
+    fetched by the `read_pod_logs` probe, as
+    `chaosk8s.pod.probes.should_be_found_in_logs` does. No request is made.
+    """
+    return probes.should_be_found_in_logs(
+        pattern, all_containers=all_containers, value=value, secrets=secrets
+    )
+
+
+async def should_be_found_in_pod_logs(
+    pattern: str,
+    name: str = None,
+    last: Union[str, None] = None,
+    ns: str = "default",
+    from_previous: bool = False,
+    label_selector: str = "name in ({name})",
+    container_name: str = None,
+    all_pods: bool = True,
+    tail_lines: int = None,
+    limit_bytes: int = None,
+    since_time: str = None,
+    max_concurrency: int = 1,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Lookup for the first occurence of `pattern` in the logs of the pods, as
+    `chaosk8s.pod.probes.should_be_found_in_pod_logs` does, without loading
+    these logs in memory.
+    """
+    label_selector = label_selector.format(name=name)
+    api = await create_k8s_api_client(secrets)
+    v1 = client.CoreV1Api(api)
+
+    if label_selector:
+        ret = await v1.list_namespaced_pod(ns, label_selector=label_selector)
+    else:
+        ret = await v1.list_namespaced_pod(ns)
+
+    if not ret.items:
+        raise ActivityFailed("no logs to search from")
+
+    params = _log_params(
+        ns,
+        last,
+        from_previous,
+        container_name,
+        tail_lines,
+        limit_bytes,
+        since_time,
+    )
+    c_pattern = re.compile(pattern)
+    # set once the outcome is known so remaining searches can bail out
+    settled = asyncio.Event()
+
+    async def search(p: "client.V1Pod") -> bool:
+        if settled.is_set():
+            return False
+
+        r = await v1.read_namespaced_pod_log(p.metadata.name, **params)
+        try:
+            await raise_for_status(r)
+            async for line in _iter_log_lines(r, settled):
+                m = c_pattern.search(line)
+                if m:
+                    logger.debug(
+                        f"Pod '{p.metadata.name}' logs matched at "
+                        f"position {m.span()} of line '{line}'"
+                    )
+                    return True
+        finally:
+            r.release()
+
+        return False
+
+    outcome = _LogSearch(len(ret.items), all_pods, settled)
+    async for p, found, error in fan_out(search, ret.items, max_concurrency):
+        outcome.record(p, found, error)
+
+    return outcome.found()
+
+
+###############################################################################
+# Internals
+###############################################################################
+async def _iter_log_lines(
+    resp: Any, stop: asyncio.Event = None
+) -> AsyncIterator[str]:
+    """
+    Yield the lines of a log response as they are received, holding no more
+    than one chunk and one partial line in memory.
+    """
+    pending = b""
+    async for chunk in resp.content.iter_chunked(LOG_CHUNK_SIZE):
+        if stop is not None and stop.is_set():
+            return
+
+        lines, pending = _split_log_lines(pending, chunk)
+        for line in lines:
+            yield line
+
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+async def _check_pods(
+    ns: str,
+    label_selector: str,
+    mismatch: Callable[[List[Any]], Optional[str]],
+    timeout: float = None,
+    secrets: Secrets = None,
+) -> Optional[str]:
+    """
+    Return why the pods matching `label_selector` do not have the expected
+    state, as told by `mismatch`, or `None` when they do.
+
+    Without a `timeout`, the pods are checked as they are now. Otherwise,
+    they are watched until they have the expected state or until `timeout`
+    seconds have passed, whichever comes first.
+    """
+    if timeout is None:
+        return mismatch(await _list_pods(ns, label_selector, secrets))
+
+    reason = None
+
+    def expected(pods: List[Any]) -> bool:
+        nonlocal reason
+        reason = mismatch(pods)
+        return reason is None
+
+    await wait_for_selection(
+        "pod", expected, ns, label_selector, timeout, secrets
+    )
+    return reason
+
+
+async def _list_pods(
+    ns: str = "default", label_selector: str = None, secrets: Secrets = None
+) -> List[ObjectView]:
+    """
+    List the pods matching `label_selector` in the namespace `ns`, as views
+    over the raw JSON response.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.CoreV1Api(api)
+    list_pods = raw_list(v1.list_namespaced_pod)
+    if label_selector:
+        ret = await list_pods(ns, label_selector=label_selector)
+        logger.debug(
+            f"Found {len(ret.items)} pods matching label '{label_selector}'"
+            f" in ns '{ns}'"
+        )
+    else:
+        ret = await list_pods(ns)
+        logger.debug(f"Found {len(ret.items)} pods in ns '{ns}'")
+
+    return ret.items
@@ -0,0 +1,100 @@
+import logging
+from typing import List
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.collection import delete_namespaced_collection
+from chaosk8s.aio.concurrency import run_blocking
+from chaosk8s.collection import _deletion_selectors
+from chaosk8s.lazy import lazy_import
+from chaosk8s.spec import load_spec
+
+client = lazy_import("kubernetes_asyncio.client")
+rest = lazy_import("kubernetes_asyncio.client.rest")
+
+__all__ = ["create_statefulset", "scale_statefulset", "remove_statefulset"]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def create_statefulset(
+    spec_path: str, ns: str = "default", secrets: Secrets = None
+):
+    """
+    Create a statefulset described by the service config, which must be
+    the path to the JSON or YAML representation of the statefulset.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    statefulset = await run_blocking(load_spec, spec_path)
+
+    v1 = client.AppsV1Api(api)
+    await v1.create_namespaced_stateful_set(ns, body=statefulset)
+
+
+async def scale_statefulset(
+    name: str, replicas: int, ns: str = "default", secrets: Secrets = None
+):
+    """
+    Scale a stateful set up or down. The `name` is the name of the stateful
+    set.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.AppsV1Api(api)
+    body = {"spec": {"replicas": replicas}}
+    try:
+        await v1.patch_namespaced_stateful_set(name, namespace=ns, body=body)
+    except rest.ApiException as e:
+        raise ActivityFailed(
+            f"failed to scale '{name}' to {replicas} replicas: {str(e)}"
+        )
+
+
+async def remove_statefulset(
+    name: str = None,
+    ns: str = "default",
+    label_selector: str = None,
+    delete_collection: bool = False,
+    secrets: Secrets = None,
+) -> List[str]:
+    """
+    Remove a statefulset by `name` or `label_selector` in the namespace `ns`.
+
+    The statefulset is removed by deleting it without
+        a graceful period to trigger an abrupt termination.
+
+    If neither `name` nor `label_selector` is specified, all the statefulsets
+    will be deleted in the namespace.
+
+    Set `delete_collection` to `True` to delete all the matching statefulsets
+    through a single request to the API server rather than one per statefulset.
+
+    Returns the names of the deleted statefulsets.
+    """
+    api = await create_k8s_api_client(secrets)
+
+    v1 = client.AppsV1Api(api)
+
+    if delete_collection:
+        return await delete_namespaced_collection(
+            v1.delete_collection_namespaced_stateful_set,
+            ns,
+            name,
+            label_selector,
+        )
+
+    ret = await v1.list_namespaced_stateful_set(
+        ns, **_deletion_selectors(name, label_selector)
+    )
+
+    logger.debug(
+        f"Found {len(ret.items)} statefulset(s) named '{name}' in ns '{ns}'"
+    )
+
+    body = client.V1DeleteOptions()
+    for d in ret.items:
+        await v1.delete_namespaced_stateful_set(d.metadata.name, ns, body=body)
+
+    return [d.metadata.name for d in ret.items]
@@ -0,0 +1,100 @@
+import logging
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio.waiter import wait_for
+from chaosk8s.statefulset.probes import _statefulset_readiness_target
+
+__all__ = ["statefulset_fully_available", "statefulset_not_fully_available"]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def statefulset_not_fully_available(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    raise_on_fully_available: bool = True,
+    secrets: Secrets = None,
+):
+    """
+    Wait until the statefulSet gets into an intermediate state where not all
+    expected replicas are available. Once this state is reached, return `True`.
+    If the state is not reached after `timeout` seconds, a
+    :exc:`chaoslib.exceptions.ActivityFailed` exception is raised.
+
+    If `raise_on_fully_available` is set to `False`, return `False` instead
+    of raising the exception.
+    """
+    if await _statefulset_readiness_has_state(
+        name,
+        False,
+        ns,
+        label_selector,
+        timeout,
+        secrets,
+    ):
+        return True
+    else:
+        m = f"microservice '{name}' failed to stop running within {timeout}s"
+        if not raise_on_fully_available:
+            logger.debug(m)
+            return False
+        else:
+            raise ActivityFailed(m)
+
+
+async def statefulset_fully_available(
+    name: str,
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    raise_on_not_fully_available: bool = True,
+    secrets: Secrets = None,
+):
+    """
+    Wait until all the statefulSet expected replicas are available.
+    Once this state is reached, return `True`.
+    If the state is not reached after `timeout` seconds, a
+    :exc:`chaoslib.exceptions.ActivityFailed` exception is raised.
+
+    If `raise_on_not_fully_available` is set to `False`, return `False` instead
+    of raising the exception.
+    """
+    if await _statefulset_readiness_has_state(
+        name,
+        True,
+        ns,
+        label_selector,
+        timeout,
+        secrets,
+    ):
+        return True
+    else:
+        m = f"microservice '{name}' failed to recover within {timeout}s"
+        if not raise_on_not_fully_available:
+            logger.debug(m)
+            return False
+        else:
+            raise ActivityFailed(m)
+
+
+###############################################################################
+# Internals
+###############################################################################
+async def _statefulset_readiness_has_state(
+    name: str,
+    ready: bool,
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    secrets: Secrets = None,
+):
+    """
+    Check wether if the given statefulSet state is ready or not
+    according to the ready paramter.
+    Return `False` if the state is not reached after `timeout` seconds.
+    """
+    target = _statefulset_readiness_target(name, ready, ns, label_selector)
+    return await wait_for([target], timeout=timeout, secrets=secrets)
@@ -0,0 +1,61 @@
+"""
+Views over the raw JSON returned by the asynchronous Kubernetes client.
+
+Counterpart of `chaosk8s.views`. Responses obtained with
+`_preload_content=False` from `kubernetes_asyncio` are the `aiohttp` ones,
+whose status the client has not checked, so errors are raised here as the
+client would have.
+"""
+
+import json
+from typing import Any, Awaitable, Callable
+
+from chaosk8s.lazy import lazy_import
+from chaosk8s.views import ObjectView
+
+rest = lazy_import("kubernetes_asyncio.client.rest")
+
+__all__ = ["ObjectView", "raw_list", "read_json", "raise_for_status"]
+
+
+async def raise_for_status(resp: Any) -> None:
+    """
+    Raise the `ApiException` the client raises for preloaded responses when
+    the streamed response `resp` is not a success.
+    """
+    if 200 <= resp.status <= 299:
+        return
+
+    data = await resp.read()
+    x = rest.ApiException(http_resp=rest.RESTResponse(resp, data))
+    x.body = data.decode("utf-8", errors="replace")
+    raise x
+
+
+async def read_json(resp: Any) -> Any:
+    """
+    Decode the JSON body of a response obtained with `_preload_content=False`
+    and give its connection back to the pool.
+    """
+    try:
+        await raise_for_status(resp)
+        return json.loads(await resp.read())
+    finally:
+        resp.release()
+
+
+def raw_list(
+    list_func: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[ObjectView]]:
+    """
+    Wrap a client list method, such as `CoreV1Api.list_namespaced_pod`, so
+    that it returns an `ObjectView` of the JSON response rather than the
+    deserialized model. The wrapped method can be given to
+    `chaosk8s.aio.pagination.iter_items`.
+    """
+
+    async def call(*args: Any, **kwargs: Any) -> ObjectView:
+        kwargs["_preload_content"] = False
+        return ObjectView(await read_json(await list_func(*args, **kwargs)))
+
+    return call
@@ -0,0 +1,283 @@
+"""
+Wait for many objects to reach a given state, over as few watches as
+possible, with the asynchronous client.
+
+Counterpart of `chaosk8s.waiter`, taking the same `Target` objects. The
+watches of different groups are tasks of the running event loop rather than
+threads. Objects given to the predicates are `ObjectView` objects over the
+JSON sent by the API server.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.aio import create_k8s_api_client
+from chaosk8s.aio.pagination import iter_pages
+from chaosk8s.aio.views import ObjectView, raise_for_status, raw_list
+from chaosk8s.lazy import lazy_import
+from chaosk8s.waiter import (
+    KINDS,
+    WATCH_MIN_INTERVAL,
+    WATCH_READ_SLACK,
+    WATCH_WINDOW,
+    Target,
+    _Group,
+    _group_targets,
+    _Selection,
+    _WaitState,
+)
+
+client = lazy_import("kubernetes_asyncio.client")
+rest = lazy_import("kubernetes_asyncio.client.rest")
+
+__all__ = ["KINDS", "Target", "wait_for", "wait_for_selection", "iter_events"]
+logger = logging.getLogger("chaostoolkit")
+
+
+async def wait_for(
+    targets: Iterable[Target],
+    mode: str = "all",
+    timeout: float = 30,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Watch the `targets` until all of them, or any of them when `mode` is
+    `"any"`, have reached their state.
+
+    Return `True` when they did within `timeout` seconds, `False` otherwise.
+    """
+    groups = _group_targets(targets, mode)
+    if not groups:
+        return True
+
+    state = _WaitState(
+        [t for g in groups.values() for t in g], mode, len(groups)
+    )
+    deadline = time.monotonic() + float(timeout)
+    api = await create_k8s_api_client(secrets)
+
+    pending = {
+        asyncio.ensure_future(_watch_group(api, key, group, state, deadline))
+        for key, group in groups.items()
+    }
+    try:
+        # any change of the outcome ends the watch which made it
+        while pending and not state.done.is_set():
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            _, pending = await asyncio.wait(
+                pending, timeout=left, return_when=asyncio.FIRST_COMPLETED
+            )
+    finally:
+        for task in pending:
+            task.cancel()
+
+    succeeded = state.succeeded()
+    if not succeeded and state.error is not None:
+        raise state.error
+    return succeeded
+
+
+async def wait_for_selection(
+    kind: str,
+    predicate: Callable[[List[Any]], bool],
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: float = 30,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Watch the objects of `kind` matching `label_selector` in the namespace
+    `ns` until `predicate`, given all of them as last seen, returns `True`.
+    Objects created or deleted meanwhile join or leave the selection.
+
+    Return `True` when it did within `timeout` seconds, `False` otherwise.
+    """
+    if kind not in KINDS:
+        raise ActivityFailed(f"Cannot wait for objects of kind '{kind}'")
+
+    api_name, list_name = KINDS[kind]
+    api = await create_k8s_api_client(secrets)
+    list_func = getattr(getattr(client, api_name)(api), list_name)
+    selectors = {"label_selector": label_selector} if label_selector else {}
+    deadline = time.monotonic() + float(timeout)
+    selection = _Selection(predicate)
+
+    async def relist() -> Optional[str]:
+        selection.clear()
+        rv = None
+        async for page in iter_pages(
+            raw_list(list_func), namespace=ns, **selectors
+        ):
+            if rv is None:
+                rv = page.metadata.resource_version
+            for obj in page.items:
+                selection.add(obj)
+        return None if selection.matched() else rv
+
+    return await _list_and_watch(
+        list_func,
+        ns,
+        selectors,
+        deadline,
+        relist,
+        selection.on_event,
+        f"{kind}(s) '{label_selector or ''}'",
+    )
+
+
+async def iter_events(
+    list_func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+) -> AsyncIterator[Tuple[str, ObjectView]]:
+    """
+    Watch the objects listed by `list_func`, such as
+    `CoreV1Api.list_namespaced_pod`, given the arguments of a watch request,
+    and yield each event as an `(event type, object)` tuple, bookmarks
+    included.
+
+    The client's own `Watch` opens a client of its own, and thus an HTTP
+    session, for each watch. This rather reads the events off a request
+    made with the shared client the list method is bound to.
+
+    `ERROR` events are raised as the `ApiException` the client would raise,
+    whose `status` is `410` when the resource version watched from is too old
+    for the API server to resume from.
+    """
+    resp = await list_func(*args, watch=True, _preload_content=False, **kwargs)
+    try:
+        await raise_for_status(resp)
+        async for line in resp.content:
+            if not line.strip():
+                continue
+
+            event = json.loads(line)
+            raw = event["object"]
+            if event["type"] == "ERROR":
+                raise rest.ApiException(
+                    status=raw.get("code"), reason=raw.get("message")
+                )
+            yield event["type"], ObjectView(raw)
+    finally:
+        resp.release()
+
+
+###############################################################################
+# Private functions
+###############################################################################
+async def _watch_group(
+    api: "client.ApiClient",
+    key: Tuple[str, str, str],
+    targets: List[Target],
+    state: _WaitState,
+    deadline: float,
+) -> None:
+    group = _Group(key, targets, state)
+    api_name, list_name = KINDS[group.kind]
+    list_func = getattr(getattr(client, api_name)(api), list_name)
+
+    async def relist() -> Optional[str]:
+        rv = None
+        async for page in iter_pages(
+            raw_list(list_func), namespace=group.ns, **group.selectors
+        ):
+            if rv is None:
+                rv = page.metadata.resource_version
+            for obj in page.items:
+                if group.observe(obj):
+                    return None
+        return rv
+
+    try:
+        await _list_and_watch(
+            list_func,
+            group.ns,
+            group.selectors,
+            deadline,
+            relist,
+            lambda event_type, obj: group.observe(obj),
+            group.what,
+        )
+    except Exception as x:
+        # raised by the waiting coroutine, as with the threads of the waiter
+        logger.debug(f"Watch failed: {x}")
+        state.fail(x)
+    finally:
+        state.watch_ended(not group.remaining)
+
+
+async def _list_and_watch(
+    list_func: Callable[..., Awaitable[Any]],
+    ns: str,
+    selectors: Dict[str, str],
+    deadline: float,
+    relist: Callable[[], Awaitable[Optional[str]]],
+    on_event: Callable[[str, Any], bool],
+    what: str,
+) -> bool:
+    """
+    List the objects with `relist`, which returns the resource version to
+    watch from or `None` when done with them, then watch them until
+    `on_event` returns `True`. Return `True` when done before the deadline.
+    """
+    rv = await relist()
+    last_watch = 0.0
+    while rv is not None:
+        left = deadline - time.monotonic()
+        if left <= 0:
+            logger.debug("Timed out!")
+            return False
+
+        # do not hammer the API server when watches end right away
+        pause = last_watch + WATCH_MIN_INTERVAL - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(min(pause, left))
+            continue
+        last_watch = time.monotonic()
+
+        window = max(1, int(min(left, WATCH_WINDOW)))
+        logger.debug(
+            f"Watching {what} in ns '{ns}' from resource version {rv} for "
+            f"{window}s"
+        )
+        try:
+            async for event_type, obj in iter_events(
+                list_func,
+                namespace=ns,
+                resource_version=rv,
+                timeout_seconds=window,
+                allow_watch_bookmarks=True,
+                _request_timeout=min(left, window + WATCH_READ_SLACK),
+                **selectors,
+            ):
+                rv = obj.metadata.resource_version or rv
+                if event_type == "BOOKMARK":
+                    continue
+
+                logger.debug(f"'{obj.metadata.name}' {event_type}")
+                if on_event(event_type, obj):
+                    return True
+        except asyncio.TimeoutError:
+            logger.debug(f"Watch of {what} stalled, resuming it")
+        except rest.ApiException as x:
+            if x.status != 410:
+                raise
+            logger.debug(f"Resource version {rv} is gone, listing again")
+            rv = await relist()
+    return True
@@ -0,0 +1,456 @@
+"""
+Opt-in informer cache for the resources probes read the most.
+
+When enabled, through the `KUBERNETES_INFORMER_CACHE` key in the environment
+or in the secrets, probes no longer LIST resources from the API server on
+every call. Instead, a reflector per kind and per cluster lists the resources
+once and then keeps an in-memory store up to date by watching for changes,
+resuming from the last seen resource version (bookmarks included) and
+relisting when that version has expired.
+
+Set `KUBERNETES_INFORMER_CACHE` to `"true"` to cache all supported kinds or
+to a comma-separated list of kinds, such as `"pods,nodes"`. Supported kinds
+are: `pods`, `nodes`, `deployments`, `statefulsets` and `daemonsets`.
+
+The store is eventually consistent: a probe running right after an action
+may not see its effect until the matching watch event has been received.
+
+Reflectors keep running for the rest of the process, across expiries of the
+client cache, so long experiments do not list every cached kind again and
+again. They are stopped by `stop_informers`, once the client they were
+started with is invalidated, with `invalidate_k8s_api_client` or
+`clear_k8s_api_client_cache`, and once the kubeconfig file it was loaded
+from has been rewritten.
+"""
+
+import json
+import logging
+import os
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s import (
+    _client_cache_key,
+    _client_release_listeners,
+    _is_superseded,
+    create_k8s_api_client,
+)
+from chaosk8s.lazy import lazy_import
+from chaosk8s.selectors import LabelSelector, compile_selector
+
+client = lazy_import("kubernetes.client")
+watch = lazy_import("kubernetes.watch.watch")
+
+__all__ = [
+    "is_enabled",
+    "list_objects",
+    "get_object",
+    "stop_informers",
+    "Store",
+    "Reflector",
+]
+logger = logging.getLogger("chaostoolkit")
+
+DEFAULT_SYNC_TIMEOUT = 30
+DEFAULT_WATCH_TIMEOUT = 300
+
+# kind -> (api class, cluster-wide list method, model type)
+KINDS = {
+    "pods": ("CoreV1Api", "list_pod_for_all_namespaces", "V1Pod"),
+    "nodes": ("CoreV1Api", "list_node", "V1Node"),
+    "deployments": (
+        "AppsV1Api",
+        "list_deployment_for_all_namespaces",
+        "V1Deployment",
+    ),
+    "statefulsets": (
+        "AppsV1Api",
+        "list_stateful_set_for_all_namespaces",
+        "V1StatefulSet",
+    ),
+    "daemonsets": (
+        "AppsV1Api",
+        "list_daemon_set_for_all_namespaces",
+        "V1DaemonSet",
+    ),
+}
+
+_informers: Dict[Tuple[Tuple, str], "Reflector"] = {}
+_informers_lock = threading.Lock()
+
+
+def is_enabled(kind: str, secrets: Secrets = None) -> bool:
+    """
+    Tell whether the informer cache is enabled for the given `kind`.
+    """
+    return kind in _enabled_kinds(secrets)
+
+
+def list_objects(
+    kind: str,
+    ns: str = None,
+    label_selector: str = None,
+    secrets: Secrets = None,
+) -> Optional[List[Any]]:
+    """
+    List the cached objects of the given `kind`, optionally restricted to
+    the namespace `ns` and to the objects matching `label_selector`.
+
+    Returns `None` whenever the cache cannot answer, because it is disabled,
+    has not synced yet or the selector is invalid. Callers are then expected
+    to query the API server, which reports the error in the latter case.
+    """
+    store = _get_store(kind, secrets)
+    if store is None:
+        return None
+
+    return store.list(ns=ns, label_selector=label_selector)
+
+
+def get_object(
+    kind: str,
+    name: str,
+    ns: str = None,
+    secrets: Secrets = None,
+) -> Tuple[bool, Any]:
+    """
+    Lookup a single cached object by `name`.
+
+    Returns a `(hit, object)` tuple where `hit` is `False` when the cache
+    could not answer and the API server should be queried instead.
+    """
+    store = _get_store(kind, secrets)
+    if store is None:
+        return False, None
+
+    return True, store.get(name, ns)
+
+
+def stop_informers() -> None:
+    """
+    Stop all running reflectors and drop their stores.
+    """
+    with _informers_lock:
+        reflectors = list(_informers.values())
+        _informers.clear()
+
+    for r in reflectors:
+        r.stop()
+
+
+class Store:
+    """
+    Thread-safe object store indexed by namespace and by label.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._objects: Dict[Tuple[str, str], Any] = {}
+        self._by_namespace: Dict[str, Set[Tuple[str, str]]] = {}
+        self._by_label: Dict[str, Set[Tuple[str, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def replace(self, objects: Iterable[Any]) -> None:
+        with self._lock:
+            self._objects.clear()
+            self._by_namespace.clear()
+            self._by_label.clear()
+            for o in objects:
+                self._add(o)
+
+    def upsert(self, obj: Any) -> None:
+        with self._lock:
+            self._remove(_object_key(obj))
+            self._add(obj)
+
+    def delete(self, obj: Any) -> None:
+        with self._lock:
+            self._remove(_object_key(obj))
+
+    def get(self, name: str, ns: str = None) -> Any:
+        with self._lock:
+            return self._objects.get((ns or "", name))
+
+    def list(
+        self, ns: str = None, label_selector: str = None
+    ) -> Optional[List[Any]]:
+        """
+        List the stored objects in the namespace `ns`, or in all of them,
+        matching `label_selector`.
+
+        Returns `None`, rather than an empty list, when the selector cannot
+        be evaluated locally: the API server must then be asked instead.
+        """
+        try:
+            selector = compile_selector(label_selector)
+        except ActivityFailed as x:
+            logger.debug(f"Deferring to the API server: {x}")
+            return None
+
+        with self._lock:
+            if ns:
+                keys = set(self._by_namespace.get(ns, ()))
+            else:
+                keys = set(self._objects)
+
+            # requirements on label values are answered by the index, the
+            # others by looking at the labels of the remaining objects
+            others = []
+            for r in selector.requirements:
+                matching = set()
+                if r.operator in ("=", "in", "!=", "notin"):
+                    for value in r.values:
+                        matching |= self._by_label.get(
+                            f"{r.key}={value}", set()
+                        )
+                if r.operator in ("=", "in"):
+                    keys &= matching
+                elif r.operator in ("!=", "notin"):
+                    keys -= matching
+                else:
+                    others.append(r)
+
+            objects = [self._objects[k] for k in sorted(keys)]
+
+        if others:
+            objects = LabelSelector(others).filter(objects)
+        return objects
+
+    def _add(self, obj: Any) -> None:
+        key = _object_key(obj)
+        self._objects[key] = obj
+        self._by_namespace.setdefault(key[0], set()).add(key)
+        for k, v in (obj.metadata.labels or {}).items():
+            self._by_label.setdefault(f"{k}={v}", set()).add(key)
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        obj = self._objects.pop(key, None)
+        if obj is None:
+            return
+
+        self._by_namespace.get(key[0], set()).discard(key)
+        for k, v in (obj.metadata.labels or {}).items():
+            self._by_label.get(f"{k}={v}", set()).discard(key)
+
+
+class Reflector(threading.Thread):
+    """
+    Keep a `Store` in sync with the API server by listing a kind once and
+    then watching for changes from the listed resource version.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        api: "client.ApiClient",
+        watch_timeout: int = DEFAULT_WATCH_TIMEOUT,
+    ) -> None:
+        super().__init__(name=f"chaosk8s-reflector-{kind}", daemon=True)
+        api_class, list_method, model = KINDS[kind]
+        self.kind = kind
+        self.store = Store()
+        self.synced = threading.Event()
+        # set once synced or once the initial listing failed for good
+        self.settled = threading.Event()
+        self.error = None
+        self.resource_version = None
+        self._api = api
+        self._list = getattr(getattr(client, api_class)(api), list_method)
+        self._model = model
+        self._watch_timeout = watch_timeout
+        self._stopped = threading.Event()
+        self._resp = None
+
+    def stop(self) -> None:
+        self._stopped.set()
+        # unblock a watch waiting for its next event
+        resp = self._resp
+        if resp is not None:
+            try:
+                resp.close()
+            except Exception:
+                logger.debug(f"Failed closing the {self.kind} watch")
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watch()
+            except client.rest.ApiException as x:
+                # retrying a list we are not allowed to make is pointless
+                if not self.synced.is_set() and x.status in (401, 403):
+                    logger.debug(
+                        f"Listing {self.kind} is not allowed, giving up on "
+                        f"the informer: {x.reason}"
+                    )
+                    self.error = x
+                    self.settled.set()
+                    return
+                logger.debug(
+                    f"Watching {self.kind} failed, relisting shortly",
+                    exc_info=True,
+                )
+                self.resource_version = None
+                self._stopped.wait(1)
+            except Exception:
+                logger.debug(
+                    f"Watching {self.kind} failed, relisting shortly",
+                    exc_info=True,
+                )
+                self.resource_version = None
+                self._stopped.wait(1)
+
+    def _relist(self) -> None:
+        ret = self._list()
+        self.store.replace(ret.items)
+        self.resource_version = ret.metadata.resource_version
+        self.synced.set()
+        self.settled.set()
+        logger.debug(
+            f"Listed {len(ret.items)} {self.kind} at resource version "
+            f"{self.resource_version}"
+        )
+
+    def _watch(self) -> None:
+        resp = self._list(
+            watch=True,
+            resource_version=self.resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=self._watch_timeout,
+            _request_timeout=self._watch_timeout + 30,
+            _preload_content=False,
+        )
+        self._resp = resp
+        try:
+            if self._stopped.is_set():
+                return
+
+            for line in watch.iter_resp_lines(resp):
+                if self._stopped.is_set():
+                    return
+
+                event = json.loads(line)
+                event_type = event["type"]
+                raw = event["object"]
+
+                if event_type == "ERROR":
+                    # the resource version we resumed from is too old
+                    if raw.get("code") == 410:
+                        logger.debug(f"Watch of {self.kind} expired")
+                        self.resource_version = None
+                        return
+                    raise client.rest.ApiException(
+                        status=raw.get("code"), reason=raw.get("message")
+                    )
+
+                self.resource_version = raw["metadata"]["resourceVersion"]
+                if event_type == "BOOKMARK":
+                    continue
+
+                obj = self._api.deserialize(
+                    SimpleNamespace(data=json.dumps(raw)), self._model
+                )
+                if event_type == "DELETED":
+                    self.store.delete(obj)
+                else:
+                    self.store.upsert(obj)
+        finally:
+            self._resp = None
+            resp.close()
+            resp.release_conn()
+
+
+###############################################################################
+# Internals
+###############################################################################
+def _lookup(secrets: Secrets, k: str, d: Any = None) -> Any:
+    return (secrets or {}).get(k, os.environ.get(k, d))
+
+
+def _enabled_kinds(secrets: Secrets = None) -> Set[str]:
+    value = _lookup(secrets, "KUBERNETES_INFORMER_CACHE")
+    if not value or str(value).lower() in ("false", "0", "no"):
+        return set()
+
+    if str(value).lower() in ("true", "1", "yes", "all"):
+        return set(KINDS)
+
+    return {k.strip() for k in str(value).split(",") if k.strip() in KINDS}
+
+
+def _get_store(kind: str, secrets: Secrets = None) -> Optional[Store]:
+    if not is_enabled(kind, secrets):
+        return None
+
+    client_key = _client_cache_key(secrets)
+    key = (client_key, kind)
+    with _informers_lock:
+        reflector = _informers.get(key)
+
+    if reflector is None:
+        # getting the client may release informers, which takes the lock
+        api = create_k8s_api_client(secrets)
+        with _informers_lock:
+            reflector = _informers.get(key)
+            if reflector is None:
+                logger.debug(f"Starting informer for {kind}")
+                reflector = Reflector(kind, api)
+                reflector.start()
+                _informers[key] = reflector
+            # clients are not always cached, so informers of a rewritten
+            # kubeconfig are looked for here as well
+            stale = {k for k, _ in _informers if _is_superseded(k, client_key)}
+        for k in stale:
+            _release_informers(k)
+
+    if not reflector.settled.wait(_sync_timeout(secrets)):
+        logger.debug(f"Informer for {kind} has not synced yet")
+        return None
+
+    if reflector.error is not None:
+        # the reflector is kept so later calls fall back straight away
+        return None
+
+    return reflector.store
+
+
+def _sync_timeout(secrets: Secrets = None) -> float:
+    value = _lookup(
+        secrets, "KUBERNETES_INFORMER_SYNC_TIMEOUT", DEFAULT_SYNC_TIMEOUT
+    )
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        logger.warning(
+            f"Invalid KUBERNETES_INFORMER_SYNC_TIMEOUT '{value}', using "
+            f"{DEFAULT_SYNC_TIMEOUT}s"
+        )
+        return float(DEFAULT_SYNC_TIMEOUT)
+
+
+def _release_informers(client_key: Tuple) -> None:
+    """
+    Stop and drop the reflectors started with the credentials of the client
+    invalidated under `client_key`.
+    """
+    with _informers_lock:
+        keys = [k for k in _informers if k[0] == client_key]
+        reflectors = [_informers.pop(k) for k in keys]
+
+    for r in reflectors:
+        logger.debug(f"Stopping informer for {r.kind}")
+        r.stop()
+
+
+def _object_key(obj: Any) -> Tuple[str, str]:
+    return (obj.metadata.namespace or "", obj.metadata.name)
+
+
+_client_release_listeners.append(_release_informers)
@@ -0,0 +1,22 @@
+from typing import Any, Dict, Union
+
+from chaosk8s.selectors import compile_selector
+
+
+def _label_selector_spec(
+    selectors: Union[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Translate label selectors into the selector fields of a Chaos Mesh
+    experiment: equality requirements go to `labelSelectors` and set-based
+    ones, such as `env in (prod,staging)`, to `expressionSelectors`.
+    """
+    if not isinstance(selectors, str):
+        return {"labelSelectors": selectors}
+
+    selector = compile_selector(selectors)
+    spec = {"labelSelectors": selector.match_labels}
+    expressions = selector.match_expressions
+    if expressions:
+        spec["expressionSelectors"] = expressions
+    return spec
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, Union
 import yaml
 from chaoslib.types import Secrets
 
+from chaosk8s.chaosmesh import _label_selector_spec
 from chaosk8s.crd.actions import create_custom_object, delete_custom_object
 
 __all__ = [
@@ -573,13 +574,7 @@ def add_common_spec(
         s["selector"]["namespaces"] = namespaces_selectors
 
     if label_selectors:
-        selectors = label_selectors
-        if isinstance(label_selectors, str):
-            selectors = {}
-            for ls in label_selectors.split(","):
-                k, v = ls.split("=", 1)
-                selectors[k] = v
-        s["selector"]["labelSelectors"] = selectors
+        s["selector"].update(_label_selector_spec(label_selectors))
 
     if annotations_selectors:
         selectors = annotations_selectors
@@ -611,13 +606,9 @@ def add_common_spec(
             target["selector"]["namespaces"] = target_namespaces_selectors
 
         if target_label_selectors:
-            selectors = target_label_selectors
-            if isinstance(target_label_selectors, str):
-                selectors = {}
-                for ls in target_label_selectors.split(","):
-                    k, v = ls.split("=", 1)
-                    selectors[k] = v
-            target["selector"]["labelSelectors"] = selectors
+            target["selector"].update(
+                _label_selector_spec(target_label_selectors)
+            )
 
         if target_annotations_selectors:
             selectors = target_annotations_selectors
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, Union
 import yaml
 from chaoslib.types import Secrets
 
+from chaosk8s.chaosmesh import _label_selector_spec
 from chaosk8s.crd.actions import create_custom_object, delete_custom_object
 
 __all__ = [
@@ -223,13 +224,7 @@ def add_common_spec(
         s["selector"]["namespaces"] = namespaces_selectors
 
     if label_selectors:
-        selectors = label_selectors
-        if isinstance(label_selectors, str):
-            selectors = {}
-            for ls in label_selectors.split(","):
-                k, v = ls.split("=", 1)
-                selectors[k] = v
-        s["selector"]["labelSelectors"] = selectors
+        s["selector"].update(_label_selector_spec(label_selectors))
 
     if annotations_selectors:
         selectors = annotations_selectors
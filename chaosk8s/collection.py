@@ -0,0 +1,72 @@
+"""
+Server-side deletion of collections of namespaced resources.
+
+Rather than listing the objects to delete and issuing a DELETE for each of
+them, a single `deletecollection` request lets the API server delete all
+the objects matching the selectors. The server replies with the list of
+objects it deleted, read here as raw JSON since the client would otherwise
+try to deserialize it as a `V1Status`.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List
+
+from chaosk8s.lazy import lazy_import
+from chaosk8s.views import read_json
+
+client = lazy_import("kubernetes.client")
+
+__all__ = ["delete_namespaced_collection"]
+logger = logging.getLogger("chaostoolkit")
+
+
+def delete_namespaced_collection(
+    delete_func: Callable[..., Any],
+    ns: str = "default",
+    name: str = None,
+    label_selector: str = None,
+) -> List[str]:
+    """
+    Call a `delete_collection_namespaced_*` client method, such as
+    `AppsV1Api.delete_collection_namespaced_deployment`, to delete the
+    object named `name` or, when no name is given, those matching
+    `label_selector` in the namespace `ns`. With neither, all the objects of
+    that kind in the namespace are deleted.
+
+    Returns the names of the deleted objects.
+    """
+    resp = delete_func(
+        ns,
+        body=client.V1DeleteOptions(),
+        _preload_content=False,
+        **_deletion_selectors(name, label_selector),
+    )
+    return _deleted_names(read_json(resp), ns)
+
+
+###############################################################################
+# Internals
+###############################################################################
+def _deletion_selectors(
+    name: str = None, label_selector: str = None
+) -> Dict[str, str]:
+    """
+    Select the object named `name` or, when no name is given, those matching
+    `label_selector`. With neither, all the objects are selected.
+    """
+    if name:
+        return {"field_selector": f"metadata.name={name}"}
+    if label_selector:
+        return {"label_selector": label_selector}
+    return {}
+
+
+def _deleted_names(ret: Dict[str, Any], ns: str = "default") -> List[str]:
+    """
+    Return the names of the objects listed in the response of a
+    `deletecollection` request.
+    """
+    names = [o["metadata"]["name"] for o in ret.get("items") or []]
+    logger.debug(f"Deleted {len(names)} object(s) in ns '{ns}': {names}")
+
+    return names
@@ -0,0 +1,58 @@
+"""
+Helpers to fan Kubernetes API calls out over a bounded pool of threads.
+
+The Kubernetes client is blocking, so activities acting on many objects
+issue their requests from a thread pool when asked for a `max_concurrency`
+greater than one. The underlying connection pool is thread-safe and shared
+by all workers.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+__all__ = ["fan_out"]
+logger = logging.getLogger("chaostoolkit")
+
+T = TypeVar("T")
+
+
+def fan_out(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    max_concurrency: int = 1,
+) -> Iterator[Tuple[T, Any, Optional[BaseException]]]:
+    """
+    Call `func` on each of the `items` with at most `max_concurrency` calls
+    in flight, and yield an `(item, result, error)` tuple as soon as each
+    call completes. `error` is the exception the call raised, if any, in
+    which case `result` is `None`.
+
+    With a `max_concurrency` of one or less, calls are made sequentially
+    from the calling thread and results are yielded in order.
+    """
+    items = list(items)
+    if not items:
+        return
+
+    if max_concurrency is None or max_concurrency <= 1 or len(items) == 1:
+        for item in items:
+            try:
+                yield item, func(item), None
+            except Exception as x:
+                yield item, None, x
+        return
+
+    workers = min(max_concurrency, len(items))
+    logger.debug(f"Running {len(items)} calls over {workers} workers")
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="chaosk8s"
+    ) as pool:
+        futures = {pool.submit(func, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            error = future.exception()
+            if error is not None:
+                yield item, None, error
+            else:
+                yield item, future.result(), None
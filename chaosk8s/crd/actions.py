@@ -1,15 +1,17 @@
 import json
 import logging
 import os.path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import yaml
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client
-from kubernetes.client.rest import ApiException
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes.client")
+rest = lazy_import("kubernetes.client.rest")
 
 __all__ = [
     "create_custom_object",
@@ -32,19 +34,7 @@ def apply_from_json(
     """
     Apply the given custom resource, given as a JSON string, to the cluster.
     """
-    obj = json.loads(resource)
-    api_version = obj.get("apiVersion")
-    kind = obj.get("kind")
-    ns = obj.get("metadata", {}).get("namespace", "default")
-
-    if not api_version:
-        raise ActivityFailed("missing apiVersion in resource")
-
-    if not kind:
-        raise ActivityFailed("missing kind in resource")
-
-    group, version = api_version.rsplit("/", 1)
-    plural = get_plural(kind)
+    group, version, plural, ns = _custom_object_target(json.loads(resource))
 
     return create_custom_object(
         group, version, plural, ns, resource, secrets=secrets
@@ -57,20 +47,7 @@ def apply_from_yaml(
     """
     Apply the given custom resource, given as a YAML string, to the cluster.
     """
-    obj = yaml.safe_load(resource)
-
-    api_version = obj.get("apiVersion")
-    kind = obj.get("kind")
-    ns = obj.get("metadata", {}).get("namespace", "default")
-
-    if not api_version:
-        raise ActivityFailed("missing apiVersion in resource")
-
-    if not kind:
-        raise ActivityFailed("missing kind in resource")
-
-    group, version = api_version.rsplit("/", 1)
-    plural = get_plural(kind)
+    group, version, plural, ns = _custom_object_target(yaml.safe_load(resource))
 
     return create_custom_object(
         group, version, plural, ns, resource, secrets=secrets
@@ -101,7 +78,7 @@ def create_custom_object(
             group, version, ns, plural, body, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         if x.status == 409:
             logger.debug(
                 f"Custom resource object {group}/{version} already exists"
@@ -135,7 +112,7 @@ def delete_custom_object(
             group, version, ns, plural, name, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to delete custom resource object: '{x.reason}' {x.body}"
         )
@@ -163,7 +140,7 @@ def create_cluster_custom_object(
             group, version, plural, body, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         if x.status == 409:
             logger.debug(
                 f"Custom resource object {group}/{version} already exists"
@@ -191,7 +168,7 @@ def delete_cluster_custom_object(
             group, version, plural, name, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to delete custom resource object: '{x.reason}' {x.body}"
         )
@@ -218,19 +195,17 @@ def patch_custom_object(
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
+    api = client.CustomObjectsApi(
+        _json_patch_client(create_k8s_api_client(secrets))
+    )
     body = load_body(resource, resource_as_yaml_file)
 
     try:
-        # https://github.com/kubernetes-client/python/issues/1216
-        api.api_client.set_default_header(
-            "Content-Type", "application/json-patch+json"
-        )
         r = api.patch_namespaced_custom_object(
             group, version, ns, plural, name, body, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to patch custom resource object: '{x.reason}' {x.body}"
         )
@@ -269,7 +244,7 @@ def replace_custom_object(
             _preload_content=False,
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to replace custom resource object: '{x.reason}' {x.body}"
         )
@@ -295,19 +270,17 @@ def patch_cluster_custom_object(
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
+    api = client.CustomObjectsApi(
+        _json_patch_client(create_k8s_api_client(secrets))
+    )
     body = load_body(resource, resource_as_yaml_file)
 
     try:
-        # https://github.com/kubernetes-client/python/issues/1216
-        api.api_client.set_default_header(
-            "Content-Type", "application/json-patch+json"
-        )
         r = api.patch_cluster_custom_object(
             group, version, plural, name, body, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to patch custom resource object: '{x.reason}' {x.body}"
         )
@@ -344,7 +317,7 @@ def replace_cluster_custom_object(
             _preload_content=False,
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to replace custom resource object: '{x.reason}' {x.body}"
         )
@@ -353,6 +326,47 @@ def replace_cluster_custom_object(
 ###############################################################################
 # Internal functions
 ###############################################################################
+def _json_patch_client(api: "client.ApiClient") -> "client.ApiClient":
+    """
+    Return a private client sending its requests as JSON Patch documents
+    through the connections of the shared client `api`.
+
+    The generated client cannot be told the content type of a single patch
+    and its default headers take precedence over the per-call ones, so they
+    must not be set on `api`, which is cached and used by other activities.
+    See https://github.com/kubernetes-client/python/issues/1216
+    """
+    patcher = client.ApiClient(
+        api.configuration,
+        header_name="Content-Type",
+        header_value="application/json-patch+json",
+    )
+    # share the pool, the rate limiter and the instrumentation of `api`
+    patcher.rest_client = api.rest_client
+    return patcher
+
+
+def _custom_object_target(
+    obj: Dict[str, Any],
+) -> Tuple[str, str, str, str]:
+    """
+    Tell where to create the given custom resource, as its group, version,
+    plural and namespace.
+    """
+    api_version = obj.get("apiVersion")
+    kind = obj.get("kind")
+    ns = obj.get("metadata", {}).get("namespace", "default")
+
+    if not api_version:
+        raise ActivityFailed("missing apiVersion in resource")
+
+    if not kind:
+        raise ActivityFailed("missing kind in resource")
+
+    group, version = api_version.rsplit("/", 1)
+    return group, version, get_plural(kind), ns
+
+
 def load_body(
     body_as_object: Dict[str, Any] = None, body_as_yaml_file: str = None
 ) -> Dict[str, Any]:
@@ -3,10 +3,12 @@ from typing import Any, Dict, List
 
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client
-from kubernetes.client.rest import ApiException
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes.client")
+rest = lazy_import("kubernetes.client.rest")
 
 __all__ = [
     "get_custom_object",
@@ -37,7 +39,7 @@ def get_custom_object(
             group, version, ns, plural, name, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to create custom resource object: '{x.reason}' {x.body}"
         )
@@ -63,7 +65,7 @@ def list_custom_objects(
             group, version, ns, plural, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to create custom resource object: '{x.reason}' {x.body}"
         )
@@ -85,7 +87,7 @@ def get_cluster_custom_object(
             group, version, plural, name, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to create custom resource object: '{x.reason}' {x.body}"
         )
@@ -107,7 +109,7 @@ def list_cluster_custom_objects(
             group, version, plural, _preload_content=False
         )
         return json.loads(r.data)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(
             f"Failed to create custom resource object: '{x.reason}' {x.body}"
         )
@@ -1,14 +1,19 @@
-import json
 import logging
-import os.path
+from typing import List
 
-import yaml
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client
-from kubernetes.client.rest import ApiException
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.collection import (
+    _deletion_selectors,
+    delete_namespaced_collection,
+)
+from chaosk8s.lazy import lazy_import
+from chaosk8s.spec import load_spec
+
+client = lazy_import("kubernetes.client")
+rest = lazy_import("kubernetes.client.rest")
 
 __all__ = [
     "create_daemon_set",
@@ -27,14 +32,7 @@ def create_daemon_set(
     """
     api = create_k8s_api_client(secrets)
 
-    with open(spec_path) as f:
-        p, ext = os.path.splitext(spec_path)
-        if ext == ".json":
-            daemon_set = json.loads(f.read())
-        elif ext in [".yml", ".yaml"]:
-            daemon_set = yaml.safe_load(f.read())
-        else:
-            raise ActivityFailed(f"cannot process {spec_path}")
+    daemon_set = load_spec(spec_path)
 
     v1 = client.AppsV1Api(api)
     _ = v1.create_namespaced_daemon_set(ns, body=daemon_set)
@@ -44,8 +42,9 @@ def delete_daemon_set(
     name: str = None,
     ns: str = "default",
     label_selector: str = None,
+    delete_collection: bool = False,
     secrets: Secrets = None,
-):
+) -> List[str]:
     """
     Delete a daemon set by `name` or `label_selector` in the namespace `ns`.
 
@@ -54,19 +53,24 @@ def delete_daemon_set(
 
     If neither `name` nor `label_selector` is specified, all the daemon sets
     will be deleted in the namespace.
+
+    Set `delete_collection` to `True` to delete all the matching daemon sets
+    through a single request to the API server rather than one per daemon set.
+
+    Returns the names of the deleted daemon sets.
     """
     api = create_k8s_api_client(secrets)
 
     v1 = client.AppsV1Api(api)
 
-    if name:
-        ret = v1.list_namespaced_daemon_set(
-            ns, field_selector=f"metadata.name={name}"
+    if delete_collection:
+        return delete_namespaced_collection(
+            v1.delete_collection_namespaced_daemon_set, ns, name, label_selector
         )
-    elif label_selector:
-        ret = v1.list_namespaced_daemon_set(ns, label_selector=label_selector)
-    else:
-        ret = v1.list_namespaced_daemon_set(ns)
+
+    ret = v1.list_namespaced_daemon_set(
+        ns, **_deletion_selectors(name, label_selector)
+    )
 
     logger.debug(f"Found {len(ret.items)} daemon sets named '{name}'")
 
@@ -74,6 +78,8 @@ def delete_daemon_set(
     for d in ret.items:
         v1.delete_namespaced_daemon_set(d.metadata.name, ns, body=body)
 
+    return [d.metadata.name for d in ret.items]
+
 
 def update_daemon_set(
     name: str, spec: dict, ns: str = "default", secrets: Secrets = None
@@ -86,5 +92,5 @@ def update_daemon_set(
     v1 = client.AppsV1Api(api)
     try:
         v1.patch_namespaced_daemon_set(name=name, namespace=ns, body=spec)
-    except ApiException as e:
+    except rest.ApiException as e:
         raise ActivityFailed(f"failed to update daemon set '{name}': {str(e)}")
@@ -1,11 +1,13 @@
 import logging
-from functools import partial
+from typing import Any, List
 
-import urllib3
 from chaoslib.types import Secrets
-from kubernetes import client, watch
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.lazy import lazy_import
+from chaosk8s.waiter import Target, wait_for
+
+client = lazy_import("kubernetes.client")
 
 __all__ = [
     "daemon_set_available_and_healthy",
@@ -46,18 +48,7 @@ def daemon_set_available_and_healthy(
         f"Found {len(ret.items)} daemon_set(s) named '{name}' in ns '{ns}'"
     )
 
-    if not ret.items:
-        logger.debug(f"daemon set '{name}' was not found")
-        return False
-
-    for d in ret.items:
-        logger.debug(f"daemon set has '{d.status.number_ready}' available pods")
-
-        if d.status.number_ready != d.status.desired_number_scheduled:
-            logger.debug(f"daemon set '{name}' is not healthy")
-            return False
-
-    return True
+    return _daemon_set_available(name, ret.items)
 
 
 def daemon_set_partially_available(
@@ -86,20 +77,19 @@ def daemon_set_partially_available(
         f"Found {len(ret.items)} daemon_set(s) named '{name}' in ns '{ns}'"
     )
 
-    if not ret.items:
-        logger.debug(f"daemon set '{name}' was not found")
-        return False
+    return _daemon_set_partially_available(name, ret.items)
 
-    for d in ret.items:
-        logger.debug(f"daemon set has '{d.status.number_ready}' ready pods")
 
-        if d.status.number_ready >= 1:
-            return True
-        else:
-            logger.debug(f"daemon set '{name}' is not healthy")
-            return False
+def _daemon_set_is_ready(daemon_set) -> bool:
+    status = daemon_set.status
 
-    return False
+    logger.debug(
+        f"daemon set '{daemon_set.metadata.name}': "
+        f"Available pods {status.number_ready} - "
+        f"Unavailable pods {status.number_unavailable} - "
+        f"Desired scheduled pods {status.desired_number_scheduled}"
+    )
+    return status.number_ready == status.desired_number_scheduled
 
 
 def _daemon_set_readiness_has_state(
@@ -113,56 +103,62 @@ def _daemon_set_readiness_has_state(
     """
     Check wether if the given daemon_set state is ready or not
     according to the ready paramter.
-    If the state is not reached after `timeout` seconds, a
-    :exc:`chaoslib.exceptions.ActivityFailed` exception is raised.
+    Return `False` if the state is not reached after `timeout` seconds.
     """
-    field_selector = f"metadata.name={name}"
-    api = create_k8s_api_client(secrets)
-    v1 = client.AppsV1Api(api)
-    w = watch.Watch()
-    timeout = int(timeout)
-
-    if label_selector is None:
-        watch_events = partial(
-            w.stream,
-            v1.list_namespaced_daemon_set,
-            namespace=ns,
-            field_selector=field_selector,
-            _request_timeout=timeout,
-        )
-    else:
+    target = _daemon_set_readiness_target(name, ready, ns, label_selector)
+    return wait_for([target], timeout=timeout, secrets=secrets)
+
+
+def _daemon_set_readiness_target(
+    name: str, ready: bool, ns: str = "default", label_selector: str = None
+) -> Target:
+    """
+    Target the daemon set `name` until its readiness is `ready`.
+    """
+    if label_selector is not None:
         label_selector = label_selector.format(name=name)
-        watch_events = partial(
-            w.stream,
-            v1.list_namespaced_daemon_set,
-            namespace=ns,
-            field_selector=field_selector,
-            label_selector=label_selector,
-            _request_timeout=timeout,
-        )
 
-    try:
-        logger.debug(f"Watching events for {timeout}s")
-        for event in watch_events():
-            daemon_set = event["object"]
-            status = daemon_set.status
-
-            logger.debug(
-                f"daemon set '{daemon_set.metadata.name}' {event['type']}: "
-                f"Available pods {status.number_ready} - "
-                f"Unavailable pods {status.number_unavailable} - "
-                f"Desired scheduled pods {status.desired_number_scheduled}"
-            )
-
-            readiness = status.number_ready == status.desired_number_scheduled
-            if ready == readiness:
-                w.stop()
-                return True
-
-    except urllib3.exceptions.ReadTimeoutError:
-        logger.debug("Timed out!")
+    def has_state(daemon_set) -> bool:
+        return ready == _daemon_set_is_ready(daemon_set)
+
+    return Target(
+        "daemonset", name, has_state, ns=ns, label_selector=label_selector
+    )
+
+
+def _daemon_set_available(name: str, daemon_sets: List[Any]) -> bool:
+    """
+    Tell whether all the daemon sets named `name` have their pods ready.
+    """
+    if not daemon_sets:
+        logger.debug(f"daemon set '{name}' was not found")
+        return False
+
+    for d in daemon_sets:
+        logger.debug(f"daemon set has '{d.status.number_ready}' available pods")
+
+        if d.status.number_ready != d.status.desired_number_scheduled:
+            logger.debug(f"daemon set '{name}' is not healthy")
+            return False
+
+    return True
+
+
+def _daemon_set_partially_available(name: str, daemon_sets: List[Any]) -> bool:
+    """
+    Tell whether the first of the daemon sets named `name` has a pod ready.
+    """
+    if not daemon_sets:
+        logger.debug(f"daemon set '{name}' was not found")
         return False
 
+    d = daemon_sets[0]
+    logger.debug(f"daemon set has '{d.status.number_ready}' ready pods")
+
+    if d.status.number_ready >= 1:
+        return True
+
+    logger.debug(f"daemon set '{name}' is not healthy")
     return False
 
 
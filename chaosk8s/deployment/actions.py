@@ -1,15 +1,20 @@
 import datetime
-import json
 import logging
-import os.path
+from typing import List
 
-import yaml
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client
-from kubernetes.client.rest import ApiException
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.collection import (
+    _deletion_selectors,
+    delete_namespaced_collection,
+)
+from chaosk8s.lazy import lazy_import
+from chaosk8s.spec import load_spec
+
+client = lazy_import("kubernetes.client")
+rest = lazy_import("kubernetes.client.rest")
 
 __all__ = [
     "create_deployment",
@@ -29,14 +34,7 @@ def create_deployment(
     """
     api = create_k8s_api_client(secrets)
 
-    with open(spec_path) as f:
-        p, ext = os.path.splitext(spec_path)
-        if ext == ".json":
-            deployment = json.loads(f.read())
-        elif ext in [".yml", ".yaml"]:
-            deployment = yaml.safe_load(f.read())
-        else:
-            raise ActivityFailed(f"cannot process {spec_path}")
+    deployment = load_spec(spec_path)
 
     v1 = client.AppsV1Api(api)
     _ = v1.create_namespaced_deployment(ns, body=deployment)
@@ -46,8 +44,9 @@ def delete_deployment(
     name: str = None,
     ns: str = "default",
     label_selector: str = None,
+    delete_collection: bool = False,
     secrets: Secrets = None,
-):
+) -> List[str]:
     """
     Delete a deployment by `name` or `label_selector` in the namespace `ns`.
 
@@ -56,19 +55,24 @@ def delete_deployment(
 
     If neither `name` nor `label_selector` is specified, all the deployments
     will be deleted in the namespace.
+
+    Set `delete_collection` to `True` to delete all the matching deployments
+    through a single request to the API server rather than one per deployment.
+
+    Returns the names of the deleted deployments.
     """
     api = create_k8s_api_client(secrets)
 
     v1 = client.AppsV1Api(api)
 
-    if name:
-        ret = v1.list_namespaced_deployment(
-            ns, field_selector=f"metadata.name={name}"
+    if delete_collection:
+        return delete_namespaced_collection(
+            v1.delete_collection_namespaced_deployment, ns, name, label_selector
         )
-    elif label_selector:
-        ret = v1.list_namespaced_deployment(ns, label_selector=label_selector)
-    else:
-        ret = v1.list_namespaced_deployment(ns)
+
+    ret = v1.list_namespaced_deployment(
+        ns, **_deletion_selectors(name, label_selector)
+    )
 
     logger.debug(f"Found {len(ret.items)} deployments named '{name}'")
 
@@ -76,6 +80,8 @@ def delete_deployment(
     for d in ret.items:
         v1.delete_namespaced_deployment(d.metadata.name, ns, body=body)
 
+    return [d.metadata.name for d in ret.items]
+
 
 def scale_deployment(
     name: str, replicas: int, ns: str = "default", secrets: Secrets = None
@@ -89,7 +95,7 @@ def scale_deployment(
     body = {"spec": {"replicas": replicas}}
     try:
         v1.patch_namespaced_deployment(name=name, namespace=ns, body=body)
-    except ApiException as e:
+    except rest.ApiException as e:
         raise ActivityFailed(
             f"failed to scale '{name}' to {replicas} replicas: {str(e)}"
         )
@@ -121,7 +127,7 @@ def rollout_deployment(
 
     try:
         v1.patch_namespaced_deployment(name=name, namespace=ns, body=body)
-    except ApiException as e:
+    except rest.ApiException as e:
         raise ActivityFailed(
             f"failed to rollout the deployment '{name}'! Error: {str(e)}"
         )
@@ -1,19 +1,22 @@
 import logging
-from functools import partial
-from typing import Union
+from typing import Any, List, Optional, Union
 
-import urllib3
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client, watch
 
-from chaosk8s import create_k8s_api_client
+from chaosk8s import cache, create_k8s_api_client
+from chaosk8s.lazy import lazy_import
+from chaosk8s.views import raw_list
+from chaosk8s.waiter import Target, wait_for
+
+client = lazy_import("kubernetes.client")
 
 __all__ = [
     "deployment_available_and_healthy",
     "deployment_not_fully_available",
     "deployment_fully_available",
     "deployment_partially_available",
+    "deployments_fully_available",
 ]
 logger = logging.getLogger("chaostoolkit")
 
@@ -35,43 +38,36 @@ def deployment_available_and_healthy(
     the probe will return `False` rather than raise the exception.
     """
 
-    field_selector = f"metadata.name={name}"
-    api = create_k8s_api_client(secrets)
-
-    v1 = client.AppsV1Api(api)
-    if label_selector:
-        ret = v1.list_namespaced_deployment(
-            ns, field_selector=field_selector, label_selector=label_selector
-        )
+    deployments = cache.list_objects(
+        "deployments", ns, label_selector, secrets=secrets
+    )
+    if deployments is not None:
+        deployments = [d for d in deployments if d.metadata.name == name]
     else:
-        ret = v1.list_namespaced_deployment(ns, field_selector=field_selector)
+        field_selector = f"metadata.name={name}"
+        api = create_k8s_api_client(secrets)
+
+        v1 = client.AppsV1Api(api)
+        list_deployments = raw_list(v1.list_namespaced_deployment)
+        if label_selector:
+            ret = list_deployments(
+                ns, field_selector=field_selector, label_selector=label_selector
+            )
+        else:
+            ret = list_deployments(ns, field_selector=field_selector)
+        deployments = ret.items
 
     logger.debug(
-        f"Found {len(ret.items)} deployment(s) named '{name}' in ns '{ns}'"
+        f"Found {len(deployments)} deployment(s) named '{name}' in ns '{ns}'"
     )
 
-    if not ret.items:
-        m = f"Deployment '{name}' was not found"
-        if not raise_on_unavailable:
-            logger.debug(m)
-            return False
-        else:
-            raise ActivityFailed(m)
-
-    for d in ret.items:
-        logger.debug(
-            f"Deployment has '{d.status.available_replicas}' available replicas"
-        )
-
-        if d.status.available_replicas != d.spec.replicas:
-            m = f"Deployment '{name}' is not healthy"
-            if not raise_on_unavailable:
-                logger.debug(m)
-                return False
-            else:
-                raise ActivityFailed(m)
-
-    return True
+    m = _not_available(name, deployments)
+    if m is None:
+        return True
+    if not raise_on_unavailable:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
 
 
 def deployment_partially_available(
@@ -93,39 +89,38 @@ def deployment_partially_available(
     api = create_k8s_api_client(secrets)
 
     v1 = client.AppsV1Api(api)
+    list_deployments = raw_list(v1.list_namespaced_deployment)
     if label_selector:
-        ret = v1.list_namespaced_deployment(
+        ret = list_deployments(
             ns, field_selector=field_selector, label_selector=label_selector
         )
     else:
-        ret = v1.list_namespaced_deployment(ns, field_selector=field_selector)
+        ret = list_deployments(ns, field_selector=field_selector)
 
     logger.debug(
         f"Found {len(ret.items)} deployment(s) named '{name}' in ns '{ns}'"
     )
 
-    if not ret.items:
-        m = f"Deployment '{name}' was not found"
-        if not raise_on_not_partially_available:
-            logger.debug(m)
-            return False
-        else:
-            raise ActivityFailed(m)
+    m = _not_partially_available(name, ret.items)
+    if m is None:
+        return True
+    if not raise_on_not_partially_available:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
 
-    for d in ret.items:
-        logger.debug(
-            f"Deployment has '{d.status.available_replicas}' available replicas"
-        )
 
-        if d.status.available_replicas >= 1:
-            return True
-        else:
-            m = f"Deployment '{name}' is not healthy"
-            if not raise_on_not_partially_available:
-                logger.debug(m)
-                return False
-            else:
-                raise ActivityFailed(m)
+def _deployment_is_ready(deployment) -> bool:
+    status = deployment.status
+    spec = deployment.spec
+
+    logger.debug(
+        f"Deployment '{deployment.metadata.name}': "
+        f"Ready Replicas {status.ready_replicas} - "
+        f"Unavailable Replicas {status.unavailable_replicas} - "
+        f"Desired Replicas {spec.replicas}"
+    )
+    return status.ready_replicas == spec.replicas
 
 
 def _deployment_readiness_has_state(
@@ -139,56 +134,87 @@ def _deployment_readiness_has_state(
     """
     Check wether if the given deployment state is ready or not
     according to the ready paramter.
-    If the state is not reached after `timeout` seconds, a
-    :exc:`chaoslib.exceptions.ActivityFailed` exception is raised.
+    Return `False` if the state is not reached after `timeout` seconds.
     """
-    field_selector = f"metadata.name={name}"
-    api = create_k8s_api_client(secrets)
-    v1 = client.AppsV1Api(api)
-    w = watch.Watch()
-    timeout = int(timeout)
-
-    if label_selector is None:
-        watch_events = partial(
-            w.stream,
-            v1.list_namespaced_deployment,
-            namespace=ns,
-            field_selector=field_selector,
-            _request_timeout=timeout,
-        )
-    else:
+    target = _deployment_readiness_target(name, ready, ns, label_selector)
+    return wait_for([target], timeout=timeout, secrets=secrets)
+
+
+def _deployment_readiness_target(
+    name: str, ready: bool, ns: str = "default", label_selector: str = None
+) -> Target:
+    """
+    Target the deployment `name` until its readiness is `ready`.
+    """
+    if label_selector is not None:
         label_selector = label_selector.format(name=name)
-        watch_events = partial(
-            w.stream,
-            v1.list_namespaced_deployment,
-            namespace=ns,
-            field_selector=field_selector,
-            label_selector=label_selector,
-            _request_timeout=timeout,
-        )
 
-    try:
-        logger.debug(f"Watching events for {timeout}s")
-        for event in watch_events():
-            deployment = event["object"]
-            status = deployment.status
-            spec = deployment.spec
-
-            logger.debug(
-                f"Deployment '{deployment.metadata.name}' {event['type']}: "
-                f"Ready Replicas {status.ready_replicas} - "
-                f"Unavailable Replicas {status.unavailable_replicas} - "
-                f"Desired Replicas {spec.replicas}"
+    def has_state(deployment) -> bool:
+        return ready == _deployment_is_ready(deployment)
+
+    return Target(
+        "deployment", name, has_state, ns=ns, label_selector=label_selector
+    )
+
+
+def _deployments_targets(
+    names: List[str], ns: str = "default", label_selector: str = None
+) -> List[Target]:
+    """
+    Target each of the deployments `names` until it is ready.
+    """
+    targets = []
+    for name in names:
+        selector = label_selector.format(name=name) if label_selector else None
+        targets.append(
+            Target(
+                "deployment",
+                name,
+                _deployment_is_ready,
+                ns=ns,
+                label_selector=selector,
             )
+        )
+    return targets
 
-            readiness = status.ready_replicas == spec.replicas
-            if ready == readiness:
-                w.stop()
-                return True
 
-    except urllib3.exceptions.ReadTimeoutError:
-        logger.debug("Timed out!")
-        return False
+def _not_available(name: str, deployments: List[Any]) -> Optional[str]:
+    """
+    Tell why the deployments named `name` are not all available, if they are
+    not.
+    """
+    if not deployments:
+        return f"Deployment '{name}' was not found"
+
+    for d in deployments:
+        logger.debug(
+            f"Deployment has '{d.status.available_replicas}' available replicas"
+        )
+
+        if d.status.available_replicas != d.spec.replicas:
+            return f"Deployment '{name}' is not healthy"
+
+    return None
+
+
+def _not_partially_available(
+    name: str, deployments: List[Any]
+) -> Optional[str]:
+    """
+    Tell why the first of the deployments named `name` has no replica
+    available, if it has none.
+    """
+    if not deployments:
+        return f"Deployment '{name}' was not found"
+
+    d = deployments[0]
+    logger.debug(
+        f"Deployment has '{d.status.available_replicas}' available replicas"
+    )
+
+    if d.status.available_replicas >= 1:
+        return None
+    return f"Deployment '{name}' is not healthy"
 
 
 def deployment_not_fully_available(
@@ -259,3 +285,32 @@ def deployment_fully_available(
             return False
         else:
             raise ActivityFailed(m)
+
+
+def deployments_fully_available(
+    names: List[str],
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: int = 30,
+    raise_on_not_fully_available: bool = True,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Wait until all the expected replicas of each of the deployments `names`
+    are available. The deployments are watched at once, so this waits as long
+    as the slowest of them. Once this state is reached, return `True`.
+    If the state is not reached after `timeout` seconds, a
+    :exc:`chaoslib.exceptions.ActivityFailed` exception is raised.
+
+    If `raise_on_not_fully_available` is set to `False`, return `False` instead
+    of raising the exception.
+    """
+    targets = _deployments_targets(names, ns, label_selector)
+    if wait_for(targets, timeout=timeout, secrets=secrets):
+        return True
+
+    m = f"deployments {names} failed to recover within {timeout}s"
+    if not raise_on_not_fully_available:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
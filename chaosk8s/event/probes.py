@@ -2,9 +2,11 @@ import json
 from typing import Any, Dict
 
 from chaoslib.types import Configuration, Secrets
-from kubernetes import client
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes.client")
 
 __all__ = ["get_events"]
 
@@ -0,0 +1,200 @@
+"""
+Health of a whole cluster, checked over a single snapshot of it.
+
+A snapshot lists each kind of object a health check needs once, all kinds
+at the same time, from the informer cache when it is enabled or from the
+API server otherwise. Checks then select the objects they are about, by
+namespace, name and label selector, and evaluate them in memory, so any
+number of checks costs at most one list per kind.
+
+Objects are healthy when:
+
+* pods: they are `Running` or `Succeeded`
+* nodes: their conditions are as `nodes_must_be_healthy` expects them
+* deployments: all their replicas are available
+* statefulsets: all their replicas are ready
+* daemonsets: their pods are ready on every node they should run on
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s import cache, create_k8s_api_client
+from chaosk8s.concurrency import fan_out
+from chaosk8s.lazy import lazy_import
+from chaosk8s.node.probes import HEALTHY_NODE_CONDITIONS
+from chaosk8s.pagination import iter_items
+from chaosk8s.selectors import compile_selector
+from chaosk8s.views import raw_list
+
+client = lazy_import("kubernetes.client")
+
+__all__ = ["KINDS", "take_snapshot", "check_health"]
+logger = logging.getLogger("chaostoolkit")
+
+# kind: (client API class, all namespaces list method, namespaced one)
+KINDS = {
+    "pods": (
+        "CoreV1Api",
+        "list_pod_for_all_namespaces",
+        "list_namespaced_pod",
+    ),
+    "nodes": ("CoreV1Api", "list_node", None),
+    "deployments": (
+        "AppsV1Api",
+        "list_deployment_for_all_namespaces",
+        "list_namespaced_deployment",
+    ),
+    "statefulsets": (
+        "AppsV1Api",
+        "list_stateful_set_for_all_namespaces",
+        "list_namespaced_stateful_set",
+    ),
+    "daemonsets": (
+        "AppsV1Api",
+        "list_daemon_set_for_all_namespaces",
+        "list_namespaced_daemon_set",
+    ),
+}
+
+
+def take_snapshot(
+    kinds: Iterable[str], ns: str = None, secrets: Secrets = None
+) -> Dict[str, List[Any]]:
+    """
+    List the objects of each of the `kinds` at once, within the namespace
+    `ns` or across all namespaces, and return them per kind.
+    """
+    kinds = list(dict.fromkeys(kinds))
+    for kind in kinds:
+        if kind not in KINDS:
+            raise ActivityFailed(f"Cannot check the health of '{kind}'")
+
+    api = create_k8s_api_client(secrets)
+
+    def list_kind(kind: str) -> List[Any]:
+        namespace = ns if KINDS[kind][2] else None
+        objects = cache.list_objects(kind, namespace, secrets=secrets)
+        if objects is not None:
+            return objects
+
+        api_name, list_all, list_namespaced = KINDS[kind]
+        v1 = getattr(client, api_name)(api)
+        if namespace:
+            list_func = raw_list(getattr(v1, list_namespaced))
+            return list(iter_items(list_func, namespace=namespace))
+        return list(iter_items(raw_list(getattr(v1, list_all))))
+
+    snapshot = {}
+    for kind, objects, error in fan_out(list_kind, kinds, len(kinds)):
+        if error is not None:
+            raise error
+        logger.debug(f"Snapshot holds {len(objects)} {kind}")
+        snapshot[kind] = objects
+    return snapshot
+
+
+def check_health(
+    snapshot: Dict[str, List[Any]], check: Dict[str, Any], ns: str = None
+) -> Dict[str, Any]:
+    """
+    Evaluate a single `check` against the `snapshot` and return its result,
+    listing the problems found.
+
+    A check is a mapping with the `kind` of objects it is about and,
+    optionally, the `name` of the object, its namespace `ns` (defaults to
+    `ns`) and a `label_selector`. Checks naming an object fail when it
+    cannot be found.
+    """
+    kind = check.get("kind")
+    if kind not in KINDS:
+        raise ActivityFailed(f"Cannot check the health of '{kind}'")
+
+    name = check.get("name")
+    namespace = check.get("ns", ns) if KINDS[kind][2] else None
+    selector = compile_selector(check.get("label_selector"))
+
+    objects = [
+        o
+        for o in snapshot.get(kind, [])
+        if (not namespace or o.metadata.namespace == namespace)
+        and (not name or o.metadata.name == name)
+        and selector.matches_object(o)
+    ]
+
+    problems = []
+    if name and not objects:
+        problems.append(f"{kind[:-1]} '{name}' was not found")
+    is_healthy = _PREDICATES[kind]
+    for o in objects:
+        problem = is_healthy(o)
+        if problem:
+            problems.append(f"{_describe(o)} {problem}")
+
+    result = {"kind": kind}
+    for key, value in (
+        ("name", name),
+        ("ns", namespace),
+        ("label_selector", check.get("label_selector")),
+    ):
+        if value:
+            result[key] = value
+    result.update(
+        {"healthy": not problems, "count": len(objects), "problems": problems}
+    )
+    return result
+
+
+###############################################################################
+# Private functions
+###############################################################################
+def _describe(o: Any) -> str:
+    if o.metadata.namespace:
+        return f"'{o.metadata.namespace}/{o.metadata.name}'"
+    return f"'{o.metadata.name}'"
+
+
+def _pod_problem(pod: Any) -> Optional[str]:
+    if pod.status.phase not in ("Running", "Succeeded"):
+        return f"is {pod.status.phase}"
+    return None
+
+
+def _node_problem(node: Any) -> Optional[str]:
+    statuses = {c.type: c.status for c in node.status.conditions or []}
+    for ctype, cvalue in HEALTHY_NODE_CONDITIONS:
+        if ctype in statuses and statuses[ctype] != cvalue:
+            return f"has condition {ctype}={statuses[ctype]}"
+    return None
+
+
+def _replicas_problem(ready: int, expected: int, what: str) -> Optional[str]:
+    # rollouts with a surge run more replicas than expected for a while
+    ready, expected = ready or 0, expected or 0
+    if ready < expected:
+        return f"has {ready}/{expected} {what}"
+    return None
+
+
+_PREDICATES: Dict[str, Callable[[Any], Optional[str]]] = {
+    "pods": _pod_problem,
+    "nodes": _node_problem,
+    "deployments": lambda d: _replicas_problem(
+        d.status.available_replicas, d.spec.replicas, "available replicas"
+    ),
+    "statefulsets": lambda s: _replicas_problem(
+        s.status.ready_replicas, s.spec.replicas, "ready replicas"
+    ),
+    "daemonsets": lambda d: _replicas_problem(
+        d.status.number_ready,
+        d.status.desired_number_scheduled,
+        "ready pods",
+    ),
+}
+
+
+def _kinds_of(checks: List[Dict[str, Any]]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(c.get("kind") for c in checks))
@@ -0,0 +1,75 @@
+import logging
+from typing import Any, Dict, List
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s.health import _kinds_of, check_health, take_snapshot
+
+__all__ = ["cluster_health"]
+logger = logging.getLogger("chaostoolkit")
+
+# problems quoted in the failure message, the report holds them all
+MAX_REPORTED = 10
+
+DEFAULT_CHECKS = [
+    {"kind": "pods"},
+    {"kind": "nodes"},
+    {"kind": "deployments"},
+    {"kind": "statefulsets"},
+    {"kind": "daemonsets"},
+]
+
+
+def cluster_health(
+    checks: List[Dict[str, Any]] = None,
+    ns: str = None,
+    raise_on_unhealthy: bool = True,
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Check the health of many objects at once, over a single snapshot of the
+    cluster which lists each kind of object the `checks` are about once.
+
+    Each check is a mapping with the `kind` of objects it is about, `pods`,
+    `nodes`, `deployments`, `statefulsets` or `daemonsets`, and optionally
+    the `name` of the object, its namespace `ns` and a `label_selector`,
+    such as:
+
+    ```json
+    [
+        {"kind": "pods", "ns": "shop"},
+        {"kind": "nodes", "label_selector": "pool=default"},
+        {"kind": "deployments", "name": "front", "ns": "shop"}
+    ]
+    ```
+
+    By default, every object of every kind is checked. When `ns` is set,
+    namespaced objects are only listed, and checked, in that namespace.
+
+    Returns a report with the overall `healthy` state, the number of objects
+    listed per kind and the result of each check. Raises
+    :exc:`chaoslib.exceptions.ActivityFailed` when any check failed, unless
+    `raise_on_unhealthy` is `False`.
+    """
+    checks = checks or DEFAULT_CHECKS
+    snapshot = take_snapshot(_kinds_of(checks), ns, secrets)
+    results = [check_health(snapshot, check, ns) for check in checks]
+
+    report = {
+        "healthy": all(r["healthy"] for r in results),
+        "objects": {kind: len(objects) for kind, objects in snapshot.items()},
+        "checks": results,
+    }
+
+    if not report["healthy"]:
+        problems = [p for r in results for p in r["problems"]]
+        m = f"the cluster is unhealthy: {'; '.join(problems[:MAX_REPORTED])}"
+        if len(problems) > MAX_REPORTED:
+            m = f"{m} and {len(problems) - MAX_REPORTED} more problem(s)"
+        if not raise_on_unhealthy:
+            logger.debug(m)
+        else:
+            raise ActivityFailed(m)
+
+    return report
@@ -0,0 +1,494 @@
+"""
+Instrumentation of the requests made to the Kubernetes API server.
+
+Every client created by the extension reports its requests, as verb and
+resource (`list pods`, `patch deployments/scale`...), status, latency,
+response size and retries, to the recorders registered at the time. None are
+registered by default, which makes the instrumentation free until asked
+for.
+
+To see what each activity of an experiment costs, declare this module as a
+control:
+
+```json
+"controls": [
+    {
+        "name": "kubernetes-api-calls",
+        "provider": {
+            "type": "python",
+            "module": "chaosk8s.instrumentation",
+            "arguments": {
+                "sinks": ["log", "json"],
+                "json_path": "k8s-api-calls.jsonl"
+            }
+        }
+    }
+]
+```
+
+The calls of each activity are then attached to its result in the journal,
+under `kubernetes_api_calls`, and exported to the given sinks:
+
+* `log`: a summary logged once the activity is done
+* `json`: a JSON line per activity appended to `json_path`
+* `opentelemetry`: metrics recorded with the OpenTelemetry meter provider
+  set by the application, which requires `opentelemetry-api`
+
+Recorders see every call made while they are registered, so activities
+running in the background share the calls made in the meantime.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+from chaoslib.types import Activity, Run
+
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes.client")
+rest = lazy_import("kubernetes.client.rest")
+
+__all__ = [
+    "ApiCall",
+    "ApiCallStats",
+    "instrument_requests",
+    "record_api_calls",
+    "record_call",
+    "before_activity_control",
+    "after_activity_control",
+    "LATENCY_BUCKETS",
+]
+logger = logging.getLogger("chaostoolkit")
+
+# upper bounds, in seconds, of the latency histogram buckets, as in client-go
+LATENCY_BUCKETS = (
+    0.005,
+    0.025,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.0,
+    4.0,
+    8.0,
+    15.0,
+    30.0,
+    60.0,
+)
+
+DEFAULT_JSON_PATH = "chaosk8s-api-calls.jsonl"
+
+# key under which the calls of an activity are attached to its result
+RESULT_KEY = "kubernetes_api_calls"
+
+_VERBS = {"POST": "create", "PUT": "update", "PATCH": "patch"}
+
+
+class ApiCall(NamedTuple):
+    """
+    A request made to the API server. `status` is `0` when no response was
+    received.
+    """
+
+    verb: str
+    resource: str
+    status: int
+    duration: float
+    size: int
+    retries: int
+
+
+class ApiCallStats:
+    """
+    Calls recorded per verb and resource, with a latency histogram for each.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self._requests: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def calls(self) -> int:
+        with self._lock:
+            return sum(r["calls"] for r in self._requests.values())
+
+    def record(self, call: ApiCall) -> None:
+        with self._lock:
+            stats = self._requests.get((call.verb, call.resource))
+            if stats is None:
+                stats = self._requests[(call.verb, call.resource)] = {
+                    "calls": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "bytes": 0,
+                    "latency": {
+                        "sum": 0.0,
+                        "max": 0.0,
+                        "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+                    },
+                }
+            stats["calls"] += 1
+            if not 200 <= call.status < 400:
+                stats["errors"] += 1
+            stats["retries"] += call.retries
+            stats["bytes"] += call.size
+
+            latency = stats["latency"]
+            latency["sum"] += call.duration
+            latency["max"] = max(latency["max"], call.duration)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if call.duration <= bound:
+                    break
+            else:
+                i = len(LATENCY_BUCKETS)
+            latency["buckets"][i] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the recorded calls, totalled and per `"<verb> <resource>"`.
+        Histogram buckets are cumulative and keyed by their upper bound, as
+        with Prometheus.
+        """
+        bounds = [str(b) for b in LATENCY_BUCKETS] + ["+Inf"]
+        requests = {}
+        with self._lock:
+            for (verb, resource), stats in sorted(self._requests.items()):
+                latency = stats["latency"]
+                cumulated = 0
+                buckets = {}
+                for bound, count in zip(bounds, latency["buckets"]):
+                    cumulated += count
+                    buckets[bound] = cumulated
+                requests[f"{verb} {resource}"] = {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "bytes": stats["bytes"],
+                    "latency": {
+                        "sum": round(latency["sum"], 6),
+                        "max": round(latency["max"], 6),
+                        "buckets": buckets,
+                    },
+                }
+
+        totals = {
+            k: sum(r[k] for r in requests.values())
+            for k in ("calls", "errors", "retries", "bytes")
+        }
+        totals["duration"] = round(
+            sum(r["latency"]["sum"] for r in requests.values()), 6
+        )
+        return {**totals, "requests": requests}
+
+
+@contextmanager
+def record_api_calls(recorder: Any = None) -> Iterator[Any]:
+    """
+    Report the calls made within the block to `recorder`, an object with a
+    `record(call)` method, by default a new `ApiCallStats`.
+
+    ```python
+    with record_api_calls() as stats:
+        pods_in_phase(...)
+    print(stats.as_dict())
+    ```
+    """
+    recorder = recorder if recorder is not None else ApiCallStats()
+    _add_recorders([recorder])
+    try:
+        yield recorder
+    finally:
+        _remove_recorders([recorder])
+
+
+def instrument_requests(api: "client.ApiClient") -> "client.ApiClient":
+    """
+    Report every request sent by the client `api` to the recorders
+    registered when it is sent.
+
+    Returns the same client.
+    """
+    request = api.rest_client.request
+
+    def instrumented_request(
+        method: str, url: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        if not _recorders:
+            return request(method, url, *args, **kwargs)
+
+        query = kwargs.get("query_params", args[0] if args else None)
+        verb, resource = _describe_request(method, url, query)
+        started = time.perf_counter()
+        try:
+            response = request(method, url, *args, **kwargs)
+        except rest.ApiException as x:
+            _record(verb, resource, x.status or 0, started, x.body, None)
+            raise
+        except Exception:
+            _record(verb, resource, 0, started, None, None)
+            raise
+
+        _record(verb, resource, response.status, started, None, response)
+        return response
+
+    api.rest_client.request = instrumented_request
+    return api
+
+
+@contextmanager
+def record_call(verb: str, resource: str, status: int = 200) -> Iterator[None]:
+    """
+    Report the block as a single call to `resource`, with the given `verb`
+    and `status` unless it raised. This is meant for requests which bypass
+    the REST client of instrumented clients, such as websocket upgrades.
+    """
+    if not _recorders:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    except rest.ApiException as x:
+        _record(verb, resource, x.status or 0, started, x.body, None)
+        raise
+    except Exception:
+        _record(verb, resource, 0, started, None, None)
+        raise
+    _record(verb, resource, status, started, None, None)
+
+
+def before_activity_control(
+    context: Activity, sinks: List[str] = None, **kwargs: Any
+) -> None:
+    """
+    Start recording the calls made by the activity.
+    """
+    recorders = [ApiCallStats()]
+    if "opentelemetry" in (sinks or ["log"]):
+        meter = _opentelemetry_recorder(context.get("name"))
+        if meter is not None:
+            recorders.append(meter)
+
+    with _activity_recorders_lock:
+        _activity_recorders[id(context)] = recorders
+    _add_recorders(recorders)
+
+
+def after_activity_control(
+    context: Activity,
+    state: Run,
+    sinks: List[str] = None,
+    json_path: str = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Stop recording the calls made by the activity, attach them to its
+    result and export them to the `sinks`, `log` by default.
+    """
+    with _activity_recorders_lock:
+        recorders = _activity_recorders.pop(id(context), None)
+    if recorders is None:
+        return
+    _remove_recorders(recorders)
+
+    stats = recorders[0].as_dict()
+    if isinstance(state, dict):
+        state[RESULT_KEY] = stats
+
+    name = context.get("name")
+    for sink in sinks or ["log"]:
+        if sink == "log":
+            _log_stats(name, stats)
+        elif sink == "json":
+            _write_stats(name, stats, json_path or DEFAULT_JSON_PATH)
+        elif sink != "opentelemetry":
+            logger.warning(f"Unknown Kubernetes API call sink '{sink}'")
+
+
+###############################################################################
+# Private functions
+###############################################################################
+_recorders: Tuple[Any, ...] = ()
+_recorders_lock = threading.Lock()
+
+_activity_recorders: Dict[int, List[Any]] = {}
+_activity_recorders_lock = threading.Lock()
+
+
+def _add_recorders(recorders: List[Any]) -> None:
+    global _recorders
+    # replaced rather than mutated so that requests iterate without locking
+    with _recorders_lock:
+        _recorders = _recorders + tuple(recorders)
+
+
+def _remove_recorders(recorders: List[Any]) -> None:
+    global _recorders
+    with _recorders_lock:
+        _recorders = tuple(
+            r for r in _recorders if not any(r is o for o in recorders)
+        )
+
+
+def _record(
+    verb: str,
+    resource: str,
+    status: int,
+    started: float,
+    body: Optional[Any],
+    response: Optional[Any],
+) -> None:
+    duration = time.perf_counter() - started
+    size = len(body) if body else 0
+    retries = 0
+    if response is not None:
+        # preloaded responses wrap the urllib3 one, streamed ones are it and
+        # reading their data would consume the stream
+        raw = getattr(response, "urllib3_response", None)
+        if raw is not None:
+            size = len(response.data or "")
+        else:
+            raw = response
+            try:
+                size = int(raw.getheader("Content-Length") or 0)
+            except (AttributeError, TypeError, ValueError):
+                size = 0
+        history = getattr(getattr(raw, "retries", None), "history", None)
+        retries = len(history) if isinstance(history, tuple) else 0
+
+    call = ApiCall(verb, resource, status, duration, size, retries)
+    for recorder in _recorders:
+        try:
+            recorder.record(call)
+        except Exception as x:
+            logger.debug(f"Failed to record Kubernetes API call: {x}")
+
+
+def _describe_request(
+    method: str, url: str, query: Any = None
+) -> Tuple[str, str]:
+    """
+    Tell the verb and resource of a request from its method and path, such as
+    `list pods` for `GET /api/v1/namespaces/default/pods`.
+    """
+    method = method.upper()
+    path = urlsplit(url).path
+    parts = [p for p in path.split("/") if p]
+
+    if parts[:1] == ["api"]:
+        parts = parts[2:]
+    elif parts[:1] == ["apis"]:
+        parts = parts[3:]
+    else:
+        # non-resource paths such as /version or /healthz
+        return method.lower(), path or "/"
+
+    if len(parts) >= 3 and parts[0] == "namespaces":
+        parts = parts[2:]
+    if not parts:
+        return method.lower(), path
+
+    resource = parts[0]
+    named = len(parts) > 1
+    if len(parts) > 2:
+        resource = f"{resource}/{parts[2]}"
+
+    if method == "GET":
+        params = dict(query or [])
+        if str(params.get("watch", "")).lower() == "true":
+            verb = "watch"
+        else:
+            verb = "get" if named else "list"
+    elif method == "DELETE":
+        verb = "delete" if named else "deletecollection"
+    else:
+        verb = _VERBS.get(method, method.lower())
+
+    return verb, resource
+
+
+def _log_stats(activity: str, stats: Dict[str, Any]) -> None:
+    logger.info(
+        f"Activity '{activity}' made {stats['calls']} Kubernetes API call(s) "
+        f"in {stats['duration']:.3f}s, received {stats['bytes']} bytes, with "
+        f"{stats['errors']} error(s) and {stats['retries']} retry(ies)"
+    )
+    for request, r in stats["requests"].items():
+        logger.debug(
+            f"  {request}: {r['calls']} call(s), "
+            f"{r['latency']['sum']:.3f}s (max {r['latency']['max']:.3f}s), "
+            f"{r['bytes']} bytes"
+        )
+
+
+def _write_stats(activity: str, stats: Dict[str, Any], path: str) -> None:
+    record = {"activity": activity, "at": time.time(), **stats}
+    try:
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as x:
+        logger.warning(f"Failed to write Kubernetes API calls to '{path}': {x}")
+
+
+class _OpenTelemetryRecorder:
+    """
+    Record calls as OpenTelemetry metrics, tagged with the activity.
+    """
+
+    def __init__(self, activity: str, instruments: Tuple[Any, Any, Any]):
+        self.activity = activity
+        self.requests, self.duration, self.size = instruments
+
+    def record(self, call: ApiCall) -> None:
+        attributes = {
+            "chaosk8s.activity": self.activity or "",
+            "k8s.verb": call.verb,
+            "k8s.resource": call.resource,
+            "http.response.status_code": call.status,
+        }
+        self.requests.add(1, attributes)
+        self.duration.record(call.duration, attributes)
+        self.size.add(call.size, attributes)
+
+
+_instruments = None
+
+
+def _opentelemetry_recorder(activity: str) -> Optional[_OpenTelemetryRecorder]:
+    global _instruments
+    if _instruments is None:
+        try:
+            from opentelemetry import metrics
+        except ImportError:
+            logger.warning(
+                "Install opentelemetry-api to export Kubernetes API calls "
+                "to OpenTelemetry"
+            )
+            return None
+
+        meter = metrics.get_meter("chaosk8s")
+        _instruments = (
+            meter.create_counter(
+                "k8s.client.requests",
+                unit="{request}",
+                description="Requests sent to the Kubernetes API server",
+            ),
+            meter.create_histogram(
+                "k8s.client.request.duration",
+                unit="s",
+                description="Latency of requests to the Kubernetes API server",
+            ),
+            meter.create_counter(
+                "k8s.client.response.size",
+                unit="By",
+                description="Bytes received from the Kubernetes API server",
+            ),
+        )
+    return _OpenTelemetryRecorder(activity, _instruments)
@@ -0,0 +1,62 @@
+"""
+Deferred imports of the Kubernetes client.
+
+Importing `kubernetes` loads the whole generated client, hundreds of API
+and model modules, which takes a noticeable time and memory. Discovering
+or merely loading the activities of this extension does not need any of
+them, so modules refer to the client through `lazy_import` proxies which
+only import the real module when one of its attributes is first looked up,
+typically when an activity runs.
+
+As the proxy is bound at module level, it can be patched in tests as if it
+were the module itself.
+"""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Dict, List
+
+__all__ = ["lazy_import", "LazyModule"]
+
+_proxies: Dict[str, "LazyModule"] = {}
+_proxies_lock = threading.Lock()
+
+
+class LazyModule(ModuleType):
+    """
+    Stand-in for the module `name`, imported on first attribute access.
+
+    Lookups are always forwarded to the imported module, rather than copied
+    from it, so attributes later set on the module are seen through the
+    proxy too.
+    """
+
+    def __getattr__(self, attr: str) -> Any:
+        # only called for attributes not set on the proxy itself
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self.__name__}'>"
+
+    def _load(self) -> ModuleType:
+        return importlib.import_module(self.__name__)
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Return a proxy of the module `name`, such as `"kubernetes.client"`, which
+    imports it on first use. Proxies are shared so that patching an
+    attribute of one is seen by every module using it, like with a real
+    module.
+    """
+    with _proxies_lock:
+        proxy = _proxies.get(name)
+        if proxy is None:
+            proxy = _proxies[name] = LazyModule(name)
+        return proxy
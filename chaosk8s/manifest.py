@@ -0,0 +1,62 @@
+"""
+Precomputed manifest of the activities exported by this extension.
+
+Discovering activities means importing every activity module and parsing
+the docstring and signature of each function, which is the bulk of the time
+`chaos discover` spends on this extension. Since the activities only change
+with the package, wheels ship with a manifest computed at build time (see
+`pdm_build.py`) and keyed by the package version. When the manifest is
+missing, or was built for another version, such as when running from a
+source checkout, discovery falls back to introspecting the modules.
+"""
+
+import json
+import logging
+import os.path
+from typing import List, Optional
+
+from chaoslib.types import DiscoveredActivities
+
+__all__ = ["MANIFEST_PATH", "load_manifest", "write_manifest"]
+logger = logging.getLogger("chaostoolkit")
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "activities.json")
+
+
+def load_manifest(
+    version: str, path: str = None
+) -> Optional[List[DiscoveredActivities]]:
+    """
+    Load the activities from the manifest at `path`, by default the one
+    shipped with the package, provided it was built for `version`.
+
+    Return `None` when there is no usable manifest.
+    """
+    path = path or MANIFEST_PATH
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as x:
+        logger.debug(f"Ignoring unreadable activity manifest '{path}': {x}")
+        return None
+
+    if manifest.get("version") != version:
+        logger.debug(
+            f"Ignoring activity manifest built for version "
+            f"'{manifest.get('version')}', running '{version}'"
+        )
+        return None
+
+    return manifest.get("activities")
+
+
+def write_manifest(
+    activities: List[DiscoveredActivities], version: str, path: str
+) -> None:
+    """
+    Save the `activities` to a manifest at `path`, keyed by `version`.
+    """
+    with open(path, "w") as f:
+        json.dump({"version": version, "activities": activities}, f)
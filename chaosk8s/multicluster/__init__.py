@@ -0,0 +1,195 @@
+"""
+Run the same activity against several clusters at once.
+
+Clusters are the contexts of the kubeconfig file, given by name or as glob
+patterns such as `prod-*`. The activity is called once per context, from a
+pool of threads, with `KUBERNETES_CONTEXT` set in its secrets, so that each
+cluster gets its own cached client. Results are returned per context.
+
+Contexts only select a cluster when the client is configured from a
+kubeconfig file, so running against several clusters fails when the client
+would be configured from the environment or from within a pod instead.
+"""
+
+import fnmatch
+import importlib
+import inspect
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s import get_config_path, has_local_config_file
+from chaosk8s.concurrency import fan_out
+from chaosk8s.lazy import lazy_import
+
+config = lazy_import("kubernetes.config")
+
+__all__ = [
+    "list_contexts",
+    "resolve_contexts",
+    "run_on_clusters",
+    "load_activity",
+    "DEFAULT_MAX_CONCURRENCY",
+]
+logger = logging.getLogger("chaostoolkit")
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def list_contexts(pattern: str = None) -> List[str]:
+    """
+    List the names of the contexts of the kubeconfig file, only those
+    matching the glob `pattern` when given.
+    """
+    try:
+        contexts, _ = config.list_kube_config_contexts(
+            config_file=get_config_path()
+        )
+    except config.ConfigException as x:
+        raise ActivityFailed(f"Failed to read the Kubernetes contexts: {x}")
+
+    names = [c["name"] for c in contexts or []]
+    if pattern:
+        names = fnmatch.filter(names, pattern)
+    return names
+
+
+def resolve_contexts(contexts: Union[str, Iterable[str]]) -> List[str]:
+    """
+    Expand the glob patterns among `contexts` into the names of the contexts
+    they match, in order and without duplicates. Plain names are kept as
+    they are.
+    """
+    if isinstance(contexts, str):
+        contexts = [contexts]
+
+    known = None
+    names = []
+    for context in contexts:
+        if not _is_pattern(context):
+            matches = [context]
+        else:
+            if known is None:
+                known = list_contexts()
+            matches = fnmatch.filter(known, context)
+            if not matches:
+                logger.debug(f"No Kubernetes context matches '{context}'")
+        for name in matches:
+            if name not in names:
+                names.append(name)
+
+    if not names:
+        raise ActivityFailed(
+            f"No Kubernetes context matches {', '.join(contexts)}"
+        )
+    return names
+
+
+def run_on_clusters(
+    func: Callable[..., Any],
+    contexts: Union[str, Iterable[str]],
+    secrets: Secrets = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    **kwargs: Any,
+) -> Dict[str, Tuple[Any, BaseException]]:
+    """
+    Call `func` with the keyword arguments `kwargs` once per context, with
+    at most `max_concurrency` clusters at a time.
+
+    Return, per context, a `(result, error)` tuple where `error` is the
+    exception the call raised, if any.
+    """
+    config_file = get_config_path()
+    if not has_local_config_file(config_file):
+        # the client would then ignore the context and every call would hit
+        # the same API server
+        raise ActivityFailed(
+            f"Clusters are selected by kubeconfig context but no kubeconfig "
+            f"file was found at '{config_file}'"
+        )
+
+    names = resolve_contexts(contexts)
+    secrets = secrets or {}
+
+    def call(context: str) -> Any:
+        return func(
+            **kwargs, secrets={**secrets, "KUBERNETES_CONTEXT": context}
+        )
+
+    logger.debug(
+        f"Running '{func.__name__}' against {len(names)} cluster(s): "
+        f"{', '.join(names)}"
+    )
+    results = {}
+    for context, result, error in fan_out(call, names, max_concurrency):
+        results[context] = (result, error)
+
+    # as ordered by the caller rather than by completion
+    return {name: results[name] for name in names}
+
+
+def load_activity(name: str) -> Callable[..., Any]:
+    """
+    Load an activity of this extension from its dotted name, such as
+    `chaosk8s.pod.probes.count_pods`.
+    """
+    module_name, _, func_name = name.rpartition(".")
+    if not module_name.startswith("chaosk8s.") or module_name.startswith(
+        "chaosk8s.multicluster"
+    ):
+        raise ActivityFailed(
+            f"'{name}' is not an activity of chaostoolkit-kubernetes"
+        )
+
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as x:
+        raise ActivityFailed(f"Cannot load activity '{name}': {x}")
+
+    func = getattr(module, func_name, None)
+    if func is None or func_name not in getattr(module, "__all__", []):
+        raise ActivityFailed(f"No activity named '{name}'")
+
+    if "secrets" not in inspect.signature(func).parameters:
+        raise ActivityFailed(f"Activity '{name}' does not take secrets")
+
+    return func
+
+
+###############################################################################
+# Private functions
+###############################################################################
+def _is_pattern(name: str) -> bool:
+    return any(c in name for c in "*?[")
+
+
+def _arguments(name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
+    arguments = arguments or {}
+    # each cluster's activity is given the secrets of the multi-cluster one
+    if "secrets" in arguments:
+        raise ActivityFailed(
+            f"Arguments of '{name}' cannot hold secrets, pass them to the "
+            f"multi-cluster activity instead"
+        )
+    return arguments
+
+
+def _outputs(
+    name: str, results: Dict[str, Any], raise_on_error: bool
+) -> Dict[str, Any]:
+    outputs = {}
+    failures = []
+    for context, (result, error) in results.items():
+        outputs[context] = result
+        if error is not None:
+            logger.debug(f"'{name}' failed on cluster '{context}': {error}")
+            failures.append(f"{context}: {error}")
+
+    if failures and raise_on_error:
+        raise ActivityFailed(
+            f"'{name}' failed on {len(failures)} of {len(results)} "
+            f"cluster(s): {'; '.join(failures)}"
+        )
+    return outputs
@@ -0,0 +1,42 @@
+from typing import Any, Dict, List, Union
+
+from chaoslib.types import Secrets
+
+from chaosk8s.multicluster import (
+    DEFAULT_MAX_CONCURRENCY,
+    _arguments,
+    _outputs,
+    load_activity,
+    run_on_clusters,
+)
+
+__all__ = ["act_on_clusters"]
+
+
+def act_on_clusters(
+    action: str,
+    contexts: Union[str, List[str]],
+    arguments: Dict[str, Any] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    raise_on_error: bool = True,
+    secrets: Secrets = None,
+) -> Dict[str, Any]:
+    """
+    Run the `action` of this extension, given by its dotted name such as
+    `chaosk8s.pod.actions.terminate_pods`, with the `arguments` against each
+    of the kubeconfig `contexts` at once. Contexts may be glob patterns, such
+    as `prod-*`.
+
+    Return the output of the action per context. Unless `raise_on_error` is
+    disabled, the action fails when it failed on any cluster; otherwise the
+    output of those clusters is `None`.
+    """
+    func = load_activity(action)
+    results = run_on_clusters(
+        func,
+        contexts,
+        secrets,
+        max_concurrency,
+        **_arguments(action, arguments),
+    )
+    return _outputs(action, results, raise_on_error)
@@ -1,8 +1,8 @@
 import logging
 from chaoslib.types import Secrets
-from kubernetes import client
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.metadata import list_metadata
 
 __all__ = ["namespace_exists"]
 logger = logging.getLogger("chaostoolkit")
@@ -18,11 +18,14 @@ def namespace_exists(
     """
     api = create_k8s_api_client(secrets)
 
-    v1 = client.CoreV1Api(api)
+    found = list_metadata(
+        api,
+        "/api/v1/namespaces",
+        field_selector=f"metadata.name={name}",
+        limit=1,
+    )
 
-    ret = v1.list_namespace(field_selector=f"metadata.name={name}")
-
-    if not ret.items:
+    if not found:
         m = f"namespace '{name}' does not exist"
         logger.debug(m)
         return False
@@ -5,10 +5,12 @@ from typing import Any, Dict
 import yaml
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client
-from kubernetes.client.rest import ApiException
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes.client")
+rest = lazy_import("kubernetes.client.rest")
 
 __all__ = [
     "create_ingress",
@@ -66,7 +68,7 @@ def update_ingress(
     v1 = client.NetworkingV1Api(api)
     try:
         v1.patch_namespaced_ingress(name=name, namespace=ns, body=spec)
-    except ApiException as e:
+    except rest.ApiException as e:
         raise ActivityFailed(f"failed to update daemon set '{name}': {str(e)}")
 
 
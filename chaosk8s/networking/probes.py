@@ -1,9 +1,9 @@
 import logging
 
 from chaoslib.types import Secrets
-from kubernetes import client
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.metadata import list_metadata
 
 __all__ = ["ingress_exists"]
 logger = logging.getLogger("chaostoolkit")
@@ -20,13 +20,15 @@ def ingress_exists(
     """
     api = create_k8s_api_client(secrets)
 
-    v1 = client.NetworkingV1Api(api)
-
-    ret = v1.list_namespaced_ingress(
-        namespace=ns, field_selector=f"metadata.name={name}"
+    found = list_metadata(
+        api,
+        "/apis/networking.k8s.io/v1/namespaces/{namespace}/ingresses",
+        path_params={"namespace": ns},
+        field_selector=f"metadata.name={name}",
+        limit=1,
     )
 
-    if not ret.items:
+    if not found:
         logger.debug(f"ingress '{name}' does not exist")
         return False
 
@@ -5,14 +5,19 @@
 import logging
 import random
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client
-from kubernetes.client.rest import ApiException
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.concurrency import fan_out
+from chaosk8s.lazy import lazy_import
+from chaosk8s.pagination import iter_items, iter_pages
+
+client = lazy_import("kubernetes.client")
+watch = lazy_import("kubernetes.watch")
+rest = lazy_import("kubernetes.client.rest")
 
 __all__ = [
     "create_node",
@@ -23,6 +28,9 @@ __all__ = [
 ]
 logger = logging.getLogger("chaostoolkit")
 
+EVICTION_BACKOFF_BASE = 1
+EVICTION_BACKOFF_CAP = 30
+
 
 def _select_nodes(
     name: str = None,
@@ -32,7 +40,7 @@ def _select_nodes(
     pod_label_selector: str = None,
     pod_namespace: str = None,
     first: bool = False,
-) -> List[client.V1Node]:
+) -> List["client.V1Node"]:
     """
     Selects nodes of the kubernetes cluster based on the input parameters and
      returns them.
@@ -47,61 +55,32 @@ def _select_nodes(
     the pod's label through the `pod_label_selector` parameter and
     `pod_namespace` parameter.
     The amount of nodes to return can be capped through the `count` paramteter.
-    In this case `count` random nodes will be returned.
+    In this case up to `count` distinct random nodes will be returned.
     If first is set to true only the first node is returned.
     """
-    nodes = []
     api = create_k8s_api_client(secrets)
     v1 = client.CoreV1Api(api)
 
-    if name and not label_selector:
-        logger.debug(f"Filtering nodes by name {name}")
-        ret = v1.list_node(field_selector=f"metadata.name={name}")
-        logger.debug(f"Found {len(ret.items)} nodes")
-    elif label_selector and not name:
-        logger.debug(f"Filtering nodes by label {label_selector}")
-        ret = v1.list_node(label_selector=label_selector)
-        logger.debug(f"Found {len(ret.items)} nodes")
-    elif name and label_selector:
-        logger.debug(
-            "Filtering nodes by name %s and \
-                      label %s"
-            % (name, label_selector)
-        )
-        ret = v1.list_node(
-            field_selector=f"metadata.name={name}",
-            label_selector=label_selector,
-        )
-        logger.debug(f"Found {len(ret.items)} nodes")
-    else:
-        ret = v1.list_node()
+    selectors = _node_selectors(name, label_selector)
+    nodes = list(iter_items(v1.list_node, **selectors))
+    logger.debug(f"Found {len(nodes)} nodes")
 
     if pod_label_selector and pod_namespace:
         logger.debug(f"Filtering nodes by pod label {pod_label_selector}")
-        pods = v1.list_namespaced_pod(
-            pod_namespace, label_selector=pod_label_selector
-        )
-        for node in ret.items:
-            for pod in pods.items:
-                if pod.spec.node_name == node.metadata.name:
-                    nodes.append(node)
-                    pass
+        # index the nodes hosting the pods once, rather than scanning every
+        # pod for each node, so each node is picked once at most
+        hosting = {
+            pod.spec.node_name
+            for pod in iter_items(
+                v1.list_namespaced_pod,
+                pod_namespace,
+                label_selector=pod_label_selector,
+            )
+        }
+        nodes = [n for n in nodes if n.metadata.name in hosting]
         logger.debug(f"Found {len(nodes)} nodes")
-    else:
-        nodes = ret.items
-
-    if not nodes:
-        raise ActivityFailed("failed to find a node that matches selector")
 
-    if first:
-        nodes = [nodes[0]]
-    elif count is not None:
-        nodes = random.choices(nodes, k=count)
-    logger.debug(
-        f"Picked nodes '{', '.join([n.metadata.name for n in nodes])}'"
-    )
-
-    return nodes
+    return _pick_nodes(nodes, count, first)
 
 
 def delete_nodes(
@@ -134,27 +113,16 @@ def delete_nodes(
 
     v1 = client.CoreV1Api(api)
 
-    first = False
-    if (
-        (all is None or all is False)
-        and (rand is None or rand is False)
-        and (count is None or count < 1)
-    ):
-        first = True
-
-    if rand:
-        count = 1
-
-    if all:
-        count, label_selector, pod_label_selector, pod_namespace = None
-
     nodes = _select_nodes(
         secrets=secrets,
-        label_selector=label_selector,
-        pod_label_selector=pod_label_selector,
-        pod_namespace=pod_namespace,
-        count=count,
-        first=first,
+        **_deletion_selection(
+            label_selector,
+            all,
+            rand,
+            count,
+            pod_label_selector,
+            pod_namespace,
+        ),
     )
 
     deleted = []
@@ -165,15 +133,7 @@ def delete_nodes(
             body=body,
             grace_period_seconds=grace_period_seconds,
         )
-
-        if res.status != "Success":
-            logger.debug(
-                f"Deleting node '{n.metadata.name}' failed: "
-                f"{res.message} [{res.status}] - {res.reason}"
-            )
-            logger.debug(f"The response was: {res.to_dict()}")
-        else:
-            logger.debug("Node '{n.metadata.name}' deleted")
+        if _node_deleted(n.metadata.name, res):
             deleted.append(n.metadata.name)
 
     return deleted
@@ -183,7 +143,7 @@ def create_node(
     meta: Dict[str, Any] = None,
     spec: Dict[str, Any] = None,
     secrets: Secrets = None,
-) -> client.V1Node:
+) -> "client.V1Node":
     """
     Create one new node in the cluster.
 
@@ -203,7 +163,7 @@ def create_node(
 
     try:
         res = v1.create_node(body)
-    except ApiException as x:
+    except rest.ApiException as x:
         raise ActivityFailed(f"Creating new node failed: {x.body}")
 
     logger.debug(f"Node '{res.metadata.name}' created")
@@ -233,7 +193,7 @@ def cordon_node(
         try:
             v1.patch_node(n.metadata.name, body)
             cordoned.append(n.metadata.name)
-        except ApiException as x:
+        except rest.ApiException as x:
             logger.debug(
                 f"Unscheduling node '{n.metadata.name}' failed: {x.body}"
             )
@@ -266,7 +226,7 @@ def uncordon_node(
         try:
             v1.patch_node(n.metadata.name, body)
             uncordoned.append(n.metadata.name)
-        except ApiException as x:
+        except rest.ApiException as x:
             logger.debug(
                 f"Scheduling node '{n.metadata.name}' failed: {x.body}"
             )
@@ -286,6 +246,7 @@ def drain_nodes(
     count: int = None,
     pod_label_selector: str = None,
     pod_namespace: str = None,
+    max_concurrency: int = 1,
 ) -> List[str]:
     """
     Drain nodes matching the given label or name, so that no pods are scheduled
@@ -296,6 +257,17 @@ def drain_nodes(
     `delete_pods_with_local_storage` is set to `True`. There is no
     equivalent to the `kubectl drain --force` flag.
 
+    Each node is given `timeout` seconds, from when its draining starts, for
+    its pods to be evicted and to go. Evictions refused because of a pod
+    disruption budget are retried, with an exponential backoff, within that
+    time. Pods which could not be evicted are all reported in the raised
+    :exc:`chaoslib.exceptions.ActivityFailed`, along with the nodes which
+    failed to drain.
+
+    Set `max_concurrency` to a value greater than `1` to drain several nodes,
+    and evict their pods, in parallel, with up to that many evictions in
+    flight at once.
+
     You probably want to call `uncordon` from in your experiment's rollbacks.
     """
     # first let's make the node unschedulable
@@ -317,121 +289,408 @@ def drain_nodes(
     for node in nodes:
         cordon_node(name=node.metadata.name, secrets=secrets)
 
-    for node in nodes:
-        node_name = node.metadata.name
-        ret = v1.list_pod_for_all_namespaces(
-            field_selector=f"spec.nodeName={node_name}"
+    def list_candidates(
+        node: "client.V1Node",
+    ) -> Tuple[List["client.V1Pod"], str]:
+        return _list_eviction_candidates(
+            v1, node.metadata.name, delete_pods_with_local_storage
         )
 
-        logger.debug(f"Found {len(ret.items)} pods on node '{node_name}'")
+    candidates = {}
+    for node, listed, error in fan_out(list_candidates, nodes, max_concurrency):
+        if error is not None:
+            raise error
+        if listed[0]:
+            candidates[node.metadata.name] = listed
+
+    if not candidates:
+        logger.debug("No pods to evict")
+        return [n.metadata.name for n in nodes]
+
+    pods = [p for listed, _ in candidates.values() for p in listed]
+    logger.debug(f"Found {len(pods)} pods to evict")
+
+    # nodes drained at once share the workers evicting their pods
+    workers, per_node = _drain_workers(max_concurrency, len(candidates))
+
+    def drain(node_name: str) -> Dict[str, Any]:
+        listed, resource_version = candidates[node_name]
+        # each node is given its own timeout, from when its draining starts
+        deadline = time.time() + timeout
+
+        def evict(pod: "client.V1Pod") -> str:
+            return _evict_pod(v1, pod, deadline)
+
+        failed = {}
+        for pod, outcome, error in fan_out(evict, listed, per_node):
+            pod_name = f"{pod.metadata.namespace}/{pod.metadata.name}"
+            if error is not None:
+                reason = (
+                    error.body
+                    if isinstance(error, rest.ApiException)
+                    else error
+                )
+                logger.debug(f"Failed to evict pod '{pod_name}': {reason}")
+                failed[pod_name] = reason
+            else:
+                logger.debug(f"Pod '{pod_name}' {outcome}")
 
-        if not ret.items:
-            continue
+        if not failed:
+            # watching from the listing's version means we also see the pods
+            # which went away before the watch started
+            _wait_for_pods_to_go(
+                v1, node_name, listed, resource_version, timeout, deadline
+            )
+        return failed
+
+    failed = {}
+    errors = {}
+    for node_name, failures, error in fan_out(drain, list(candidates), workers):
+        if error is not None:
+            logger.debug(f"Failed to drain node '{node_name}': {error}")
+            errors[node_name] = error
+        else:
+            failed.update(failures)
 
-        # following the drain command from kubectl as best as we can
-        eviction_candidates = []
-        for pod in ret.items:
-            name = pod.metadata.name
-            phase = pod.status.phase
-            volumes = pod.spec.volumes
-            annotations = pod.metadata.annotations
+    error = _drain_error(failed, len(pods), errors, len(candidates))
+    if error is not None:
+        raise error
 
-            # do not handle mirror pods
-            if annotations and "kubernetes.io/config.mirror" in annotations:
-                logger.debug(
-                    f"Not deleting mirror pod '{name}' on "
-                    f"node '{node_name}'"
-                )
-                continue
+    return [n.metadata.name for n in nodes]
 
-            if any(filter(lambda v: v.empty_dir is not None, volumes)):
-                logger.debug(
-                    f"Pod '{name}' on node '{node_name}' has a volume made "
-                    "of a local storage"
-                )
-                if not delete_pods_with_local_storage:
-                    logger.debug("Not evicting a pod with local storage")
-                    continue
-                logger.debug("Deleting anyway due to flag")
-                eviction_candidates.append(pod)
-                continue
 
-            if phase in ["Succeeded", "Failed"]:
-                eviction_candidates.append(pod)
-                continue
+###############################################################################
+# Internals
+###############################################################################
+def _node_selectors(
+    name: str = None, label_selector: str = None
+) -> Dict[str, str]:
+    """
+    Build the selectors listing the nodes named `name` and matching
+    `label_selector`, if given.
+    """
+    selectors = {}
+    if name:
+        logger.debug(f"Filtering nodes by name {name}")
+        selectors["field_selector"] = f"metadata.name={name}"
+    if label_selector:
+        logger.debug(f"Filtering nodes by label {label_selector}")
+        selectors["label_selector"] = label_selector
+    return selectors
 
-            for owner in pod.metadata.owner_references:
-                if owner.controller and owner.kind != "DaemonSet":
-                    eviction_candidates.append(pod)
-                    break
-                elif owner.kind == "DaemonSet":
-                    logger.debug(
-                        f"Pod '{name}' on node '{node_name}' is owned by a DaemonSet."
-                        " Will not evict it"
-                    )
-                    break
-            else:
-                raise ActivityFailed(
-                    f"Pod '{name}' on node '{node_name}' is unmanaged, cannot drain"
-                    " this node. Delete it manually first?"
-                )
 
-        if not eviction_candidates:
-            logger.debug("No pods to evict. Let's move on to the next node.")
-            continue
-
-        logger.debug(f"Found {len(eviction_candidates)} pods to evict")
-        for pod in eviction_candidates:
-            eviction = client.V1Eviction()
-            eviction.metadata = client.V1ObjectMeta()
-            eviction.metadata.name = pod.metadata.name
-            eviction.metadata.namespace = pod.metadata.namespace
-
-            eviction.delete_options = client.V1DeleteOptions()
-            try:
-                v1.create_namespaced_pod_eviction(
-                    pod.metadata.name, pod.metadata.namespace, body=eviction
-                )
-            except ApiException as x:
-                raise ActivityFailed(
-                    f"Failed to evict pod {pod.metadata.name}: {x.body}"
-                )
+def _pick_nodes(
+    nodes: List["client.V1Node"], count: int = None, first: bool = False
+) -> List["client.V1Node"]:
+    """
+    Pick the first of the selected `nodes` or, with a `count`, up to that
+    many of them at random.
+    """
+    if not nodes:
+        raise ActivityFailed("failed to find a node that matches selector")
 
-        pods = eviction_candidates[:]
-        started = time.time()
-        while True:
-            logger.debug(f"Waiting for {len(pods)} pods to go")
+    if first:
+        nodes = [nodes[0]]
+    elif count is not None:
+        nodes = random.sample(nodes, min(count, len(nodes)))
+    logger.debug(
+        f"Picked nodes '{', '.join([n.metadata.name for n in nodes])}'"
+    )
 
-            if time.time() - started > timeout:
-                remaining_pods = "\n".join([p.metadata.name for p in pods])
-                raise ActivityFailed(
-                    f"Draining nodes did not completed within {timeout}s. "
-                    f"Remaining pods are:\n{remaining_pods}"
-                )
+    return nodes
 
-            pending_pods = pods[:]
-            for pod in pods:
-                try:
-                    p = v1.read_namespaced_pod(
-                        pod.metadata.name, pod.metadata.namespace
-                    )
-                    # rescheduled elsewhere?
-                    if p.metadata.uid != pod.metadata.uid:
-                        pending_pods.remove(pod)
-                        continue
-                    logger.debug(
-                        f"Pod '{p.metadata.name}' still around in phase:"
-                        f" {p.status.phase}"
-                    )
-                except ApiException as x:
-                    if x.status == 404:
-                        # gone...
-                        pending_pods.remove(pod)
-            pods = pending_pods[:]
-            if not pods:
-                logger.debug("Evicted all pods we could")
-                break
-
-            time.sleep(10)
 
-    return [n.metadata.name for n in nodes]
+def _deletion_selection(
+    label_selector: str = None,
+    all: bool = False,
+    rand: bool = False,
+    count: int = None,
+    pod_label_selector: str = None,
+    pod_namespace: str = None,
+) -> Dict[str, Any]:
+    """
+    Turn the arguments of `delete_nodes` into those of `_select_nodes`.
+    """
+    first = False
+    if (
+        (all is None or all is False)
+        and (rand is None or rand is False)
+        and (count is None or count < 1)
+    ):
+        first = True
+
+    if rand:
+        count = 1
+
+    if all:
+        count = label_selector = pod_label_selector = pod_namespace = None
+
+    return dict(
+        label_selector=label_selector,
+        pod_label_selector=pod_label_selector,
+        pod_namespace=pod_namespace,
+        count=count,
+        first=first,
+    )
+
+
+def _node_deleted(name: str, res: "client.V1Status") -> bool:
+    """
+    Tell whether the node `name` was deleted, given the status the API server
+    replied with.
+    """
+    if res.status != "Success":
+        logger.debug(
+            f"Deleting node '{name}' failed: "
+            f"{res.message} [{res.status}] - {res.reason}"
+        )
+        logger.debug(f"The response was: {res.to_dict()}")
+        return False
+
+    logger.debug(f"Node '{name}' deleted")
+    return True
+
+
+def _drain_workers(max_concurrency: int, nodes: int) -> Tuple[int, int]:
+    """
+    Split `max_concurrency` between the `nodes` drained at once and the
+    evictions of each of them.
+    """
+    workers = min(max_concurrency or 1, nodes)
+    return workers, max(1, (max_concurrency or 1) // workers)
+
+
+def _eviction_delay(attempt: int) -> float:
+    """
+    Return how long to wait before the next attempt at an eviction refused
+    `attempt + 1` times by a disruption budget.
+    """
+    # equal jitter so concurrent evictions do not retry in lockstep
+    delay = min(EVICTION_BACKOFF_CAP, EVICTION_BACKOFF_BASE * (2**attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _drain_timeout_error(
+    pods: Iterable["client.V1Pod"], timeout: int
+) -> ActivityFailed:
+    """
+    Build the error to raise when the given `pods` are still on their node
+    once `timeout` seconds have passed.
+    """
+    remaining_pods = "\n".join([p.metadata.name for p in pods])
+    return ActivityFailed(
+        f"Draining nodes did not completed within {timeout}s. "
+        f"Remaining pods are:\n{remaining_pods}"
+    )
+
+
+def _drain_error(
+    failed: Dict[str, Any],
+    pods: int,
+    errors: Dict[str, Exception],
+    nodes: int,
+) -> Optional[Exception]:
+    """
+    Build the error to raise once nodes have been drained, reporting both
+    the pods which could not be evicted and the nodes which failed to drain,
+    if any.
+
+    A single failed node, with all pods evicted, is reported as is.
+    """
+    if len(errors) == 1 and not failed:
+        return next(iter(errors.values()))
+
+    messages = []
+    if failed:
+        failures = "\n".join(f"{n}: {r}" for n, r in failed.items())
+        messages.append(
+            f"Failed to evict {len(failed)} out of {pods} pods:\n{failures}"
+        )
+    if errors:
+        failures = "\n".join(f"{n}: {x}" for n, x in errors.items())
+        messages.append(
+            f"Failed to drain {len(errors)} out of {nodes} nodes:\n{failures}"
+        )
+    return ActivityFailed("\n".join(messages)) if messages else None
+
+
+def _list_eviction_candidates(
+    v1: "client.CoreV1Api",
+    node_name: str,
+    delete_pods_with_local_storage: bool = False,
+) -> Tuple[List["client.V1Pod"], str]:
+    """
+    List the pods to evict from the given node, following the drain command
+    from kubectl as best as we can, along with the resource version of that
+    listing.
+    """
+    eviction_candidates = []
+    resource_version = None
+    count = 0
+    for page in iter_pages(
+        v1.list_pod_for_all_namespaces,
+        field_selector=f"spec.nodeName={node_name}",
+    ):
+        # every page is served from the snapshot of the first one
+        resource_version = resource_version or page.metadata.resource_version
+        count += len(page.items)
+        eviction_candidates.extend(
+            pod
+            for pod in page.items
+            if _is_eviction_candidate(
+                pod, node_name, delete_pods_with_local_storage
+            )
+        )
+
+    logger.debug(f"Found {count} pods on node '{node_name}'")
+
+    return eviction_candidates, resource_version
+
+
+def _is_eviction_candidate(
+    pod: "client.V1Pod",
+    node_name: str,
+    delete_pods_with_local_storage: bool = False,
+) -> bool:
+    name = pod.metadata.name
+    phase = pod.status.phase
+    volumes = pod.spec.volumes
+    annotations = pod.metadata.annotations
+
+    # do not handle mirror pods
+    if annotations and "kubernetes.io/config.mirror" in annotations:
+        logger.debug(f"Not deleting mirror pod '{name}' on node '{node_name}'")
+        return False
+
+    if any(filter(lambda v: v.empty_dir is not None, volumes)):
+        logger.debug(
+            f"Pod '{name}' on node '{node_name}' has a volume made "
+            "of a local storage"
+        )
+        if not delete_pods_with_local_storage:
+            logger.debug("Not evicting a pod with local storage")
+            return False
+        logger.debug("Deleting anyway due to flag")
+        return True
+
+    if phase in ["Succeeded", "Failed"]:
+        return True
+
+    for owner in pod.metadata.owner_references:
+        if owner.controller and owner.kind != "DaemonSet":
+            return True
+        elif owner.kind == "DaemonSet":
+            logger.debug(
+                f"Pod '{name}' on node '{node_name}' is owned by a DaemonSet."
+                " Will not evict it"
+            )
+            return False
+
+    raise ActivityFailed(
+        f"Pod '{name}' on node '{node_name}' is unmanaged, cannot drain"
+        " this node. Delete it manually first?"
+    )
+
+
+def _evict_pod(
+    v1: "client.CoreV1Api", pod: "client.V1Pod", deadline: float
+) -> str:
+    """
+    Evict the given pod, retrying with an exponential backoff and jitter for
+    as long as a disruption budget refuses the eviction, until `deadline`.
+    """
+    eviction = client.V1Eviction()
+    eviction.metadata = client.V1ObjectMeta()
+    eviction.metadata.name = pod.metadata.name
+    eviction.metadata.namespace = pod.metadata.namespace
+    eviction.delete_options = client.V1DeleteOptions()
+
+    attempt = 0
+    while True:
+        try:
+            v1.create_namespaced_pod_eviction(
+                pod.metadata.name, pod.metadata.namespace, body=eviction
+            )
+            return "evicted"
+        except rest.ApiException as x:
+            if x.status == 404:
+                return "already gone"
+            if x.status != 429:
+                raise
+
+            delay = _eviction_delay(attempt)
+            if time.time() + delay > deadline:
+                raise
+
+            logger.debug(
+                f"Eviction of pod '{pod.metadata.name}' refused by a "
+                f"disruption budget, retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+
+def _wait_for_pods_to_go(
+    v1: "client.CoreV1Api",
+    node_name: str,
+    pods: List["client.V1Pod"],
+    resource_version: str = None,
+    timeout: int = 120,
+    deadline: float = None,
+) -> None:
+    """
+    Wait until all the given `pods` have been deleted from the node.
+
+    Rather than polling each pod, a single watch of the pods scheduled on the
+    node is opened from `resource_version`, and pods are crossed out as
+    their `DELETED` event is received. When that version has expired, pods
+    are listed again to resume from there.
+    """
+    pending = {p.metadata.uid: p for p in pods}
+    field_selector = f"spec.nodeName={node_name}"
+    if deadline is None:
+        deadline = time.time() + timeout
+    w = watch.Watch()
+
+    while pending:
+        logger.debug(f"Waiting for {len(pending)} pods to go")
+
+        remaining = int(deadline - time.time())
+        if remaining <= 0:
+            raise _drain_timeout_error(pending.values(), timeout)
+
+        try:
+            for event in w.stream(
+                v1.list_pod_for_all_namespaces,
+                field_selector=field_selector,
+                resource_version=resource_version,
+                timeout_seconds=remaining,
+            ):
+                if event["type"] != "DELETED":
+                    continue
+
+                pod = event["object"]
+                if pending.pop(pod.metadata.uid, None) is not None:
+                    logger.debug(f"Pod '{pod.metadata.name}' is gone")
+
+                if not pending:
+                    w.stop()
+                    break
+            resource_version = w.resource_version or resource_version
+        except rest.ApiException as x:
+            if x.status != 410:
+                raise
+
+            logger.debug("Watch expired, listing pods still on the node")
+            present = set()
+            resource_version = None
+            for page in iter_pages(
+                v1.list_pod_for_all_namespaces, field_selector=field_selector
+            ):
+                resource_version = (
+                    resource_version or page.metadata.resource_version
+                )
+                present.update(p.metadata.uid for p in page.items)
+            pending = {u: p for u, p in pending.items() if u in present}
+
+    logger.debug("Evicted all pods we could")
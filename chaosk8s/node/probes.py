@@ -1,11 +1,14 @@
 import json
 import logging
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from chaoslib.types import Configuration, Secrets
-from kubernetes import client
 
-from chaosk8s import create_k8s_api_client
+from chaosk8s import cache, create_k8s_api_client
+from chaosk8s.lazy import lazy_import
+from chaosk8s.views import raw_list
+
+client = lazy_import("kubernetes.client")
 
 __all__ = [
     "get_nodes",
@@ -16,6 +19,22 @@ __all__ = [
 ]
 logger = logging.getLogger("chaostoolkit")
 
+# node conditions, when reported, and their status on a healthy node
+HEALTHY_NODE_CONDITIONS = [
+    ("FrequentKubeletRestart", "False"),
+    ("FrequentDockerRestart", "False"),
+    ("FrequentContainerdRestart", "False"),
+    ("ReadonlyFilesystem", "False"),
+    ("KernelDeadlock", "False"),
+    ("CorruptDockerOverlay2", "False"),
+    ("FrequentUnregisterNetDevice", "False"),
+    ("NetworkUnavailable", "False"),
+    ("MemoryPressure", "False"),
+    ("DiskPressure", "False"),
+    ("PIDPressure", "False"),
+    ("Ready", "True"),
+]
+
 
 def get_nodes(
     label_selector: str = None,
@@ -48,22 +67,18 @@ def get_all_node_status_conditions(
     Get all nodes conditions. You can select a subset of nodes by specifying a
     `label_selector`.
     """
-    api = create_k8s_api_client(secrets)
-
-    v1 = client.CoreV1Api(api)
-    nodes = v1.list_node(label_selector=label_selector or None)
-
-    result = []
-
-    for node in nodes.items:
-        n = {"name": node.metadata.name}
-        for cond in node.status.conditions:
-            n[cond.type] = cond.status
-        result.append(n)
+    nodes = cache.list_objects(
+        "nodes", label_selector=label_selector, secrets=secrets
+    )
+    if nodes is None:
+        api = create_k8s_api_client(secrets)
 
-    logger.debug(f"Nodes statuses: {result}")
+        v1 = client.CoreV1Api(api)
+        nodes = raw_list(v1.list_node)(
+            label_selector=label_selector or None
+        ).items
 
-    return result
+    return _node_statuses(nodes)
 
 
 def all_nodes_must_be_ready_to_schedule(
@@ -80,12 +95,7 @@ def all_nodes_must_be_ready_to_schedule(
         label_selector, configuration, secrets
     )
 
-    for statuses in result:
-        if statuses.get("Ready") != "True":
-            logger.debug(f"Node {statuses['name']} is not in 'Ready' state")
-            return False
-
-    return True
+    return _nodes_in_condition(result, "Ready", "True")
 
 
 def verify_nodes_condition(
@@ -102,15 +112,7 @@ def verify_nodes_condition(
         label_selector, configuration, secrets
     )
 
-    for statuses in result:
-        if statuses.get(condition_type) != condition_value:
-            logger.debug(
-                f"Node {statuses['name']} does not match '{condition_type}' "
-                "expected state"
-            )
-            return False
-
-    return True
+    return _nodes_in_condition(result, condition_type, condition_value)
 
 
 def nodes_must_be_healthy(
@@ -141,27 +143,59 @@ def nodes_must_be_healthy(
         label_selector, configuration, secrets
     )
 
-    expectations = [
-        ("FrequentKubeletRestart", "False"),
-        ("FrequentDockerRestart", "False"),
-        ("FrequentContainerdRestart", "False"),
-        ("ReadonlyFilesystem", "False"),
-        ("KernelDeadlock", "False"),
-        ("CorruptDockerOverlay2", "False"),
-        ("FrequentUnregisterNetDevice", "False"),
-        ("NetworkUnavailable", "False"),
-        ("MemoryPressure", "False"),
-        ("DiskPressure", "False"),
-        ("PIDPressure", "False"),
-        ("Ready", "True"),
-    ]
+    return _nodes_healthy(result)
+
 
+###############################################################################
+# Internals
+###############################################################################
+def _node_statuses(nodes: List[Any]) -> List[Dict[str, str]]:
+    """
+    Map the type of each condition of the `nodes` to its status, along with
+    the name of the node.
+    """
+    result = []
+
+    for node in nodes:
+        n = {"name": node.metadata.name}
+        for cond in node.status.conditions:
+            n[cond.type] = cond.status
+        result.append(n)
+
+    logger.debug(f"Nodes statuses: {result}")
+
+    return result
+
+
+def _nodes_in_condition(
+    result: List[Dict[str, str]], condition_type: str, condition_value: str
+) -> bool:
+    """
+    Tell whether the condition `condition_type` of all the nodes has the
+    status `condition_value`.
+    """
+    for statuses in result:
+        if statuses.get(condition_type) != condition_value:
+            logger.debug(
+                f"Node {statuses['name']} does not match '{condition_type}' "
+                "expected state"
+            )
+            return False
+
+    return True
+
+
+def _nodes_healthy(result: List[Dict[str, str]]) -> bool:
+    """
+    Tell whether the conditions reported by all the nodes have the status of
+    a healthy node.
+    """
     for statuses in result:
-        for ctype, cvalue in expectations:
+        for ctype, cvalue in HEALTHY_NODE_CONDITIONS:
             if (ctype in statuses) and (statuses[ctype] != cvalue):
                 logger.debug(
                     f"Node {statuses['name']} does not match '{ctype}' "
-                    "expected state: {cvalue}"
+                    f"expected state: {cvalue}"
                 )
                 return False
 
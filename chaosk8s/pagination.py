@@ -0,0 +1,57 @@
+"""
+Paginated listing of Kubernetes resources.
+
+A single LIST over a large cluster can return hundreds of megabytes and
+time out before the response is complete. These helpers request resources
+in chunks of `limit` objects, following the `continue` token of each page,
+so that only one page is held in memory at a time.
+
+All pages are served from the same snapshot as the first one, whose
+resource version can therefore be used to watch for changes made after
+the listing.
+"""
+
+import logging
+from typing import Any, Callable, Iterator
+
+__all__ = ["DEFAULT_PAGE_SIZE", "iter_pages", "iter_items"]
+logger = logging.getLogger("chaostoolkit")
+
+DEFAULT_PAGE_SIZE = 500
+
+
+def iter_pages(
+    list_func: Callable[..., Any],
+    *args: Any,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """
+    Call `list_func`, such as `CoreV1Api.list_namespaced_pod`, with the
+    given arguments and yield each page of results, as returned by the
+    client, until the API server has no more to send.
+    """
+    token = None
+    while True:
+        if token:
+            kwargs["_continue"] = token
+        ret = list_func(*args, limit=page_size, **kwargs)
+        yield ret
+
+        token = ret.metadata._continue if ret.metadata else None
+        if not token:
+            return
+        logger.debug(f"Listed {len(ret.items)} objects, fetching more")
+
+
+def iter_items(
+    list_func: Callable[..., Any],
+    *args: Any,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """
+    Same as `iter_pages` but yield the listed objects one by one.
+    """
+    for page in iter_pages(list_func, *args, page_size=page_size, **kwargs):
+        yield from page.items
@@ -5,15 +5,22 @@ import math
 import random
 import re
 import shlex
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client, stream
-from kubernetes.client.models.v1_pod import V1Pod
-from kubernetes.stream.ws_client import ERROR_CHANNEL, STDOUT_CHANNEL
 
 from chaosk8s import _log_deprecated, create_k8s_api_client
+from chaosk8s.concurrency import fan_out
+from chaosk8s.instrumentation import record_call
+from chaosk8s.lazy import lazy_import
+from chaosk8s.pagination import iter_items
+from chaosk8s.ratelimit import throttle
+
+client = lazy_import("kubernetes.client")
+stream = lazy_import("kubernetes.stream")
+rest = lazy_import("kubernetes.client.rest")
+ws_client = lazy_import("kubernetes.stream.ws_client")
 
 __all__ = ["terminate_pods", "exec_in_pods"]
 logger = logging.getLogger("chaostoolkit")
@@ -29,6 +36,7 @@ def terminate_pods(
     grace_period: int = -1,
     ns: str = "default",
     order: str = "alphabetic",
+    max_concurrency: int = 1,
     secrets: Secrets = None,
 ):
     """
@@ -57,6 +65,13 @@ def terminate_pods(
     If `grace_period` is greater than or equal to 0, it will
     be used as the grace period (in seconds) to terminate the pods.
     Otherwise, the default pod's grace period will be used.
+
+    Pods are deleted one after the other, stopping at the first failure,
+    unless `max_concurrency` is greater than `1`, in which case up to that
+    many deletions are sent to the API server at once. Pods that could not be
+    deleted are then reported in the raised
+    :exc:`chaoslib.exceptions.ActivityFailed`, once all deletions have been
+    attempted.
     """
 
     api = create_k8s_api_client(secrets)
@@ -70,12 +85,36 @@ def terminate_pods(
     if grace_period >= 0:
         body = client.V1DeleteOptions(grace_period_seconds=grace_period)
 
-    deleted_pods = []
-    for p in pods:
+    if max_concurrency is None or max_concurrency <= 1:
+        deleted_pods = []
+        for p in pods:
+            v1.delete_namespaced_pod(p.metadata.name, ns, body=body)
+            deleted_pods.append(p.metadata.name)
+
+        return deleted_pods
+
+    def delete(p: "client.V1Pod") -> str:
         v1.delete_namespaced_pod(p.metadata.name, ns, body=body)
-        deleted_pods.append(p.metadata.name)
+        return p.metadata.name
+
+    deleted = set()
+    failed = {}
+    for p, name, error in fan_out(delete, pods, max_concurrency):
+        if error is None:
+            logger.debug(f"Pod '{name}' deleted")
+            deleted.add(name)
+        else:
+            reason = (
+                error.reason if isinstance(error, rest.ApiException) else error
+            )
+            logger.debug(f"Failed to delete pod '{p.metadata.name}': {reason}")
+            failed[p.metadata.name] = reason
+
+    if failed:
+        raise _deletion_error(failed, len(pods))
 
-    return deleted_pods
+    # keep the order in which pods were selected
+    return [p.metadata.name for p in pods if p.metadata.name in deleted]
 
 
 def exec_in_pods(
@@ -90,6 +129,7 @@ def exec_in_pods(
     order: str = "alphabetic",
     container_name: str = None,
     request_timeout: int = 60,
+    max_concurrency: int = 1,
     secrets: Secrets = None,
 ) -> List[Dict[str, Any]]:
     """
@@ -119,6 +159,11 @@ def exec_in_pods(
     a sequence of arguments is generally preferred, as it allows the action to
     take care of any required escaping and quoting (e.g. to permit spaces in the
     arguments). If passing a single string it will be split automatically.
+
+    When `max_concurrency` is greater than `1`, the command runs in up to that
+    many pods at once, each bounded by its own `request_timeout`, so the
+    action takes as long as the slowest pod rather than the sum of them all.
+    Results are then listed in the order pods completed.
     """
     if not cmd:
         raise ActivityFailed("A command must be set to run a container")
@@ -130,9 +175,79 @@ def exec_in_pods(
         v1, label_selector, name_pattern, all, rand, mode, qty, ns, order
     )
 
+    return list(
+        _exec_in_pods_as_completed(
+            api,
+            pods,
+            cmd,
+            ns,
+            container_name,
+            request_timeout,
+            max_concurrency,
+        )
+    )
+
+
+###############################################################################
+# Internals
+###############################################################################
+def _exec_in_pods_as_completed(
+    api: "client.ApiClient",
+    pods: List["client.V1Pod"],
+    cmd: Union[str, List[str]],
+    ns: str = "default",
+    container_name: str = None,
+    request_timeout: int = 60,
+    max_concurrency: int = 1,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run `cmd` in the `container_name` container of each pod and yield each
+    result as soon as its pod is done.
+    """
+    exec_command, targets = _exec_targets(pods, cmd, container_name)
+
+    # streaming swaps the request method of the client it is given for the
+    # duration of the call and puts the original back once done, so each exec
+    # gets a client of its own: a shared one would be restored to plain REST
+    # requests by the first exec to finish while others are still starting.
+    # As websocket upgrades bypass the REST client, they are throttled and
+    # recorded here, against the cached client
+    def run(po: "client.V1Pod") -> Dict[str, Any]:
+        exec_v1 = client.CoreV1Api(client.ApiClient(api.configuration))
+        throttle(api)
+        with record_call("create", "pods/exec", status=101):
+            return _exec_in_pod(
+                exec_v1,
+                po,
+                ns,
+                container_name,
+                exec_command,
+                cmd,
+                request_timeout,
+            )
+
+    for po, result, error in fan_out(run, targets, max_concurrency):
+        if error is not None:
+            raise error
+        logger.debug(
+            f"Command exited with '{result['exit_code']}' in pod "
+            f"'{po.metadata.name}'"
+        )
+        yield result
+
+
+def _exec_targets(
+    pods: List["client.V1Pod"],
+    cmd: Union[str, List[str]],
+    container_name: str = None,
+) -> Tuple[List[str], List["client.V1Pod"]]:
+    """
+    Split `cmd` into the arguments of the command to run and keep the pods
+    which have the `container_name` container to run it in.
+    """
     exec_command = shlex.split(cmd) if isinstance(cmd, str) else cmd
 
-    results = []
+    targets = []
     for po in pods:
         logger.debug(
             f"Picked pods '{po.metadata.name}' for command execution {exec_command}"
@@ -142,60 +257,88 @@ def exec_in_pods(
                 f"Pod {po.metadata.name} do not have container named '{container_name}'"
             )
             continue
+        targets.append(po)
 
-        # Use _preload_content to get back the raw JSON response.
-        resp = stream.stream(
-            v1.connect_get_namespaced_pod_exec,
-            po.metadata.name,
-            ns,
-            container=container_name,
-            command=exec_command,
-            stderr=True,
-            stdin=False,
-            stdout=True,
-            tty=False,
-            _preload_content=False,
-        )
+    return exec_command, targets
 
-        resp.run_forever(timeout=request_timeout)
 
-        out = resp.read_channel(STDOUT_CHANNEL)
-        err = resp.read_channel(ERROR_CHANNEL).strip()
+def _exec_in_pod(
+    v1: "client.CoreV1Api",
+    po: "client.V1Pod",
+    ns: str,
+    container_name: str,
+    exec_command: List[str],
+    cmd: Union[str, List[str]],
+    request_timeout: int = 60,
+) -> Dict[str, Any]:
+    # Use _preload_content to get back the raw JSON response.
+    resp = stream.stream(
+        v1.connect_get_namespaced_pod_exec,
+        po.metadata.name,
+        ns,
+        container=container_name,
+        command=exec_command,
+        stderr=True,
+        stdin=False,
+        stdout=True,
+        tty=False,
+        _preload_content=False,
+    )
 
-        try:
-            err = json.loads(err)
-        except json.decoder.JSONDecodeError:
-            logger.debug(
-                "Failed loading pod exec error stream as a json payload",
-                exc_info=True,
-            )
+    resp.run_forever(timeout=request_timeout)
 
-        if isinstance(err, dict) and (err["status"] != "Success"):
-            error_code = err["details"]["causes"][0]["message"]
-            error_message = err["message"]
-        elif isinstance(err, str):
-            error_code = 1
-            error_message = err
-        else:
-            error_code = 0
-            error_message = ""
-
-        results.append(
-            dict(
-                pod_name=po.metadata.name,
-                exit_code=error_code,
-                cmd=cmd,
-                stdout=out,
-                stderr=error_message,
-            )
+    out = resp.read_channel(ws_client.STDOUT_CHANNEL)
+    err = resp.read_channel(ws_client.ERROR_CHANNEL).strip()
+
+    return _exec_result(po, cmd, out, err)
+
+
+def _exec_result(
+    po: "client.V1Pod", cmd: Union[str, List[str]], out: str, err: str
+) -> Dict[str, Any]:
+    """
+    Build the result of running `cmd` in the pod `po` out of what it wrote
+    to its standard output and of the status sent on the error channel.
+    """
+    try:
+        err = json.loads(err)
+    except json.decoder.JSONDecodeError:
+        logger.debug(
+            "Failed loading pod exec error stream as a json payload",
+            exc_info=True,
         )
-    return results
+
+    if isinstance(err, dict) and (err["status"] != "Success"):
+        error_code = err["details"]["causes"][0]["message"]
+        error_message = err["message"]
+    elif isinstance(err, str):
+        error_code = 1
+        error_message = err
+    else:
+        error_code = 0
+        error_message = ""
+
+    return dict(
+        pod_name=po.metadata.name,
+        exit_code=error_code,
+        cmd=cmd,
+        stdout=out,
+        stderr=error_message,
+    )
 
 
-###############################################################################
-# Internals
-###############################################################################
-def _sort_by_pod_creation_timestamp(pod: V1Pod) -> datetime.datetime:
+def _deletion_error(failed: Dict[str, Any], pods: int) -> ActivityFailed:
+    """
+    Build the error reporting the pods which could not be deleted, out of the
+    `pods` selected.
+    """
+    failures = ", ".join(f"'{n}' ({r})" for n, r in failed.items())
+    return ActivityFailed(
+        f"Failed to delete {len(failed)} out of {pods} pods: {failures}"
+    )
+
+
+def _sort_by_pod_creation_timestamp(pod: "client.V1Pod") -> datetime.datetime:
     """
     Function that serves as a key for the sort pods comparison
     """
@@ -203,7 +346,7 @@ def _sort_by_pod_creation_timestamp(pod: V1Pod) -> datetime.datetime:
 
 
 def _select_pods(
-    v1: client.CoreV1Api = None,
+    v1: "client.CoreV1Api" = None,
     label_selector: str = None,
     name_pattern: str = None,
     all: bool = False,
@@ -212,11 +355,35 @@ def _select_pods(
     qty: int = 1,
     ns: str = "default",
     order: str = "alphabetic",
-) -> List[V1Pod]:
+) -> List["client.V1Pod"]:
     # Fail if CoreV1Api is not instanciated
     if v1 is None:
         raise ActivityFailed("Cannot select pods. Client API is None")
 
+    _check_selection(mode, qty, order)
+
+    # only the pods matching the name pattern are kept while paging through
+    # the namespace
+    pattern = re.compile(name_pattern) if name_pattern else None
+    pods = []
+    count = 0
+    selectors = {"label_selector": label_selector} if label_selector else {}
+    for p in iter_items(v1.list_namespaced_pod, ns, **selectors):
+        count += 1
+        if _name_matches(p, pattern):
+            pods.append(p)
+
+    _log_selection(count, label_selector, ns)
+
+    return _pick_pods(pods, all, rand, mode, qty, order)
+
+
+def _check_selection(
+    mode: str = "fixed", qty: int = 1, order: str = "alphabetic"
+) -> None:
+    """
+    Fail when the arguments selecting pods are invalid.
+    """
     # Fail when quantity is less than 0
     if qty < 0:
         raise ActivityFailed(
@@ -231,25 +398,38 @@ def _select_pods(
     if order not in ["alphabetic", "oldest"]:
         raise ActivityFailed(f"Cannot select pods. Order '{order}' is invalid.")
 
+
+def _name_matches(pod: "client.V1Pod", pattern: Optional[re.Pattern]) -> bool:
+    if pattern is None:
+        return True
+    if pattern.search(pod.metadata.name):
+        logger.debug(f"Pod '{pod.metadata.name}' match pattern")
+        return True
+    return False
+
+
+def _log_selection(
+    count: int, label_selector: str = None, ns: str = "default"
+) -> None:
     if label_selector:
-        ret = v1.list_namespaced_pod(ns, label_selector=label_selector)
         logger.debug(
-            f"Found {len(ret.items)} pods labelled '{label_selector}' in ns {ns}"
+            f"Found {count} pods labelled '{label_selector}' in ns {ns}"
         )
     else:
-        ret = v1.list_namespaced_pod(ns)
-        logger.debug(f"Found {len(ret.items)} pods in ns '{ns}'")
+        logger.debug(f"Found {count} pods in ns '{ns}'")
 
-    pods = []
-    if name_pattern:
-        pattern = re.compile(name_pattern)
-        for p in ret.items:
-            if pattern.search(p.metadata.name):
-                pods.append(p)
-                logger.debug(f"Pod '{p.metadata.name}' match pattern")
-    else:
-        pods = ret.items
 
+def _pick_pods(
+    pods: List["client.V1Pod"],
+    all: bool = False,
+    rand: bool = False,
+    mode: str = "fixed",
+    qty: int = 1,
+    order: str = "alphabetic",
+) -> List["client.V1Pod"]:
+    """
+    Pick the pods to act upon out of those selected.
+    """
     if order == "oldest":
         pods.sort(key=_sort_by_pod_creation_timestamp)
     if not all:
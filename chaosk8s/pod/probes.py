@@ -1,14 +1,31 @@
 import logging
 import re
-from datetime import datetime
-from typing import Dict, List, Union
+import threading
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import dateparser
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import MicroservicesStatus, Secrets
-from kubernetes import client
 
-from chaosk8s import create_k8s_api_client
+from chaosk8s import cache, create_k8s_api_client
+from chaosk8s.concurrency import fan_out
+from chaosk8s.lazy import lazy_import
+from chaosk8s.metadata import list_metadata
+from chaosk8s.pagination import iter_items
+from chaosk8s.views import ObjectView, raw_list
+from chaosk8s.waiter import wait_for_selection
+
+client = lazy_import("kubernetes.client")
+dateparser = lazy_import("dateparser")
 
 __all__ = [
     "pods_in_phase",
@@ -19,9 +36,12 @@ __all__ = [
     "pod_is_not_available",
     "count_min_pods",
     "should_be_found_in_logs",
+    "should_be_found_in_pod_logs",
 ]
 logger = logging.getLogger("chaostoolkit")
 
+LOG_CHUNK_SIZE = 64 * 1024
+
 
 def read_pod_logs(
     name: str = None,
@@ -30,6 +50,10 @@ def read_pod_logs(
     from_previous: bool = False,
     label_selector: str = "name in ({name})",
     container_name: str = None,
+    tail_lines: int = None,
+    limit_bytes: int = None,
+    since_time: str = None,
+    max_concurrency: int = 1,
     secrets: Secrets = None,
 ) -> Dict[str, str]:
     """
@@ -43,9 +67,19 @@ def read_pod_logs(
 
     If you provide `last`, this returns the logs of the last N seconds
     until now. This can set to a fluent delta such as `10 minutes`.
+    Likewise, `since_time` returns the logs written since the given date,
+    such as `2024-05-06T10:00:00Z`. When both are set, the shortest window
+    is used.
 
     You may also set `from_previous` to `True` to capture the logs of a
     previous pod's incarnation, if any.
+
+    To bound how much is transferred, set `tail_lines` to only get the last N
+    lines of each log and/or `limit_bytes` to cap the size of each log. These
+    are applied by the API server.
+
+    Logs are fetched from one pod at a time unless `max_concurrency` is
+    greater than `1`.
     """
     label_selector = label_selector.format(name=name)
     api = create_k8s_api_client(secrets)
@@ -62,31 +96,34 @@ def read_pod_logs(
         f"pods: [{', '.join([p.metadata.name for p in ret.items])}] in ns '{ns}'"
     )
 
-    since = None
-    if last:
-        now = datetime.now()
-        since = int((now - dateparser.parse(last)).total_seconds())
-
-    params = dict(
-        namespace=ns,
-        follow=False,
-        previous=from_previous,
-        timestamps=True,
-        container=container_name or "",  # None is not a valid value
-        _preload_content=False,
+    params = _log_params(
+        ns,
+        last,
+        from_previous,
+        container_name,
+        tail_lines,
+        limit_bytes,
+        since_time,
     )
 
-    if since:
-        params["since_seconds"] = since
+    def fetch(p: "client.V1Pod") -> str:
+        logger.debug(f"Fetching logs for pod '{p.metadata.name}'")
+        r = v1.read_namespaced_pod_log(p.metadata.name, **params)
+        # limit_bytes may cut the last character in half
+        return r.read().decode("utf-8", errors="replace")
 
     logs = {}
-    for p in ret.items:
-        name = p.metadata.name
-        logger.debug(f"Fetching logs for pod '{name}'")
-        r = v1.read_namespaced_pod_log(name, **params)
-        logs[name] = r.read().decode("utf-8")
+    for p, text, error in fan_out(fetch, ret.items, max_concurrency):
+        if error is not None:
+            raise error
+        logs[p.metadata.name] = text
 
-    return logs
+    # keep the order in which pods were listed
+    return {
+        p.metadata.name: logs[p.metadata.name]
+        for p in ret.items
+        if p.metadata.name in logs
+    }
 
 
 def pods_in_phase(
@@ -94,48 +131,28 @@ def pods_in_phase(
     phase: str = "Running",
     ns: str = "default",
     raise_on_invalid_phase: bool = True,
+    timeout: float = None,
     secrets: Secrets = None,
 ) -> bool:
     """
     Lookup a pod by `label_selector` in the namespace `ns`.
 
     Raises :exc:`chaoslib.exceptions.ActivityFailed` when the state is not
-    as expected unless `raise_on_invalid_phase`. In that case, returns `False`.
-    """
-    api = create_k8s_api_client(secrets)
-
-    v1 = client.CoreV1Api(api)
-    if label_selector:
-        ret = v1.list_namespaced_pod(ns, label_selector=label_selector)
-        logger.debug(
-            f"Found {len(ret.items)} pods matching label '{label_selector}'"
-            f" in ns '{ns}'"
-        )
-    else:
-        ret = v1.list_namespaced_pod(ns)
-        logger.debug(f"Found {len(ret.items)} pods in ns '{ns}'")
-
-    if not ret.items:
-        m = f"no pods '{label_selector}' were found"
-        if not raise_on_invalid_phase:
-            logger.debug(m)
-            return False
-        else:
-            raise ActivityFailed(m)
+    as expected. Unless `raise_on_invalid_phase` is `False` and in that case
+    returns `False`.
 
-    for d in ret.items:
-        if d.status.phase != phase:
-            m = (
-                f"pod '{label_selector}' is in phase '{d.status.phase}'"
-                f" but should be '{phase}'"
-            )
-            if not raise_on_invalid_phase:
-                logger.debug(m)
-                return False
-            else:
-                raise ActivityFailed(m)
+    With a `timeout`, in seconds, the pods are watched until they all are in
+    the `phase`, and the probe only fails when they still are not by then.
+    """
 
-    return True
+    mismatch = _not_in_phase(label_selector, phase)
+    m = _check_pods(ns, label_selector, mismatch, timeout, secrets)
+    if m is None:
+        return True
+    if not raise_on_invalid_phase:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
 
 
 def pods_in_conditions(
@@ -143,6 +160,7 @@ def pods_in_conditions(
     conditions: List[Dict[str, str]],
     ns: str = "default",
     raise_on_invalid_conditions: bool = True,
+    timeout: float = None,
     secrets: Secrets = None,
 ) -> bool:
     """
@@ -151,46 +169,19 @@ def pods_in_conditions(
     Raises :exc:`chaoslib.exceptions.ActivityFailed` if one of the given
     conditions type/status is not as expected unless
     `raise_on_invalid_conditions`. In that case, returns `False`.
-    """
-    api = create_k8s_api_client(secrets)
 
-    v1 = client.CoreV1Api(api)
-    if label_selector:
-        ret = v1.list_namespaced_pod(ns, label_selector=label_selector)
-        logger.debug(
-            f"Found {len(ret.items)} pods matching label '{label_selector}'"
-            f" in ns '{ns}'"
-        )
-    else:
-        ret = v1.list_namespaced_pod(ns)
-        logger.debug(f"Found {len(ret.items)} pods in ns '{ns}'")
-
-    if not ret.items:
-        m = f"no pods '{label_selector}' were found"
-        if not raise_on_invalid_conditions:
-            logger.debug(m)
-            return False
-        else:
-            raise ActivityFailed(m)
-
-    for d in ret.items:
-        # create a list of hash to compare with the given conditions
-        pod_conditions = [
-            {"type": pc.type, "status": pc.status} for pc in d.status.conditions
-        ]
-        for condition in conditions:
-            if condition not in pod_conditions:
-                m = (
-                    f"pod {d.metadata.name} does not match the following "
-                    f"given condition: {condition}"
-                )
-                if not raise_on_invalid_conditions:
-                    logger.debug(m)
-                    return False
-                else:
-                    raise ActivityFailed(m)
+    With a `timeout`, in seconds, the pods are watched until they all meet
+    the `conditions`, and the probe only fails when they still do not by then.
+    """
 
-    return True
+    mismatch = _not_in_conditions(label_selector, conditions)
+    m = _check_pods(ns, label_selector, mismatch, timeout, secrets)
+    if m is None:
+        return True
+    if not raise_on_invalid_conditions:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
 
 
 def pods_not_in_phase(
@@ -198,6 +189,7 @@ def pods_not_in_phase(
     phase: str = "Running",
     ns: str = "default",
     raise_on_in_phase: bool = True,
+    timeout: float = None,
     secrets: Secrets = None,
 ) -> bool:
     """
@@ -206,38 +198,19 @@ def pods_not_in_phase(
     Raises :exc:`chaoslib.exceptions.ActivityFailed` when the pod is in the
     given phase and should not have, unless
     `raise_on_in_phase`. In that case, returns `False`.
-    """
-    api = create_k8s_api_client(secrets)
-
-    v1 = client.CoreV1Api(api)
-    if label_selector:
-        ret = v1.list_namespaced_pod(ns, label_selector=label_selector)
-        logger.debug(
-            f"Found {len(ret.items)} pods matching label '{label_selector}'"
-            f" in ns '{ns}'"
-        )
-    else:
-        ret = v1.list_namespaced_pod(ns)
-        logger.debug(f"Found {len(ret.items)} pods in ns '{ns}'")
-
-    if not ret.items:
-        m = f"no pods '{label_selector}' were found"
-        if not raise_on_in_phase:
-            logger.debug(m)
-            return False
-        else:
-            raise ActivityFailed(m)
 
-    for d in ret.items:
-        if d.status.phase == phase:
-            m = f"pod '{label_selector}' should not be in phase '{d.status.phase}'"
-            if not raise_on_in_phase:
-                logger.debug(m)
-                return False
-            else:
-                raise ActivityFailed(m)
+    With a `timeout`, in seconds, the pods are watched until none of them is
+    in the `phase`, and the probe only fails when one still is by then.
+    """
 
-    return True
+    mismatch = _in_phase(label_selector, phase)
+    m = _check_pods(ns, label_selector, mismatch, timeout, secrets)
+    if m is None:
+        return True
+    if not raise_on_in_phase:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
 
 
 def count_pods(
@@ -250,31 +223,27 @@ def count_pods(
     Count the number of pods matching the given selector in a given `phase`, if
     one is given.
     """
+    pods = cache.list_objects("pods", ns, label_selector, secrets=secrets)
+    if pods is not None:
+        if not phase:
+            return len(pods)
+        return len([p for p in pods if p.status.phase == phase])
+
+    # the phase is filtered by the API server and only the metadata of the
+    # matching pods is transferred
     api = create_k8s_api_client(secrets)
+    pods = list_metadata(
+        api,
+        "/api/v1/namespaces/{namespace}/pods",
+        path_params={"namespace": ns},
+        label_selector=label_selector,
+        field_selector=f"status.phase={phase}" if phase else None,
+    )
+    logger.debug(
+        f"Found {len(pods)} pods matching label '{label_selector}' in ns '{ns}'"
+    )
 
-    v1 = client.CoreV1Api(api)
-    if label_selector:
-        ret = v1.list_namespaced_pod(ns, label_selector=label_selector)
-        logger.debug(
-            f"Found {len(ret.items)} pods matching label '{label_selector}'"
-            f" in ns '{ns}'"
-        )
-    else:
-        ret = v1.list_namespaced_pod(ns)
-        logger.debug(f"Found {len(ret.items)} pods in ns '{ns}'")
-
-    if not ret.items:
-        return 0
-
-    if not phase:
-        return len(ret.items)
-
-    count = 0
-    for d in ret.items:
-        if d.status.phase == phase:
-            count = count + 1
-
-    return count
+    return len(pods)
 
 
 def pod_is_not_available(
@@ -295,25 +264,21 @@ def pod_is_not_available(
     api = create_k8s_api_client(secrets)
 
     v1 = client.CoreV1Api(api)
+    list_pods = raw_list(v1.list_namespaced_pod)
     if label_selector:
-        ret = v1.list_namespaced_pod(ns, label_selector=label_selector)
+        ret = list_pods(ns, label_selector=label_selector)
     else:
-        ret = v1.list_namespaced_pod(ns)
+        ret = list_pods(ns)
 
     logger.debug(f"Found {len(ret.items)} pod(s) named '{name}' in ns '{ns}")
 
-    for p in ret.items:
-        phase = p.status.phase
-        logger.debug(f"Pod '{p.metadata.name}' has status '{phase}'")
-        if phase == "Running":
-            m = f"pod '{name}' is actually running"
-            if not raise_on_is_available:
-                logger.debug(m)
-                return False
-            else:
-                raise ActivityFailed(m)
-
-    return True
+    m = _running(name, ret.items)
+    if m is None:
+        return True
+    if not raise_on_is_available:
+        logger.debug(m)
+        return False
+    raise ActivityFailed(m)
 
 
 def all_pods_healthy(
@@ -328,13 +293,16 @@ def all_pods_healthy(
     as expected. Unless `raise_on_any_unhealthy` is `False` and in that case
     returns `False`.
     """
-    api = create_k8s_api_client(secrets)
     not_ready = []
     failed = []
 
-    v1 = client.CoreV1Api(api)
-    ret = v1.list_namespaced_pod(namespace=ns)
-    for p in ret.items:
+    pods = cache.list_objects("pods", ns, secrets=secrets)
+    if pods is None:
+        api = create_k8s_api_client(secrets)
+        v1 = client.CoreV1Api(api)
+        pods = iter_items(raw_list(v1.list_namespaced_pod), namespace=ns)
+
+    for p in pods:
         phase = p.status.phase
         if phase == "Failed":
             failed.append(p)
@@ -412,3 +380,347 @@ def should_be_found_in_logs(
         return False
 
     return True
+
+
+def should_be_found_in_pod_logs(
+    pattern: str,
+    name: str = None,
+    last: Union[str, None] = None,
+    ns: str = "default",
+    from_previous: bool = False,
+    label_selector: str = "name in ({name})",
+    container_name: str = None,
+    all_pods: bool = True,
+    tail_lines: int = None,
+    limit_bytes: int = None,
+    since_time: str = None,
+    max_concurrency: int = 1,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Lookup for the first occurence of `pattern` in the logs of the pods
+    selected the same way as the `read_pod_logs` probe does, without
+    loading these logs in memory.
+
+    Each log is read from the API server in chunks and searched line by line,
+    so the pattern cannot span several lines. Reading a log stops as soon as
+    the pattern is found in it.
+
+    If `all_pods` is set the match must occur in the logs of all pods.
+    Otherwise, the search stops at the first pod whose logs match.
+    """
+    label_selector = label_selector.format(name=name)
+    api = create_k8s_api_client(secrets)
+    v1 = client.CoreV1Api(api)
+
+    if label_selector:
+        ret = v1.list_namespaced_pod(ns, label_selector=label_selector)
+    else:
+        ret = v1.list_namespaced_pod(ns)
+
+    if not ret.items:
+        raise ActivityFailed("no logs to search from")
+
+    params = _log_params(
+        ns,
+        last,
+        from_previous,
+        container_name,
+        tail_lines,
+        limit_bytes,
+        since_time,
+    )
+    c_pattern = re.compile(pattern)
+    # set once the outcome is known so remaining searches can bail out
+    settled = threading.Event()
+
+    def search(p: "client.V1Pod") -> bool:
+        if settled.is_set():
+            return False
+
+        r = v1.read_namespaced_pod_log(p.metadata.name, **params)
+        try:
+            for line in _iter_log_lines(r, settled):
+                m = c_pattern.search(line)
+                if m:
+                    logger.debug(
+                        f"Pod '{p.metadata.name}' logs matched at "
+                        f"position {m.span()} of line '{line}'"
+                    )
+                    return True
+        finally:
+            r.close()
+            r.release_conn()
+
+        return False
+
+    outcome = _LogSearch(len(ret.items), all_pods, settled)
+    for p, found, error in fan_out(search, ret.items, max_concurrency):
+        outcome.record(p, found, error)
+
+    return outcome.found()
+
+
+###############################################################################
+# Internals
+###############################################################################
+def _log_params(
+    ns: str = "default",
+    last: Union[str, None] = None,
+    from_previous: bool = False,
+    container_name: str = None,
+    tail_lines: int = None,
+    limit_bytes: int = None,
+    since_time: str = None,
+) -> Dict[str, Any]:
+    """
+    Build the parameters of a log request out of the probes' arguments.
+    """
+    since = None
+    if last:
+        now = datetime.now()
+        since = int((now - dateparser.parse(last)).total_seconds())
+
+    if since_time:
+        started = dateparser.parse(
+            since_time, settings={"RETURN_AS_TIMEZONE_AWARE": True}
+        )
+        if started is None:
+            raise ActivityFailed(f"cannot parse since_time '{since_time}'")
+        elapsed = int((datetime.now(timezone.utc) - started).total_seconds())
+        # the API rejects windows shorter than a second
+        elapsed = max(elapsed, 1)
+        since = min(since, elapsed) if since else elapsed
+
+    params = dict(
+        namespace=ns,
+        follow=False,
+        previous=from_previous,
+        timestamps=True,
+        container=container_name or "",  # None is not a valid value
+        _preload_content=False,
+    )
+
+    if since:
+        params["since_seconds"] = since
+
+    if tail_lines is not None:
+        params["tail_lines"] = tail_lines
+
+    if limit_bytes is not None:
+        params["limit_bytes"] = limit_bytes
+
+    return params
+
+
+def _not_in_phase(
+    label_selector: str, phase: str
+) -> Callable[[List[Any]], Optional[str]]:
+    """
+    Tell why the selected pods are not all in the `phase`, if they are not.
+    """
+
+    def mismatch(pods: List[Any]) -> Optional[str]:
+        if not pods:
+            return f"no pods '{label_selector}' were found"
+
+        for d in pods:
+            if d.status.phase != phase:
+                return (
+                    f"pod '{label_selector}' is in phase '{d.status.phase}'"
+                    f" but should be '{phase}'"
+                )
+        return None
+
+    return mismatch
+
+
+def _not_in_conditions(
+    label_selector: str, conditions: List[Dict[str, str]]
+) -> Callable[[List[Any]], Optional[str]]:
+    """
+    Tell why the selected pods do not all meet the `conditions`, if they do
+    not.
+    """
+
+    def mismatch(pods: List[Any]) -> Optional[str]:
+        if not pods:
+            return f"no pods '{label_selector}' were found"
+
+        for d in pods:
+            # create a list of hash to compare with the given conditions
+            pod_conditions = [
+                {"type": pc.type, "status": pc.status}
+                for pc in d.status.conditions or []
+            ]
+            for condition in conditions:
+                if condition not in pod_conditions:
+                    return (
+                        f"pod {d.metadata.name} does not match the following "
+                        f"given condition: {condition}"
+                    )
+        return None
+
+    return mismatch
+
+
+def _in_phase(
+    label_selector: str, phase: str
+) -> Callable[[List[Any]], Optional[str]]:
+    """
+    Tell why one of the selected pods is in the `phase`, if one is.
+    """
+
+    def mismatch(pods: List[Any]) -> Optional[str]:
+        if not pods:
+            return f"no pods '{label_selector}' were found"
+
+        for d in pods:
+            if d.status.phase == phase:
+                return (
+                    f"pod '{label_selector}' should not be in phase "
+                    f"'{d.status.phase}'"
+                )
+        return None
+
+    return mismatch
+
+
+def _split_log_lines(pending: bytes, chunk: bytes) -> Tuple[List[str], bytes]:
+    """
+    Split the lines completed by `chunk`, read after the partial line
+    `pending`, from the partial line it ends with.
+    """
+    lines = (pending + chunk).split(b"\n")
+    pending = lines.pop()
+    return [line.decode("utf-8", errors="replace") for line in lines], pending
+
+
+class _LogSearch:
+    """
+    Outcome of the search of the logs of `pods` pods, settled as soon as it
+    is known so that the searches still running can bail out.
+    """
+
+    def __init__(self, pods: int, all_pods: bool, settled: Any):
+        self.pods = pods
+        self.all_pods = all_pods
+        self.settled = settled
+        self.matched = 0
+
+    def record(
+        self, pod: "client.V1Pod", found: bool, error: Exception = None
+    ) -> None:
+        """
+        Record the result of the search of the logs of `pod`, raising the
+        error it failed with, if any.
+        """
+        if error is not None:
+            self.settled.set()
+            raise error
+
+        if found:
+            self.matched += 1
+            if not self.all_pods:
+                self.settled.set()
+        else:
+            logger.debug(f"Pod '{pod.metadata.name}' logs did not match")
+            if self.all_pods:
+                self.settled.set()
+
+    def found(self) -> bool:
+        if self.all_pods:
+            return self.matched == self.pods
+        return self.matched > 0
+
+
+def _running(name: str, pods: List[Any]) -> Optional[str]:
+    """
+    Tell which of the pods named `name` is running, if one is.
+    """
+    for p in pods:
+        phase = p.status.phase
+        logger.debug(f"Pod '{p.metadata.name}' has status '{phase}'")
+        if phase == "Running":
+            return f"pod '{name}' is actually running"
+    return None
+
+
+def _iter_log_lines(resp: Any, stop: threading.Event = None) -> Iterator[str]:
+    """
+    Yield the lines of a log response as they are received, holding no more
+    than one chunk and one partial line in memory.
+    """
+    pending = b""
+    for chunk in resp.stream(LOG_CHUNK_SIZE, decode_content=True):
+        if stop is not None and stop.is_set():
+            return
+
+        lines, pending = _split_log_lines(pending, chunk)
+        for line in lines:
+            yield line
+
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+def _check_pods(
+    ns: str,
+    label_selector: str,
+    mismatch: Callable[[List[Any]], Optional[str]],
+    timeout: float = None,
+    secrets: Secrets = None,
+) -> Optional[str]:
+    """
+    Return why the pods matching `label_selector` do not have the expected
+    state, as told by `mismatch`, or `None` when they do.
+
+    Without a `timeout`, the pods are checked as they are now. Otherwise,
+    they are watched until they have the expected state or until `timeout`
+    seconds have passed, whichever comes first.
+    """
+    if timeout is None:
+        return mismatch(_list_pods(ns, label_selector, secrets))
+
+    reason = None
+
+    def expected(pods: List[Any]) -> bool:
+        nonlocal reason
+        reason = mismatch(pods)
+        return reason is None
+
+    wait_for_selection("pod", expected, ns, label_selector, timeout, secrets)
+    return reason
+
+
+def _list_pods(
+    ns: str = "default", label_selector: str = None, secrets: Secrets = None
+) -> List[Union["client.V1Pod", ObjectView]]:
+    """
+    List the pods matching `label_selector` in the namespace `ns`, from the
+    informer cache when it is enabled or from the API server otherwise, in
+    which case pods are views over the raw JSON response.
+    """
+    pods = cache.list_objects("pods", ns, label_selector, secrets=secrets)
+    if pods is not None:
+        logger.debug(
+            f"Found {len(pods)} cached pods matching label "
+            f"'{label_selector}' in ns '{ns}'"
+        )
+        return pods
+
+    api = create_k8s_api_client(secrets)
+
+    v1 = client.CoreV1Api(api)
+    list_pods = raw_list(v1.list_namespaced_pod)
+    if label_selector:
+        ret = list_pods(ns, label_selector=label_selector)
+        logger.debug(
+            f"Found {len(ret.items)} pods matching label '{label_selector}'"
+            f" in ns '{ns}'"
+        )
+    else:
+        ret = list_pods(ns)
+        logger.debug(f"Found {len(ret.items)} pods in ns '{ns}'")
+
+    return ret.items
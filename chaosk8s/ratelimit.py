@@ -0,0 +1,142 @@
+"""
+Client-side rate limiting of the requests made to the Kubernetes API server.
+
+Activities acting on many objects concurrently, such as terminating all the
+pods of an application or draining several nodes, can send bursts of
+requests large enough to be throttled by the API Priority and Fairness of
+the server, slowing down every other client of the control plane. Like
+client-go, each client is therefore given a token bucket: requests may be
+sent in bursts of `KUBERNETES_BURST`, after which they are spaced to average
+`KUBERNETES_QPS` requests per second.
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Any, Tuple
+
+from chaoslib.types import Secrets
+
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes.client")
+
+__all__ = [
+    "TokenBucket",
+    "limit_requests",
+    "throttle",
+    "DEFAULT_QPS",
+    "DEFAULT_BURST",
+]
+logger = logging.getLogger("chaostoolkit")
+
+# same defaults as kubectl
+DEFAULT_QPS = 50.0
+DEFAULT_BURST = 300
+
+# throttling longer than this, in seconds, is logged
+THROTTLING_LOG_THRESHOLD = 1.0
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `qps` tokens per second, holding up to `burst`
+    of them. Callers are served in the order they asked for a token.
+    """
+
+    def __init__(self, qps: float, burst: int):
+        self.qps = float(qps)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token and return how long, in seconds, the caller must wait
+        before it may be used.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.qps
+            )
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.qps
+
+    def acquire(self) -> float:
+        """
+        Wait for a token and return how long, in seconds, that took.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+def limit_requests(
+    api: "client.ApiClient", secrets: Secrets = None
+) -> "client.ApiClient":
+    """
+    Make every request sent by the client `api` wait for a token of a bucket
+    configured from `KUBERNETES_QPS` and `KUBERNETES_BURST`, in the secrets
+    or the environment. A QPS of `0` disables the limit.
+
+    Returns the same client.
+    """
+    qps, burst = _rate_limit_settings(secrets)
+    if qps <= 0:
+        return api
+
+    bucket = TokenBucket(qps, burst)
+    request = api.rest_client.request
+
+    @functools.wraps(request)
+    def limited_request(*args: Any, **kwargs: Any) -> Any:
+        waited = bucket.acquire()
+        if waited > THROTTLING_LOG_THRESHOLD:
+            logger.debug(
+                f"Waited {waited:.2f}s due to client-side throttling, "
+                f"not priority and fairness"
+            )
+        return request(*args, **kwargs)
+
+    limited_request.bucket = bucket
+    api.rest_client.request = limited_request
+    return api
+
+
+def throttle(api: "client.ApiClient") -> float:
+    """
+    Wait for a token of the bucket limiting the requests of the client `api`
+    and return how long, in seconds, that took. This is meant for requests
+    which bypass its REST client, such as websocket upgrades.
+    """
+    bucket = getattr(api.rest_client.request, "bucket", None)
+    if not isinstance(bucket, TokenBucket):
+        return 0.0
+    return bucket.acquire()
+
+
+###############################################################################
+# Private functions
+###############################################################################
+def _rate_limit_settings(secrets: Secrets = None) -> Tuple[float, int]:
+    secrets = secrets or {}
+
+    def lookup(k: str, d: Any) -> Any:
+        return secrets.get(k, os.environ.get(k, d))
+
+    try:
+        qps = float(lookup("KUBERNETES_QPS", DEFAULT_QPS))
+        burst = int(lookup("KUBERNETES_BURST", DEFAULT_BURST))
+    except (TypeError, ValueError):
+        logger.debug("Invalid rate limit settings, using the defaults")
+        return DEFAULT_QPS, DEFAULT_BURST
+
+    return qps, burst
@@ -1,8 +1,13 @@
 import logging
+from typing import List
+
 from chaoslib.types import Secrets
-from kubernetes import client
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.collection import delete_namespaced_collection
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes.client")
 
 __all__ = ["delete_replica_set"]
 logger = logging.getLogger("chaostoolkit")
@@ -12,8 +17,9 @@ def delete_replica_set(
     name: str = None,
     ns: str = "default",
     label_selector: str = None,
+    delete_collection: bool = False,
     secrets: Secrets = None,
-):
+) -> List[str]:
     """
     Delete a replica set by `name` or `label_selector` in the namespace `ns`.
 
@@ -22,9 +28,23 @@ def delete_replica_set(
 
     If neither `name` nor `label_selector` is specified, all the replica sets
     will be deleted in the namespace.
+
+    Set `delete_collection` to `True` to delete all the matching replica sets
+    through a single request to the API server rather than one per replica set.
+
+    Returns the names of the deleted replica sets.
     """
     api = create_k8s_api_client(secrets)
     v1 = client.AppsV1Api(api)
+
+    if delete_collection:
+        return delete_namespaced_collection(
+            v1.delete_collection_namespaced_replica_set,
+            ns,
+            name,
+            label_selector,
+        )
+
     if name:
         ret = v1.list_namespaced_replica_set(
             ns, field_selector=f"metadata.name={name}"
@@ -39,3 +59,5 @@ def delete_replica_set(
     body = client.V1DeleteOptions()
     for r in ret.items:
         v1.delete_namespaced_replica_set(r.metadata.name, ns, body=body)
+
+    return [r.metadata.name for r in ret.items]
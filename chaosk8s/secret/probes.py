@@ -1,8 +1,8 @@
 import logging
 from chaoslib.types import Secrets
-from kubernetes import client
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.metadata import list_metadata
 
 __all__ = ["secret_exists"]
 logger = logging.getLogger("chaostoolkit")
@@ -20,41 +20,23 @@ def secret_exists(
     """
     api = create_k8s_api_client(secrets)
 
-    v1 = client.CoreV1Api(api)
-
-    if name and not label_selector:
+    field_selector = f"metadata.name={name}" if name else None
+    if name:
         logger.debug(f"Filtering secrets by name {name}")
-        ret = v1.list_namespaced_secret(
-            ns, field_selector=f"metadata.name={name}"
-        )
-        logger.debug(
-            f"Found {len(ret.items)} secrets(s) named '{name}' in ns '{ns}'"
-        )
-    elif label_selector and not name:
+    if label_selector:
         logger.debug(f"Filtering secrets by label {label_selector}")
-        ret = v1.list_namespaced_secret(ns, label_selector=label_selector)
-        logger.debug(
-            f"Found {len(ret.items)} secret(s) in ns '{ns}'"
-            " labelled '{label_selector}'"
-        )
-    elif name and label_selector:
-        logger.debug(
-            f"Filtering secrets by name {name} and label {label_selector}"
-        )
-        ret = v1.list_namespaced_secret(
-            ns,
-            field_selector=f"metadata.name={name}",
-            label_selector=label_selector,
-        )
-        logger.debug(
-            f"Found {len(ret.items)} secret(s) named '{name}' and labelled"
-            f" '{label_selector}' in ns '{ns}'"
-        )
-    else:
-        ret = v1.list_namespaced_secret(ns)
-        logger.debug(f"Found {len(ret.items)} secret(s) in ns '{ns}'")
-
-    if not ret.items:
+
+    # only the metadata of a single secret is needed, never its payload
+    found = list_metadata(
+        api,
+        "/api/v1/namespaces/{namespace}/secrets",
+        path_params={"namespace": ns},
+        label_selector=label_selector,
+        field_selector=field_selector,
+        limit=1,
+    )
+
+    if not found:
         m = f"secret '{name}' does not exist"
         logger.debug(m)
         return False
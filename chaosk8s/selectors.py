@@ -0,0 +1,288 @@
+"""
+Label selectors, parsed once and evaluated locally.
+
+`compile_selector` turns a selector in the Kubernetes syntax into a
+`LabelSelector`, which tells whether a set of labels, or an object, matches
+it without a call to the API server. The syntax is that of
+`kubectl --selector`, requirements being separated by commas:
+
+* equality: `app=web`, `app==web`, `tier!=front`
+* set-based: `env in (prod, staging)`, `env notin (dev)`
+* existence: `release`, `!canary`
+* numeric comparison: `replicas>2`, `replicas<5`
+
+Compiled selectors are cached, so parsing the same selector string twice
+costs a dictionary lookup.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, NamedTuple
+
+from chaoslib.exceptions import ActivityFailed
+
+__all__ = ["Requirement", "LabelSelector", "compile_selector"]
+
+# kubectl operators and their LabelSelectorRequirement counterpart
+_EXPRESSION_OPERATORS = {
+    "in": "In",
+    "notin": "NotIn",
+    "!=": "NotIn",
+    "exists": "Exists",
+    "!": "DoesNotExist",
+}
+
+_TOKENS = re.compile(r"\s*(!=|==|=|!|\(|\)|,|>|<|[^\s!=(),<>]+)")
+_NAME = r"([A-Za-z0-9]([-A-Za-z0-9_.]{0,61}[A-Za-z0-9])?)"
+_KEY = re.compile(
+    rf"^([a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*/)?"
+    rf"{_NAME}$"
+)
+_VALUE = re.compile(rf"^{_NAME}?$")
+
+
+class Requirement(NamedTuple):
+    """
+    A single requirement of a selector: the label `key` compared by the
+    `operator` (`=`, `!=`, `in`, `notin`, `exists`, `!`, `>` or `<`) to the
+    `values`.
+    """
+
+    key: str
+    operator: str
+    values: FrozenSet[str] = frozenset()
+
+    def matches(self, labels: Mapping[str, str]) -> bool:
+        op = self.operator
+        if op == "exists":
+            return self.key in labels
+        if op == "!":
+            return self.key not in labels
+        if op in ("=", "in"):
+            return self.key in labels and labels[self.key] in self.values
+        if op in ("!=", "notin"):
+            return labels.get(self.key) not in self.values
+
+        # > and <, the label must be an integer
+        try:
+            value = int(labels[self.key])
+        except (KeyError, TypeError, ValueError):
+            return False
+        (bound,) = self.values
+        return value > int(bound) if op == ">" else value < int(bound)
+
+    def __str__(self) -> str:
+        values = sorted(self.values)
+        if self.operator == "exists":
+            return self.key
+        if self.operator == "!":
+            return f"!{self.key}"
+        if self.operator in ("in", "notin"):
+            return f"{self.key} {self.operator} ({','.join(values)})"
+        return f"{self.key}{self.operator}{values[0]}"
+
+
+class LabelSelector:
+    """
+    A compiled label selector, matching the labels which meet all of its
+    requirements. An empty selector matches everything.
+    """
+
+    __slots__ = ("requirements",)
+
+    def __init__(self, requirements: Iterable[Requirement] = ()):
+        self.requirements = tuple(requirements)
+
+    def matches(self, labels: Mapping[str, str]) -> bool:
+        """
+        Tell whether the `labels` meet all the requirements.
+        """
+        labels = labels or {}
+        return all(r.matches(labels) for r in self.requirements)
+
+    def matches_object(self, obj: Any) -> bool:
+        """
+        Tell whether the labels of `obj` meet all the requirements. The
+        object may be a client model, an `ObjectView` or a dictionary.
+        """
+        return self.matches(_labels_of(obj))
+
+    def filter(self, objects: Iterable[Any]) -> List[Any]:
+        """
+        Return the `objects` whose labels meet all the requirements.
+        """
+        if not self.requirements:
+            return list(objects)
+        return [o for o in objects if self.matches(_labels_of(o))]
+
+    @property
+    def match_labels(self) -> Dict[str, str]:
+        """
+        The equality requirements, as the `matchLabels` of a Kubernetes
+        `LabelSelector`.
+        """
+        return {
+            r.key: next(iter(r.values))
+            for r in self.requirements
+            if r.operator == "="
+        }
+
+    @property
+    def match_expressions(self) -> List[Dict[str, Any]]:
+        """
+        The other requirements, as the `matchExpressions` of a Kubernetes
+        `LabelSelector`. Numeric comparisons have no such form and raise
+        `ActivityFailed`.
+        """
+        expressions = []
+        for r in self.requirements:
+            if r.operator == "=":
+                continue
+            if r.operator not in _EXPRESSION_OPERATORS:
+                raise ActivityFailed(
+                    f"Label selector requirement '{r}' cannot be expressed "
+                    f"as a match expression"
+                )
+            expression = {
+                "key": r.key,
+                "operator": _EXPRESSION_OPERATORS[r.operator],
+            }
+            if r.values:
+                expression["values"] = sorted(r.values)
+            expressions.append(expression)
+        return expressions
+
+    def __bool__(self) -> bool:
+        return bool(self.requirements)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LabelSelector):
+            return self.requirements == other.requirements
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.requirements)
+
+    def __str__(self) -> str:
+        return ",".join(str(r) for r in self.requirements)
+
+    def __repr__(self) -> str:
+        return f"LabelSelector({str(self)!r})"
+
+
+@lru_cache(maxsize=256)
+def compile_selector(label_selector: str = None) -> LabelSelector:
+    """
+    Parse `label_selector` into a `LabelSelector`. An empty or `None`
+    selector matches everything.
+
+    Raise `ActivityFailed` when the selector is not valid.
+    """
+    if not label_selector or not label_selector.strip():
+        return LabelSelector()
+
+    try:
+        return LabelSelector(_parse(_tokenize(label_selector)))
+    except ValueError as x:
+        raise ActivityFailed(f"Invalid label selector '{label_selector}': {x}")
+
+
+###############################################################################
+# Private functions
+###############################################################################
+def _tokenize(label_selector: str) -> List[str]:
+    tokens = []
+    position = 0
+    text = label_selector.rstrip()
+    while position < len(text):
+        m = _TOKENS.match(text, position)
+        if m is None:
+            raise ValueError(f"unexpected character at {position}")
+        tokens.append(m.group(1))
+        position = m.end()
+    return tokens
+
+
+def _parse(tokens: List[str]) -> List[Requirement]:
+    requirements = []
+    i = 0
+
+    def peek() -> str:
+        return tokens[i] if i < len(tokens) else None
+
+    def take() -> str:
+        nonlocal i
+        if i >= len(tokens):
+            raise ValueError("unexpected end of selector")
+        i += 1
+        return tokens[i - 1]
+
+    def key() -> str:
+        k = take()
+        if not _KEY.match(k):
+            raise ValueError(f"'{k}' is not a valid label key")
+        return k
+
+    def value() -> str:
+        # empty values are allowed, such as in `app=`
+        if peek() in (None, ",", ")"):
+            return ""
+        v = take()
+        if not _VALUE.match(v):
+            raise ValueError(f"'{v}' is not a valid label value")
+        return v
+
+    while True:
+        if peek() == "!":
+            take()
+            requirements.append(Requirement(key(), "!"))
+        else:
+            k = key()
+            op = peek()
+            if op in (None, ","):
+                requirements.append(Requirement(k, "exists"))
+            elif op in ("=", "==", "!="):
+                take()
+                operator = "!=" if op == "!=" else "="
+                requirements.append(
+                    Requirement(k, operator, frozenset([value()]))
+                )
+            elif op in ("in", "notin"):
+                take()
+                if take() != "(":
+                    raise ValueError(f"expected '(' after '{op}'")
+                values = [value()]
+                while peek() == ",":
+                    take()
+                    values.append(value())
+                if take() != ")":
+                    raise ValueError("expected ')' to close the set")
+                requirements.append(Requirement(k, op, frozenset(values)))
+            elif op in (">", "<"):
+                take()
+                bound = take()
+                if not re.match(r"^-?\d+$", bound):
+                    raise ValueError(f"'{bound}' is not an integer")
+                requirements.append(Requirement(k, op, frozenset([bound])))
+            else:
+                raise ValueError(f"unexpected '{op}' after '{k}'")
+
+        if peek() is None:
+            return requirements
+        if take() != ",":
+            raise ValueError(f"expected ',' before '{tokens[i - 1]}'")
+        if peek() is None:
+            raise ValueError("trailing ','")
+
+
+def _labels_of(obj: Any) -> Mapping[str, str]:
+    if isinstance(obj, Mapping):
+        return (obj.get("metadata") or {}).get("labels") or {}
+
+    labels = obj.metadata.labels if obj.metadata is not None else None
+    if labels is None:
+        return {}
+    # views wrap nested objects, labels included
+    if hasattr(labels, "to_dict") and not isinstance(labels, Mapping):
+        return labels.to_dict()
+    return labels
@@ -4,9 +4,11 @@ import os.path
 import yaml
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.lazy import lazy_import
+
+client = lazy_import("kubernetes.client")
 
 __all__ = ["create_service_endpoint", "delete_service"]
 
@@ -2,9 +2,9 @@ import logging
 
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.metadata import list_metadata
 
 __all__ = ["service_is_initialized"]
 logger = logging.getLogger("chaostoolkit")
@@ -27,41 +27,22 @@ def service_is_initialized(
     """
     api = create_k8s_api_client(secrets)
 
-    v1 = client.CoreV1Api(api)
-
-    if name and not label_selector:
+    field_selector = f"metadata.name={name}" if name else None
+    if name:
         logger.debug(f"Filtering services by name {name}")
-        ret = v1.list_namespaced_service(
-            ns, field_selector=f"metadata.name={name}"
-        )
-        logger.debug(
-            f"Found {len(ret.items)} service(s) named '{name}' in ns '{ns}'"
-        )
-    elif label_selector and not name:
+    if label_selector:
         logger.debug(f"Filtering services by label {label_selector}")
-        ret = v1.list_namespaced_service(ns, label_selector=label_selector)
-        logger.debug(
-            f"Found {len(ret.items)} service(s) in ns '{ns}'"
-            " labelled '{label_selector}'"
-        )
-    elif name and label_selector:
-        logger.debug(
-            f"Filtering services by name {name} and label {label_selector}"
-        )
-        ret = v1.list_namespaced_service(
-            ns,
-            field_selector=f"metadata.name={name}",
-            label_selector=label_selector,
-        )
-        logger.debug(
-            f"Found {len(ret.items)} service(s) named '{name}' and labelled"
-            f" '{label_selector}' in ns '{ns}'"
-        )
-    else:
-        ret = v1.list_namespaced_service(ns)
-        logger.debug(f"Found {len(ret.items)} service(s) in ns '{ns}'")
 
-    if not ret.items:
+    found = list_metadata(
+        api,
+        "/api/v1/namespaces/{namespace}/services",
+        path_params={"namespace": ns},
+        label_selector=label_selector,
+        field_selector=field_selector,
+        limit=1,
+    )
+
+    if not found:
         m = f"service '{name}' is not initialized"
         if not raise_if_service_not_initialized:
             logger.debug(m)
@@ -0,0 +1,28 @@
+"""
+Specifications of the objects created by the actions, read from the JSON or
+YAML files they are given.
+"""
+
+import json
+import os.path
+from typing import Any, Dict
+
+import yaml
+from chaoslib.exceptions import ActivityFailed
+
+__all__ = ["load_spec"]
+
+
+def load_spec(spec_path: str) -> Dict[str, Any]:
+    """
+    Read the object described by the file at `spec_path`, which must be the
+    JSON or YAML representation of that object.
+    """
+    with open(spec_path) as f:
+        p, ext = os.path.splitext(spec_path)
+        if ext == ".json":
+            return json.loads(f.read())
+        elif ext in [".yml", ".yaml"]:
+            return yaml.safe_load(f.read())
+        else:
+            raise ActivityFailed(f"cannot process {spec_path}")
@@ -1,14 +1,19 @@
-import json
 import logging
-import os.path
+from typing import List
 
-import yaml
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client
-from kubernetes.client.rest import ApiException
 
 from chaosk8s import create_k8s_api_client
+from chaosk8s.collection import (
+    _deletion_selectors,
+    delete_namespaced_collection,
+)
+from chaosk8s.lazy import lazy_import
+from chaosk8s.spec import load_spec
+
+client = lazy_import("kubernetes.client")
+rest = lazy_import("kubernetes.client.rest")
 
 __all__ = ["create_statefulset", "scale_statefulset", "remove_statefulset"]
 logger = logging.getLogger("chaostoolkit")
@@ -23,14 +28,7 @@ def create_statefulset(
     """
     api = create_k8s_api_client(secrets)
 
-    with open(spec_path) as f:
-        p, ext = os.path.splitext(spec_path)
-        if ext == ".json":
-            statefulset = json.loads(f.read())
-        elif ext in [".yml", ".yaml"]:
-            statefulset = yaml.safe_load(f.read())
-        else:
-            raise ActivityFailed(f"cannot process {spec_path}")
+    statefulset = load_spec(spec_path)
 
     v1 = client.AppsV1Api(api)
     v1.create_namespaced_stateful_set(ns, body=statefulset)
@@ -49,7 +47,7 @@ def scale_statefulset(
     body = {"spec": {"replicas": replicas}}
     try:
         v1.patch_namespaced_stateful_set(name, namespace=ns, body=body)
-    except ApiException as e:
+    except rest.ApiException as e:
         raise ActivityFailed(
             f"failed to scale '{name}' to {replicas} replicas: {str(e)}"
         )
@@ -59,8 +57,9 @@ def remove_statefulset(
     name: str = None,
     ns: str = "default",
     label_selector: str = None,
+    delete_collection: bool = False,
     secrets: Secrets = None,
-):
+) -> List[str]:
     """
     Remove a statefulset by `name` or `label_selector` in the namespace `ns`.
 
@@ -69,18 +68,27 @@ def remove_statefulset(
 
     If neither `name` nor `label_selector` is specified, all the statefulsets
     will be deleted in the namespace.
+
+    Set `delete_collection` to `True` to delete all the matching statefulsets
+    through a single request to the API server rather than one per statefulset.
+
+    Returns the names of the deleted statefulsets.
     """
     api = create_k8s_api_client(secrets)
 
     v1 = client.AppsV1Api(api)
-    if name:
-        ret = v1.list_namespaced_stateful_set(
-            ns, field_selector=f"metadata.name={name}"
+
+    if delete_collection:
+        return delete_namespaced_collection(
+            v1.delete_collection_namespaced_stateful_set,
+            ns,
+            name,
+            label_selector,
         )
-    elif label_selector:
-        ret = v1.list_namespaced_stateful_set(ns, label_selector=label_selector)
-    else:
-        ret = v1.list_namespaced_stateful_set(ns)
+
+    ret = v1.list_namespaced_stateful_set(
+        ns, **_deletion_selectors(name, label_selector)
+    )
 
     logger.debug(
         f"Found {len(ret.items)} statefulset(s) named '{name}' in ns '{ns}'"
@@ -89,3 +97,5 @@ def remove_statefulset(
     body = client.V1DeleteOptions()
     for d in ret.items:
         _ = v1.delete_namespaced_stateful_set(d.metadata.name, ns, body=body)
+
+    return [d.metadata.name for d in ret.items]
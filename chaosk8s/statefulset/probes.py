@@ -1,17 +1,28 @@
 import logging
-from functools import partial
 
-import urllib3
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
-from kubernetes import client, watch
 
-from chaosk8s import create_k8s_api_client
+from chaosk8s.waiter import Target, wait_for
 
 __all__ = ["statefulset_fully_available", "statefulset_not_fully_available"]
 logger = logging.getLogger("chaostoolkit")
 
 
+def _statefulset_is_ready(statefulset) -> bool:
+    status = statefulset.status
+    spec = statefulset.spec
+
+    logger.debug(
+        f"StatefulSet '{statefulset.metadata.name}': "
+        f"Current Revision: {status.current_revision} - "
+        f"Ready Replicas {status.ready_replicas} - "
+        f"Current Replicas {status.current_replicas} - "
+        f"Replicas {spec.replicas}"
+    )
+    return status.ready_replicas == spec.replicas
+
+
 def _statefulset_readiness_has_state(
     name: str,
     ready: bool,
@@ -23,57 +34,27 @@ def _statefulset_readiness_has_state(
     """
     Check wether if the given statefulSet state is ready or not
     according to the ready paramter.
-    If the state is not reached after `timeout` seconds, a
-    :exc:`chaoslib.exceptions.ActivityFailed` exception is raised.
+    Return `False` if the state is not reached after `timeout` seconds.
     """
-    field_selector = f"metadata.name={name}"
-    api = create_k8s_api_client(secrets)
-    v1 = client.AppsV1Api(api)
-    w = watch.Watch()
-    timeout = int(timeout)
-
-    if label_selector is None:
-        watch_events = partial(
-            w.stream,
-            v1.list_namespaced_stateful_set,
-            namespace=ns,
-            field_selector=field_selector,
-            _request_timeout=timeout,
-        )
-    else:
+    target = _statefulset_readiness_target(name, ready, ns, label_selector)
+    return wait_for([target], timeout=timeout, secrets=secrets)
+
+
+def _statefulset_readiness_target(
+    name: str, ready: bool, ns: str = "default", label_selector: str = None
+) -> Target:
+    """
+    Target the statefulset `name` until its readiness is `ready`.
+    """
+    if label_selector is not None:
         label_selector = label_selector.format(name=name)
-        watch_events = partial(
-            w.stream,
-            v1.list_namespaced_stateful_set,
-            namespace=ns,
-            field_selector=field_selector,
-            label_selector=label_selector,
-            _request_timeout=timeout,
-        )
-
-    try:
-        logger.debug(f"Watching events for {timeout}s")
-        for event in watch_events():
-            statefulset = event["object"]
-            status = statefulset.status
-            spec = statefulset.spec
-
-            logger.debug(
-                f"StatefulSet '{statefulset.metadata.name}' {event['type']}: "
-                f"Current Revision: {status.current_revision} - "
-                f"Ready Replicas {status.ready_replicas} - "
-                f"Current Replicas {status.current_replicas} - "
-                f"Replicas {spec.replicas}"
-            )
-
-            readiness = status.ready_replicas == spec.replicas
-            if ready == readiness:
-                w.stop()
-                return True
-
-    except urllib3.exceptions.ReadTimeoutError:
-        logger.debug("Timed out!")
-        return False
+
+    def has_state(statefulset) -> bool:
+        return ready == _statefulset_is_ready(statefulset)
+
+    return Target(
+        "statefulset", name, has_state, ns=ns, label_selector=label_selector
+    )
 
 
 def statefulset_not_fully_available(
@@ -0,0 +1,107 @@
+"""
+Lightweight views over the raw JSON returned by the Kubernetes API.
+
+Deserializing a list response into the client's models builds a tree of
+`V1Pod`, `V1ObjectMeta`, `V1Container`... objects, through reflection, for
+every single field of every object, even though probes only read a handful
+of them. Loading the response with `json.loads` instead and wrapping it into
+an `ObjectView` is much cheaper: fields are looked up lazily, by the same
+snake case names as the models, when probes access them.
+
+Values are left as sent by the API server, dates are therefore strings
+rather than `datetime` objects.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
+__all__ = ["ObjectView", "raw_list", "read_json"]
+
+# fields whose JSON name is not the camel case form of the model attribute
+SPECIAL_KEYS = {
+    "cluster_ip": "clusterIP",
+    "cluster_i_ps": "clusterIPs",
+    "external_i_ps": "externalIPs",
+    "host_ip": "hostIP",
+    "host_i_ps": "hostIPs",
+    "pod_ip": "podIP",
+    "pod_i_ps": "podIPs",
+}
+
+
+class ObjectView:
+    """
+    Read-only, attribute based, access to a Kubernetes object decoded from
+    JSON. Missing fields read as `None`, as they do on the client's models.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self._raw = raw
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _wrap(self._raw.get(_json_key(name)))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ObjectView):
+            return self._raw == other._raw
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ObjectView({self._raw!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the JSON object, as decoded, behind this view.
+        """
+        return self._raw
+
+
+def read_json(resp: Any) -> Any:
+    """
+    Decode the JSON body of a response obtained with `_preload_content=False`
+    and give its connection back to the pool.
+    """
+    try:
+        return json.loads(resp.data)
+    finally:
+        resp.release_conn()
+
+
+def raw_list(list_func: Callable[..., Any]) -> Callable[..., ObjectView]:
+    """
+    Wrap a client list method, such as `CoreV1Api.list_namespaced_pod`, so
+    that it returns an `ObjectView` of the JSON response rather than the
+    deserialized model. The wrapped method can be given to
+    `chaosk8s.pagination.iter_items`.
+    """
+
+    def call(*args: Any, **kwargs: Any) -> ObjectView:
+        kwargs["_preload_content"] = False
+        return ObjectView(read_json(list_func(*args, **kwargs)))
+
+    return call
+
+
+###############################################################################
+# Internals
+###############################################################################
+def _wrap(value: Any) -> Any:
+    if isinstance(value, dict):
+        return ObjectView(value)
+    if isinstance(value, list):
+        return [_wrap(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=512)
+def _json_key(name: str) -> str:
+    if name in SPECIAL_KEYS:
+        return SPECIAL_KEYS[name]
+
+    head, *tail = name.lstrip("_").split("_")
+    return head + "".join(t.capitalize() for t in tail)
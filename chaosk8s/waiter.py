@@ -0,0 +1,424 @@
+"""
+Wait for many objects to reach a given state, over as few watches as
+possible.
+
+Each object to wait for is a `Target`: its kind, name and namespace, plus a
+predicate telling whether the object, as last seen, has reached the
+expected state. Targets of the same kind, namespace and label selector share
+a single watch and the watches of different groups run concurrently, so
+waiting on many objects takes as long as the slowest of them rather than
+the sum of their waits. `wait_for_selection` rather watches all the objects
+matching a label selector, whichever they are, until a predicate holds for
+them as a whole.
+
+Objects are first listed, so that those already in their expected state
+are not waited for, and then watched from the resource version of that
+list. Rather than a single request held open for the whole wait, each watch
+lasts `WATCH_WINDOW` seconds and is resumed from the last resource version
+it saw, bookmarks included. When that version is too old for the API server
+to resume from, the objects are listed again.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+import urllib3
+from chaoslib.exceptions import ActivityFailed
+from chaoslib.types import Secrets
+
+from chaosk8s import create_k8s_api_client
+from chaosk8s.lazy import lazy_import
+from chaosk8s.pagination import iter_pages
+
+client = lazy_import("kubernetes.client")
+rest = lazy_import("kubernetes.client.rest")
+watch = lazy_import("kubernetes.watch")
+
+__all__ = ["KINDS", "Target", "wait_for", "wait_for_selection"]
+logger = logging.getLogger("chaostoolkit")
+
+# seconds each watch request lasts before it is resumed with a new one
+WATCH_WINDOW = 60
+# seconds a watch may stay silent past its window before it is deemed stalled
+WATCH_READ_SLACK = 10
+# minimum seconds between two watch requests of the same group
+WATCH_MIN_INTERVAL = 1.0
+
+# kind: (client API class, namespaced list method)
+KINDS = {
+    "daemonset": ("AppsV1Api", "list_namespaced_daemon_set"),
+    "deployment": ("AppsV1Api", "list_namespaced_deployment"),
+    "pod": ("CoreV1Api", "list_namespaced_pod"),
+    "statefulset": ("AppsV1Api", "list_namespaced_stateful_set"),
+}
+
+
+class Target(NamedTuple):
+    """
+    An object to wait for, until `predicate` returns `True` for it.
+    """
+
+    kind: str
+    name: str
+    predicate: Callable[[Any], bool]
+    ns: str = "default"
+    label_selector: str = None
+
+
+def wait_for(
+    targets: Iterable[Target],
+    mode: str = "all",
+    timeout: float = 30,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Watch the `targets` until all of them, or any of them when `mode` is
+    `"any"`, have reached their state.
+
+    Return `True` when they did within `timeout` seconds, `False` otherwise.
+    """
+    groups = _group_targets(targets, mode)
+    if not groups:
+        return True
+
+    state = _WaitState(
+        [t for g in groups.values() for t in g], mode, len(groups)
+    )
+    deadline = time.monotonic() + float(timeout)
+    api = create_k8s_api_client(secrets)
+
+    if len(groups) == 1:
+        _watch_group(api, *groups.popitem(), state, deadline)
+        return state.succeeded()
+
+    for key, group in groups.items():
+        threading.Thread(
+            target=_watch_group_in_thread,
+            args=(api, key, group, state, deadline),
+            name=f"chaosk8s-wait-{key[0]}-{key[1]}",
+            daemon=True,
+        ).start()
+
+    # watches still blocked on a read once the outcome is known end with
+    # their request timeout, at the latest by the deadline
+    state.done.wait(max(0, deadline - time.monotonic()))
+    succeeded = state.succeeded()
+    if not succeeded and state.error is not None:
+        raise state.error
+    return succeeded
+
+
+def wait_for_selection(
+    kind: str,
+    predicate: Callable[[List[Any]], bool],
+    ns: str = "default",
+    label_selector: str = None,
+    timeout: float = 30,
+    secrets: Secrets = None,
+) -> bool:
+    """
+    Watch the objects of `kind` matching `label_selector` in the namespace
+    `ns` until `predicate`, given all of them as last seen, returns `True`.
+    Objects created or deleted meanwhile join or leave the selection.
+
+    Return `True` when it did within `timeout` seconds, `False` otherwise.
+    """
+    if kind not in KINDS:
+        raise ActivityFailed(f"Cannot wait for objects of kind '{kind}'")
+
+    api_name, list_name = KINDS[kind]
+    api = create_k8s_api_client(secrets)
+    list_func = getattr(getattr(client, api_name)(api), list_name)
+    selectors = {"label_selector": label_selector} if label_selector else {}
+    deadline = time.monotonic() + float(timeout)
+    selection = _Selection(predicate)
+
+    def relist() -> Optional[str]:
+        selection.clear()
+        rv = None
+        for page in iter_pages(list_func, namespace=ns, **selectors):
+            if rv is None:
+                rv = page.metadata.resource_version
+            for obj in page.items:
+                selection.add(obj)
+        return None if selection.matched() else rv
+
+    return _list_and_watch(
+        list_func,
+        ns,
+        selectors,
+        deadline,
+        relist,
+        selection.on_event,
+        f"{kind}(s) '{label_selector or ''}'",
+    )
+
+
+###############################################################################
+# Private functions
+###############################################################################
+class _WaitState:
+    """
+    Targets still pending across all the watches of a wait.
+    """
+
+    def __init__(self, targets: List[Target], mode: str, watches: int):
+        self.pending = set(targets)
+        self.reached = set()
+        self.mode = mode
+        self.watches = watches
+        self.done = threading.Event()
+        self.error = None
+        self._lock = threading.Lock()
+
+    def reach(self, target: Target) -> None:
+        with self._lock:
+            if target not in self.pending:
+                return
+            self.pending.discard(target)
+            self.reached.add(target)
+            if self.mode == "any" or not self.pending:
+                self.done.set()
+
+    def watch_ended(self, satisfied: bool) -> None:
+        with self._lock:
+            self.watches -= 1
+            # a watch which ended short of its targets fails a wait for all
+            if self.watches == 0 or (self.mode == "all" and not satisfied):
+                self.done.set()
+
+    def fail(self, error: Exception) -> None:
+        with self._lock:
+            if self.error is None:
+                self.error = error
+
+    def succeeded(self) -> bool:
+        with self._lock:
+            if self.mode == "any":
+                return bool(self.reached)
+            return not self.pending
+
+
+def _group_targets(
+    targets: Iterable[Target], mode: str
+) -> Dict[Tuple[str, str, str], List[Target]]:
+    """
+    Group the `targets` sharing a watch, by kind, namespace and label
+    selector.
+    """
+    if mode not in ("all", "any"):
+        raise ActivityFailed(f"Unknown wait mode '{mode}', use 'all' or 'any'")
+
+    groups: Dict[Tuple[str, str, str], List[Target]] = defaultdict(list)
+    for target in targets:
+        if target.kind not in KINDS:
+            raise ActivityFailed(
+                f"Cannot wait for objects of kind '{target.kind}'"
+            )
+        groups[(target.kind, target.ns, target.label_selector)].append(target)
+    return groups
+
+
+class _Group:
+    """
+    Targets of a wait sharing a watch, those of the same kind selected by the
+    same label selector in the same namespace.
+    """
+
+    def __init__(
+        self,
+        key: Tuple[str, str, str],
+        targets: List[Target],
+        state: _WaitState,
+    ):
+        self.kind, self.ns, label_selector = key
+        self.by_name: Dict[str, List[Target]] = defaultdict(list)
+        for target in targets:
+            self.by_name[target.name].append(target)
+
+        # a single object is selected by the server, others filtered out here
+        self.selectors = {}
+        self.only = None
+        if len(self.by_name) == 1:
+            self.only = targets
+            self.selectors["field_selector"] = (
+                f"metadata.name={targets[0].name}"
+            )
+        if label_selector:
+            self.selectors["label_selector"] = label_selector
+
+        self.remaining = set(targets)
+        self.state = state
+        self.what = f"{len(self.by_name)} {self.kind}(s)"
+
+    def observe(self, obj: Any) -> bool:
+        """
+        Check `obj` as it is now, telling whether the group is done with.
+        """
+        for target in self.only or self.by_name.get(obj.metadata.name, []):
+            if target in self.remaining and target.predicate(obj):
+                self.remaining.discard(target)
+                self.state.reach(target)
+        return not self.remaining or self.state.done.is_set()
+
+
+class _Selection:
+    """
+    Objects watched by `wait_for_selection`, as last seen.
+    """
+
+    def __init__(self, predicate: Callable[[List[Any]], bool]):
+        self.predicate = predicate
+        self.objects: Dict[str, Any] = {}
+
+    def clear(self) -> None:
+        self.objects.clear()
+
+    def add(self, obj: Any) -> None:
+        self.objects[obj.metadata.name] = obj
+
+    def on_event(self, event_type: str, obj: Any) -> bool:
+        if event_type == "DELETED":
+            self.objects.pop(obj.metadata.name, None)
+        else:
+            self.add(obj)
+        return self.matched()
+
+    def matched(self) -> bool:
+        return self.predicate(list(self.objects.values()))
+
+
+def _watch_group(
+    api: "client.ApiClient",
+    key: Tuple[str, str, str],
+    targets: List[Target],
+    state: _WaitState,
+    deadline: float,
+) -> None:
+    group = _Group(key, targets, state)
+    api_name, list_name = KINDS[group.kind]
+    list_func = getattr(getattr(client, api_name)(api), list_name)
+
+    try:
+        _list_and_watch(
+            list_func,
+            group.ns,
+            group.selectors,
+            deadline,
+            lambda: _list_group(
+                list_func, group.ns, group.selectors, group.observe
+            ),
+            lambda event_type, obj: group.observe(obj),
+            group.what,
+        )
+    except Exception as x:
+        # recorded before the wait may be told this watch ended
+        state.fail(x)
+        raise
+    finally:
+        state.watch_ended(not group.remaining)
+
+
+def _list_and_watch(
+    list_func: Callable[..., Any],
+    ns: str,
+    selectors: Dict[str, str],
+    deadline: float,
+    relist: Callable[[], Optional[str]],
+    on_event: Callable[[str, Any], bool],
+    what: str,
+) -> bool:
+    """
+    List the objects with `relist`, which returns the resource version to
+    watch from or `None` when done with them, then watch them until
+    `on_event` returns `True`. Return `True` when done before the deadline.
+    """
+    rv = relist()
+    last_watch = 0.0
+    while rv is not None:
+        left = deadline - time.monotonic()
+        if left <= 0:
+            logger.debug("Timed out!")
+            return False
+
+        # do not hammer the API server when watches end right away
+        pause = last_watch + WATCH_MIN_INTERVAL - time.monotonic()
+        if pause > 0:
+            time.sleep(min(pause, left))
+            continue
+        last_watch = time.monotonic()
+
+        window = max(1, int(min(left, WATCH_WINDOW)))
+        logger.debug(
+            f"Watching {what} in ns '{ns}' from resource version {rv} for "
+            f"{window}s"
+        )
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                list_func,
+                namespace=ns,
+                resource_version=rv,
+                timeout_seconds=window,
+                allow_watch_bookmarks=True,
+                _request_timeout=min(left, window + WATCH_READ_SLACK),
+                **selectors,
+            ):
+                if event["type"] == "BOOKMARK":
+                    rv = event["raw_object"]["metadata"]["resourceVersion"]
+                    continue
+
+                obj = event["object"]
+                rv = obj.metadata.resource_version or rv
+                logger.debug(f"'{obj.metadata.name}' {event['type']}")
+                if on_event(event["type"], obj):
+                    w.stop()
+                    return True
+        except urllib3.exceptions.ReadTimeoutError:
+            logger.debug(f"Watch of {what} stalled, resuming it")
+        except rest.ApiException as x:
+            if x.status != 410:
+                raise
+            logger.debug(f"Resource version {rv} is gone, listing again")
+            rv = relist()
+    return True
+
+
+def _list_group(
+    list_func: Callable[..., Any],
+    ns: str,
+    selectors: Dict[str, str],
+    observe: Callable[[Any], bool],
+) -> Optional[str]:
+    """
+    List the objects of a group to check them as they are now. Return the
+    resource version to watch from, or `None` when they are done with.
+    """
+    rv = None
+    for page in iter_pages(list_func, namespace=ns, **selectors):
+        if rv is None:
+            rv = page.metadata.resource_version
+        for obj in page.items:
+            if observe(obj):
+                return None
+    return rv
+
+
+def _watch_group_in_thread(*args: Any) -> None:
+    # errors are raised from the waiting thread, as with a single watch
+    try:
+        _watch_group(*args)
+    except Exception as x:
+        logger.debug(f"Watch failed: {x}")
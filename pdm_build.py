@@ -0,0 +1,39 @@
+"""
+pdm-backend build hook generating the manifest of the activities exported by
+the extension, shipped in wheels as `chaosk8s/activities.json` so that
+discovery does not have to introspect every activity module at runtime.
+
+Importing the activity modules only requires chaostoolkit-lib, the
+Kubernetes client itself being imported lazily. Should the manifest fail to
+be generated, the build goes on without it and the activities are discovered
+at runtime instead.
+"""
+
+import logging
+import sys
+
+logger = logging.getLogger("pdm_build")
+
+
+def pdm_build_update_files(context, files):
+    # editable installs run from the sources, which change under them
+    if context.target != "wheel":
+        return
+
+    version = context.config.metadata["version"]
+    sys.path.insert(0, str(context.root))
+    try:
+        from chaosk8s import load_exported_activities
+        from chaosk8s.manifest import write_manifest
+
+        activities = load_exported_activities(use_manifest=False)
+        path = context.ensure_build_dir() / "activities.json"
+        write_manifest(activities, version, str(path))
+    except Exception as x:
+        # without a manifest, the activities are discovered at runtime
+        logger.warning(f"Not building the activity manifest: {x}")
+        return
+    finally:
+        sys.path.remove(str(context.root))
+
+    files["chaosk8s/activities.json"] = path
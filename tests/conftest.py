@@ -0,0 +1,10 @@
+import pytest
+
+from chaosk8s import clear_k8s_api_client_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    clear_k8s_api_client_cache()
+    yield
+    clear_k8s_api_client_cache()
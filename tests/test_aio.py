@@ -0,0 +1,226 @@
+import asyncio
+import importlib
+import inspect
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from chaoslib.exceptions import ActivityFailed
+
+from benchmarks.fakeapi import FakeApiServer, FakeCluster
+from chaosk8s import instrumentation
+from chaosk8s.aio import close_k8s_api_clients, create_k8s_api_client
+from chaosk8s.aio.crd.actions import patch_custom_object
+from chaosk8s.aio.deployment.probes import deployment_fully_available
+from chaosk8s.aio.node.actions import drain_nodes
+from chaosk8s.aio.node.probes import get_all_node_status_conditions
+from chaosk8s.aio.pod.actions import exec_in_pods, terminate_pods
+from chaosk8s.aio.pod.probes import count_pods, pods_in_phase, read_pod_logs
+
+
+@pytest.fixture
+def cluster(monkeypatch):
+    cluster = FakeCluster(pods=300)
+    with FakeApiServer(cluster) as server:
+        monkeypatch.setenv("KUBERNETES_HOST", server.url)
+        monkeypatch.delenv("CHAOSTOOLKIT_IN_POD", raising=False)
+        with patch("chaosk8s.has_local_config_file", return_value=False):
+            cluster.server = server
+            yield cluster
+
+
+def run(coro):
+    async def main():
+        try:
+            return await coro
+        finally:
+            await close_k8s_api_clients()
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "kind", ["pod", "node", "deployment", "statefulset", "daemonset", "crd"]
+)
+@pytest.mark.parametrize("module", ["actions", "probes"])
+def test_async_modules_mirror_the_activities(kind, module):
+    sync = importlib.import_module(f"chaosk8s.{kind}.{module}")
+    async_ = importlib.import_module(f"chaosk8s.aio.{kind}.{module}")
+
+    assert async_.__all__ == sync.__all__
+    for name in sync.__all__:
+        func = getattr(async_, name)
+        assert inspect.iscoroutinefunction(func)
+        assert inspect.signature(func) == inspect.signature(getattr(sync, name))
+
+
+def test_count_pods(cluster):
+    assert run(count_pods(label_selector="shard=1")) == 3
+
+
+def test_pods_in_phase(cluster):
+    assert run(pods_in_phase(label_selector="shard=1", phase="Running"))
+
+    with pytest.raises(ActivityFailed):
+        run(pods_in_phase(label_selector="shard=1", phase="Pending"))
+
+
+def test_pods_in_phase_fails_once_timed_out(cluster):
+    assert run(
+        pods_in_phase(label_selector="shard=1", phase="Running", timeout=5)
+    )
+
+    started = time.monotonic()
+    with pytest.raises(ActivityFailed):
+        run(pods_in_phase(label_selector="shard=1", phase="Pending", timeout=1))
+    assert time.monotonic() - started < 5
+
+
+def test_terminate_pods(cluster):
+    deleted = run(
+        terminate_pods(label_selector="shard=1", all=True, max_concurrency=3)
+    )
+
+    assert deleted == ["bench-1", "bench-101", "bench-201"]
+    assert cluster.deleted == {1, 101, 201}
+
+
+def test_read_pod_logs(cluster):
+    logs = run(
+        read_pod_logs(label_selector="shard=2", tail_lines=5, max_concurrency=2)
+    )
+
+    assert list(logs) == ["bench-2", "bench-102", "bench-202"]
+    assert logs["bench-2"].count("\n") == 5
+
+
+def test_node_status_conditions(cluster):
+    conditions = run(get_all_node_status_conditions())
+
+    assert [c["name"] for c in conditions] == ["node-0", "node-1", "node-2"]
+    assert all(c["Ready"] == "True" for c in conditions)
+
+
+def test_drain_nodes(cluster):
+    drained = run(drain_nodes(name="node-0", timeout=10))
+
+    assert drained == ["node-0"]
+    assert cluster.cordoned == {"node-0"}
+    assert cluster.deleted == set(range(0, 300, 3))
+
+
+def test_deployment_fully_available(cluster):
+    assert run(deployment_fully_available("bench-1", timeout=5))
+
+
+def test_activities_share_the_event_loop(cluster):
+    cluster.server.latency = 0.2
+
+    async def main():
+        # requests do not hold a thread, a single one is left to the loop
+        executor = ThreadPoolExecutor(max_workers=1)
+        asyncio.get_running_loop().set_default_executor(executor)
+        return await asyncio.gather(
+            *[count_pods(label_selector=f"shard={i}") for i in range(20)]
+        )
+
+    started = time.monotonic()
+    counts = run(main())
+
+    assert counts == [3] * 20
+    # one after the other, they would have taken at least 4s
+    assert time.monotonic() - started < 2
+
+
+def test_clients_are_shared_within_an_event_loop(cluster):
+    async def main():
+        return await asyncio.gather(
+            create_k8s_api_client(), create_k8s_api_client()
+        )
+
+    first, second = run(main())
+
+    assert first is second
+
+
+def test_requests_are_recorded(cluster):
+    with instrumentation.record_api_calls() as stats:
+        run(count_pods(label_selector="shard=1"))
+
+    assert stats.as_dict()["requests"]["list pods"]["calls"] == 1
+
+
+class FakeWebSocket:
+    def __init__(self, frames):
+        self.frames = frames
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self._messages()
+
+    async def _messages(self):
+        for frame in self.frames:
+            yield MagicMock(data=frame)
+
+
+def test_exec_in_pods(cluster):
+    # the command's output is cut in the middle of a character
+    frames = [
+        b"\x01caf\xc3",
+        b"\x01\xa9\n",
+        b"\x03" + json.dumps({"status": "Success"}).encode("utf-8"),
+    ]
+
+    async def main():
+        api = await create_k8s_api_client()
+        with patch.object(
+            api.rest_client.pool_manager,
+            "ws_connect",
+            return_value=FakeWebSocket(frames),
+        ) as ws_connect:
+            result = await exec_in_pods(
+                "cat menu", label_selector="shard=1", container_name="app"
+            )
+        return result, ws_connect
+
+    (result,), ws_connect = run(main())
+
+    assert result["pod_name"] == "bench-1"
+    assert result["exit_code"] == 0
+    assert result["stdout"] == "café\n"
+    url = ws_connect.call_args[0][0]
+    assert url.startswith("ws://")
+    assert (
+        "/namespaces/default/pods/bench-1/exec?command=cat&command=menu" in url
+    )
+
+
+def test_json_patches_are_sent_as_such(cluster):
+    async def main():
+        api = await create_k8s_api_client()
+        response = MagicMock(status=200)
+        response.read = AsyncMock(return_value=b'{"kind": "Chaos"}')
+        with patch.object(
+            api.rest_client, "request", AsyncMock(return_value=response)
+        ) as request:
+            result = await patch_custom_object(
+                "chaos-mesh.org",
+                "v1alpha1",
+                "podchaos",
+                "kill",
+                resource=[{"op": "remove", "path": "/spec/duration"}],
+            )
+        return result, request
+
+    result, request = run(main())
+
+    assert result == {"kind": "Chaos"}
+    headers = request.call_args.kwargs["headers"]
+    assert headers["Content-Type"] == "application/json-patch+json"
@@ -0,0 +1,63 @@
+import pytest
+
+from benchmarks.imports import time_import
+from benchmarks.runner import compare, run_one
+from benchmarks.scenarios import SCENARIOS
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_scenarios_run_against_the_fake_api_server(name, monkeypatch):
+    # run_one points the client at the fake server through the environment
+    monkeypatch.setenv("KUBERNETES_HOST", "http://localhost")
+    monkeypatch.setenv("KUBECONFIG", "")
+    monkeypatch.delenv("CHAOSTOOLKIT_IN_POD", raising=False)
+
+    result = run_one(name, 300, 0.0)
+
+    assert result["scenario"] == name
+    assert result["api_calls"] > 0
+    assert result["peak_rss_kb"] > 0
+
+
+def test_slower_results_are_reported_as_regressions():
+    baseline = [
+        {
+            "scenario": "count_pods",
+            "size": 1000,
+            "wall_time": 1.0,
+            "api_calls": 1,
+        },
+        {
+            "scenario": "drain_nodes",
+            "size": 1000,
+            "wall_time": 1.0,
+            "api_calls": 105,
+        },
+    ]
+    results = [
+        {
+            "scenario": "count_pods",
+            "size": 1000,
+            "wall_time": 1.1,
+            "api_calls": 1,
+        },
+        {
+            "scenario": "drain_nodes",
+            "size": 1000,
+            "wall_time": 1.5,
+            "api_calls": 205,
+        },
+    ]
+
+    regressions = compare(results, baseline, 0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("drain_nodes (1000 pods) took 1.500s")
+
+
+def test_importing_the_extension_is_timed_in_a_fresh_interpreter():
+    result = time_import("import")
+
+    assert result["scenario"] == "import"
+    assert result["wall_time"] > 0
+    assert result["kubernetes_loaded"] is False
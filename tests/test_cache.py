@@ -0,0 +1,303 @@
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client import ApiClient
+from kubernetes.client.rest import ApiException
+from kubernetes.client.models import (
+    V1ListMeta,
+    V1ObjectMeta,
+    V1Pod,
+    V1PodList,
+    V1PodStatus,
+)
+
+from chaosk8s import create_k8s_api_client, invalidate_k8s_api_client
+from chaosk8s.cache import (
+    Reflector,
+    Store,
+    is_enabled,
+    list_objects,
+    stop_informers,
+)
+from chaosk8s.pod.probes import count_pods
+
+
+def make_pod(name, ns="default", labels=None, phase="Running"):
+    return V1Pod(
+        metadata=V1ObjectMeta(name=name, namespace=ns, labels=labels),
+        status=V1PodStatus(phase=phase),
+    )
+
+
+def test_cache_is_disabled_by_default():
+    assert is_enabled("pods") is False
+    assert list_objects("pods", "default") is None
+
+
+def test_cache_can_be_enabled_per_kind():
+    secrets = {"KUBERNETES_INFORMER_CACHE": "pods, nodes"}
+    assert is_enabled("pods", secrets) is True
+    assert is_enabled("nodes", secrets) is True
+    assert is_enabled("deployments", secrets) is False
+
+    secrets = {"KUBERNETES_INFORMER_CACHE": "true"}
+    assert is_enabled("deployments", secrets) is True
+
+
+def test_store_indexes_by_namespace_and_label():
+    store = Store()
+    store.replace(
+        [
+            make_pod("a", labels={"app": "web", "tier": "front"}),
+            make_pod("b", labels={"app": "web"}),
+            make_pod("c", ns="other", labels={"app": "web"}),
+            make_pod("d", labels={"app": "db"}),
+        ]
+    )
+
+    names = [p.metadata.name for p in store.list("default", "app=web")]
+    assert names == ["a", "b"]
+
+    names = [p.metadata.name for p in store.list(None, "app==web")]
+    assert names == ["a", "b", "c"]
+
+    names = [p.metadata.name for p in store.list("default", "tier!=front")]
+    assert names == ["b", "d"]
+
+    names = [p.metadata.name for p in store.list("default", "app in (web,db)")]
+    assert names == ["a", "b", "d"]
+
+    names = [p.metadata.name for p in store.list("default", "app,!tier")]
+    assert names == ["b", "d"]
+
+    assert store.list("default", "app in web") is None
+
+
+def test_store_tracks_updates_and_deletions():
+    store = Store()
+    store.replace([make_pod("a", labels={"app": "web"})])
+
+    store.upsert(make_pod("a", labels={"app": "db"}))
+    assert store.list("default", "app=web") == []
+    assert len(store.list("default", "app=db")) == 1
+
+    store.delete(make_pod("a"))
+    assert len(store) == 0
+    assert store.list("default", "app=db") == []
+
+
+@patch("chaosk8s.cache.client.CoreV1Api", autospec=True)
+def test_reflector_lists_and_applies_watch_events(core):
+    v1 = core.return_value
+    v1.list_pod_for_all_namespaces.return_value = V1PodList(
+        items=[make_pod("a"), make_pod("b")],
+        metadata=V1ListMeta(resource_version="10"),
+    )
+
+    reflector = Reflector("pods", ApiClient())
+    reflector._relist()
+    assert reflector.synced.is_set()
+    assert reflector.resource_version == "10"
+    assert len(reflector.store) == 2
+
+    events = [
+        {
+            "type": "DELETED",
+            "object": {
+                "metadata": {
+                    "name": "a",
+                    "namespace": "default",
+                    "resourceVersion": "11",
+                }
+            },
+        },
+        {
+            "type": "ADDED",
+            "object": {
+                "metadata": {
+                    "name": "c",
+                    "namespace": "default",
+                    "resourceVersion": "12",
+                },
+                "status": {"phase": "Pending"},
+            },
+        },
+        {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "15"}}},
+    ]
+    resp = MagicMock()
+    resp.stream.return_value = [
+        "\n".join(json.dumps(e) for e in events).encode("utf-8") + b"\n"
+    ]
+    v1.list_pod_for_all_namespaces.return_value = resp
+    reflector._watch()
+
+    _, kwargs = v1.list_pod_for_all_namespaces.call_args
+    assert kwargs["watch"] is True
+    assert kwargs["resource_version"] == "10"
+    assert kwargs["allow_watch_bookmarks"] is True
+
+    assert reflector.resource_version == "15"
+    names = [p.metadata.name for p in reflector.store.list("default")]
+    assert names == ["b", "c"]
+    assert reflector.store.get("c", "default").status.phase == "Pending"
+
+
+@patch("chaosk8s.cache.client.CoreV1Api", autospec=True)
+def test_reflector_relists_when_resource_version_expired(core):
+    v1 = core.return_value
+    resp = MagicMock()
+    resp.stream.return_value = [
+        json.dumps(
+            {"type": "ERROR", "object": {"code": 410, "message": "too old"}}
+        ).encode("utf-8")
+        + b"\n"
+    ]
+    v1.list_pod_for_all_namespaces.return_value = resp
+
+    reflector = Reflector("pods", ApiClient())
+    reflector.resource_version = "10"
+    reflector._watch()
+
+    assert reflector.resource_version is None
+
+
+@patch("chaosk8s.cache.create_k8s_api_client", autospec=True)
+@patch("chaosk8s.cache.client.CoreV1Api", autospec=True)
+def test_cache_falls_back_at_once_when_listing_is_forbidden(core, create):
+    create.return_value = ApiClient()
+    v1 = core.return_value
+    v1.list_pod_for_all_namespaces.side_effect = ApiException(
+        status=403, reason="Forbidden"
+    )
+    secrets = {
+        "KUBERNETES_INFORMER_CACHE": "pods",
+        "KUBERNETES_INFORMER_SYNC_TIMEOUT": "30",
+    }
+
+    try:
+        started = time.monotonic()
+        assert list_objects("pods", secrets=secrets) is None
+        assert list_objects("pods", secrets=secrets) is None
+        assert time.monotonic() - started < 5
+        assert v1.list_pod_for_all_namespaces.call_count == 1
+    finally:
+        stop_informers()
+
+
+@patch("chaosk8s.pod.probes.cache.list_objects", autospec=True)
+@patch("chaosk8s.pod.probes.client", autospec=True)
+@patch("chaosk8s.client")
+def test_count_pods_reads_from_cache_when_enabled(cl, client, list_objects):
+    list_objects.return_value = [
+        make_pod("a"),
+        make_pod("b", phase="Pending"),
+    ]
+    secrets = {"KUBERNETES_INFORMER_CACHE": "pods"}
+
+    assert count_pods("app=web", phase="Running", secrets=secrets) == 1
+    list_objects.assert_called_with(
+        "pods", "default", "app=web", secrets=secrets
+    )
+    client.CoreV1Api.assert_not_called()
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.cache.Reflector")
+def test_informers_are_stopped_with_their_client(reflector, has_conf):
+    has_conf.return_value = False
+    reflector.return_value.error = None
+    secrets = {
+        "KUBERNETES_HOST": "http://someplace",
+        "KUBERNETES_INFORMER_CACHE": "pods",
+    }
+
+    try:
+        assert list_objects("pods", secrets=secrets) is not None
+        reflector.return_value.stop.assert_not_called()
+
+        invalidate_k8s_api_client(secrets)
+        reflector.return_value.stop.assert_called_once_with()
+
+        list_objects("pods", secrets=secrets)
+        assert reflector.call_count == 2
+    finally:
+        stop_informers()
+
+
+@patch("chaosk8s._file_mtime", autospec=True)
+@patch("chaosk8s.config", autospec=True)
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.cache.Reflector")
+def test_informers_are_stopped_once_kubeconfig_is_rewritten(
+    reflector, has_conf, cfg, mtime
+):
+    has_conf.return_value = True
+    mtime.return_value = 1.0
+    reflector.return_value.error = None
+    secrets = {"KUBERNETES_INFORMER_CACHE": "pods"}
+
+    try:
+        list_objects("pods", secrets=secrets)
+        reflector.return_value.stop.assert_not_called()
+
+        mtime.return_value = 2.0
+        list_objects("pods", secrets=secrets)
+        reflector.return_value.stop.assert_called_once_with()
+        assert reflector.call_count == 2
+    finally:
+        stop_informers()
+
+
+def test_stopping_a_reflector_closes_its_watch():
+    reflector = Reflector("pods", ApiClient())
+    resp = MagicMock()
+    reflector._resp = resp
+
+    reflector.stop()
+
+    resp.close.assert_called_once_with()
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.cache.Reflector")
+def test_invalid_sync_timeout_falls_back_to_the_default(reflector, has_conf):
+    has_conf.return_value = False
+    reflector.return_value.error = None
+    secrets = {
+        "KUBERNETES_HOST": "http://someplace",
+        "KUBERNETES_INFORMER_CACHE": "pods",
+        "KUBERNETES_INFORMER_SYNC_TIMEOUT": "soon",
+    }
+
+    try:
+        assert list_objects("pods", secrets=secrets) is not None
+        reflector.return_value.settled.wait.assert_called_once_with(30.0)
+    finally:
+        stop_informers()
+
+
+@patch("chaosk8s.time", autospec=True)
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.cache.Reflector")
+def test_informers_outlive_the_expiry_of_their_client(
+    reflector, has_conf, time
+):
+    has_conf.return_value = False
+    time.monotonic.side_effect = [0, 400]
+    reflector.return_value.error = None
+    secrets = {
+        "KUBERNETES_HOST": "http://someplace",
+        "KUBERNETES_INFORMER_CACHE": "pods",
+    }
+
+    try:
+        list_objects("pods", secrets=secrets)
+        # the client has expired by now and is created again
+        create_k8s_api_client(secrets)
+        list_objects("pods", secrets=secrets)
+
+        reflector.return_value.stop.assert_not_called()
+        assert reflector.call_count == 1
+    finally:
+        stop_informers()
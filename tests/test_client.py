@@ -1,7 +1,11 @@
 import os
 from unittest.mock import MagicMock, patch
 
-from chaosk8s import create_k8s_api_client
+from chaosk8s import (
+    _client_release_listeners,
+    create_k8s_api_client,
+    invalidate_k8s_api_client,
+)
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
@@ -73,3 +77,81 @@ def test_client_can_provide_a_context(cfg, has_conf):
     cfg.load_kube_config = MagicMock()
     _ = create_k8s_api_client()
     cfg.load_kube_config.assert_called_with(context="minikube")
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+def test_client_is_cached_for_same_credentials(has_conf):
+    has_conf.return_value = False
+    secrets = {
+        "KUBERNETES_HOST": "http://someplace",
+        "KUBERNETES_API_KEY": "6789",
+    }
+    api = create_k8s_api_client(secrets)
+    assert create_k8s_api_client(dict(secrets)) is api
+
+    other = create_k8s_api_client(
+        {"KUBERNETES_HOST": "http://someplace", "KUBERNETES_API_KEY": "1234"}
+    )
+    assert other is not api
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+def test_client_cache_can_be_invalidated(has_conf):
+    has_conf.return_value = False
+    secrets = {"KUBERNETES_HOST": "http://someplace"}
+    api = create_k8s_api_client(secrets)
+
+    assert invalidate_k8s_api_client(secrets) is True
+    assert invalidate_k8s_api_client(secrets) is False
+    assert create_k8s_api_client(secrets) is not api
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+def test_client_cache_can_be_disabled(has_conf):
+    has_conf.return_value = False
+    secrets = {
+        "KUBERNETES_HOST": "http://someplace",
+        "KUBERNETES_CLIENT_CACHE_TTL": "0",
+    }
+    api = create_k8s_api_client(secrets)
+    assert create_k8s_api_client(secrets) is not api
+
+
+@patch("chaosk8s.time", autospec=True)
+@patch("chaosk8s.has_local_config_file", autospec=True)
+def test_client_cache_expires_entries(has_conf, time):
+    has_conf.return_value = False
+    time.monotonic.side_effect = [0, 10, 400]
+    secrets = {"KUBERNETES_HOST": "http://someplace"}
+    api = create_k8s_api_client(secrets)
+    assert create_k8s_api_client(secrets) is api
+    assert create_k8s_api_client(secrets) is not api
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+def test_client_cache_evicts_least_recently_used(has_conf):
+    has_conf.return_value = False
+    secrets = {"KUBERNETES_CLIENT_CACHE_SIZE": "2"}
+    first = create_k8s_api_client(dict(secrets, KUBERNETES_HOST="http://a"))
+    create_k8s_api_client(dict(secrets, KUBERNETES_HOST="http://b"))
+    create_k8s_api_client(dict(secrets, KUBERNETES_HOST="http://c"))
+
+    assert create_k8s_api_client(dict(secrets, KUBERNETES_HOST="http://a")) is not first
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+def test_client_cache_reports_invalidated_clients(has_conf):
+    has_conf.return_value = False
+    released = []
+    _client_release_listeners.append(released.append)
+    try:
+        secrets = {"KUBERNETES_CLIENT_CACHE_SIZE": "1"}
+        create_k8s_api_client(dict(secrets, KUBERNETES_HOST="http://a"))
+        create_k8s_api_client(dict(secrets, KUBERNETES_HOST="http://b"))
+        # evicted clients are not reported, their credentials still hold
+        assert released == []
+
+        invalidate_k8s_api_client(dict(secrets, KUBERNETES_HOST="http://b"))
+        assert [k[1] for k in released] == ["http://b"]
+    finally:
+        _client_release_listeners.remove(released.append)
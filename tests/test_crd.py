@@ -7,6 +7,7 @@ import yaml
 from chaoslib.exceptions import ActivityFailed
 from kubernetes.client.rest import ApiException
 
+from chaosk8s import create_k8s_api_client
 from chaosk8s.crd.actions import (
     apply_from_json,
     apply_from_yaml,
@@ -381,6 +382,45 @@ def test_patching_cro(cl, client, has_conf):
     )
 
 
+@patch("chaosk8s.has_local_config_file", autospec=True)
+def test_patching_cro_leaves_the_shared_client_content_type(has_conf):
+    has_conf.return_value = False
+    secrets = {"KUBERNETES_HOST": "http://someplace"}
+
+    api = create_k8s_api_client(secrets)
+    api.rest_client.pool_manager = MagicMock()
+    api.rest_client.pool_manager.request.return_value = MagicMock(
+        status=200, reason="OK", data=b"{}"
+    )
+
+    patch_custom_object(
+        group="stable.example.com",
+        version="v1",
+        plural="crontabs",
+        name="my-new-cron-object",
+        resource=[{"op": "replace", "path": "/spec/x", "value": 1}],
+        secrets=secrets,
+    )
+    create_custom_object(
+        group="stable.example.com",
+        version="v1",
+        plural="crontabs",
+        resource={"kind": "CronTab"},
+        secrets=secrets,
+    )
+
+    requests = api.rest_client.pool_manager.request.call_args_list
+    assert len(requests) == 2
+    patched, created = requests
+    assert patched.args[0] == "PATCH"
+    assert patched.kwargs["headers"]["Content-Type"] == (
+        "application/json-patch+json"
+    )
+    assert created.args[0] == "POST"
+    assert created.kwargs["headers"]["Content-Type"] == "application/json"
+    assert "Content-Type" not in api.default_headers
+
+
 @patch("chaosk8s.has_local_config_file", autospec=True)
 @patch("chaosk8s.crd.actions.client", autospec=True)
 @patch("chaosk8s.client")
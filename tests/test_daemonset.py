@@ -29,7 +29,7 @@ def test_cannot_process_other_than_yaml_and_json(has_conf):
 
 
 @patch("builtins.open", autospec=True)
-@patch("chaosk8s.daemonset.actions.json", autospec=True)
+@patch("chaosk8s.spec.json", autospec=True)
 @patch("chaosk8s.daemonset.actions.create_k8s_api_client", autospec=True)
 @patch("chaosk8s.daemonset.actions.client", autospec=True)
 def test_create_daemon_set(client, api, json, open):
@@ -89,11 +89,12 @@ def test_update_daemon_set(client, api):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.daemonset.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.daemonset.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_daemon_set_is_fully_available_when_it_should_not(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     daemonset = MagicMock()
     daemonset.status.desired_number_scheduled = 2
     daemonset.status.number_ready = 1
@@ -103,7 +104,7 @@ def test_daemon_set_is_fully_available_when_it_should_not(cl, client, watch, has
     watcher.stream.side_effect = urllib3.exceptions.ReadTimeoutError(None, None, None)
     watch.Watch.return_value = watcher
 
-    assert daemon_set_not_fully_available("mysvc") is False
+    assert daemon_set_not_fully_available("mysvc", timeout=1) is False
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
@@ -154,11 +155,12 @@ def test_expecting_a_healthy_daemon_set(cl, client, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.daemonset.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.daemonset.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_daemon_set_is_fully_available(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     daemonset = MagicMock()
     daemonset.status.desired_number_scheduled = 2
     daemonset.status.number_ready = 2
@@ -172,11 +174,12 @@ def test_daemon_set_is_fully_available(cl, client, watch, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.daemonset.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.daemonset.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_daemon_set_is_not_fully_available_when_it_should(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     daemonset = MagicMock()
     daemonset.status.desired_number_scheduled = 2
     daemonset.status.number_ready = 0
@@ -186,15 +189,16 @@ def test_daemon_set_is_not_fully_available_when_it_should(cl, client, watch, has
     watcher.stream.side_effect = [[{"object": daemonset, "type": "ADDED"}]]
     watch.Watch.return_value = watcher
 
-    assert daemon_set_fully_available("mysvc") is False
+    assert daemon_set_fully_available("mysvc", timeout=1) is False
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.daemonset.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.daemonset.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_daemon_set_is_not_fully_available(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     result = MagicMock()
     result.items = []
 
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timezone
 from unittest.mock import ANY, MagicMock, call, patch
 
@@ -16,6 +17,7 @@ from chaosk8s.deployment.probes import (
     deployment_available_and_healthy,
     deployment_fully_available,
     deployment_not_fully_available,
+    deployments_fully_available,
 )
 
 
@@ -29,7 +31,7 @@ def test_cannot_process_other_than_yaml_and_json(has_conf):
 
 
 @patch("builtins.open", autospec=True)
-@patch("chaosk8s.deployment.actions.json", autospec=True)
+@patch("chaosk8s.spec.json", autospec=True)
 @patch("chaosk8s.deployment.actions.create_k8s_api_client", autospec=True)
 @patch("chaosk8s.deployment.actions.client", autospec=True)
 def test_create_deployment(client, api, json, open):
@@ -67,6 +69,27 @@ def test_delete_deployment(client, api):
     )
 
 
+@patch("chaosk8s.deployment.actions.create_k8s_api_client", autospec=True)
+@patch("chaosk8s.deployment.actions.client", autospec=True)
+def test_delete_deployment_as_collection_by_name(client, api):
+    v1 = MagicMock()
+    client.AppsV1Api.return_value = v1
+    v1.delete_collection_namespaced_deployment.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "depl1"}}]})
+    )
+
+    deleted = delete_deployment("depl1", "fake_ns", delete_collection=True)
+
+    assert deleted == ["depl1"]
+    v1.delete_collection_namespaced_deployment.assert_called_once_with(
+        "fake_ns",
+        body=ANY,
+        _preload_content=False,
+        field_selector="metadata.name=depl1",
+    )
+    v1.delete_namespaced_deployment.assert_not_called()
+
+
 @patch("chaosk8s.deployment.actions.create_k8s_api_client", autospec=True)
 @patch("chaosk8s.deployment.actions.client", autospec=True)
 def test_scale_deployment(client, api):
@@ -82,11 +105,12 @@ def test_scale_deployment(client, api):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.deployment.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.deployment.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_deployment_is_fully_available_when_it_should_not(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     deployment = MagicMock()
     deployment.spec.replicas = 2
     deployment.status.ready_replicas = 2
@@ -97,7 +121,7 @@ def test_deployment_is_fully_available_when_it_should_not(cl, client, watch, has
     watch.Watch.return_value = watcher
 
     with pytest.raises(ActivityFailed) as x:
-        deployment_not_fully_available("mysvc")
+        deployment_not_fully_available("mysvc", timeout=1)
     assert "deployment 'mysvc' failed to stop running within" in str(x.value)
 
 
@@ -108,8 +132,7 @@ def test_expecting_a_healthy_microservice_should_be_reported_when_not(
     cl, client, has_conf
 ):
     has_conf.return_value = False
-    result = MagicMock()
-    result.items = []
+    result = MagicMock(data=json.dumps({"items": []}))
 
     v1 = MagicMock()
     v1.list_namespaced_deployment.return_value = result
@@ -119,10 +142,8 @@ def test_expecting_a_healthy_microservice_should_be_reported_when_not(
         deployment_available_and_healthy("mysvc")
     assert "Deployment 'mysvc' was not found" in str(x.value)
 
-    deployment = MagicMock()
-    deployment.spec.replicas = 2
-    deployment.status.available_replicas = 1
-    result.items.append(deployment)
+    deployment = {"spec": {"replicas": 2}, "status": {"availableReplicas": 1}}
+    result.data = json.dumps({"items": [deployment]})
 
     with pytest.raises(ActivityFailed) as x:
         deployment_available_and_healthy("mysvc")
@@ -134,27 +155,23 @@ def test_expecting_a_healthy_microservice_should_be_reported_when_not(
 @patch("chaosk8s.client")
 def test_expecting_a_healthy_microservice(cl, client, has_conf):
     has_conf.return_value = False
-    result = MagicMock()
-    result.items = []
+    deployment = {"spec": {"replicas": 2}, "status": {"availableReplicas": 2}}
+    result = MagicMock(data=json.dumps({"items": [deployment]}))
 
     v1 = MagicMock()
     v1.list_namespaced_deployment.return_value = result
     client.AppsV1Api.return_value = v1
 
-    deployment = MagicMock()
-    deployment.spec.replicas = 2
-    deployment.status.available_replicas = 2
-    result.items.append(deployment)
-
     assert deployment_available_and_healthy("mysvc") is True
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.deployment.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.deployment.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_deployment_is_fully_available(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     deployment = MagicMock()
     deployment.spec.replicas = 2
     deployment.status.ready_replicas = 2
@@ -168,11 +185,12 @@ def test_deployment_is_fully_available(cl, client, watch, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.deployment.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.deployment.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_deployment_is_not_fully_available_when_it_should(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     deployment = MagicMock()
     deployment.spec.replicas = 2
     deployment.status.ready_replicas = 1
@@ -183,10 +201,53 @@ def test_deployment_is_not_fully_available_when_it_should(cl, client, watch, has
     watch.Watch.return_value = watcher
 
     with pytest.raises(ActivityFailed) as x:
-        deployment_fully_available("mysvc")
+        deployment_fully_available("mysvc", timeout=1)
     assert "deployment 'mysvc' failed to recover within" in str(x.value)
 
 
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_deployments_are_fully_available_over_a_single_watch(
+    cl, client, watch, has_conf
+):
+    has_conf.return_value = False
+    v1 = client.AppsV1Api.return_value
+    v1.list_namespaced_deployment.return_value.metadata._continue = None
+    events = []
+    for name, ready in [("front", 1), ("back", 2), ("front", 2)]:
+        deployment = MagicMock()
+        deployment.metadata.name = name
+        deployment.spec.replicas = 2
+        deployment.status.ready_replicas = ready
+        events.append({"object": deployment, "type": "MODIFIED"})
+    watch.Watch.return_value.stream.return_value = events
+
+    assert deployments_fully_available(["front", "back"]) is True
+    assert watch.Watch.call_count == 1
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_deployments_are_not_fully_available(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    v1 = client.AppsV1Api.return_value
+    v1.list_namespaced_deployment.return_value.metadata._continue = None
+    watch.Watch.return_value.stream.side_effect = (
+        urllib3.exceptions.ReadTimeoutError(None, None, None)
+    )
+
+    with pytest.raises(ActivityFailed) as x:
+        deployments_fully_available(["front", "back"], timeout=1)
+    assert "failed to recover within" in str(x.value)
+    assert deployments_fully_available(
+        ["front", "back"], timeout=1, raise_on_not_fully_available=False
+    ) is False
+
+
 def _generate_mock_time():
     return datetime(2023, 6, 7, 10, 30, 0, tzinfo=timezone.utc)
 
@@ -0,0 +1,213 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from chaoslib.exceptions import ActivityFailed
+
+from chaosk8s.health.probes import cluster_health
+
+
+def _response(*items):
+    return MagicMock(data=json.dumps({"metadata": {}, "items": list(items)}))
+
+
+def _meta(name, ns=None, labels=None):
+    meta = {"name": name, "labels": labels or {}}
+    if ns:
+        meta["namespace"] = ns
+    return meta
+
+
+def _listed(client, ns=None):
+    core = client.CoreV1Api.return_value
+    apps = client.AppsV1Api.return_value
+    pods = [
+        {
+            "metadata": _meta("front-1", "shop", {"app": "front"}),
+            "status": {"phase": "Running"},
+        },
+        {
+            "metadata": _meta("back-1", "shop", {"app": "back"}),
+            "status": {"phase": "Pending"},
+        },
+    ]
+    nodes = [
+        {
+            "metadata": _meta("node-1"),
+            "status": {
+                "conditions": [
+                    {"type": "Ready", "status": "True"},
+                    {"type": "DiskPressure", "status": "False"},
+                ]
+            },
+        }
+    ]
+    deployments = [
+        {
+            "metadata": _meta("front", "shop"),
+            "spec": {"replicas": 2},
+            "status": {"availableReplicas": 2},
+        }
+    ]
+    statefulsets = [
+        {
+            "metadata": _meta("db", "shop"),
+            "spec": {"replicas": 3},
+            "status": {"readyReplicas": 3},
+        }
+    ]
+    daemonsets = [
+        {
+            "metadata": _meta("agent", "kube-system"),
+            "status": {"numberReady": 1, "desiredNumberScheduled": 1},
+        }
+    ]
+    core.list_pod_for_all_namespaces.return_value = _response(*pods)
+    core.list_namespaced_pod.return_value = _response(*pods)
+    core.list_node.return_value = _response(*nodes)
+    apps.list_deployment_for_all_namespaces.return_value = _response(
+        *deployments
+    )
+    apps.list_namespaced_deployment.return_value = _response(*deployments)
+    apps.list_stateful_set_for_all_namespaces.return_value = _response(
+        *statefulsets
+    )
+    apps.list_daemon_set_for_all_namespaces.return_value = _response(
+        *daemonsets
+    )
+    return core, apps
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.health.client", autospec=True)
+@patch("chaosk8s.client")
+def test_cluster_is_checked_over_one_list_per_kind(cl, client, has_conf):
+    has_conf.return_value = False
+    core, apps = _listed(client)
+
+    report = cluster_health(
+        checks=[
+            {"kind": "pods", "ns": "shop", "label_selector": "app=front"},
+            {"kind": "pods", "label_selector": "app in (front)"},
+            {"kind": "nodes"},
+            {"kind": "deployments", "name": "front", "ns": "shop"},
+            {"kind": "statefulsets"},
+            {"kind": "daemonsets"},
+        ]
+    )
+
+    assert report["healthy"] is True
+    assert report["objects"] == {
+        "pods": 2,
+        "nodes": 1,
+        "deployments": 1,
+        "statefulsets": 1,
+        "daemonsets": 1,
+    }
+    assert [r["count"] for r in report["checks"]] == [1, 1, 1, 1, 1, 1]
+    assert core.list_pod_for_all_namespaces.call_count == 1
+    assert core.list_node.call_count == 1
+    assert apps.list_deployment_for_all_namespaces.call_count == 1
+    assert apps.list_stateful_set_for_all_namespaces.call_count == 1
+    assert apps.list_daemon_set_for_all_namespaces.call_count == 1
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.health.client", autospec=True)
+@patch("chaosk8s.client")
+def test_unhealthy_cluster_is_reported(cl, client, has_conf):
+    has_conf.return_value = False
+    _listed(client)
+    checks = [
+        {"kind": "pods", "ns": "shop"},
+        {"kind": "deployments", "name": "back", "ns": "shop"},
+    ]
+
+    with pytest.raises(ActivityFailed) as x:
+        cluster_health(checks)
+    assert "'shop/back-1' is Pending" in str(x.value)
+    assert "deployment 'back' was not found" in str(x.value)
+
+    report = cluster_health(checks, raise_on_unhealthy=False)
+    assert report["healthy"] is False
+    assert report["checks"][0] == {
+        "kind": "pods",
+        "ns": "shop",
+        "healthy": False,
+        "count": 2,
+        "problems": ["'shop/back-1' is Pending"],
+    }
+    assert report["checks"][1]["healthy"] is False
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.health.client", autospec=True)
+@patch("chaosk8s.client")
+def test_deployments_surging_during_a_rollout_are_healthy(cl, client, has_conf):
+    has_conf.return_value = False
+    _, apps = _listed(client)
+    apps.list_deployment_for_all_namespaces.return_value = _response(
+        {
+            "metadata": _meta("front", "shop"),
+            "spec": {"replicas": 2},
+            "status": {"availableReplicas": 3},
+        },
+        {
+            "metadata": _meta("back", "shop"),
+            "spec": {"replicas": 2},
+            "status": {},
+        },
+    )
+
+    report = cluster_health([{"kind": "deployments"}], raise_on_unhealthy=False)
+
+    assert report["checks"][0]["problems"] == [
+        "'shop/back' has 0/2 available replicas"
+    ]
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.health.client", autospec=True)
+@patch("chaosk8s.client")
+def test_namespaced_objects_are_listed_in_the_namespace(cl, client, has_conf):
+    has_conf.return_value = False
+    core, apps = _listed(client)
+
+    report = cluster_health(
+        [
+            {"kind": "deployments"},
+            {"kind": "pods", "label_selector": "app=front"},
+        ],
+        ns="shop",
+    )
+
+    assert report["healthy"] is True
+    core.list_namespaced_pod.assert_called_once()
+    apps.list_namespaced_deployment.assert_called_once()
+    core.list_pod_for_all_namespaces.assert_not_called()
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.health.cache.list_objects", autospec=True)
+@patch("chaosk8s.health.client", autospec=True)
+@patch("chaosk8s.client")
+def test_snapshot_is_taken_from_the_cache(cl, client, list_objects, has_conf):
+    has_conf.return_value = False
+    node = MagicMock()
+    node.metadata.name = "node-1"
+    node.metadata.namespace = None
+    node.metadata.labels = {}
+    node.status.conditions = [MagicMock(type="Ready", status="False")]
+    list_objects.return_value = [node]
+
+    report = cluster_health([{"kind": "nodes"}], raise_on_unhealthy=False)
+
+    assert report["checks"][0]["problems"] == [
+        "'node-1' has condition Ready=False"
+    ]
+    client.CoreV1Api.return_value.list_node.assert_not_called()
+
+
+def test_unknown_kinds_cannot_be_checked():
+    with pytest.raises(ActivityFailed):
+        cluster_health([{"kind": "jobs"}])
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -83,19 +84,23 @@ def test_delete_ingress(client, api):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.networking.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_namespace_exists(cl, client, has_conf):
+def test_namespace_exists(cl, has_conf):
     has_conf.return_value = False
-    ingress = MagicMock()
-    result = MagicMock()
-    result.items = [ingress]
-
-    v1 = MagicMock()
-    v1.list_namespaced_ingress.return_value = result
-    client.NetworkingV1Api.return_value = v1
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "mynamespace"}}]})
+    )
 
     assert ingress_exists("mynamespace") is True
-    v1.list_namespaced_ingress.assert_called_with(
-        namespace="default", field_selector="metadata.name=mynamespace"
+
+    args, kwargs = api.call_api.call_args
+    assert args == (
+        "/apis/networking.k8s.io/v1/namespaces/{namespace}/ingresses",
+        "GET",
     )
+    assert kwargs["path_params"] == {"namespace": "default"}
+    assert kwargs["query_params"] == [
+        ("fieldSelector", "metadata.name=mynamespace"),
+        ("limit", 1),
+    ]
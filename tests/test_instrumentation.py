@@ -0,0 +1,179 @@
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from chaosk8s import clear_k8s_api_client_cache, create_k8s_api_client
+from chaosk8s.instrumentation import (
+    ApiCall,
+    ApiCallStats,
+    after_activity_control,
+    before_activity_control,
+    instrument_requests,
+    record_api_calls,
+)
+from chaosk8s.instrumentation import _describe_request
+
+
+@pytest.mark.parametrize(
+    "method,url,query,expected",
+    [
+        ("GET", "https://k8s/api/v1/namespaces/ns/pods", [], ("list", "pods")),
+        (
+            "GET",
+            "https://k8s/api/v1/namespaces/ns/pods",
+            [("watch", True)],
+            ("watch", "pods"),
+        ),
+        ("GET", "https://k8s/api/v1/namespaces/ns/pods/p", [], ("get", "pods")),
+        (
+            "GET",
+            "https://k8s/api/v1/namespaces/ns/pods/p/log",
+            [],
+            ("get", "pods/log"),
+        ),
+        (
+            "POST",
+            "https://k8s/api/v1/namespaces/ns/pods/p/eviction",
+            [],
+            ("create", "pods/eviction"),
+        ),
+        (
+            "PATCH",
+            "https://k8s/apis/apps/v1/namespaces/ns/deployments/d/scale",
+            [],
+            ("patch", "deployments/scale"),
+        ),
+        ("GET", "https://k8s/api/v1/namespaces", [], ("list", "namespaces")),
+        (
+            "DELETE",
+            "https://k8s/api/v1/namespaces/ns",
+            [],
+            ("delete", "namespaces"),
+        ),
+        (
+            "DELETE",
+            "https://k8s/api/v1/namespaces/ns/pods",
+            [],
+            ("deletecollection", "pods"),
+        ),
+        ("GET", "https://k8s/api/v1/nodes", [], ("list", "nodes")),
+        ("PUT", "https://k8s/api/v1/nodes/n", [], ("update", "nodes")),
+        ("GET", "https://k8s/version/", [], ("get", "/version/")),
+    ],
+)
+def test_requests_are_described_by_verb_and_resource(
+    method, url, query, expected
+):
+    assert _describe_request(method, url, query) == expected
+
+
+def test_latencies_are_bucketed_cumulatively():
+    stats = ApiCallStats()
+    stats.record(ApiCall("list", "pods", 200, 0.01, 100, 0))
+    stats.record(ApiCall("list", "pods", 200, 0.2, 50, 1))
+    stats.record(ApiCall("list", "pods", 500, 90.0, 0, 0))
+
+    result = stats.as_dict()
+
+    assert result["calls"] == 3
+    assert result["errors"] == 1
+    assert result["retries"] == 1
+    assert result["bytes"] == 150
+    latency = result["requests"]["list pods"]["latency"]
+    assert latency["max"] == 90.0
+    assert latency["buckets"]["0.005"] == 0
+    assert latency["buckets"]["0.025"] == 1
+    assert latency["buckets"]["0.25"] == 2
+    assert latency["buckets"]["60.0"] == 2
+    assert latency["buckets"]["+Inf"] == 3
+
+
+def test_requests_are_not_recorded_without_recorders():
+    api = MagicMock()
+    request = api.rest_client.request
+
+    instrument_requests(api)
+    api.rest_client.request("GET", "https://k8s/api/v1/nodes", query_params=[])
+
+    request.assert_called_once_with(
+        "GET", "https://k8s/api/v1/nodes", query_params=[]
+    )
+
+
+def test_requests_are_recorded():
+    api = MagicMock()
+    response = api.rest_client.request.return_value
+    response.status = 200
+    response.data = b'{"items": []}'
+    response.urllib3_response.retries.history = ("retried",)
+
+    instrument_requests(api)
+    with record_api_calls() as stats:
+        api.rest_client.request(
+            "GET", "https://k8s/api/v1/nodes", query_params=[]
+        )
+    api.rest_client.request("GET", "https://k8s/api/v1/nodes", query_params=[])
+
+    result = stats.as_dict()
+    assert result["calls"] == 1
+    assert result["requests"]["list nodes"]["bytes"] == 13
+    assert result["requests"]["list nodes"]["retries"] == 1
+
+
+def test_failed_requests_are_recorded_as_errors():
+    api = MagicMock()
+    api.rest_client.request.side_effect = ApiException(status=404)
+
+    instrument_requests(api)
+    with record_api_calls() as stats:
+        with pytest.raises(ApiException):
+            api.rest_client.request("GET", "https://k8s/api/v1/nodes/n")
+
+    assert stats.as_dict()["requests"]["get nodes"]["errors"] == 1
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch.dict(os.environ, {"KUBERNETES_HOST": "http://someplace"})
+def test_calls_made_by_created_clients_are_recorded(has_conf):
+    has_conf.return_value = False
+    clear_k8s_api_client_cache()
+
+    api = create_k8s_api_client()
+    response = MagicMock(status=200, reason="OK", data=b'{"items": []}')
+    api.rest_client.pool_manager = MagicMock()
+    api.rest_client.pool_manager.request.return_value = response
+
+    with record_api_calls() as stats:
+        client.CoreV1Api(api).list_namespaced_pod("default")
+
+    assert stats.as_dict()["requests"]["list pods"]["calls"] == 1
+    clear_k8s_api_client_cache()
+
+
+def test_activity_calls_are_attached_to_its_result(tmp_path):
+    api = MagicMock()
+    response = api.rest_client.request.return_value
+    response.status = 200
+    response.data = b"{}"
+    instrument_requests(api)
+
+    path = str(tmp_path / "calls.jsonl")
+    activity = {"name": "list-nodes"}
+    state = {"status": "succeeded"}
+
+    before_activity_control(activity, sinks=["log", "json"], json_path=path)
+    api.rest_client.request("GET", "https://k8s/api/v1/nodes")
+    after_activity_control(
+        activity, state, sinks=["log", "json"], json_path=path
+    )
+    api.rest_client.request("GET", "https://k8s/api/v1/nodes")
+
+    assert state["kubernetes_api_calls"]["calls"] == 1
+    with open(path) as f:
+        record = json.loads(f.readline())
+    assert record["activity"] == "list-nodes"
+    assert record["requests"]["list nodes"]["calls"] == 1
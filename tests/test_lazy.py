@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import types
+
+from chaosk8s.lazy import LazyModule, lazy_import
+
+
+def test_discovery_does_not_import_the_kubernetes_client():
+    code = (
+        "import sys, chaosk8s; chaosk8s.discover(); "
+        "print(sorted({'kubernetes', 'dateparser'} & set(sys.modules)))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert out.strip() == "[]"
+
+
+def test_lazy_import_shares_proxies():
+    proxy = lazy_import("kubernetes.client")
+
+    assert isinstance(proxy, LazyModule)
+    assert lazy_import("kubernetes.client") is proxy
+
+
+def test_lazy_module_forwards_to_the_imported_module():
+    from kubernetes import client
+
+    proxy = lazy_import("kubernetes.client")
+
+    assert proxy.CoreV1Api is client.CoreV1Api
+    assert "CoreV1Api" in dir(proxy)
+
+
+def test_lazy_module_sees_attributes_set_on_the_module_later(monkeypatch):
+    module = types.ModuleType("chaosk8s_lazy_fixture")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    proxy = LazyModule(module.__name__)
+
+    module.value = 1
+    assert proxy.value == 1
+
+    module.value = 2
+    assert proxy.value == 2
@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import chaosk8s
+from chaosk8s import discover, load_exported_activities
+from chaosk8s.manifest import load_manifest, write_manifest
+
+
+def test_manifest_is_loaded_when_built_for_the_running_version(tmp_path):
+    path = str(tmp_path / "activities.json")
+    activities = [{"name": "terminate_pods", "type": "action"}]
+    write_manifest(activities, "1.2.3", path)
+
+    assert load_manifest("1.2.3", path) == activities
+
+
+def test_manifest_is_ignored_when_built_for_another_version(tmp_path):
+    path = str(tmp_path / "activities.json")
+    write_manifest([{"name": "terminate_pods"}], "1.2.3", path)
+
+    assert load_manifest("1.2.4", path) is None
+
+
+def test_manifest_is_ignored_when_missing_or_unreadable(tmp_path):
+    path = tmp_path / "activities.json"
+    assert load_manifest("1.2.3", str(path)) is None
+
+    path.write_text("{not json")
+    assert load_manifest("1.2.3", str(path)) is None
+
+
+@patch("chaosk8s.load_manifest", autospec=True)
+def test_discover_reads_the_manifest(load_manifest):
+    activities = [{"name": "terminate_pods", "type": "action"}]
+    load_manifest.return_value = activities
+
+    discovery = discover()
+
+    load_manifest.assert_called_once_with(chaosk8s.__version__)
+    assert discovery["activities"] == activities
+
+
+@patch("chaosk8s.load_manifest", autospec=True)
+def test_discover_introspects_without_a_manifest(load_manifest):
+    load_manifest.return_value = None
+
+    activities = discover()["activities"]
+
+    names = {a["name"] for a in activities}
+    assert "terminate_pods" in names
+    assert "read_pod_logs" in names
+    assert activities == load_exported_activities(use_manifest=False)
+
+
+def test_build_hook_ships_the_manifest_in_wheels(tmp_path):
+    import pdm_build
+
+    root = Path(chaosk8s.__file__).parent.parent
+    context = SimpleNamespace(
+        target="wheel",
+        root=root,
+        config=SimpleNamespace(metadata={"version": "1.2.3"}),
+        ensure_build_dir=lambda: tmp_path,
+    )
+    files = {}
+
+    pdm_build.pdm_build_update_files(context, files)
+
+    path = files["chaosk8s/activities.json"]
+    with open(path) as f:
+        manifest = json.load(f)
+    assert manifest["version"] == "1.2.3"
+    assert manifest["activities"] == load_exported_activities(
+        use_manifest=False
+    )
+
+
+def test_build_hook_skips_editable_installs(tmp_path):
+    import pdm_build
+
+    context = SimpleNamespace(target="editable")
+    files = {}
+
+    pdm_build.pdm_build_update_files(context, files)
+
+    assert files == {}
+
+
+def test_build_hook_leaves_discovery_to_runtime_on_failure(tmp_path):
+    import pdm_build
+
+    root = Path(chaosk8s.__file__).parent.parent
+    context = SimpleNamespace(
+        target="wheel",
+        root=root,
+        config=SimpleNamespace(metadata={"version": "1.2.3"}),
+        ensure_build_dir=lambda: tmp_path,
+    )
+    files = {}
+
+    with patch(
+        "chaosk8s.manifest.write_manifest", side_effect=OSError("read-only")
+    ):
+        pdm_build.pdm_build_update_files(context, files)
+
+    assert files == {}
@@ -0,0 +1,175 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+from chaoslib.exceptions import ActivityFailed
+
+from chaosk8s import clear_k8s_api_client_cache
+from chaosk8s.multicluster import (
+    load_activity,
+    resolve_contexts,
+    run_on_clusters,
+)
+from chaosk8s.multicluster.probes import probe_clusters
+
+CONTEXTS = ["prod-eu", "prod-us", "staging"]
+
+
+def write_kubeconfig(path):
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "apiVersion": "v1",
+                "kind": "Config",
+                "current-context": "staging",
+                "clusters": [
+                    {"name": c, "cluster": {"server": f"https://{c}:6443"}}
+                    for c in CONTEXTS
+                ],
+                "users": [{"name": "me", "user": {"token": "t"}}],
+                "contexts": [
+                    {"name": c, "context": {"cluster": c, "user": "me"}}
+                    for c in CONTEXTS
+                ],
+            }
+        )
+    )
+
+
+def test_context_patterns_are_expanded(tmp_path, monkeypatch):
+    write_kubeconfig(tmp_path / "config")
+    monkeypatch.setenv("KUBECONFIG", str(tmp_path / "config"))
+
+    assert resolve_contexts("prod-*") == ["prod-eu", "prod-us"]
+    assert resolve_contexts(["staging", "prod-*", "prod-eu"]) == [
+        "staging",
+        "prod-eu",
+        "prod-us",
+    ]
+
+    with pytest.raises(ActivityFailed):
+        resolve_contexts("dev-*")
+
+
+@patch("chaosk8s.multicluster.has_local_config_file", autospec=True)
+def test_activity_is_called_once_per_context(has_kubeconfig):
+    has_kubeconfig.return_value = True
+    func = MagicMock(__name__="func", side_effect=lambda **kw: kw)
+
+    results = run_on_clusters(
+        func, ["a", "b", "c"], {"KUBERNETES_QPS": "5"}, 3, ns="default"
+    )
+
+    assert list(results) == ["a", "b", "c"]
+    for context, (result, error) in results.items():
+        assert error is None
+        assert result == {
+            "ns": "default",
+            "secrets": {"KUBERNETES_QPS": "5", "KUBERNETES_CONTEXT": context},
+        }
+
+
+def test_each_cluster_gets_its_own_client(tmp_path, monkeypatch):
+    write_kubeconfig(tmp_path / "config")
+    monkeypatch.setenv("KUBECONFIG", str(tmp_path / "config"))
+    # the client reads the location of the kubeconfig file once imported
+    monkeypatch.setattr(
+        "kubernetes.config.kube_config.KUBE_CONFIG_DEFAULT_LOCATION",
+        str(tmp_path / "config"),
+    )
+    clear_k8s_api_client_cache()
+
+    from chaosk8s import create_k8s_api_client
+
+    def host(secrets=None):
+        return create_k8s_api_client(secrets).configuration.host
+
+    results = run_on_clusters(host, "prod-*")
+    clear_k8s_api_client_cache()
+
+    assert results == {
+        "prod-eu": ("https://prod-eu:6443", None),
+        "prod-us": ("https://prod-us:6443", None),
+    }
+
+
+@patch("chaosk8s.multicluster.has_local_config_file", autospec=True)
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.client")
+def test_probe_output_is_returned_per_cluster(cl, has_conf, has_kubeconfig):
+    has_conf.return_value = False
+    has_kubeconfig.return_value = True
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "p0"}}]})
+    )
+
+    outputs = probe_clusters(
+        "chaosk8s.pod.probes.count_pods",
+        ["eu", "us"],
+        arguments={"label_selector": "app=mysvc"},
+    )
+
+    assert outputs == {"eu": 1, "us": 1}
+
+
+@patch("chaosk8s.multicluster.has_local_config_file", autospec=True)
+@patch("chaosk8s.multicluster.probes.load_activity", autospec=True)
+def test_probe_fails_when_it_failed_on_any_cluster(
+    load_activity, has_kubeconfig
+):
+    has_kubeconfig.return_value = True
+
+    def probe(secrets=None):
+        if secrets["KUBERNETES_CONTEXT"] == "us":
+            raise ActivityFailed("no pods")
+        return 3
+
+    load_activity.return_value = probe
+
+    with pytest.raises(ActivityFailed) as x:
+        probe_clusters("chaosk8s.pod.probes.count_pods", ["eu", "us"])
+    assert "failed on 1 of 2 cluster(s): us: no pods" in str(x.value)
+
+    outputs = probe_clusters(
+        "chaosk8s.pod.probes.count_pods", ["eu", "us"], raise_on_error=False
+    )
+    assert outputs == {"eu": 3, "us": None}
+
+
+@patch("chaosk8s.multicluster.has_local_config_file", autospec=True)
+def test_clusters_cannot_be_selected_without_kubeconfig(has_kubeconfig):
+    has_kubeconfig.return_value = False
+    func = MagicMock(__name__="func")
+
+    with pytest.raises(ActivityFailed) as x:
+        run_on_clusters(func, ["eu", "us"])
+    assert "no kubeconfig file was found" in str(x.value)
+    func.assert_not_called()
+
+
+@patch("chaosk8s.multicluster.has_local_config_file", autospec=True)
+def test_activity_arguments_cannot_hold_secrets(has_kubeconfig):
+    has_kubeconfig.return_value = True
+
+    with pytest.raises(ActivityFailed):
+        probe_clusters(
+            "chaosk8s.pod.probes.count_pods",
+            ["eu", "us"],
+            arguments={"label_selector": "app=mysvc", "secrets": {}},
+        )
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "os.system",
+        "chaosk8s.pod.probes.nope",
+        "chaosk8s.pod.probes.logging",
+        "chaosk8s.multicluster.probes.probe_clusters",
+    ],
+)
+def test_only_activities_of_the_extension_can_be_run(name):
+    with pytest.raises(ActivityFailed):
+        load_activity(name)
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -86,17 +87,20 @@ def test_delete_namespace(client, api):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.namespace.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_namespace_exists(cl, client, has_conf):
+def test_namespace_exists(cl, has_conf):
     has_conf.return_value = False
-    namespace = MagicMock()
-    result = MagicMock()
-    result.items = [namespace]
-
-    v1 = MagicMock()
-    v1.list_namespace.return_value = result
-    client.CoreV1Api.return_value = v1
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "mynamespace"}}]})
+    )
 
     assert namespace_exists("mynamespace") is True
-    v1.list_namespace.assert_called_with(field_selector="metadata.name=mynamespace")
+
+    args, kwargs = api.call_api.call_args
+    assert args == ("/api/v1/namespaces", "GET")
+    assert kwargs["query_params"] == [
+        ("fieldSelector", "metadata.name=mynamespace"),
+        ("limit", 1),
+    ]
+    api.call_api.return_value.release_conn.assert_called_once_with()
@@ -8,6 +8,7 @@ from kubernetes.client.rest import ApiException
 
 from chaosk8s.actions import kill_microservice, start_microservice
 from chaosk8s.node.actions import (
+    _select_nodes,
     cordon_node,
     create_node,
     delete_nodes,
@@ -80,6 +81,7 @@ def test_delete_nodes(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [node]
+    result.metadata._continue = None
     v1.list_node.return_value = result
 
     res = MagicMock()
@@ -91,6 +93,37 @@ def test_delete_nodes(cl, client, has_conf):
     v1.delete_node.assert_called_with("mynode", body=ANY, grace_period_seconds=None)
 
 
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_delete_all_nodes(cl, client, has_conf):
+    has_conf.return_value = False
+
+    v1 = MagicMock()
+    client.CoreV1Api.return_value = v1
+
+    nodes = []
+    for name in ("node-a", "node-b"):
+        node = MagicMock()
+        node.metadata.name = name
+        nodes.append(node)
+
+    result = MagicMock()
+    result.items = nodes
+    result.metadata._continue = None
+    v1.list_node.return_value = result
+
+    res = MagicMock()
+    res.status = "Success"
+    v1.delete_node.return_value = res
+
+    deleted = delete_nodes(label_selector="k=mynode", all=True)
+
+    assert deleted == ["node-a", "node-b"]
+    # all nodes are selected, whichever their labels
+    v1.list_node.assert_called_once_with(limit=ANY)
+
+
 @patch("chaosk8s.has_local_config_file", autospec=True)
 @patch("chaosk8s.node.actions.client", autospec=True)
 @patch("chaosk8s.client")
@@ -105,6 +138,7 @@ def test_cordon_node_by_name(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [node]
+    result.metadata._continue = None
     v1.list_node.return_value = result
 
     cordon_node(name="mynode")
@@ -114,6 +148,38 @@ def test_cordon_node_by_name(cl, client, has_conf):
     v1.patch_node.assert_called_with("mynode", body)
 
 
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_select_nodes_hosting_pods_picks_each_node_once(cl, client, has_conf):
+    has_conf.return_value = False
+
+    v1 = MagicMock()
+    client.CoreV1Api.return_value = v1
+
+    nodes = []
+    for name in ("node-a", "node-b", "node-c"):
+        node = MagicMock()
+        node.metadata.name = name
+        nodes.append(node)
+    v1.list_node.return_value = MagicMock(items=nodes)
+    v1.list_node.return_value.metadata._continue = None
+
+    pods = []
+    for node_name in ("node-a", "node-a", "node-b", "node-b", "node-b"):
+        pod = MagicMock()
+        pod.spec.node_name = node_name
+        pods.append(pod)
+    v1.list_namespaced_pod.return_value = MagicMock(items=pods)
+    v1.list_namespaced_pod.return_value.metadata._continue = None
+
+    selected = _select_nodes(
+        pod_label_selector="app=web", pod_namespace="default", count=5
+    )
+
+    assert sorted(n.metadata.name for n in selected) == ["node-a", "node-b"]
+
+
 @patch("chaosk8s.has_local_config_file", autospec=True)
 @patch("chaosk8s.node.actions.client", autospec=True)
 @patch("chaosk8s.client")
@@ -128,6 +194,7 @@ def test_uncordon_node_by_name(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [node]
+    result.metadata._continue = None
     v1.list_node.return_value = result
 
     uncordon_node(name="mynode")
@@ -138,9 +205,10 @@ def test_uncordon_node_by_name(cl, client, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.watch", autospec=True)
 @patch("chaosk8s.node.actions.client", autospec=True)
 @patch("chaosk8s.client")
-def test_drain_nodes_by_name(cl, client, has_conf):
+def test_drain_nodes_by_name(cl, client, watch, has_conf):
     has_conf.return_value = False
 
     client.V1Eviction = MagicMock()
@@ -155,6 +223,7 @@ def test_drain_nodes_by_name(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [node]
+    result.metadata._continue = None
     v1.list_node.return_value = result
 
     owner = MagicMock()
@@ -169,18 +238,23 @@ def test_drain_nodes_by_name(cl, client, has_conf):
 
     pods = MagicMock()
     pods.items = [pod]
+    pods.metadata._continue = None
     v1.list_pod_for_all_namespaces.return_value = pods
 
-    new_pod = MagicMock()
-    new_pod.metadata.uid = "2"
-    new_pod.metadata.name = "apod"
-    new_pod.metadata.namespace = "default"
-
-    v1.read_namespaced_pod.side_effect = [pod, new_pod]
+    watcher = watch.Watch.return_value
+    watcher.resource_version = "11"
+    watcher.stream.return_value = [
+        {"type": "MODIFIED", "object": pod},
+        {"type": "DELETED", "object": pod},
+    ]
 
     drain_nodes(name="mynode")
 
     v1.create_namespaced_pod_eviction.assert_called_with("apod", "default", body=ANY)
+    v1.read_namespaced_pod.assert_not_called()
+    _, kwargs = watcher.stream.call_args
+    assert kwargs["field_selector"] == "spec.nodeName=mynode"
+    assert kwargs["resource_version"] == pods.metadata.resource_version
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
@@ -197,6 +271,7 @@ def test_daemonsets_cannot_be_drained(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [node]
+    result.metadata._continue = None
     v1.list_node.return_value = result
 
     owner = MagicMock()
@@ -211,6 +286,7 @@ def test_daemonsets_cannot_be_drained(cl, client, has_conf):
 
     pods = MagicMock()
     pods.items = [pod]
+    pods.metadata._continue = None
     v1.list_pod_for_all_namespaces.return_value = pods
 
     drain_nodes(name="mynode")
@@ -233,6 +309,7 @@ def test_pod_with_local_volume_cannot_be_drained(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [node]
+    result.metadata._continue = None
     v1.list_node.return_value = result
 
     owner = MagicMock()
@@ -250,6 +327,7 @@ def test_pod_with_local_volume_cannot_be_drained(cl, client, has_conf):
 
     pods = MagicMock()
     pods.items = [pod]
+    pods.metadata._continue = None
     v1.list_pod_for_all_namespaces.return_value = pods
 
     drain_nodes(name="mynode")
@@ -259,9 +337,12 @@ def test_pod_with_local_volume_cannot_be_drained(cl, client, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.watch", autospec=True)
 @patch("chaosk8s.node.actions.client", autospec=True)
 @patch("chaosk8s.client")
-def test_pod_with_local_volume_cannot_be_drained_unless_forced(cl, client, has_conf):
+def test_pod_with_local_volume_cannot_be_drained_unless_forced(
+    cl, client, watch, has_conf
+):
     has_conf.return_value = False
 
     client.V1Eviction = MagicMock()
@@ -276,6 +357,7 @@ def test_pod_with_local_volume_cannot_be_drained_unless_forced(cl, client, has_c
 
     result = MagicMock()
     result.items = [node]
+    result.metadata._continue = None
     v1.list_node.return_value = result
 
     owner = MagicMock()
@@ -290,14 +372,13 @@ def test_pod_with_local_volume_cannot_be_drained_unless_forced(cl, client, has_c
 
     pods = MagicMock()
     pods.items = [pod]
+    pods.metadata._continue = None
     v1.list_pod_for_all_namespaces.return_value = pods
 
-    new_pod = MagicMock()
-    new_pod.metadata.uid = "2"
-    new_pod.metadata.name = "apod"
-    new_pod.metadata.namespace = "default"
-
-    v1.read_namespaced_pod.side_effect = [pod, new_pod]
+    watch.Watch.return_value.resource_version = None
+    watch.Watch.return_value.stream.return_value = [
+        {"type": "DELETED", "object": pod},
+    ]
 
     drain_nodes(name="mynode", delete_pods_with_local_storage=True)
 
@@ -318,6 +399,7 @@ def test_mirror_pod_cannot_be_drained(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [node]
+    result.metadata._continue = None
     v1.list_node.return_value = result
 
     owner = MagicMock()
@@ -333,6 +415,7 @@ def test_mirror_pod_cannot_be_drained(cl, client, has_conf):
 
     pods = MagicMock()
     pods.items = [pod]
+    pods.metadata._continue = None
     v1.list_pod_for_all_namespaces.return_value = pods
 
     drain_nodes(name="mynode")
@@ -341,11 +424,249 @@ def test_mirror_pod_cannot_be_drained(cl, client, has_conf):
     v1.create_namespaced_pod_eviction.assert_not_called()
 
 
+def make_drainable_node(client):
+    client.V1Eviction = MagicMock()
+    client.V1ObjectMeta = MagicMock()
+    client.V1DeleteOptions = MagicMock()
+
+    v1 = MagicMock()
+    client.CoreV1Api.return_value = v1
+
+    node = MagicMock()
+    node.metadata.name = "mynode"
+
+    result = MagicMock()
+    result.items = [node]
+    result.metadata._continue = None
+    v1.list_node.return_value = result
+
+    owner = MagicMock()
+    owner.controller = True
+    owner.kind = "ReplicationSet"
+
+    pod = MagicMock()
+    pod.metadata.uid = "1"
+    pod.metadata.name = "apod"
+    pod.metadata.namespace = "default"
+    pod.metadata.owner_references = [owner]
+    pod.metadata.annotations = None
+    pod.spec.volumes = []
+
+    pods = MagicMock()
+    pods.items = [pod]
+    pods.metadata._continue = None
+    v1.list_pod_for_all_namespaces.return_value = pods
+    return v1, pod
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.watch", autospec=True)
+@patch("chaosk8s.node.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_drain_nodes_relists_when_watch_expired(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    v1, pod = make_drainable_node(client)
+
+    watcher = watch.Watch.return_value
+    watcher.stream.side_effect = ApiException(status=410, reason="Gone")
+
+    gone = MagicMock()
+    gone.items = []
+    gone.metadata._continue = None
+    v1.list_pod_for_all_namespaces.side_effect = [
+        v1.list_pod_for_all_namespaces.return_value,
+        gone,
+    ]
+
+    assert drain_nodes(name="mynode") == ["mynode"]
+    assert watcher.stream.call_count == 1
+    assert v1.list_pod_for_all_namespaces.call_count == 2
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.time", autospec=True)
+@patch("chaosk8s.node.actions.watch", autospec=True)
+@patch("chaosk8s.node.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_drain_nodes_fails_when_pods_do_not_go(cl, client, watch, time, has_conf):
+    has_conf.return_value = False
+    make_drainable_node(client)
+
+    time.time.side_effect = [0, 1, 200]
+    watch.Watch.return_value.resource_version = "12"
+    watch.Watch.return_value.stream.return_value = []
+
+    with pytest.raises(ActivityFailed) as x:
+        drain_nodes(name="mynode", timeout=120)
+    assert "Remaining pods are:\napod" in str(x.value)
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.time", autospec=True)
+@patch("chaosk8s.node.actions.watch", autospec=True)
+@patch("chaosk8s.node.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_drain_nodes_retries_evictions_blocked_by_budget(
+    cl, client, watch, time, has_conf
+):
+    has_conf.return_value = False
+    v1, pod = make_drainable_node(client)
+
+    time.time.return_value = 0
+    v1.create_namespaced_pod_eviction.side_effect = [
+        ApiException(status=429, reason="Too Many Requests"),
+        ApiException(status=429, reason="Too Many Requests"),
+        None,
+    ]
+    watch.Watch.return_value.resource_version = None
+    watch.Watch.return_value.stream.return_value = [
+        {"type": "DELETED", "object": pod},
+    ]
+
+    assert drain_nodes(name="mynode") == ["mynode"]
+    assert v1.create_namespaced_pod_eviction.call_count == 3
+    assert time.sleep.call_count == 2
+    first, second = [c.args[0] for c in time.sleep.call_args_list]
+    assert 0.5 <= first <= 1
+    assert 1 <= second <= 2
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.watch", autospec=True)
+@patch("chaosk8s.node.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_drain_nodes_reports_every_failed_eviction(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    v1, pod = make_drainable_node(client)
+
+    other = MagicMock()
+    other.metadata.uid = "2"
+    other.metadata.name = "otherpod"
+    other.metadata.namespace = "default"
+    other.metadata.owner_references = pod.metadata.owner_references
+    other.metadata.annotations = None
+    other.spec.volumes = []
+    v1.list_pod_for_all_namespaces.return_value.items.append(other)
+
+    v1.create_namespaced_pod_eviction.side_effect = ApiException(
+        status=500, reason="Internal Server Error"
+    )
+
+    with pytest.raises(ActivityFailed) as x:
+        drain_nodes(name="mynode", max_concurrency=2)
+
+    assert "Failed to evict 2 out of 2 pods" in str(x.value)
+    assert "default/apod" in str(x.value)
+    assert "default/otherpod" in str(x.value)
+    watch.Watch.return_value.stream.assert_not_called()
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.time", autospec=True)
+@patch("chaosk8s.node.actions.watch", autospec=True)
+@patch("chaosk8s.node.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_drain_nodes_reports_failed_evictions_and_nodes(
+    cl, client, watch, time, has_conf
+):
+    has_conf.return_value = False
+    v1, pod = make_drainable_node(client)
+
+    nodes = []
+    for i in range(2):
+        node = MagicMock()
+        node.metadata.name = f"node-{i}"
+        nodes.append(node)
+    v1.list_node.return_value.items = nodes
+
+    # the pod of node-0 cannot be evicted, the one of node-1 does not go
+    v1.create_namespaced_pod_eviction.side_effect = [
+        ApiException(status=500, reason="Internal Server Error"),
+        None,
+    ]
+    time.time.side_effect = [0, 0, 200]
+    watch.Watch.return_value.resource_version = "12"
+    watch.Watch.return_value.stream.return_value = []
+
+    with pytest.raises(ActivityFailed) as x:
+        drain_nodes(label_selector="pool=a", timeout=120)
+
+    assert "Failed to evict 1 out of 2 pods" in str(x.value)
+    assert "Failed to drain 1 out of 2 nodes" in str(x.value)
+    assert "node-1: Draining nodes did not completed" in str(x.value)
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.watch", autospec=True)
+@patch("chaosk8s.node.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_drain_nodes_concurrently(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    v1, pod = make_drainable_node(client)
+
+    nodes = []
+    for i in range(3):
+        node = MagicMock()
+        node.metadata.name = f"node-{i}"
+        nodes.append(node)
+    v1.list_node.return_value.items = nodes
+    v1.list_node.return_value.metadata._continue = None
+
+    watch.Watch.return_value.resource_version = None
+    watch.Watch.return_value.stream.side_effect = lambda *a, **kw: [
+        {"type": "DELETED", "object": pod}
+    ]
+
+    assert drain_nodes(label_selector="pool=a", max_concurrency=3) == [
+        "node-0",
+        "node-1",
+        "node-2",
+    ]
+    assert v1.list_pod_for_all_namespaces.call_count == 3
+    assert v1.create_namespaced_pod_eviction.call_count == 3
+    assert watch.Watch.return_value.stream.call_count == 3
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.actions.time", autospec=True)
+@patch("chaosk8s.node.actions.watch", autospec=True)
+@patch("chaosk8s.node.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_drain_nodes_gives_each_node_its_own_timeout(
+    cl, client, watch, time, has_conf
+):
+    has_conf.return_value = False
+    v1, pod = make_drainable_node(client)
+
+    nodes = []
+    for i in range(2):
+        node = MagicMock()
+        node.metadata.name = f"node-{i}"
+        nodes.append(node)
+    v1.list_node.return_value.items = nodes
+
+    # a minute goes by between each look at the clock, so a single deadline
+    # for both nodes would be reached when waiting for the pods of node-1
+    time.time.side_effect = [0, 60, 120, 180]
+    watch.Watch.return_value.resource_version = None
+    watch.Watch.return_value.stream.side_effect = lambda *a, **kw: [
+        {"type": "DELETED", "object": pod}
+    ]
+
+    assert drain_nodes(label_selector="pool=a", timeout=120) == [
+        "node-0",
+        "node-1",
+    ]
+    assert watch.Watch.return_value.stream.call_count == 2
+
+
 @patch("chaosk8s.has_local_config_file", autospec=True)
 @patch("chaosk8s.deployment.actions.client", autospec=True)
 @patch("chaosk8s.client")
 def test_killing_microservice_deletes_deployment(cl, client, has_conf):
     has_conf.return_value = False
+    # pods are listed through the real client, over the mocked ApiClient
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
 
     v1 = MagicMock()
     client.AppsV1Api.return_value = v1
@@ -370,6 +691,8 @@ def test_killing_microservice_deletes_deployment(cl, client, has_conf):
 @patch("chaosk8s.client")
 def test_killing_microservice_deletes_rs(cl, client, has_conf):
     has_conf.return_value = False
+    # pods are listed through the real client, over the mocked ApiClient
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
 
     v1 = MagicMock()
     client.AppsV1Api.return_value = v1
@@ -403,6 +726,7 @@ def test_killing_microservice_deletes_pod(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [MagicMock()]
+    result.metadata._continue = None
     result.items[0].metadata.name = "mydeployment"
     v1.list_namespaced_pod.return_value = result
 
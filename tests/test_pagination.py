@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, call, patch
+
+from kubernetes.client.models import V1ListMeta, V1ObjectMeta, V1Pod, V1PodList
+
+from chaosk8s.pagination import iter_items, iter_pages
+from chaosk8s.pod.actions import terminate_pods
+
+
+def make_page(names, token=None, rv="10"):
+    return V1PodList(
+        items=[V1Pod(metadata=V1ObjectMeta(name=n)) for n in names],
+        metadata=V1ListMeta(_continue=token, resource_version=rv),
+    )
+
+
+def test_iter_items_follows_continue_tokens():
+    list_func = MagicMock(
+        side_effect=[
+            make_page(["a", "b"], token="t1"),
+            make_page(["c", "d"], token="t2"),
+            make_page(["e"]),
+        ]
+    )
+
+    names = [
+        p.metadata.name for p in iter_items(list_func, "default", page_size=2)
+    ]
+
+    assert names == ["a", "b", "c", "d", "e"]
+    assert list_func.call_args_list == [
+        call("default", limit=2),
+        call("default", limit=2, _continue="t1"),
+        call("default", limit=2, _continue="t2"),
+    ]
+
+
+def test_iter_pages_is_lazy():
+    list_func = MagicMock(
+        side_effect=[make_page(["a"], token="t1"), make_page(["b"])]
+    )
+
+    pages = iter_pages(list_func, label_selector="app=web")
+    first = next(pages)
+
+    assert first.metadata.resource_version == "10"
+    assert list_func.call_count == 1
+    list_func.assert_called_with(label_selector="app=web", limit=500)
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.pod.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_terminate_pods_selects_across_pages(cl, client, has_conf):
+    has_conf.return_value = False
+    v1 = MagicMock()
+    v1.list_namespaced_pod.side_effect = [
+        make_page(["web-1", "db-1"], token="t1"),
+        make_page(["web-2"]),
+    ]
+    client.CoreV1Api.return_value = v1
+
+    terminated = terminate_pods(name_pattern="^web-", all=True)
+
+    assert terminated == ["web-1", "web-2"]
+    assert v1.list_namespaced_pod.call_count == 2
@@ -1,3 +1,4 @@
+import io
 import json
 from unittest.mock import ANY, MagicMock, call, patch
 
@@ -5,7 +6,9 @@ import pytest
 from chaoslib.exceptions import ActivityFailed, InvalidActivity
 from chaoslib.provider.python import validate_python_activity
 from kubernetes import stream
+from kubernetes.client.rest import ApiException
 
+from chaosk8s.instrumentation import record_api_calls
 from chaosk8s.pod.actions import exec_in_pods, terminate_pods
 from chaosk8s.pod.probes import (
     all_pods_healthy,
@@ -14,6 +17,8 @@ from chaosk8s.pod.probes import (
     pods_in_conditions,
     pods_in_phase,
     pods_not_in_phase,
+    read_pod_logs,
+    should_be_found_in_pod_logs,
 )
 
 
@@ -30,6 +35,7 @@ def test_terminate_pods_by_name_pattern(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod, pod2]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -59,6 +65,7 @@ def test_terminate_pods_by_name_pattern_all(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2, pod3]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -97,6 +104,7 @@ def test_terminate_pods_by_name_pattern_rand(cl, client, has_conf):
 
         result = MagicMock()
         result.items = [pod1, pod2, pod3, pod4]
+        result.metadata._continue = None
 
         v1 = MagicMock()
         v1.list_namespaced_pod.return_value = result
@@ -125,6 +133,7 @@ def test_terminate_pods_all(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -157,6 +166,7 @@ def test_terminate_pods_rand(cl, client, has_conf):
 
         result = MagicMock()
         result.items = [pod1, pod2]
+        result.metadata._continue = None
 
         v1 = MagicMock()
         v1.list_namespaced_pod.return_value = result
@@ -185,6 +195,7 @@ def test_terminate_pods_when_no_params_given(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -208,6 +219,7 @@ def test_terminate_pods_when_grace_period_is_set(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -244,6 +256,7 @@ def test_terminate_pods_by_given_percentage(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2, pod3, pod4]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -282,6 +295,7 @@ def test_terminate_pods_by_given_percentage_rand(cl, client, has_conf):
 
         result = MagicMock()
         result.items = [pod1, pod2, pod3, pod4]
+        result.metadata._continue = None
 
         v1 = MagicMock()
         v1.list_namespaced_pod.return_value = result
@@ -312,6 +326,7 @@ def test_terminate_pods_when_qty_grt_than_pods_selected(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -344,6 +359,7 @@ def test_terminate_pods_should_fail_when_qty_less_than_pods_selected(
 
     result = MagicMock()
     result.items = [pod1, pod2]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -368,6 +384,7 @@ def test_terminate_pods_should_fail_when_mode_not_present(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -384,11 +401,7 @@ def test_terminate_pods_should_fail_when_mode_not_present(cl, client, has_conf):
 @patch("chaosk8s.client")
 def test_pods_in_phase(cl, client, has_conf):
     has_conf.return_value = False
-    pod = MagicMock()
-    pod.status = MagicMock()
-    pod.status.phase = "Running"
-    result = MagicMock()
-    result.items = [pod]
+    result = MagicMock(data=json.dumps({"items": [{"status": {"phase": "Running"}}]}))
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -402,11 +415,7 @@ def test_pods_in_phase(cl, client, has_conf):
 @patch("chaosk8s.client")
 def test_pods_should_have_been_phase(cl, client, has_conf):
     has_conf.return_value = False
-    pod = MagicMock()
-    pod.status = MagicMock()
-    pod.status.phase = "Pending"
-    result = MagicMock()
-    result.items = [pod]
+    result = MagicMock(data=json.dumps({"items": [{"status": {"phase": "Pending"}}]}))
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -424,11 +433,7 @@ def test_pods_should_have_been_phase(cl, client, has_conf):
 @patch("chaosk8s.client")
 def test_pods_not_in_phase(cl, client, has_conf):
     has_conf.return_value = False
-    pod = MagicMock()
-    pod.status = MagicMock()
-    pod.status.phase = "Pending"
-    result = MagicMock()
-    result.items = [pod]
+    result = MagicMock(data=json.dumps({"items": [{"status": {"phase": "Pending"}}]}))
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -442,13 +447,11 @@ def test_pods_not_in_phase(cl, client, has_conf):
 @patch("chaosk8s.client")
 def test_pods_in_conditions(cl, client, has_conf):
     has_conf.return_value = False
-    pod = MagicMock()
-    pod.status = MagicMock()
-    pod.status.conditions = [MagicMock()]
-    pod.status.conditions[0].type = "Ready"
-    pod.status.conditions[0].status = "True"
-    result = MagicMock()
-    result.items = [pod]
+    pod = {
+        "metadata": {"name": "mypod"},
+        "status": {"conditions": [{"type": "Ready", "status": "True"}]},
+    }
+    result = MagicMock(data=json.dumps({"items": [pod]}))
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -513,6 +516,7 @@ def test_exec_in_pods_by_name_pattern(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2, pod3]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -561,6 +565,7 @@ def test_exec_in_pods_by_name_pattern_rand(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2, pod3, pod4]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -586,11 +591,9 @@ def test_exec_in_pods_by_name_pattern_rand(cl, client, has_conf):
 @patch("chaosk8s.client")
 def test_unhealthy_system_should_be_reported(cl, client, has_conf):
     has_conf.return_value = False
-    pod = MagicMock()
-    pod.status.phase = "Failed"
-
-    result = MagicMock()
-    result.items = [pod]
+    result = MagicMock(
+        data=json.dumps({"items": [{"status": {"phase": "Failed"}}]})
+    )
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -626,6 +629,7 @@ def test_exec_in_pods_invalid_container_name(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -658,6 +662,7 @@ def test_exec_in_pods_no_command_provided(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -710,6 +715,7 @@ def test_exec_in_pods_no_pod_found_with_name(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -746,6 +752,7 @@ def test_exec_in_pods_order_by_oldest(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod2, pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -781,6 +788,7 @@ def test_exec_in_pods_invalid_order(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -822,6 +830,7 @@ def test_exec_in_pods_using_pod_label_selector(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -855,6 +864,7 @@ def test_exec_in_pods_return_value(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -887,6 +897,7 @@ def test_exec_in_pods_cmd_as_string(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -920,6 +931,7 @@ def test_exec_in_pods_cmd_as_list(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -950,14 +962,16 @@ def test_exec_in_pods_cmd_as_list(cl, client, has_conf):
 def test_succeeded_and_running_pods_should_be_considered_healthy(cl, client, has_conf):
     has_conf.return_value = False
 
-    podSucceeded = MagicMock()
-    podSucceeded.status.phase = "Succeeded"
-
-    podRunning = MagicMock()
-    podRunning.status.phase = "Running"
-
-    result = MagicMock()
-    result.items = [podSucceeded, podRunning]
+    result = MagicMock(
+        data=json.dumps(
+            {
+                "items": [
+                    {"status": {"phase": "Succeeded"}},
+                    {"status": {"phase": "Running"}},
+                ]
+            }
+        )
+    )
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -980,6 +994,7 @@ def test_terminate_pods_by_name_with_prefix_pattern(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod, pod2]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -1007,6 +1022,7 @@ def test_terminate_pods_by_name_with_prefix_pattern_all(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1, pod2, pod3]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -1043,6 +1059,7 @@ def test_terminate_pods_by_name_with_prefix_pattern_rand(cl, client, has_conf):
 
         result = MagicMock()
         result.items = [pod1, pod2, pod3, pod4]
+        result.metadata._continue = None
 
         v1 = MagicMock()
         v1.list_namespaced_pod.return_value = result
@@ -1071,6 +1088,7 @@ def test_exec_in_pods_stderr_can_be_json(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -1112,6 +1130,7 @@ def test_exec_in_pods_stderr_sometimes_not_json(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -1147,6 +1166,7 @@ def test_exec_in_pods_cmd_as_shlex(cl, client, has_conf):
 
     result = MagicMock()
     result.items = [pod1]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -1168,60 +1188,484 @@ def test_exec_in_pods_cmd_as_shlex(cl, client, has_conf):
     assert result[0]["exit_code"] == 0
 
 
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.client")
+def test_count_min_pods_true(cl, has_conf):
+    has_conf.return_value = False
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "p0"}}, {"metadata": {"name": "p1"}}]})
+    )
+
+    assert (
+        count_min_pods(label_selector="app=mysvc", phase="Running", min_count=2) is True
+    )
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.client")
+def test_count_min_pods_false(cl, has_conf):
+    has_conf.return_value = False
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "p0"}}]})
+    )
+
+    assert (
+        count_min_pods(label_selector="app=mysvc", phase="Running", min_count=2)
+        is False
+    )
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.client")
+def test_count_running_pods(cl, has_conf):
+    has_conf.return_value = False
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "p0"}}, {"metadata": {"name": "p1"}}]})
+    )
+
+    assert count_pods(label_selector="app=mysvc", phase="Running") == 2
+
+    _, kwargs = api.call_api.call_args
+    assert kwargs["path_params"] == {"namespace": "default"}
+    assert kwargs["query_params"] == [
+        ("labelSelector", "app=mysvc"),
+        ("fieldSelector", "status.phase=Running"),
+    ]
+    assert "as=PartialObjectMetadataList" in kwargs["header_params"]["Accept"]
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.pod.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_terminate_pods_concurrently(cl, client, has_conf):
+    has_conf.return_value = False
+    pods = []
+    for i in range(10):
+        pod = MagicMock()
+        pod.metadata.name = f"my-app-{i}"
+        pods.append(pod)
+
+    result = MagicMock()
+    result.items = pods
+    result.metadata._continue = None
+
+    v1 = MagicMock()
+    v1.list_namespaced_pod.return_value = result
+    client.CoreV1Api.return_value = v1
+
+    ret = terminate_pods(all=True, max_concurrency=4)
+
+    assert ret == [f"my-app-{i}" for i in range(10)]
+    assert v1.delete_namespaced_pod.call_count == 10
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.pod.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_terminate_pods_stops_at_first_failure_by_default(cl, client, has_conf):
+    has_conf.return_value = False
+    pods = []
+    for i in range(3):
+        pod = MagicMock()
+        pod.metadata.name = f"my-app-{i}"
+        pods.append(pod)
+
+    result = MagicMock()
+    result.items = pods
+    result.metadata._continue = None
+
+    v1 = MagicMock()
+    v1.list_namespaced_pod.return_value = result
+    v1.delete_namespaced_pod.side_effect = [
+        None,
+        ApiException(status=403, reason="Forbidden"),
+        None,
+    ]
+    client.CoreV1Api.return_value = v1
+
+    with pytest.raises(ApiException) as x:
+        terminate_pods(all=True)
+
+    assert x.value.status == 403
+    assert v1.delete_namespaced_pod.call_count == 2
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.pod.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_terminate_pods_reports_failed_deletions(cl, client, has_conf):
+    has_conf.return_value = False
+    pods = []
+    for i in range(3):
+        pod = MagicMock()
+        pod.metadata.name = f"my-app-{i}"
+        pods.append(pod)
+
+    result = MagicMock()
+    result.items = pods
+    result.metadata._continue = None
+
+    def delete(name, ns, body):
+        if name == "my-app-1":
+            raise ApiException(status=403, reason="Forbidden")
+
+    v1 = MagicMock()
+    v1.list_namespaced_pod.return_value = result
+    v1.delete_namespaced_pod.side_effect = delete
+    client.CoreV1Api.return_value = v1
+
+    with pytest.raises(ActivityFailed) as x:
+        terminate_pods(all=True, max_concurrency=3)
+
+    assert "Failed to delete 1 out of 3 pods: 'my-app-1' (Forbidden)" in str(
+        x.value
+    )
+    assert v1.delete_namespaced_pod.call_count == 3
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.pod.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_exec_in_pods_concurrently(cl, client, has_conf):
+    has_conf.return_value = False
+
+    container1 = MagicMock()
+    container1.name = "container1"
+
+    pods = []
+    for i in range(5):
+        pod = MagicMock()
+        pod.metadata.name = f"my-app-{i}"
+        pod.spec.containers = [container1]
+        pods.append(pod)
+
+    result = MagicMock()
+    result.items = pods
+    result.metadata._continue = None
+
+    v1 = MagicMock()
+    v1.list_namespaced_pod.return_value = result
+    client.CoreV1Api.return_value = v1
+
+    def read_channel(channel):
+        if channel == 1:
+            return "hello"
+        return '{"status":"Success"}'
+
+    stream.stream = MagicMock()
+    stream.stream.return_value.read_channel.side_effect = read_channel
+
+    results = exec_in_pods(
+        cmd="dummy",
+        all=True,
+        container_name="container1",
+        max_concurrency=3,
+    )
+
+    assert stream.stream.call_count == 5
+    assert sorted(r["pod_name"] for r in results) == [
+        f"my-app-{i}" for i in range(5)
+    ]
+    assert all(r["exit_code"] == 0 for r in results)
+    assert all(r["stdout"] == "hello" for r in results)
+    # each exec gets a client of its own
+    assert client.ApiClient.call_count == 5
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.pod.actions.throttle", autospec=True)
+@patch("chaosk8s.pod.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_exec_in_pods_is_throttled_and_recorded(cl, client, throttle, has_conf):
+    has_conf.return_value = False
+
+    container1 = MagicMock()
+    container1.name = "container1"
+    pod = MagicMock()
+    pod.metadata.name = "my-app-1"
+    pod.spec.containers = [container1]
+
+    result = MagicMock()
+    result.items = [pod]
+    result.metadata._continue = None
+    client.CoreV1Api.return_value.list_namespaced_pod.return_value = result
+
+    stream.stream = MagicMock()
+    stream.stream.return_value.read_channel.return_value = '{"status":"Success"}'
+
+    with record_api_calls() as stats:
+        exec_in_pods(cmd="dummy", all=True, container_name="container1")
+
+    throttle.assert_called_once_with(cl.ApiClient.return_value)
+    assert stats.as_dict()["requests"]["create pods/exec"]["calls"] == 1
+
+
 @patch("chaosk8s.has_local_config_file", autospec=True)
 @patch("chaosk8s.pod.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_count_min_pods_true(cl, client, has_conf):
+def test_read_pod_logs_with_bounded_window(cl, client, has_conf):
     has_conf.return_value = False
     pod = MagicMock()
-    pod.status = MagicMock()
-    pod.status.phase = "Running"
+    pod.metadata.name = "myapp-1235"
     result = MagicMock()
-    result.items = [pod, pod]
+    result.items = [pod]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
+    v1.read_namespaced_pod_log.return_value = io.BytesIO(b"hello")
     client.CoreV1Api.return_value = v1
 
-    assert (
-        count_min_pods(label_selector="app=mysvc", phase="Running", min_count=2) is True
+    logs = read_pod_logs(
+        label_selector="app=myapp",
+        tail_lines=10,
+        limit_bytes=2048,
+        since_time="2000-01-01T00:00:00Z",
     )
 
+    assert logs == {"myapp-1235": "hello"}
+    _, kwargs = v1.read_namespaced_pod_log.call_args
+    assert kwargs["tail_lines"] == 10
+    assert kwargs["limit_bytes"] == 2048
+    assert kwargs["since_seconds"] > 24 * 365 * 86400
+
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
 @patch("chaosk8s.pod.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_count_min_pods_false(cl, client, has_conf):
+def test_read_pod_logs_cut_within_a_character(cl, client, has_conf):
     has_conf.return_value = False
     pod = MagicMock()
-    pod.status = MagicMock()
-    pod.status.phase = "Running"
+    pod.metadata.name = "myapp-1235"
     result = MagicMock()
     result.items = [pod]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
+    # the first two of the three bytes of "€"
+    v1.read_namespaced_pod_log.return_value = io.BytesIO(
+        "price: €".encode("utf-8")[:-1]
+    )
     client.CoreV1Api.return_value = v1
 
-    assert (
-        count_min_pods(label_selector="app=mysvc", phase="Running", min_count=2)
-        is False
+    logs = read_pod_logs(label_selector="app=myapp", limit_bytes=9)
+
+    assert logs == {"myapp-1235": "price: \ufffd"}
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.pod.probes.client", autospec=True)
+@patch("chaosk8s.client")
+def test_read_pod_logs_concurrently(cl, client, has_conf):
+    has_conf.return_value = False
+    pods = []
+    for i in range(6):
+        pod = MagicMock()
+        pod.metadata.name = f"myapp-{i}"
+        pods.append(pod)
+    result = MagicMock()
+    result.items = pods
+    result.metadata._continue = None
+
+    v1 = MagicMock()
+    v1.list_namespaced_pod.return_value = result
+    v1.read_namespaced_pod_log.side_effect = lambda name, **kw: io.BytesIO(
+        name.encode("utf-8")
     )
+    client.CoreV1Api.return_value = v1
+
+    logs = read_pod_logs(label_selector="app=myapp", max_concurrency=4)
+
+    assert list(logs) == [f"myapp-{i}" for i in range(6)]
+    assert all(k == v for k, v in logs.items())
+
+
+class FakeLogResponse:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.served = 0
+        self.closed = False
+
+    def stream(self, amt=None, decode_content=None):
+        for chunk in self.chunks:
+            self.served += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        pass
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
 @patch("chaosk8s.pod.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_count_running_pods(cl, client, has_conf):
+def test_search_pod_logs_stops_at_first_match(cl, client, has_conf):
     has_conf.return_value = False
     pod = MagicMock()
-    pod.status = MagicMock()
-    pod.status.phase = "Running"
+    pod.metadata.name = "myapp-1"
     result = MagicMock()
-    result.items = [pod, pod]
+    result.items = [pod]
+    result.metadata._continue = None
 
+    resp = FakeLogResponse([b"booting\nstar", b"ted in 2s\nserving", b"\nlast\n"])
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
+    v1.read_namespaced_pod_log.return_value = resp
     client.CoreV1Api.return_value = v1
 
-    assert count_pods(label_selector="app=mysvc", phase="Running") == 2
+    assert should_be_found_in_pod_logs("started in", label_selector="app=a")
+    assert resp.served == 2
+    assert resp.closed is True
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.pod.probes.client", autospec=True)
+@patch("chaosk8s.client")
+def test_search_pod_logs_must_match_all_pods(cl, client, has_conf):
+    has_conf.return_value = False
+    pod1 = MagicMock()
+    pod1.metadata.name = "myapp-1"
+    pod2 = MagicMock()
+    pod2.metadata.name = "myapp-2"
+    result = MagicMock()
+    result.items = [pod1, pod2]
+    result.metadata._continue = None
+
+    logs = {"myapp-1": [b"hello\n"], "myapp-2": [b"bye"]}
+    v1 = MagicMock()
+    v1.list_namespaced_pod.return_value = result
+    v1.read_namespaced_pod_log.side_effect = lambda name, **kw: FakeLogResponse(
+        logs[name]
+    )
+    client.CoreV1Api.return_value = v1
+
+    assert should_be_found_in_pod_logs("hello", label_selector="app=a") is False
+    assert (
+        should_be_found_in_pod_logs("hello", label_selector="app=a", all_pods=False)
+        is True
+    )
+    assert should_be_found_in_pod_logs("^bye$", label_selector="app=a", all_pods=False)
+
+
+def _watched_pod(name, phase, conditions=None):
+    pod = MagicMock()
+    pod.metadata.name = name
+    pod.metadata.resource_version = None
+    pod.status.phase = phase
+    pod.status.conditions = conditions
+    return pod
+
+
+def _listed_pods(client, *pods):
+    page = MagicMock()
+    page.metadata._continue = None
+    page.metadata.resource_version = "1"
+    page.items = list(pods)
+    client.CoreV1Api.return_value.list_namespaced_pod.return_value = page
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_pods_in_phase_waits_for_pods_to_be_in_phase(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    _listed_pods(client, _watched_pod("a", "Running"), _watched_pod("b", "Pending"))
+    watcher = watch.Watch.return_value
+    watcher.stream.return_value = [
+        {"object": _watched_pod("c", "Pending"), "type": "ADDED"},
+        {"object": _watched_pod("b", "Running"), "type": "MODIFIED"},
+        {"object": _watched_pod("c", "Running"), "type": "MODIFIED"},
+    ]
+
+    assert (
+        pods_in_phase(label_selector="app=mysvc", phase="Running", timeout=5) is True
+    )
+    assert watch.Watch.call_count == 1
+    _, kwargs = watcher.stream.call_args
+    assert kwargs["label_selector"] == "app=mysvc"
+    assert kwargs["resource_version"] == "1"
+    watcher.stop.assert_called_once_with()
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_pods_in_phase_does_not_watch_pods_already_in_phase(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    _listed_pods(client, _watched_pod("a", "Running"))
+
+    assert (
+        pods_in_phase(label_selector="app=mysvc", phase="Running", timeout=5) is True
+    )
+    watch.Watch.assert_not_called()
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_pods_in_phase_fails_when_timing_out(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    _listed_pods(client, _watched_pod("a", "Pending"))
+    watch.Watch.return_value.stream.return_value = []
+
+    with pytest.raises(ActivityFailed) as x:
+        pods_in_phase(label_selector="app=mysvc", phase="Running", timeout=1)
+    assert "is in phase 'Pending' but should be 'Running'" in str(x.value)
+
+    assert (
+        pods_in_phase(
+            label_selector="app=mysvc",
+            phase="Running",
+            timeout=1,
+            raise_on_invalid_phase=False,
+        )
+        is False
+    )
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_pods_not_in_phase_waits_for_pods_to_leave_phase(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    _listed_pods(client, _watched_pod("a", "Running"), _watched_pod("b", "Pending"))
+    watch.Watch.return_value.stream.return_value = [
+        {"object": _watched_pod("a", "Running"), "type": "DELETED"},
+    ]
+
+    assert (
+        pods_not_in_phase(label_selector="app=mysvc", phase="Running", timeout=5)
+        is True
+    )
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_pods_in_conditions_waits_for_conditions(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    ready = MagicMock(type="Ready", status="True")
+    _listed_pods(client, _watched_pod("a", "Pending"))
+    watch.Watch.return_value.stream.return_value = [
+        {"object": _watched_pod("a", "Running", [ready]), "type": "MODIFIED"},
+    ]
+
+    assert (
+        pods_in_conditions(
+            label_selector="app=mysvc",
+            conditions=[{"type": "Ready", "status": "True"}],
+            timeout=5,
+        )
+        is True
+    )
@@ -27,11 +27,9 @@ from chaosk8s.statefulset.probes import (
 @patch("chaosk8s.client")
 def test_unhealthy_system_should_be_reported(cl, client, has_conf):
     has_conf.return_value = False
-    pod = MagicMock()
-    pod.status.phase = "Failed"
-
-    result = MagicMock()
-    result.items = [pod]
+    result = MagicMock(
+        data=json.dumps({"items": [{"status": {"phase": "Failed"}}]})
+    )
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -48,14 +46,16 @@ def test_unhealthy_system_should_be_reported(cl, client, has_conf):
 def test_succeeded_and_running_pods_should_be_considered_healthy(cl, client, has_conf):
     has_conf.return_value = False
 
-    podSucceeded = MagicMock()
-    podSucceeded.status.phase = "Succeeded"
-
-    podRunning = MagicMock()
-    podRunning.status.phase = "Running"
-
-    result = MagicMock()
-    result.items = [podSucceeded, podRunning]
+    result = MagicMock(
+        data=json.dumps(
+            {
+                "items": [
+                    {"status": {"phase": "Succeeded"}},
+                    {"status": {"phase": "Running"}},
+                ]
+            }
+        )
+    )
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -72,8 +72,7 @@ def test_expecting_healthy_microservice_should_be_reported_when_not(
     cl, client, has_conf
 ):
     has_conf.return_value = False
-    result = MagicMock()
-    result.items = []
+    result = MagicMock(data=json.dumps({"items": []}))
 
     v1 = MagicMock()
     v1.list_namespaced_deployment.return_value = result
@@ -83,10 +82,8 @@ def test_expecting_healthy_microservice_should_be_reported_when_not(
         microservice_available_and_healthy("mysvc")
     assert "Deployment 'mysvc' was not found" in str(excinfo.value)
 
-    deployment = MagicMock()
-    deployment.spec.replicas = 2
-    deployment.status.available_replicas = 1
-    result.items.append(deployment)
+    deployment = {"spec": {"replicas": 2}, "status": {"availableReplicas": 1}}
+    result.data = json.dumps({"items": [deployment]})
 
     with pytest.raises(ActivityFailed) as excinfo:
         microservice_available_and_healthy("mysvc")
@@ -98,10 +95,15 @@ def test_expecting_healthy_microservice_should_be_reported_when_not(
 @patch("chaosk8s.client")
 def test_expecting_microservice_is_there_when_it_should_not(cl, client, has_conf):
     has_conf.return_value = False
-    pod = MagicMock()
-    pod.status.phase = "Running"
-    result = MagicMock()
-    result.items = [pod]
+    result = MagicMock(
+        data=json.dumps(
+            {
+                "items": [
+                    {"metadata": {"name": "mysvc"}, "status": {"phase": "Running"}}
+                ]
+            }
+        )
+    )
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -113,34 +115,25 @@ def test_expecting_microservice_is_there_when_it_should_not(cl, client, has_conf
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.service.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_expecting_service_endpoint_should_be_initialized(cl, client, has_conf):
+def test_expecting_service_endpoint_should_be_initialized(cl, has_conf):
     has_conf.return_value = False
-    service = MagicMock()
-    result = MagicMock()
-    result.items = [service]
-
-    v1 = MagicMock()
-    v1.list_namespaced_service.return_value = result
-    client.CoreV1Api.return_value = v1
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "mysvc"}}]})
+    )
 
     assert service_endpoint_is_initialized("mysvc") is True
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.service.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_unitialized_or_not_existing_service_endpoint_should_not_be_available(
-    cl, client, has_conf
+    cl, has_conf
 ):
     has_conf.return_value = False
-    result = MagicMock()
-    result.items = []
-
-    v1 = MagicMock()
-    v1.list_namespaced_service.return_value = result
-    client.CoreV1Api.return_value = v1
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(data=json.dumps({"items": []}))
 
     with pytest.raises(ActivityFailed) as excinfo:
         service_endpoint_is_initialized("mysvc")
@@ -148,11 +141,12 @@ def test_unitialized_or_not_existing_service_endpoint_should_not_be_available(
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.deployment.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.deployment.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_deployment_is_not_fully_available(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     deployment = MagicMock()
     deployment.spec.replicas = 2
     deployment.status.ready_replicas = 1
@@ -166,11 +160,12 @@ def test_deployment_is_not_fully_available(cl, client, watch, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.deployment.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.deployment.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_deployment_is_fully_available_when_it_should_not(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     deployment = MagicMock()
     deployment.spec.replicas = 2
     deployment.status.ready_replicas = 2
@@ -181,16 +176,17 @@ def test_deployment_is_fully_available_when_it_should_not(cl, client, watch, has
     watch.Watch.return_value = watcher
 
     with pytest.raises(ActivityFailed) as excinfo:
-        deployment_is_not_fully_available("mysvc")
+        deployment_is_not_fully_available("mysvc", timeout=1)
     assert "deployment 'mysvc' failed to stop running within" in str(excinfo.value)
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.deployment.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.deployment.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_deployment_is_fully_available(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     deployment = MagicMock()
     deployment.spec.replicas = 2
     deployment.status.ready_replicas = 2
@@ -204,11 +200,12 @@ def test_deployment_is_fully_available(cl, client, watch, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.deployment.probes.watch", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
 @patch("chaosk8s.deployment.probes.client", autospec=True)
 @patch("chaosk8s.client")
 def test_deployment_is_not_fully_available_when_it_should(cl, client, watch, has_conf):
     has_conf.return_value = False
+    cl.ApiClient.return_value.call_api.return_value.metadata._continue = None
     deployment = MagicMock()
     deployment.spec.replicas = 2
     deployment.status.ready_replicas = 1
@@ -219,16 +216,18 @@ def test_deployment_is_not_fully_available_when_it_should(cl, client, watch, has
     watch.Watch.return_value = watcher
 
     with pytest.raises(ActivityFailed) as excinfo:
-        deployment_is_fully_available("mysvc")
+        deployment_is_fully_available("mysvc", timeout=1)
     assert "deployment 'mysvc' failed to recover within" in str(excinfo.value)
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.statefulset.probes.watch", autospec=True)
-@patch("chaosk8s.statefulset.probes.client", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
 @patch("chaosk8s.client")
 def test_statefulset_not_fully_available(cl, client, watch, has_conf):
     has_conf.return_value = False
+    v1 = client.AppsV1Api.return_value
+    v1.list_namespaced_stateful_set.return_value.metadata._continue = None
     statefulset = MagicMock()
     statefulset.spec.replicas = 2
     statefulset.status.ready_replicas = 1
@@ -242,11 +241,13 @@ def test_statefulset_not_fully_available(cl, client, watch, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.statefulset.probes.watch", autospec=True)
-@patch("chaosk8s.statefulset.probes.client", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
 @patch("chaosk8s.client")
 def test_statefulset_fully_available_when_it_should_not(cl, client, watch, has_conf):
     has_conf.return_value = False
+    v1 = client.AppsV1Api.return_value
+    v1.list_namespaced_stateful_set.return_value.metadata._continue = None
     statefulset = MagicMock()
     statefulset.spec.replicas = 2
     statefulset.status.ready_replicas = 2
@@ -257,16 +258,18 @@ def test_statefulset_fully_available_when_it_should_not(cl, client, watch, has_c
     watch.Watch.return_value = watcher
 
     with pytest.raises(ActivityFailed) as excinfo:
-        statefulset_not_fully_available("mysvc")
+        statefulset_not_fully_available("mysvc", timeout=1)
     assert "microservice 'mysvc' failed to stop running within" in str(excinfo.value)
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.statefulset.probes.watch", autospec=True)
-@patch("chaosk8s.statefulset.probes.client", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
 @patch("chaosk8s.client")
 def test_statefulset_fully_available(cl, client, watch, has_conf):
     has_conf.return_value = False
+    v1 = client.AppsV1Api.return_value
+    v1.list_namespaced_stateful_set.return_value.metadata._continue = None
     statefulset = MagicMock()
     statefulset.spec.replicas = 2
     statefulset.status.ready_replicas = 2
@@ -280,11 +283,13 @@ def test_statefulset_fully_available(cl, client, watch, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.statefulset.probes.watch", autospec=True)
-@patch("chaosk8s.statefulset.probes.client", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
 @patch("chaosk8s.client")
 def test_statefulset_not_fully_available_when_it_should(cl, client, watch, has_conf):
     has_conf.return_value = False
+    v1 = client.AppsV1Api.return_value
+    v1.list_namespaced_stateful_set.return_value.metadata._continue = None
     statefulset = MagicMock()
     statefulset.spec.replicas = 2
     statefulset.status.ready_replicas = 1
@@ -295,7 +300,7 @@ def test_statefulset_not_fully_available_when_it_should(cl, client, watch, has_c
     watch.Watch.return_value = watcher
 
     with pytest.raises(ActivityFailed) as excinfo:
-        statefulset_fully_available("mysvc")
+        statefulset_fully_available("mysvc", timeout=1)
     assert "microservice 'mysvc' failed to recover within" in str(excinfo.value)
 
 
@@ -308,6 +313,7 @@ def test_fetch_last_logs(cl, client, has_conf):
     pod.metadata.name = "myapp-1235"
     result = MagicMock()
     result.items = [pod]
+    result.metadata._continue = None
 
     v1 = MagicMock()
     v1.list_namespaced_pod.return_value = result
@@ -322,22 +328,23 @@ def test_fetch_last_logs(cl, client, has_conf):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.service.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_can_select_by_label(cl, client, has_conf):
+def test_can_select_by_label(cl, has_conf):
     has_conf.return_value = False
-    result = MagicMock()
-    result.items = [MagicMock()]
-
-    v1 = MagicMock()
-    v1.list_namespaced_service.return_value = result
-    client.CoreV1Api.return_value = v1
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "mysvc"}}]})
+    )
 
     label_selector = "app=my-super-app"
     service_endpoint_is_initialized("mysvc", label_selector=label_selector)
-    v1.list_namespaced_service.assert_called_with(
-        "default", field_selector="metadata.name=mysvc", label_selector=label_selector
-    )
+
+    _, kwargs = api.call_api.call_args
+    assert kwargs["query_params"] == [
+        ("labelSelector", label_selector),
+        ("fieldSelector", "metadata.name=mysvc"),
+        ("limit", 1),
+    ]
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
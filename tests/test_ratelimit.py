@@ -0,0 +1,72 @@
+import os
+from unittest.mock import MagicMock, patch
+
+from chaosk8s import create_k8s_api_client
+from chaosk8s.ratelimit import TokenBucket, limit_requests, throttle
+
+
+@patch("chaosk8s.ratelimit.time", autospec=True)
+def test_token_bucket_allows_a_burst_then_spaces_requests(time):
+    time.monotonic.return_value = 100.0
+    bucket = TokenBucket(qps=10, burst=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == 0.1
+    assert bucket.reserve() == 0.2
+
+    # one second later, the debt is paid and the bucket is full again
+    time.monotonic.return_value = 101.0
+    assert bucket.reserve() == 0.0
+
+
+@patch("chaosk8s.ratelimit.time", autospec=True)
+def test_token_bucket_waits_for_a_token(time):
+    time.monotonic.return_value = 100.0
+    bucket = TokenBucket(qps=2, burst=1)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.5
+    time.sleep.assert_called_once_with(0.5)
+
+
+@patch("chaosk8s.ratelimit.TokenBucket", autospec=True)
+def test_requests_wait_for_a_token(bucket):
+    api = MagicMock()
+    request = api.rest_client.request
+    bucket.return_value.acquire.return_value = 0.0
+
+    limit_requests(api, {"KUBERNETES_QPS": "5", "KUBERNETES_BURST": "10"})
+    api.rest_client.request("GET", "http://localhost/api/v1/pods")
+
+    bucket.assert_called_once_with(5.0, 10)
+    bucket.return_value.acquire.assert_called_once_with()
+    request.assert_called_once_with("GET", "http://localhost/api/v1/pods")
+
+
+def test_requests_bypassing_the_rest_client_can_be_throttled():
+    api = MagicMock()
+    limit_requests(api, {"KUBERNETES_QPS": "1", "KUBERNETES_BURST": "1"})
+
+    assert throttle(api) == 0.0
+    assert throttle(MagicMock()) == 0.0
+    bucket = api.rest_client.request.bucket
+    assert bucket._tokens < 1
+
+
+def test_requests_are_not_limited_when_qps_is_zero():
+    api = MagicMock()
+    request = api.rest_client.request
+
+    limit_requests(api, {"KUBERNETES_QPS": "0"})
+
+    assert api.rest_client.request is request
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch.dict(os.environ, {"KUBERNETES_HOST": "http://someplace"})
+def test_created_clients_are_rate_limited(has_conf):
+    has_conf.return_value = False
+
+    api = create_k8s_api_client({"KUBERNETES_QPS": "5"})
+
+    assert hasattr(api.rest_client.request, "__wrapped__")
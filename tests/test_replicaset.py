@@ -1,3 +1,4 @@
+import json
 from unittest.mock import ANY, MagicMock, call, patch
 
 from kubernetes.client.models import V1ObjectMeta, V1ReplicaSet, V1ReplicaSetList
@@ -27,3 +28,32 @@ def test_delete_replica_set(client, api):
         [call("repl1", "fake_ns", body=ANY), call("repl2", "fake_ns", body=ANY)],
         any_order=True,
     )
+
+
+@patch("chaosk8s.replicaset.actions.create_k8s_api_client", autospec=True)
+@patch("chaosk8s.replicaset.actions.client", autospec=True)
+def test_delete_replica_set_as_collection(client, api):
+    v1 = MagicMock()
+    client.AppsV1Api.return_value = v1
+    v1.delete_collection_namespaced_replica_set.return_value = MagicMock(
+        data=json.dumps(
+            {
+                "kind": "ReplicaSetList",
+                "items": [
+                    {"metadata": {"name": "repl1"}},
+                    {"metadata": {"name": "repl2"}},
+                ],
+            }
+        )
+    )
+
+    deleted = delete_replica_set(
+        label_selector="app=canary", ns="fake_ns", delete_collection=True
+    )
+
+    assert deleted == ["repl1", "repl2"]
+    v1.delete_collection_namespaced_replica_set.assert_called_once_with(
+        "fake_ns", body=ANY, _preload_content=False, label_selector="app=canary"
+    )
+    v1.list_namespaced_replica_set.assert_not_called()
+    v1.delete_namespaced_replica_set.assert_not_called()
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -69,19 +70,38 @@ def test_delete_secret(client, api):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.secret.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_expecting_service_should_be_initialized(cl, client, has_conf):
+def test_expecting_service_should_be_initialized(cl, has_conf):
     has_conf.return_value = False
-    secret = MagicMock()
-    result = MagicMock()
-    result.items = [secret]
-
-    v1 = MagicMock()
-    v1.list_namespaced_secret.return_value = result
-    client.CoreV1Api.return_value = v1
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "mysecret"}}]})
+    )
 
     assert secret_exists("mysecret") is True
-    v1.list_namespaced_secret.assert_called_with(
-        "default", field_selector="metadata.name=mysecret"
-    )
+
+    args, kwargs = api.call_api.call_args
+    assert args == ("/api/v1/namespaces/{namespace}/secrets", "GET")
+    assert kwargs["path_params"] == {"namespace": "default"}
+    assert kwargs["query_params"] == [
+        ("fieldSelector", "metadata.name=mysecret"),
+        ("limit", 1),
+    ]
+    assert "as=PartialObjectMetadataList" in kwargs["header_params"]["Accept"]
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.client")
+def test_secret_does_not_exist(cl, has_conf):
+    has_conf.return_value = False
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(data=json.dumps({"items": []}))
+
+    assert secret_exists("mysecret", label_selector="app=web") is False
+
+    _, kwargs = api.call_api.call_args
+    assert kwargs["query_params"] == [
+        ("labelSelector", "app=web"),
+        ("fieldSelector", "metadata.name=mysecret"),
+        ("limit", 1),
+    ]
@@ -0,0 +1,106 @@
+import pytest
+from chaoslib.exceptions import ActivityFailed
+from kubernetes.client.models import V1ObjectMeta, V1Pod
+
+from chaosk8s.chaosmesh import _label_selector_spec
+from chaosk8s.selectors import LabelSelector, compile_selector
+from chaosk8s.views import ObjectView
+
+LABELS = {"app": "web", "env": "prod", "replicas": "3"}
+
+
+@pytest.mark.parametrize(
+    "selector,expected",
+    [
+        ("", True),
+        ("app=web", True),
+        ("app==web", True),
+        ("app = web", True),
+        ("app!=web", False),
+        ("app!=db", True),
+        ("tier!=front", True),
+        ("app=web,env=dev", False),
+        ("env in (prod, staging)", True),
+        ("env in (dev,staging)", False),
+        ("env notin (dev)", True),
+        ("tier notin (front)", True),
+        ("env", True),
+        ("tier", False),
+        ("!tier", True),
+        ("!env", False),
+        ("replicas>2", True),
+        ("replicas<3", False),
+        ("app>2", False),
+        ("example.com/app", False),
+        ("app=web,env in (prod),!canary", True),
+    ],
+)
+def test_selectors_match_labels(selector, expected):
+    assert compile_selector(selector).matches(LABELS) is expected
+
+
+@pytest.mark.parametrize(
+    "selector",
+    [
+        "app in web",
+        "app in (web",
+        "app=web,",
+        ",app=web",
+        "app=web=db",
+        "app web",
+        "-app=web",
+        "app=-web",
+        "replicas>two",
+        "Example.com/app=web",
+    ],
+)
+def test_invalid_selectors_are_rejected(selector):
+    with pytest.raises(ActivityFailed):
+        compile_selector(selector)
+
+
+def test_selectors_are_compiled_once():
+    assert compile_selector("app=web") is compile_selector("app=web")
+
+
+def test_selectors_read_the_labels_of_objects():
+    selector = compile_selector("app=web")
+    objects = [
+        V1Pod(metadata=V1ObjectMeta(name="a", labels={"app": "web"})),
+        V1Pod(metadata=V1ObjectMeta(name="b")),
+        ObjectView({"metadata": {"name": "c", "labels": {"app": "web"}}}),
+        {"metadata": {"name": "d", "labels": {"app": "db"}}},
+        {"metadata": {"name": "e", "labels": {"app": "web"}}},
+    ]
+
+    matching = selector.filter(objects)
+
+    assert len(matching) == 3
+    assert selector.matches_object(objects[0]) is True
+    assert selector.matches_object(objects[1]) is False
+    assert LabelSelector().filter(objects) == objects
+
+
+def test_selectors_are_turned_into_match_labels_and_expressions():
+    selector = compile_selector("app=web,env in (prod,dev),tier!=front,!canary")
+
+    assert str(selector) == "app=web,env in (dev,prod),tier!=front,!canary"
+    assert selector.match_labels == {"app": "web"}
+    assert selector.match_expressions == [
+        {"key": "env", "operator": "In", "values": ["dev", "prod"]},
+        {"key": "tier", "operator": "NotIn", "values": ["front"]},
+        {"key": "canary", "operator": "DoesNotExist"},
+    ]
+
+
+def test_chaos_mesh_experiments_select_by_label_expressions():
+    assert _label_selector_spec("a=b,c=d") == {
+        "labelSelectors": {"a": "b", "c": "d"}
+    }
+    assert _label_selector_spec({"a": "b"}) == {"labelSelectors": {"a": "b"}}
+    assert _label_selector_spec("a=b,env notin (dev)") == {
+        "labelSelectors": {"a": "b"},
+        "expressionSelectors": [
+            {"key": "env", "operator": "NotIn", "values": ["dev"]}
+        ],
+    }
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -69,38 +70,56 @@ def test_delete_service(client, api):
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.service.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_expecting_service_should_be_initialized(cl, client, has_conf):
+def test_expecting_service_should_be_initialized(cl, has_conf):
     has_conf.return_value = False
-    service = MagicMock()
-    result = MagicMock()
-    result.items = [service]
-
-    v1 = MagicMock()
-    v1.list_namespaced_service.return_value = result
-    client.CoreV1Api.return_value = v1
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "mysvc"}}]})
+    )
 
     assert service_is_initialized("mysvc") is True
-    v1.list_namespaced_service.assert_called_with(
-        "default", field_selector="metadata.name=mysvc"
-    )
+
+    args, kwargs = api.call_api.call_args
+    assert args == ("/api/v1/namespaces/{namespace}/services", "GET")
+    assert kwargs["path_params"] == {"namespace": "default"}
+    assert kwargs["query_params"] == [
+        ("fieldSelector", "metadata.name=mysvc"),
+        ("limit", 1),
+    ]
 
 
 @patch("chaosk8s.has_local_config_file", autospec=True)
-@patch("chaosk8s.service.probes.client", autospec=True)
 @patch("chaosk8s.client")
-def test_can_select_by_label(cl, client, has_conf):
+def test_can_select_by_label(cl, has_conf):
     has_conf.return_value = False
-    result = MagicMock()
-    result.items = [MagicMock()]
-
-    v1 = MagicMock()
-    v1.list_namespaced_service.return_value = result
-    client.CoreV1Api.return_value = v1
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(
+        data=json.dumps({"items": [{"metadata": {"name": "mysvc"}}]})
+    )
 
     label_selector = "app=my-super-app"
     service_is_initialized("mysvc", label_selector=label_selector)
-    v1.list_namespaced_service.assert_called_with(
-        "default", field_selector="metadata.name=mysvc", label_selector=label_selector
+
+    _, kwargs = api.call_api.call_args
+    assert kwargs["query_params"] == [
+        ("labelSelector", label_selector),
+        ("fieldSelector", "metadata.name=mysvc"),
+        ("limit", 1),
+    ]
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.client")
+def test_service_not_initialized_raises(cl, has_conf):
+    has_conf.return_value = False
+    api = cl.ApiClient.return_value
+    api.call_api.return_value = MagicMock(data=json.dumps({"items": []}))
+
+    with pytest.raises(ActivityFailed):
+        service_is_initialized("mysvc")
+
+    assert (
+        service_is_initialized("mysvc", raise_if_service_not_initialized=False)
+        is False
     )
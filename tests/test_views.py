@@ -0,0 +1,76 @@
+import json
+from unittest.mock import MagicMock, patch
+
+from chaosk8s.node.probes import get_all_node_status_conditions
+from chaosk8s.views import ObjectView, raw_list
+
+
+def test_view_reads_fields_by_their_model_name():
+    pod = ObjectView(
+        {
+            "metadata": {
+                "name": "web-1",
+                "ownerReferences": [{"kind": "ReplicaSet", "controller": True}],
+            },
+            "spec": {"nodeName": "node-a"},
+            "status": {
+                "phase": "Running",
+                "podIP": "10.0.0.1",
+                "conditions": [{"type": "Ready", "status": "True"}],
+            },
+        }
+    )
+
+    assert pod.metadata.name == "web-1"
+    assert pod.metadata.owner_references[0].kind == "ReplicaSet"
+    assert pod.spec.node_name == "node-a"
+    assert pod.status.phase == "Running"
+    assert pod.status.pod_ip == "10.0.0.1"
+    assert pod.status.conditions[0].type == "Ready"
+    assert pod.status.start_time is None
+
+
+def test_raw_list_skips_deserialization():
+    list_func = MagicMock()
+    list_func.return_value.data = json.dumps(
+        {"metadata": {"continue": "t1"}, "items": [{"metadata": {"name": "a"}}]}
+    )
+
+    ret = raw_list(list_func)("default", label_selector="app=web")
+
+    list_func.assert_called_with(
+        "default", label_selector="app=web", _preload_content=False
+    )
+    list_func.return_value.release_conn.assert_called_once_with()
+    assert ret.metadata._continue == "t1"
+    assert [p.metadata.name for p in ret.items] == ["a"]
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.node.probes.client", autospec=True)
+@patch("chaosk8s.client")
+def test_node_conditions_are_read_from_raw_json(cl, client, has_conf):
+    has_conf.return_value = False
+    v1 = MagicMock()
+    v1.list_node.return_value.data = json.dumps(
+        {
+            "items": [
+                {
+                    "metadata": {"name": "node-a"},
+                    "status": {
+                        "conditions": [
+                            {"type": "Ready", "status": "True"},
+                            {"type": "DiskPressure", "status": "False"},
+                        ]
+                    },
+                }
+            ]
+        }
+    )
+    client.CoreV1Api.return_value = v1
+
+    conditions = get_all_node_status_conditions()
+
+    assert conditions == [
+        {"name": "node-a", "Ready": "True", "DiskPressure": "False"}
+    ]
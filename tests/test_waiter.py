@@ -0,0 +1,285 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import urllib3
+from chaoslib.exceptions import ActivityFailed
+from kubernetes.client.rest import ApiException
+
+from chaosk8s.waiter import Target, wait_for, wait_for_selection
+
+
+def _deployment(name: str, ready: int, replicas: int = 2) -> MagicMock:
+    deployment = MagicMock()
+    deployment.metadata.name = name
+    deployment.metadata.resource_version = None
+    deployment.spec.replicas = replicas
+    deployment.status.ready_replicas = ready
+    return deployment
+
+
+def _listed(list_func: MagicMock, *items: MagicMock, rv: str = "1") -> None:
+    page = MagicMock()
+    page.metadata._continue = None
+    page.metadata.resource_version = rv
+    page.items = list(items)
+    list_func.return_value = page
+
+
+def _is_ready(deployment) -> bool:
+    return deployment.status.ready_replicas == deployment.spec.replicas
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_targets_of_a_namespace_share_a_watch(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    _listed(client.AppsV1Api.return_value.list_namespaced_deployment)
+    watcher = watch.Watch.return_value
+    watcher.stream.return_value = [
+        {"object": _deployment("front", 1), "type": "ADDED"},
+        {"object": _deployment("back", 2), "type": "ADDED"},
+        {"object": _deployment("front", 2), "type": "MODIFIED"},
+    ]
+
+    targets = [
+        Target("deployment", "front", _is_ready),
+        Target("deployment", "back", _is_ready),
+    ]
+
+    assert wait_for(targets) is True
+    assert watch.Watch.call_count == 1
+    _, kwargs = watcher.stream.call_args
+    assert kwargs["namespace"] == "default"
+    assert "field_selector" not in kwargs
+    watcher.stop.assert_called_once_with()
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_a_single_target_is_selected_by_name(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    v1 = client.AppsV1Api.return_value
+    _listed(v1.list_namespaced_deployment)
+    watcher = watch.Watch.return_value
+    watcher.stream.return_value = [
+        {"object": _deployment("front", 2), "type": "ADDED"},
+    ]
+
+    assert wait_for([Target("deployment", "front", _is_ready)]) is True
+    _, kwargs = v1.list_namespaced_deployment.call_args
+    assert kwargs["field_selector"] == "metadata.name=front"
+    _, kwargs = watcher.stream.call_args
+    assert kwargs["field_selector"] == "metadata.name=front"
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_objects_already_in_state_are_not_watched(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    _listed(
+        client.AppsV1Api.return_value.list_namespaced_deployment,
+        _deployment("front", 2),
+    )
+
+    assert wait_for([Target("deployment", "front", _is_ready)]) is True
+    watch.Watch.return_value.stream.assert_not_called()
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_watch_resumes_from_the_last_resource_version(
+    cl, client, watch, has_conf
+):
+    has_conf.return_value = False
+    _listed(client.AppsV1Api.return_value.list_namespaced_deployment, rv="10")
+    not_ready = _deployment("front", 1)
+    not_ready.metadata.resource_version = "11"
+    watcher = watch.Watch.return_value
+    watcher.stream.side_effect = [
+        [{"object": not_ready, "type": "MODIFIED"}],
+        [
+            {
+                "object": None,
+                "raw_object": {"metadata": {"resourceVersion": "15"}},
+                "type": "BOOKMARK",
+            }
+        ],
+        urllib3.exceptions.ReadTimeoutError(None, None, None),
+        [{"object": _deployment("front", 2), "type": "MODIFIED"}],
+    ]
+
+    with patch("chaosk8s.waiter.WATCH_MIN_INTERVAL", 0):
+        assert wait_for([Target("deployment", "front", _is_ready)]) is True
+
+    versions = [
+        c.kwargs["resource_version"] for c in watcher.stream.call_args_list
+    ]
+    assert versions == ["10", "11", "15", "15"]
+    for c in watcher.stream.call_args_list:
+        assert c.kwargs["allow_watch_bookmarks"] is True
+        assert 1 <= c.kwargs["timeout_seconds"] <= 30
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_objects_are_listed_again_when_the_version_is_gone(
+    cl, client, watch, has_conf
+):
+    has_conf.return_value = False
+    v1 = client.AppsV1Api.return_value
+    first, second = MagicMock(), MagicMock()
+    for page, rv in [(first, "10"), (second, "20")]:
+        page.metadata._continue = None
+        page.metadata.resource_version = rv
+        page.items = []
+    v1.list_namespaced_deployment.side_effect = [first, second]
+    watcher = watch.Watch.return_value
+    watcher.stream.side_effect = [
+        ApiException(status=410, reason="Expired"),
+        [{"object": _deployment("front", 2), "type": "MODIFIED"}],
+    ]
+
+    with patch("chaosk8s.waiter.WATCH_MIN_INTERVAL", 0):
+        assert wait_for([Target("deployment", "front", _is_ready)]) is True
+
+    assert v1.list_namespaced_deployment.call_count == 2
+    _, kwargs = watcher.stream.call_args
+    assert kwargs["resource_version"] == "20"
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_waiting_for_all_fails_when_one_is_not_reached(
+    cl, client, watch, has_conf
+):
+    has_conf.return_value = False
+    _listed(
+        client.AppsV1Api.return_value.list_namespaced_deployment,
+        _deployment("front", 2),
+        _deployment("back", 1),
+    )
+    watch.Watch.return_value.stream.return_value = []
+
+    targets = [
+        Target("deployment", "front", _is_ready),
+        Target("deployment", "back", _is_ready),
+    ]
+
+    assert wait_for(targets, timeout=1) is False
+    assert wait_for(targets, mode="any") is True
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_waiting_times_out(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    _listed(client.AppsV1Api.return_value.list_namespaced_deployment)
+    watcher = watch.Watch.return_value
+    watcher.stream.side_effect = urllib3.exceptions.ReadTimeoutError(
+        None, None, None
+    )
+
+    assert (
+        wait_for([Target("deployment", "front", _is_ready)], timeout=1) is False
+    )
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_namespaces_are_watched_concurrently(cl, client, watch, has_conf):
+    has_conf.return_value = False
+    v1 = client.AppsV1Api.return_value
+    _listed(v1.list_namespaced_deployment)
+    _listed(v1.list_namespaced_stateful_set)
+    events = {
+        "ns-a": [{"object": _deployment("front", 2), "type": "ADDED"}],
+        "ns-b": [{"object": _deployment("back", 2), "type": "ADDED"}],
+    }
+    watch.Watch.return_value.stream.side_effect = lambda func, **kw: events[
+        kw["namespace"]
+    ]
+
+    targets = [
+        Target("deployment", "front", _is_ready, ns="ns-a"),
+        Target("statefulset", "back", _is_ready, ns="ns-b"),
+    ]
+
+    assert wait_for(targets, timeout=5) is True
+    assert watch.Watch.call_count == 2
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_watch_errors_are_raised_from_the_waiting_thread(
+    cl, client, watch, has_conf
+):
+    has_conf.return_value = False
+    _listed(client.AppsV1Api.return_value.list_namespaced_deployment)
+    watch.Watch.return_value.stream.side_effect = RuntimeError("boom")
+
+    targets = [
+        Target("deployment", "front", _is_ready, ns="ns-a"),
+        Target("deployment", "back", _is_ready, ns="ns-b"),
+    ]
+
+    with pytest.raises(RuntimeError):
+        wait_for(targets, timeout=5)
+
+
+def test_unknown_kinds_and_modes_are_refused():
+    with pytest.raises(ActivityFailed):
+        wait_for([Target("cronjob", "nightly", _is_ready)])
+
+    with pytest.raises(ActivityFailed):
+        wait_for([Target("deployment", "front", _is_ready)], mode="most")
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.waiter.watch", autospec=True)
+@patch("chaosk8s.waiter.client", autospec=True)
+@patch("chaosk8s.client")
+def test_selection_is_listed_again_when_its_version_is_gone(
+    cl, client, watch, has_conf
+):
+    has_conf.return_value = False
+    list_func = client.AppsV1Api.return_value.list_namespaced_deployment
+    first, second = MagicMock(), MagicMock()
+    for page, ready, rv in ((first, 1, "1"), (second, 2, "5")):
+        page.metadata._continue = None
+        page.metadata.resource_version = rv
+        page.items = [_deployment("front", ready), _deployment("back", 2)]
+    list_func.side_effect = [first, second]
+    watch.Watch.return_value.stream.side_effect = ApiException(status=410)
+
+    def all_ready(deployments):
+        return all(_is_ready(d) for d in deployments)
+
+    assert (
+        wait_for_selection("deployment", all_ready, label_selector="app=x")
+        is True
+    )
+    assert list_func.call_count == 2
+    assert list_func.call_args.kwargs["label_selector"] == "app=x"
+
+
+def test_selection_of_unknown_kind_cannot_be_waited_for():
+    with pytest.raises(ActivityFailed):
+        wait_for_selection("job", lambda objects: True)